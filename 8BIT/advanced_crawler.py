@@ -10,9 +10,13 @@ from bs4 import BeautifulSoup
 import json
 import time
 import os
+import sys
 from datetime import datetime
 from urllib.parse import urlparse
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import webdriver_pool
+
 from genre_classifier import GenreClassifier
 from text_summarizer import TextSummarizer
 from keyword_extractor import KeywordExtractor
@@ -66,7 +70,7 @@ class AdvancedWebCrawler:
             
             # 1. 페이지 로드
             self.driver.get(url)
-            time.sleep(2)
+            webdriver_pool.wait_for_page(self.driver, 10, label="crawl")
             
             # 2. HTML 파싱
             html = self.driver.page_source
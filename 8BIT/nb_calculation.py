@@ -4,8 +4,14 @@ JavaScript의 BIT 계산 시스템을 Python으로 변환
 """
 
 import math
+import os
 import sys
 
+# 공통 N/B 계산 모듈 (nbcore) import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import nbcore
+
+
 class NBCalculator:
     """N/B 가중치 계산 클래스"""
     
@@ -14,91 +20,19 @@ class NBCalculator:
     
     def initialize_arrays(self, count):
         """배열 초기화"""
-        arrays = {
-            'BIT_START_A50': [0] * count,
-            'BIT_START_A100': [0] * count,
-            'BIT_START_B50': [0] * count,
-            'BIT_START_B100': [0] * count,
-            'BIT_START_NBA100': [0] * count,
-        }
-        return arrays
+        return nbcore.initialize_arrays(count)
     
     def calculate_bit(self, nb, bit=5.5, reverse=False):
-        """N/B 값을 계산하는 함수"""
-        
-        if len(nb) < 2:
-            return bit / 100
-        
-        BIT_NB = bit
-        max_val = max(nb)
-        min_val = min(nb)
-        COUNT = 50
-        CONT = 20
-        range_val = max_val - min_val
-        
-        # 음수와 양수 범위를 구분하여 증분 계산
-        negative_range = abs(min_val) if min_val < 0 else 0
-        positive_range = max_val if max_val > 0 else 0
-        
-        negative_increment = negative_range / (COUNT * len(nb) - 1) if (COUNT * len(nb) - 1) > 0 else 0
-        positive_increment = positive_range / (COUNT * len(nb) - 1) if (COUNT * len(nb) - 1) > 0 else 0
-        
-        arrays = self.initialize_arrays(COUNT * len(nb))
-        count = 0
-        total_sum = 0
-        
-        for value in nb:
-            for i in range(COUNT):
-                BIT_END = 1
-                
-                # 부호에 따른 A50, B50 계산
-                if value < 0:
-                    A50 = min_val + negative_increment * (count + 1)
-                else:
-                    A50 = min_val + positive_increment * (count + 1)
-                
-                A100 = (count + 1) * BIT_NB / (COUNT * len(nb))
-                
-                if value < 0:
-                    B50 = A50 - negative_increment * 2
-                    B100 = A50 + negative_increment
-                else:
-                    B50 = A50 - positive_increment * 2
-                    B100 = A50 + positive_increment
-                
-                NBA100 = A100 / (len(nb) - BIT_END) if (len(nb) - BIT_END) > 0 else 0
-                
-                arrays['BIT_START_A50'][count] = A50
-                arrays['BIT_START_A100'][count] = A100
-                arrays['BIT_START_B50'][count] = B50
-                arrays['BIT_START_B100'][count] = B100
-                arrays['BIT_START_NBA100'][count] = NBA100
-                count += 1
-            
-            total_sum += value
-        
-        # Reverse 옵션 처리
-        if reverse:
-            arrays['BIT_START_NBA100'].reverse()
-        
-        # NB50 계산
-        NB50 = 0
-        for value in nb:
-            for a in range(len(arrays['BIT_START_NBA100'])):
-                if arrays['BIT_START_B50'][a] <= value <= arrays['BIT_START_B100'][a]:
-                    NB50 += arrays['BIT_START_NBA100'][min(a, len(arrays['BIT_START_NBA100']) - 1)]
-                    break
-        
-        # 평균 비율 기반 NB50 정규화
-        BIT = max((10 - len(nb)) * 10, 1)
-        abs_max = abs(max_val) if max_val != 0 else 1
-        average_ratio = (total_sum / (len(nb) * abs_max)) * 100
-        NB50 = min((NB50 / 100) * average_ratio, BIT_NB)
-        
-        if len(nb) == 2:
-            return bit - NB50
-        
-        return NB50
+        """N/B 값을 계산하는 함수 (NumPy 사용 가능 시 벡터 계산)"""
+        return nbcore.calculate_bit(nb, bit, reverse)
+    
+    def calculate_bit_vectorized(self, nb, bit=5.5, reverse=False):
+        """N/B 값 벡터 계산 (calculate_bit_loop와 동일한 결과)"""
+        return nbcore.calculate_bit_vectorized(nb, bit, reverse)
+    
+    def calculate_bit_loop(self, nb, bit=5.5, reverse=False):
+        """N/B 값 루프 계산 (원본 알고리즘, NumPy 미설치 시 사용)"""
+        return nbcore.calculate_bit_loop(nb, bit, reverse)
     
     def update_super_bit(self, new_value):
         """SUPER_BIT 업데이트"""
@@ -123,6 +57,10 @@ class NBCalculator:
         else:
             self.update_super_bit(result)
             return result
+    
+    def calculate_many(self, sequences, bit=5.5, reverse=False):
+        """여러 시퀀스 배치 계산 (nbcore.calculate_many 참고)"""
+        return nbcore.calculate_many(sequences, bit, reverse)
 
 
 def parse_input(input_str):
@@ -0,0 +1,345 @@
+"""
+N/B 계산 결과 자동 정리 프로그램
+- 결과 정렬
+- 중복 제거
+- 통계 생성
+- 결과 저장 (JSONL, CSV 이어 쓰기)
+
+IDE는 새 결과를 data/nb_store에 추가하므로 스캔 전에 아직 내보내지 않은
+결과를 기존 폴더 구조(data/nb_max, data/nb_min)로 내보낸다.
+manifest.json에 파일별 (mtime, 크기, 내용 해시)를 기록해 다시 실행할 때는
+새로 생겼거나 바뀐 파일만 읽는다. 중복 판정은 계산 결과의 정규화 JSON
+다이제스트 집합(digests.bin)으로 하며 이전 실행분과도 비교한다.
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# 공통 N/B 모듈 (nbcore) import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import nbcore
+
+MANIFEST_FILE = "manifest.json"
+DIGEST_FILE = "digests.bin"
+JSONL_FILE = "organized_results.jsonl"
+CSV_FILE = "organized_results.csv"
+LATEST_FILE = "latest_results.json"
+DIGEST_SIZE = 16
+DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def calculation_digest(calc):
+    """계산 결과의 정규화 JSON 다이제스트 (키 정렬, 공백 없음)"""
+    canonical = json.dumps(calc, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=DIGEST_SIZE).digest()
+
+
+def read_result_file(path, previous):
+    """파일을 읽어 (경로, manifest 항목, 데이터 또는 None) 반환
+
+    내용 해시가 이전과 같으면(mtime만 바뀐 경우) JSON 파싱을 생략한다.
+    """
+    stat = os.stat(path)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    content_hash = hashlib.blake2b(raw, digest_size=DIGEST_SIZE).hexdigest()
+    entry = {'mtime': stat.st_mtime, 'size': stat.st_size, 'hash': content_hash}
+    if previous and previous.get('hash') == content_hash:
+        return path, entry, None
+    try:
+        data = json.loads(raw.decode('utf-8-sig'))
+    except ValueError:
+        data = None
+    return path, entry, data
+
+
+class NBResultOrganizer:
+    def __init__(self, data_dir="data/nb_max", output_dir="data/nb_results", workers=DEFAULT_WORKERS, store_dir=None):
+        self.data_dir = data_dir
+        self.output_dir = output_dir
+        self.workers = workers
+        # 결과 저장소 (기본: data_dir 옆의 nb_store, 없으면 내보내기 생략)
+        self.store_dir = store_dir or os.path.join(os.path.dirname(os.path.abspath(data_dir)), 'nb_store')
+        self.manifest_path = os.path.join(self.output_dir, MANIFEST_FILE)
+        self.digest_path = os.path.join(self.output_dir, DIGEST_FILE)
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.manifest = self.load_manifest()
+        self.seen = self.load_digests()
+        self.pending_digests = []
+
+    def load_manifest(self):
+        """이전 실행의 파일 목록과 누적 통계"""
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {'files': {}, 'statistics': {'total_count': 0, 'by_type': {}}}
+
+    def save_manifest(self):
+        temp_path = self.manifest_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
+
+    def load_digests(self):
+        """이전에 저장한 계산 결과 다이제스트 집합"""
+        seen = set()
+        if os.path.exists(self.digest_path):
+            with open(self.digest_path, 'rb') as f:
+                data = f.read()
+            usable = len(data) - len(data) % DIGEST_SIZE
+            seen.update(data[i:i + DIGEST_SIZE] for i in range(0, usable, DIGEST_SIZE))
+        return seen
+
+    def export_store(self):
+        """결과 저장소에만 있는 결과를 data_dir(와 옆의 nb_min) 폴더 구조로 내보냄"""
+        if not os.path.isdir(self.store_dir):
+            return 0
+        nb_min_dir = os.path.join(os.path.dirname(os.path.abspath(self.data_dir)), 'nb_min')
+        count = nbcore.open_store(self.store_dir).export_pending(self.data_dir, nb_min_dir)
+        print(f"📤 결과 저장소에서 {count}개 내보냄")
+        return count
+
+    def list_files(self):
+        """data_dir 아래 JSON 파일의 (경로, mtime, 크기)"""
+        files = []
+        stack = [self.data_dir]
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.json'):
+                    stat = entry.stat()
+                    files.append((entry.path, stat.st_mtime, stat.st_size))
+        files.sort()
+        return files
+
+    def scan_results(self):
+        """새로 생겼거나 바뀐 결과 파일만 스레드 풀로 읽기"""
+        results = []
+        if not os.path.exists(self.data_dir):
+            print("✅ 0개의 결과 파일 발견")
+            return results
+
+        known = self.manifest['files']
+        files = self.list_files()
+        changed = [
+            path for path, mtime, size in files
+            if not (path in known and known[path]['mtime'] == mtime and known[path]['size'] == size)
+        ]
+        current = {path for path, _, _ in files}
+        for path in list(known):
+            if path not in current:
+                del known[path]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for path, entry, data in executor.map(lambda p: read_result_file(p, known.get(p)), changed):
+                known[path] = entry
+                if data is not None:
+                    results.append({
+                        'path': path,
+                        'data': data,
+                        'timestamp': entry['mtime']
+                    })
+
+        print(f"✅ {len(files)}개의 결과 파일 중 {len(changed)}개 변경, {len(results)}개 읽음")
+        return results
+
+    def extract_calculations(self, results):
+        """계산 결과 추출"""
+        calculations = []
+
+        for item in results:
+            data = item['data']
+
+            # 결과 추출 (구조에 따라 조정 필요)
+            if isinstance(data, dict):
+                if 'results' in data:
+                    for calc in data['results']:
+                        calculations.append(calc)
+                elif 'nb_max' in data:
+                    calculations.append(data)
+            elif isinstance(data, list):
+                calculations.extend(data)
+
+        print(f"📊 {len(calculations)}개의 계산 결과 추출")
+        return calculations
+
+    def remove_duplicates(self, calculations):
+        """중복 제거 (이전 실행분 포함, 다이제스트 비교)"""
+        unique_calcs = []
+        new_digests = []
+
+        for calc in calculations:
+            if isinstance(calc, dict):
+                digest = calculation_digest(calc)
+                if digest not in self.seen:
+                    self.seen.add(digest)
+                    new_digests.append(digest)
+                    unique_calcs.append(calc)
+
+        # 다이제스트는 결과를 쓴 뒤 저장 (save_results)
+        self.pending_digests = new_digests
+
+        removed = len(calculations) - len(unique_calcs)
+        print(f"🗑️ {removed}개의 중복 제거")
+        return unique_calcs
+
+    def generate_statistics(self, calculations):
+        """통계 생성 (누적 + 이번 실행)"""
+        totals = self.manifest['statistics']
+        stats = {
+            'total_count': totals['total_count'] + len(calculations),
+            'new_count': len(calculations),
+            'collection_time': datetime.now().isoformat(),
+            'breakdown': {
+                'by_type': dict(totals['by_type']),
+                'by_category': {}
+            }
+        }
+
+        # 유형별 분류
+        for calc in calculations:
+            if isinstance(calc, dict):
+                calc_type = calc.get('type', 'unknown')
+                stats['breakdown']['by_type'][calc_type] = \
+                    stats['breakdown']['by_type'].get(calc_type, 0) + 1
+
+        self.manifest['statistics'] = {
+            'total_count': stats['total_count'],
+            'by_type': stats['breakdown']['by_type']
+        }
+        print("📈 통계 생성 완료")
+        return stats
+
+    def save_results(self, calculations, stats):
+        """새 결과를 JSONL/CSV 끝에 이어 쓰기"""
+        json_file = os.path.join(self.output_dir, JSONL_FILE)
+        csv_file = os.path.join(self.output_dir, CSV_FILE)
+
+        if calculations:
+            with open(json_file, 'a', encoding='utf-8') as f:
+                for calc in calculations:
+                    f.write(json.dumps(calc, ensure_ascii=False) + '\n')
+            print(f"✅ JSONL 추가: {json_file} (+{len(calculations)})")
+
+            try:
+                self.append_csv(csv_file, calculations)
+                print(f"✅ CSV 추가: {csv_file}")
+            except (OSError, csv.Error):
+                print("⚠️ CSV 저장 실패")
+
+            # 최신 결과 (이번 실행에서 추가된 결과 중 100개)
+            latest_json = os.path.join(self.output_dir, LATEST_FILE)
+            with open(latest_json, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'statistics': stats,
+                    'results': calculations[:100]
+                }, f, ensure_ascii=False, indent=2)
+
+        if self.pending_digests:
+            with open(self.digest_path, 'ab') as f:
+                f.write(b''.join(self.pending_digests))
+            self.pending_digests = []
+
+        return json_file, csv_file
+
+    def append_csv(self, csv_file, calculations):
+        """CSV 이어 쓰기 (열은 기존 헤더를 따르고, 새 파일이면 첫 결과의 키 사용)"""
+        fieldnames = None
+        if os.path.exists(csv_file) and os.path.getsize(csv_file) > 0:
+            with open(csv_file, 'r', newline='', encoding='utf-8-sig') as f:
+                fieldnames = next(csv.reader(f), None)
+        write_header = not fieldnames
+        if write_header:
+            fieldnames = list(calculations[0].keys())
+
+        with open(csv_file, 'a', newline='', encoding='utf-8-sig' if write_header else 'utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            if write_header:
+                writer.writeheader()
+            writer.writerows(calculations)
+
+    def display_summary(self, stats):
+        """요약 표시"""
+        print("\n" + "="*60)
+        print("📋 정리 결과 요약")
+        print("="*60)
+        print(f"✅ 총 항목: {stats['total_count']:,}개 (이번 실행 +{stats['new_count']:,}개)")
+        print(f"📅 정리 시간: {stats['collection_time']}")
+
+        if stats['breakdown']['by_type']:
+            print("\n📊 유형별 분류:")
+            for key, count in sorted(stats['breakdown']['by_type'].items()):
+                print(f"   - {key}: {count:,}개")
+
+        print("="*60 + "\n")
+
+    def organize(self):
+        """전체 정리 프로세스"""
+        try:
+            print("\n" + "="*60)
+            print("🔄 N/B 계산 결과 자동 정리 시작")
+            print("="*60 + "\n")
+
+            # 1. 결과 스캔 (저장소의 새 결과를 내보낸 뒤 변경된 파일만)
+            print("[1/5] 결과 파일 스캔 중...")
+            self.export_store()
+            results = self.scan_results()
+
+            # 2. 계산 결과 추출
+            print("[2/5] 계산 결과 추출 중...")
+            calculations = self.extract_calculations(results)
+
+            # 3. 중복 제거
+            print("[3/5] 중복 제거 중...")
+            unique_calcs = self.remove_duplicates(calculations)
+
+            # 4. 통계 생성
+            print("[4/5] 통계 생성 중...")
+            stats = self.generate_statistics(unique_calcs)
+
+            # 5. 결과 저장
+            print("[5/5] 결과 저장 중...")
+            self.save_results(unique_calcs, stats)
+            self.save_manifest()
+
+            # 요약 표시
+            self.display_summary(stats)
+
+            print("✅ 정리 완료!")
+            return True
+
+        except Exception as e:
+            print(f"❌ 정리 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="N/B 계산 결과 자동 정리")
+    parser.add_argument('--data-dir', default="data/nb_max", help="결과 파일 폴더")
+    parser.add_argument('--output-dir', default="data/nb_results", help="정리 결과 폴더")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="파일 읽기 스레드 수")
+    parser.add_argument('--store-dir', default=None, help="결과 저장소 폴더 (기본: 결과 파일 폴더 옆의 nb_store)")
+    args = parser.parse_args()
+
+    organizer = NBResultOrganizer(args.data_dir, args.output_dir, args.workers, args.store_dir)
+    organizer.organize()
+
+
+if __name__ == "__main__":
+    main()
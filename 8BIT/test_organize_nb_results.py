@@ -0,0 +1,84 @@
+"""
+N/B 결과 정리 프로그램 테스트 (변경 파일만 읽기, 이전 실행분과 중복 제거, 이어 쓰기)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from organize_nb_results import NBResultOrganizer
+from nbcore.store import NBResultStore
+
+
+def write_result(path, nb_max, nb_min):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'id': os.path.basename(os.path.dirname(path)), 'results': [
+            {'calculation': 1, 'nb_max': nb_max, 'nb_min': nb_min, 'difference': nb_max - nb_min}
+        ]}, f)
+
+
+def read_jsonl(output_dir):
+    with open(os.path.join(output_dir, 'organized_results.jsonl'), 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_incremental_runs():
+    """두 번째 실행은 바뀐 파일만 읽고 새 결과만 JSONL/CSV에 추가"""
+    with tempfile.TemporaryDirectory() as root:
+        data_dir = os.path.join(root, 'nb_max')
+        output_dir = os.path.join(root, 'nb_results')
+        write_result(os.path.join(data_dir, '1', 'a', 'results.json'), 10.5, 0.1)
+        write_result(os.path.join(data_dir, '2', 'b', 'results.json'), 20.5, 0.2)
+        write_result(os.path.join(data_dir, '2', 'c', 'results.json'), 20.5, 0.2)  # 중복 결과
+
+        NBResultOrganizer(data_dir, output_dir).organize()
+        assert [calc['nb_max'] for calc in read_jsonl(output_dir)] == [10.5, 20.5]
+
+        organizer = NBResultOrganizer(data_dir, output_dir)
+        assert organizer.scan_results() == []
+
+        write_result(os.path.join(data_dir, '3', 'd', 'results.json'), 30.5, 0.3)
+        NBResultOrganizer(data_dir, output_dir).organize()
+        assert [calc['nb_max'] for calc in read_jsonl(output_dir)] == [10.5, 20.5, 30.5]
+
+        with open(os.path.join(output_dir, 'organized_results.csv'), 'r', encoding='utf-8-sig') as f:
+            lines = f.read().splitlines()
+        assert lines[0] == 'calculation,nb_max,nb_min,difference' and len(lines) == 4
+        with open(os.path.join(output_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        assert len(manifest['files']) == 4 and manifest['statistics']['total_count'] == 3
+
+
+def test_store_results_are_exported_before_scan():
+    """IDE가 data/nb_store에만 추가한 결과도 폴더로 내보낸 뒤 정리"""
+    with tempfile.TemporaryDirectory() as root:
+        data_dir = os.path.join(root, 'nb_max')
+        output_dir = os.path.join(root, 'nb_results')
+        write_result(os.path.join(data_dir, '1', 'a', 'results.json'), 10.5, 0.1)
+        store = NBResultStore(os.path.join(root, 'nb_store'), fsync=False)
+        store.append({'id': 'new', 'type': 'text', 'results': [
+            {'calculation': 1, 'nb_max': 40.5, 'nb_min': 0.4, 'difference': 40.1}
+        ]})
+
+        NBResultOrganizer(data_dir, output_dir).organize()
+        assert sorted(calc['nb_max'] for calc in read_jsonl(output_dir)) == [10.5, 40.5]
+        assert os.path.isdir(os.path.join(root, 'nb_min'))
+        NBResultOrganizer(data_dir, output_dir).organize()
+        assert len(read_jsonl(output_dir)) == 2
+
+
+def main():
+    print("=" * 60)
+    print("N/B 결과 정리 테스트")
+    print("=" * 60)
+    for test in (test_incremental_runs, test_store_results_are_exported_before_scan):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
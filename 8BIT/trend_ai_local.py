@@ -7,12 +7,17 @@ Ollama 로컬 처리 스크립트
 
 import json
 import os
+import sys
 import time
 from datetime import datetime
 from urllib.parse import quote
 
 import requests
 
+# Ollama 공용 클라이언트 (저장소 루트의 ollama_client)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import ollama_client
+
 DATA_PATH = os.path.join("data", "naver_creator_trends", "latest_trend_data.json")
 OUTPUT_DIR = os.path.join("data", "revenue_content")
 OLLAMA_BASE_URL = os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434")
@@ -44,26 +49,17 @@ def load_trend_keywords(limit):
 
 
 def call_ollama(prompt, model):
-    response = requests.post(
-        f"{OLLAMA_BASE_URL}/api/generate",
-        json={"model": model, "prompt": prompt, "stream": False},
-        timeout=OLLAMA_TIMEOUT_SECONDS
-    )
-    response.raise_for_status()
-    data = response.json()
-    return (data.get("response") or "").strip()
+    client = ollama_client.get_client(OLLAMA_BASE_URL)
+    return client.generate_text(model, prompt, timeout=OLLAMA_TIMEOUT_SECONDS)
 
 
 def get_default_model():
     if OLLAMA_MODEL:
         return OLLAMA_MODEL
     try:
-        response = requests.get(f"{OLLAMA_BASE_URL}/api/tags", timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        models = data.get("models", [])
+        models = ollama_client.get_client(OLLAMA_BASE_URL).list_models(timeout=10)
         if models:
-            return models[0].get("name") or ""
+            return models[0]
     except Exception:
         return ""
     return ""
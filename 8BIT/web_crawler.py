@@ -11,10 +11,15 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
 import json
+import os
+import sys
 import time
 from datetime import datetime
 from urllib.parse import urlparse
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import webdriver_pool
+
 class WebCrawler:
     def __init__(self, headless=True):
         """
@@ -57,7 +62,8 @@ class WebCrawler:
             
             # 페이지 로드
             self.driver.get(url)
-            time.sleep(2)  # 페이지 로딩 대기
+            # 페이지 로딩 대기 (DOM이 잠잠해지면 바로 진행, 최대 10초)
+            webdriver_pool.wait_for_page(self.driver, 10, label="crawl")
             
             # HTML 가져오기
             html = self.driver.page_source
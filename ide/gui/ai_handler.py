@@ -2,6 +2,8 @@
 AI 응답 생성 및 처리
 """
 
+import os
+import sys
 import requests
 import re
 from datetime import datetime
@@ -10,6 +12,10 @@ from .config import OLLAMA_URL, DATABASE_BASE_URL
 from .utils import log_debug, clean_text_simple
 from .news_manager import DateHelper
 
+# Ollama 공용 클라이언트 (저장소 루트의 ollama_client)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from ollama_client import get_client
+
 
 class AIHandler:
     """AI 응답 생성 관리"""
@@ -29,26 +35,20 @@ class AIHandler:
                 return "모델이 설정되지 않았습니다."
             
             log_debug(f"Sending prompt to Ollama (model: {use_model})...")
-            response = requests.post(
-                f"{OLLAMA_URL}/api/generate",
-                json={
-                    "model": use_model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": temperature,
-                        "num_predict": 2000,
-                        "top_k": 40,
-                        "top_p": 0.9
-                    }
+            result = get_client(OLLAMA_URL).generate(
+                use_model,
+                prompt,
+                options={
+                    "temperature": temperature,
+                    "num_predict": 2000,
+                    "top_k": 40,
+                    "top_p": 0.9
                 },
                 timeout=timeout
             )
-            response.raise_for_status()
-            data = response.json()
-            log_debug(f"Response received")
+            log_debug(f"Response received ({result.latency:.1f}s, {result.eval_count} tokens)")
             
-            answer = data.get('response', '').strip()
+            answer = result.text.strip()
             return clean_text_simple(answer) if answer else "응답을 생성할 수 없습니다."
             
         except Exception as e:
@@ -72,18 +72,10 @@ class AIHandler:
 
 카테고리:"""
 
-            response = requests.post(
-                f"{OLLAMA_URL}/api/generate",
-                json={
-                    "model": self.current_model,
-                    "prompt": prompt,
-                    "stream": False
-                },
-                timeout=15
-            )
-            response.raise_for_status()
-            data = response.json()
-            category = data.get('response', '일반').strip()
+            result = get_client(OLLAMA_URL).generate(self.current_model, prompt, timeout=15, cache=True)
+            if result.cached:
+                log_debug(f"[LLM 캐시] {get_client(OLLAMA_URL).cache.summary_line()}")
+            category = result.text.strip() or '일반'
             
             # 깔끔하게 정리
             category = category.split('\n')[0].strip()
@@ -177,25 +169,19 @@ class AIHandler:
             
             log_debug(f"[AI 필터링] 카테고리({category}) 분석 중...")
             
-            response = requests.post(
-                f"{OLLAMA_URL}/api/generate",
-                json={
-                    "model": self.current_model,
-                    "prompt": filter_prompt,
-                    "stream": False,
-                    "options": {
+            try:
+                filtered_text = get_client(OLLAMA_URL).generate_text(
+                    self.current_model,
+                    filter_prompt,
+                    options={
                         "temperature": 0.3,
                         "num_predict": 1000
-                    }
-                },
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                log_debug(f"[AI 필터링 실패] Status: {response.status_code}")
+                    },
+                    timeout=30
+                )
+            except requests.HTTPError as e:
+                log_debug(f"[AI 필터링 실패] Status: {e.response.status_code if e.response is not None else '?'}")
                 return []
-            
-            filtered_text = response.json().get('response', '').strip()
             log_debug(f"[AI 필터링 결과] {filtered_text[:100]}")
             
             if not filtered_text or filtered_text == "":
@@ -248,18 +234,7 @@ class AIHandler:
 
 출력 형식: YES 또는 NO 중 하나만 반환
 """
-            response = requests.post(
-                f"{OLLAMA_URL}/api/generate",
-                json={
-                    "model": self.current_model,
-                    "prompt": prompt,
-                    "stream": False
-                },
-                timeout=12
-            )
-            response.raise_for_status()
-            data = response.json()
-            verdict = (data.get('response') or '').strip().upper()
+            verdict = get_client(OLLAMA_URL).generate_text(self.current_model, prompt, timeout=12).upper()
             return verdict.startswith("YES")
         except Exception as e:
             log_debug(f"[신선도 판단 오류] {e}")
@@ -14,6 +14,8 @@ DATABASE_BASE_URL = os.getenv("DATABASE_BASE_URL", "https://xn--9l4b4xi9r.com")
 AUTO_UPLOAD_DATA = os.getenv("AUTO_UPLOAD_DATA", "1") == "1"
 AJAX_SAVE_ENABLED = os.getenv("AJAX_SAVE_ENABLED", "1") == "1"
 SAVE_LOCAL_SUMMARY = os.getenv("SAVE_LOCAL_SUMMARY", "0") == "1"
+# 저장할 때마다 data/nb_max, data/nb_min 폴더 구조도 바로 갱신 (기본: 업로드 직전에 내보내기)
+NB_LEGACY_TREE = os.getenv("NB_LEGACY_TREE", "0") == "1"
 
 # Directories
 HISTORY_DIR = "data/ollama_chat"
@@ -3,7 +3,7 @@
 """
 
 import os
-import json
+import sys
 import requests
 import subprocess
 from datetime import datetime, timedelta
@@ -11,10 +11,14 @@ import re
 
 from .config import (
     NB_API_URL, DATABASE_BASE_URL, AUTO_UPLOAD_DATA,
-    AJAX_SAVE_ENABLED, SAVE_LOCAL_SUMMARY
+    AJAX_SAVE_ENABLED, SAVE_LOCAL_SUMMARY, NB_LEGACY_TREE
 )
 from .utils import log_debug
 
+# 공통 N/B 계산 모듈 import
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import nbcore
+
 
 class DateHelper:
     """날짜 관련 헬퍼 함수"""
@@ -221,7 +225,8 @@ class NewsManager:
 
         for item in items:
             try:
-                unicode_array = [ord(ch) for ch in item]
+                # 서버(charCodeAt)와 같은 코드 배열로 기존 결과 검색
+                unicode_array = nbcore.js_char_codes(item)
                 self.add_detail_log('calc', f"요청: {item}")
 
                 # 1) Search existing
@@ -272,7 +277,7 @@ class NewsManager:
             except Exception as e:
                 log_debug(f"[저장 오류] N/B 계산 실패: {e}")
                 self.add_detail_log('calc', f"실패: {item}")
-                results.append({
+                failed = {
                     'id': None,
                     'calculation_id': None,
                     'timestamp': None,
@@ -283,7 +288,17 @@ class NewsManager:
                     'view_count': 0,
                     'results': [],
                     'saved': False
-                })
+                }
+                # 서버 없이도 같은 공식(calculate.js)으로 값 확인 (저장되지 않음, 실패해도 이 항목만 건너뜀)
+                try:
+                    local = nbcore.calculate_web_result(item)
+                    local_max = local['results'][0]['nb_max']
+                    local_min = local['results'][0]['nb_min']
+                    self.add_detail_log('calc', f"로컬 계산: MAX {local_max} MIN {local_min}")
+                    failed['local_results'] = local['results']
+                except Exception as local_error:
+                    log_debug(f"[저장 오류] 로컬 N/B 계산 실패: {local_error}")
+                results.append(failed)
 
         return results
     
@@ -303,40 +318,24 @@ class NewsManager:
         if not calculations:
             return
 
-        for calc in calculations:
-            try:
-                calc_id = calc.get('id') or calc.get('calculation_id')
-                if not calc_id:
-                    continue
-
-                results = calc.get('results') or []
-                if not results:
-                    continue
-
-                nb_max = results[0].get('nb_max')
-                nb_min = results[0].get('nb_min')
-                if nb_max is None or nb_min is None:
-                    continue
-
-                max_path = self.number_to_path(nb_max)
-                min_path = self.number_to_path(nb_min)
-
-                self.add_detail_log('paths', f"nb_max: {max_path}")
-                self.add_detail_log('paths', f"nb_min: {min_path}")
-
-                max_dir = os.path.join(nb_max_dir, max_path)
-                min_dir = os.path.join(nb_min_dir, min_path)
-                os.makedirs(max_dir, exist_ok=True)
-                os.makedirs(min_dir, exist_ok=True)
+        # 결과 저장소(data/nb_store)에 한 번에 추가, 폴더 구조는 업로드 전에 내보냄
+        try:
+            store = nbcore.open_store(os.path.join(os.path.dirname(nb_max_dir), 'nb_store'))
+            recnos = store.append_many(calculations)
+        except Exception as e:
+            log_debug(f"[저장 오류] 결과 저장소 저장 실패: {e}")
+            return
 
-                payload = json.dumps(calc, ensure_ascii=False, indent=2)
-                max_file = os.path.join(max_dir, "results.json")
-                min_file = os.path.join(min_dir, "results.json")
+        for calc, recno in zip(calculations, recnos):
+            if recno is None:
+                continue
+            first = calc['results'][0]
+            self.add_detail_log('paths', f"nb_max: {self.number_to_path(first['nb_max'])}")
+            self.add_detail_log('paths', f"nb_min: {self.number_to_path(first['nb_min'])}")
 
-                with open(max_file, 'w', encoding='utf-8') as f:
-                    f.write(payload)
-                with open(min_file, 'w', encoding='utf-8') as f:
-                    f.write(payload)
+        if NB_LEGACY_TREE:
+            try:
+                store.export_pending(nb_max_dir, nb_min_dir)
             except Exception as e:
                 log_debug(f"[저장 오류] 경로 저장 실패: {e}")
     
@@ -346,6 +345,16 @@ class NewsManager:
             self.notify("⏭️ 데이터 업로드 생략됨")
             return
 
+        # 웹 서버가 읽는 data/nb_max, data/nb_min 폴더 구조에 새 결과 반영
+        try:
+            data_dir = os.path.join(root_dir, 'data')
+            store = nbcore.open_store(os.path.join(data_dir, 'nb_store'))
+            exported = store.export_pending(os.path.join(data_dir, 'nb_max'), os.path.join(data_dir, 'nb_min'))
+            if exported:
+                self.add_detail_log('upload', f"결과 내보내기: {exported}건")
+        except Exception as e:
+            log_debug(f"[저장 오류] 결과 내보내기 실패: {e}")
+
         script_path = os.path.join(root_dir, 'sync_data_only.bat')
         if not os.path.exists(script_path):
             self.notify("⚠️ 데이터 업로드 스크립트 없음")
@@ -8,13 +8,9 @@ import re
 import time
 import requests
 from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
 from .config import SEARCH_KEYWORDS
 from .utils import log_debug
@@ -29,6 +25,18 @@ from search import (
 )
 from search.naver_search import format_search_results
 from search.youtube_search import format_youtube_results
+import webdriver_pool
+
+
+def get_search_page_pool():
+    """검색 결과 페이지 다운로드용 헤드리스 Chrome 풀"""
+    return webdriver_pool.get_pool("ide_search", lambda: webdriver_pool.create_chrome(
+        webdriver_pool.chrome_options(
+            window_size="1920,1080",
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        ),
+        page_load_timeout=30,
+    ))
 
 
 class SearchHandler:
@@ -119,22 +127,9 @@ class SearchHandler:
         try:
             use_selenium = any(host in url for host in ['search.naver.com', 'bing.com'])
             if use_selenium:
-                options = Options()
-                options.add_argument('--headless')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-gpu')
-                options.add_argument('--window-size=1920,1080')
-                options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-                options.add_argument('--disable-blink-features=AutomationControlled')
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                options.add_experimental_option('useAutomationExtension', False)
-
                 driver = None
                 try:
-                    service = Service(ChromeDriverManager().install())
-                    driver = webdriver.Chrome(service=service, options=options)
-                    driver.set_page_load_timeout(30)
+                    driver = get_search_page_pool().checkout()
                     driver.get(url)
 
                     try:
@@ -145,8 +140,7 @@ class SearchHandler:
 
                     page_source = driver.page_source
                 finally:
-                    if driver:
-                        driver.quit()
+                    get_search_page_pool().checkin(driver)
 
                 soup = BeautifulSoup(page_source, 'html.parser')
             else:
@@ -25,7 +25,6 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
 # 로깅 설정
 LOG_FILE = "data/ollama_chat/debug.log"
@@ -62,6 +61,9 @@ from search import (
 )
 from search.naver_search import format_search_results
 from search.youtube_search import format_youtube_results
+import nbcore
+import ollama_client
+import webdriver_pool
 
 OLLAMA_URL = "http://localhost:11434"
 NB_API_URL = os.getenv("NB_API_URL", "http://localhost:3000")
@@ -69,11 +71,23 @@ AUTO_UPLOAD_DATA = os.getenv("AUTO_UPLOAD_DATA", "1") == "1"
 DATABASE_BASE_URL = os.getenv("DATABASE_BASE_URL", "https://xn--9l4b4xi9r.com")
 AJAX_SAVE_ENABLED = os.getenv("AJAX_SAVE_ENABLED", "1") == "1"
 SAVE_LOCAL_SUMMARY = os.getenv("SAVE_LOCAL_SUMMARY", "0") == "1"
+NB_LEGACY_TREE = os.getenv("NB_LEGACY_TREE", "0") == "1"
 HISTORY_DIR = "data/ollama_chat"
 ROTATION_FILE = os.path.join(HISTORY_DIR, "model_rotation.json")
 os.makedirs(HISTORY_DIR, exist_ok=True)
 
 
+def get_search_page_pool():
+    """검색 결과 페이지 다운로드용 헤드리스 Chrome 풀"""
+    return webdriver_pool.get_pool("ide_search", lambda: webdriver_pool.create_chrome(
+        webdriver_pool.chrome_options(
+            window_size="1920,1080",
+            user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+        ),
+        page_load_timeout=30,
+    ))
+
+
 def clean_text_simple(text: str) -> str:
     """텍스트에서 특수문자와 HTML 태그 제거"""
     if not text:
@@ -115,6 +129,7 @@ class OllamaIDE:
         self.repeat_message = ""
         self.repeat_force_search = False
         self.batch_active = False
+        self._set_ollama_priority()
         self.batch_items = []
         self.batch_index = 0
         self.batch_interval = 2.0
@@ -336,41 +351,24 @@ class OllamaIDE:
         if not calculations:
             return
 
-        for calc in calculations:
-            try:
-                calc_id = calc.get('id') or calc.get('calculation_id')
-                if not calc_id:
-                    continue
-
-                results = calc.get('results') or []
-                if not results:
-                    continue
-
-                nb_max = results[0].get('nb_max')
-                nb_min = results[0].get('nb_min')
-                if nb_max is None or nb_min is None:
-                    continue
-
-                max_path = self.number_to_path(nb_max)
-                min_path = self.number_to_path(nb_min)
-
-                self.add_detail_log('paths', f"nb_max: {max_path}")
-                self.add_detail_log('paths', f"nb_min: {min_path}")
-
-
-                max_dir = os.path.join(nb_max_dir, max_path)
-                min_dir = os.path.join(nb_min_dir, min_path)
-                os.makedirs(max_dir, exist_ok=True)
-                os.makedirs(min_dir, exist_ok=True)
+        # 결과 저장소(data/nb_store)에 한 번에 추가, 폴더 구조는 업로드 전에 내보냄
+        try:
+            store = nbcore.open_store(os.path.join(os.path.dirname(nb_max_dir), 'nb_store'))
+            recnos = store.append_many(calculations)
+        except Exception as e:
+            log_debug(f"[저장 오류] 결과 저장소 저장 실패: {e}")
+            return
 
-                payload = json.dumps(calc, ensure_ascii=False, indent=2)
-                max_file = os.path.join(max_dir, "results.json")
-                min_file = os.path.join(min_dir, "results.json")
+        for calc, recno in zip(calculations, recnos):
+            if recno is None:
+                continue
+            first = calc['results'][0]
+            self.add_detail_log('paths', f"nb_max: {self.number_to_path(first['nb_max'])}")
+            self.add_detail_log('paths', f"nb_min: {self.number_to_path(first['nb_min'])}")
 
-                with open(max_file, 'w', encoding='utf-8') as f:
-                    f.write(payload)
-                with open(min_file, 'w', encoding='utf-8') as f:
-                    f.write(payload)
+        if NB_LEGACY_TREE:
+            try:
+                store.export_pending(nb_max_dir, nb_min_dir)
             except Exception as e:
                 log_debug(f"[저장 오류] 경로 저장 실패: {e}")
 
@@ -381,7 +379,8 @@ class OllamaIDE:
 
         for item in items:
             try:
-                unicode_array = [ord(ch) for ch in item]
+                # 서버(charCodeAt)와 같은 코드 배열로 기존 결과 검색
+                unicode_array = nbcore.js_char_codes(item)
 
                 self.add_detail_log('calc', f"요청: {item}")
 
@@ -433,7 +432,7 @@ class OllamaIDE:
             except Exception as e:
                 log_debug(f"[저장 오류] N/B 계산 실패: {e}")
                 self.add_detail_log('calc', f"실패: {item}")
-                results.append({
+                failed = {
                     'id': None,
                     'calculation_id': None,
                     'timestamp': None,
@@ -444,7 +443,17 @@ class OllamaIDE:
                     'view_count': 0,
                     'results': [],
                     'saved': False
-                })
+                }
+                # 서버 없이도 같은 공식(calculate.js)으로 값 확인 (저장되지 않음, 실패해도 이 항목만 건너뜀)
+                try:
+                    local = nbcore.calculate_web_result(item)
+                    local_max = local['results'][0]['nb_max']
+                    local_min = local['results'][0]['nb_min']
+                    self.add_detail_log('calc', f"로컬 계산: MAX {local_max} MIN {local_min}")
+                    failed['local_results'] = local['results']
+                except Exception as local_error:
+                    log_debug(f"[저장 오류] 로컬 N/B 계산 실패: {local_error}")
+                results.append(failed)
 
         return results
 
@@ -453,6 +462,16 @@ class OllamaIDE:
             self.notify_system("⏭️ 데이터 업로드 생략됨")
             return
 
+        # 웹 서버가 읽는 data/nb_max, data/nb_min 폴더 구조에 새 결과 반영
+        try:
+            data_dir = os.path.join(root_dir, 'data')
+            store = nbcore.open_store(os.path.join(data_dir, 'nb_store'))
+            exported = store.export_pending(os.path.join(data_dir, 'nb_max'), os.path.join(data_dir, 'nb_min'))
+            if exported:
+                self.add_detail_log('upload', f"결과 내보내기: {exported}건")
+        except Exception as e:
+            log_debug(f"[저장 오류] 결과 내보내기 실패: {e}")
+
         script_path = os.path.join(root_dir, 'sync_data_only.bat')
         if not os.path.exists(script_path):
             self.notify_system("⚠️ 데이터 업로드 스크립트 없음")
@@ -938,10 +957,7 @@ class OllamaIDE:
     def load_models(self):
         """모델 로드"""
         try:
-            response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=5)
-            response.raise_for_status()
-            data = response.json()
-            models = [m['name'] for m in data.get('models', [])]
+            models = ollama_client.get_client(OLLAMA_URL).list_models(timeout=5)
             
             if models:
                 self.model_combo['values'] = models
@@ -1013,7 +1029,7 @@ class OllamaIDE:
         self._save_model_rotation()
         return models[self.model_rotation["index"]]
 
-    def _ollama_generate(self, prompt, timeout=120, options=None):
+    def _ollama_generate(self, prompt, timeout=120, options=None, cache=False):
         models = []
         if self.model_rotation and self.model_rotation.get("models"):
             models = self.model_rotation["models"]
@@ -1042,25 +1058,22 @@ class OllamaIDE:
                 payload["options"] = options
 
             try:
-                response = requests.post(
-                    f"{OLLAMA_URL}/api/generate",
-                    json=payload,
-                    timeout=timeout
+                # 429/5xx는 아래에서 모델을 바꿔 재시도하므로 클라이언트 재시도는 끔
+                result = ollama_client.get_client(OLLAMA_URL).generate_payload(
+                    payload, timeout=timeout, retries=0, cache=cache
                 )
-                if response.status_code in (429, 500, 502, 503, 504):
-                    raise requests.HTTPError(
-                        f"{response.status_code} {response.reason}",
-                        response=response
-                    )
-                response.raise_for_status()
-                data = response.json()
+                if result.cached:
+                    log_debug(f"[LLM 캐시] {ollama_client.get_cache().summary_line()}")
+                if result.queue_wait >= 1:
+                    log_debug(f"[Ollama 대기열] {result.queue_wait:.1f}초 대기 후 실행")
+                data = result.json()
                 if model != self.current_model:
                     self._set_current_model(model, notify=True)
                 else:
                     self._set_current_model(model)
                 return data
             except requests.HTTPError as e:
-                status = e.response.status_code if e.response else None
+                status = e.response.status_code if e.response is not None else None
                 if status in (429, 500, 502, 503, 504):
                     last_error = str(e)
                     delay = base_delay * (2 ** attempt) + random.uniform(0, 0.5)
@@ -1611,8 +1624,6 @@ class OllamaIDE:
 
     def generate_question_from_report(self, model: str) -> str:
         """최신 YouTube 보고서를 분석해서 질문형 문장 1개 생성"""
-        import requests
-        
         root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         reports_dir = os.path.join(root_dir, 'youtube', 'reports')
         
@@ -1672,22 +1683,15 @@ class OllamaIDE:
 검색 질문:"""
         
         try:
-            response = requests.post(
-                "http://localhost:11434/api/generate",
-                json={{
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {{
-                        "temperature": 0.5,
-                        "num_predict": 100,
-                    }}
-                }},
+            question = ollama_client.get_client(OLLAMA_URL).generate_text(
+                model,
+                prompt,
+                options={
+                    "temperature": 0.5,
+                    "num_predict": 100,
+                },
                 timeout=60
             )
-            response.raise_for_status()
-            result = response.json()
-            question = result.get("response", "").strip()
             
             if question and len(question) > 5:
                 return question
@@ -1888,8 +1892,14 @@ class OllamaIDE:
 
         return keywords
 
+    def _set_ollama_priority(self):
+        """일괄 실행 중이면 배치, 아니면 대화형 우선순위로 Ollama 입장 대기열에 들어감"""
+        client = ollama_client.get_client(OLLAMA_URL)
+        client.priority = ollama_client.BATCH if self.batch_active else ollama_client.INTERACTIVE
+
     def start_batch(self, items: list, interval: float, search_mode: bool = False, infinite_loop: bool = False):
         self.batch_active = True
+        self._set_ollama_priority()
         self.batch_items = items
         self.batch_index = 0
         self.batch_interval = interval
@@ -1907,6 +1917,7 @@ class OllamaIDE:
     def stop_batch(self):
         if self.batch_active:
             self.batch_active = False
+            self._set_ollama_priority()
             self.batch_items = []
             self.batch_index = 0
             self.display_message("system", "⏹️ 트렌드 일괄 실행 중단")
@@ -1922,7 +1933,19 @@ class OllamaIDE:
                 self.display_message("system", "🔄 처음부터 다시 시작합니다...")
             else:
                 self.batch_active = False
+                self._set_ollama_priority()
                 self.display_message("system", "✅ 트렌드 일괄 실행 완료")
+                llm_cache = ollama_client.get_cache()
+                if llm_cache:
+                    self.display_message("system", f"🗂️ {llm_cache.summary_line()}")
+                queue = ollama_client.get_client(OLLAMA_URL).admission
+                if queue:
+                    status, stats = queue.status(), queue.snapshot_stats()
+                    self.display_message(
+                        "system",
+                        f"🚦 Ollama 대기열: 사용 중 {status['in_flight']}/{status['max_in_flight']}, "
+                        f"대기 {status['waiting']}건, 평균 대기 {stats['wait_avg']}초 (최대 {stats['wait_max']}초)",
+                    )
                 return
 
         if self.is_generating:
@@ -1936,6 +1959,7 @@ class OllamaIDE:
             started = self.process_user_message(keyword)
         if not started:
             self.batch_active = False
+            self._set_ollama_priority()
             self.display_message("system", "⚠️ 트렌드 일괄 실행이 중단되었습니다.")
             return
 
@@ -2200,22 +2224,9 @@ class OllamaIDE:
         try:
             use_selenium = any(host in url for host in ['search.naver.com', 'bing.com'])
             if use_selenium:
-                options = Options()
-                options.add_argument('--headless')
-                options.add_argument('--no-sandbox')
-                options.add_argument('--disable-dev-shm-usage')
-                options.add_argument('--disable-gpu')
-                options.add_argument('--window-size=1920,1080')
-                options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-                options.add_argument('--disable-blink-features=AutomationControlled')
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                options.add_experimental_option('useAutomationExtension', False)
-
                 driver = None
                 try:
-                    service = Service(ChromeDriverManager().install())
-                    driver = webdriver.Chrome(service=service, options=options)
-                    driver.set_page_load_timeout(30)
+                    driver = get_search_page_pool().checkout()
                     driver.get(url)
 
                     try:
@@ -2226,8 +2237,7 @@ class OllamaIDE:
 
                     page_source = driver.page_source
                 finally:
-                    if driver:
-                        driver.quit()
+                    get_search_page_pool().checkin(driver)
 
                 soup = BeautifulSoup(page_source, 'html.parser')
             else:
@@ -2485,7 +2495,8 @@ class OllamaIDE:
                 options={
                     "temperature": 0.1,  # 낮은 temperature로 일관성 향상
                     "num_predict": 20
-                }
+                },
+                cache=True,
             )
             category = data.get('response', '일반').strip()
             
@@ -2895,7 +2906,7 @@ class OllamaIDE:
             chrome_options.add_experimental_option('useAutomationExtension', False)
             
             log_debug("[Selenium] Chrome 드라이버 초기화 중...")
-            service = Service(ChromeDriverManager().install())
+            service = Service(webdriver_pool.chromedriver_path())
             driver = webdriver.Chrome(service=service, options=chrome_options)
             
             log_debug(f"[Selenium] URL 로드: {url}")
@@ -0,0 +1,50 @@
+"""
+N/B 계산 공통 모듈
+8BIT 계산기, YouTube 모니터, IDE가 함께 사용하는 N/B MAX/MIN 계산 기능 제공
+
+하위 모듈(NumPy 등)은 처음 사용하는 시점에 import 된다.
+"""
+
+import importlib
+
+# 공개 이름 -> 하위 모듈
+_EXPORTS = {
+    'calculate_bit': 'engine',
+    'calculate_bit_loop': 'engine',
+    'calculate_bit_vectorized': 'engine',
+    'calculate_bit_many': 'engine',
+    'calculate_bit_both': 'engine',
+    'calculate_many': 'engine',
+    'can_vectorize': 'engine',
+    'first_bucket_indices': 'engine',
+    'initialize_arrays': 'engine',
+    'NBResultCache': 'engine',
+    'RESULT_CACHE': 'engine',
+    'NBIndex': 'index',
+    'IncrementalNBScorer': 'stream',
+    'NBResultStore': 'store',
+    'open_store': 'store',
+    'calculate_web_nb': 'web',
+    'calculate_web_result': 'web',
+    'js_char_codes': 'web',
+    'to_fixed': 'web',
+}
+
+_SUBMODULES = ('batch', 'bench', 'engine', 'index', 'store', 'stream', 'web')
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
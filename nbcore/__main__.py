@@ -0,0 +1,10 @@
+"""
+python -m nbcore : N/B 대량 재계산 CLI (nbcore.batch)
+"""
+
+import sys
+
+from nbcore.batch import main
+
+if __name__ == '__main__':
+    sys.exit(main())
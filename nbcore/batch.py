@@ -0,0 +1,252 @@
+"""
+N/B 대량 재계산 (멀티 프로세스)
+
+data/nb_max, data/nb_min 결과 파일이나 youtube/reports 보고서 JSON처럼 많은
+입력을 다시 계산할 때 사용한다. 입력은 스트리밍으로 읽어 값 개수 기준 청크로
+묶은 뒤 ProcessPoolExecutor에 보내고, 결과는 입력 순서대로 JSONL로 쓴다.
+
+사용법:
+    python -m nbcore data/nb_max --output nb_max_rescored.jsonl --workers 8
+    python -m nbcore youtube/reports --method bit
+    cat sequences.jsonl | python -m nbcore - --workers 4
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from nbcore import engine, web
+
+# 청크 하나에 담는 값 개수 (작으면 피클링/프로세스 왕복 비용이 커짐)
+DEFAULT_CHUNK_VALUES = 50000
+# 청크 하나의 최대 시퀀스 수
+DEFAULT_CHUNK_RECORDS = 2000
+# 진행 표시 간격 (초)
+PROGRESS_INTERVAL = 0.5
+METHODS = ('auto', 'bit', 'web')
+BIT_DEFAULT = 5.5
+
+
+def _iter_json_file(path):
+    """JSON 파일(객체/배열) 또는 JSONL 파일의 레코드를 순서대로 반환"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith('.jsonl'):
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+            return
+        data = json.load(f)
+    if isinstance(data, list) and not all(isinstance(item, (int, float)) for item in data):
+        yield from data
+    elif data != []:  # 빈 배열은 계산할 값이 없으므로 건너뜀
+        yield data
+
+
+def _iter_paths(paths):
+    """파일/폴더 경로 목록을 JSON/JSONL 파일 경로로 펼침 (폴더는 정렬 순서로 탐색)"""
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith(('.json', '.jsonl')):
+                        yield os.path.join(dirpath, filename)
+        else:
+            yield path
+
+
+def expand_record(record, source, method='auto'):
+    """레코드 하나를 계산 작업 목록으로 변환
+
+    지원 형식:
+    - 숫자 배열
+    - 결과 파일(results.json): unicode + bit -> calculate.js 방식
+    - 모니터 보고서: keywords[].views -> calculateBit 방식 (키워드별 1건)
+    - views / nb / values 키를 가진 객체
+    """
+    if isinstance(record, list):
+        yield _job(source, None, record, None, method, 'bit')
+        return
+    if not isinstance(record, dict):
+        return
+    if isinstance(record.get('keywords'), list):
+        for keyword in record['keywords']:
+            if isinstance(keyword, dict) and isinstance(keyword.get('views'), list):
+                meta = {'keyword': keyword.get('keyword')}
+                yield _job(source, meta, keyword['views'], None, method, 'bit')
+        return
+    meta = {'id': record['id']} if 'id' in record else None
+    if isinstance(record.get('unicode'), list):
+        yield _job(source, meta, record['unicode'], record.get('bit'), method, 'web')
+        return
+    for key in ('views', 'nb', 'values'):
+        if isinstance(record.get(key), list):
+            yield _job(source, meta, record[key], record.get('bit'), method, 'bit')
+            return
+
+
+def _job(source, meta, values, bit, method, auto_method):
+    method = auto_method if method == 'auto' else method
+    if bit is None:
+        bit = web.WEB_BIT_DEFAULT if method == 'web' else BIT_DEFAULT
+    return {'source': source, 'meta': meta, 'values': values, 'bit': bit, 'method': method}
+
+
+def iter_jobs(paths, method='auto'):
+    """입력 경로('-'는 표준 입력 JSONL)에서 계산 작업을 스트리밍"""
+    for path in paths:
+        if path == '-':
+            for line_no, line in enumerate(sys.stdin, 1):
+                line = line.strip()
+                if line:
+                    yield from expand_record(json.loads(line), f"<stdin>:{line_no}", method)
+            continue
+        for file_path in _iter_paths([path]):
+            try:
+                for record in _iter_json_file(file_path):
+                    yield from expand_record(record, file_path, method)
+            except (OSError, ValueError) as e:
+                print(f"\n⚠️ 읽기 실패: {file_path} ({e})", file=sys.stderr)
+
+
+def iter_chunks(jobs, chunk_values=DEFAULT_CHUNK_VALUES, chunk_records=DEFAULT_CHUNK_RECORDS):
+    """값 개수/시퀀스 수 기준으로 작업을 청크로 묶음"""
+    chunk = []
+    values = 0
+    for job in jobs:
+        chunk.append(job)
+        values += len(job['values'])
+        if values >= chunk_values or len(chunk) >= chunk_records:
+            yield chunk
+            chunk = []
+            values = 0
+    if chunk:
+        yield chunk
+
+
+def score_chunk(payload):
+    """청크 계산 (작업 프로세스에서 실행). payload = [(방식, bit, 값 목록), ...]
+
+    calculateBit 방식은 같은 bit끼리 묶어 배치 계산하고 (캐시 미사용),
+    calculate.js 방식은 시퀀스별로 계산한다. 결과는 (MAX, MIN) 목록.
+    """
+    results = [None] * len(payload)
+    groups = {}
+    for index, (method, bit, values) in enumerate(payload):
+        if method == 'web':
+            results[index] = (
+                web.to_fixed(web.calculate_web_nb(values, bit, False)),
+                web.to_fixed(web.calculate_web_nb(values, bit, True))
+            )
+        else:
+            groups.setdefault(bit, []).append(index)
+    for bit, indices in groups.items():
+        sequences = [payload[index][2] for index in indices]
+        bit_max, bit_min = engine.calculate_bit_both(sequences, bit, cache=None)
+        for index, max_value, min_value in zip(indices, bit_max, bit_min):
+            results[index] = (float(max_value), float(min_value))
+    return results
+
+
+def _payload(chunk):
+    return [(job['method'], job['bit'], job['values']) for job in chunk]
+
+
+def score_jobs(jobs, workers=None, chunk_values=DEFAULT_CHUNK_VALUES, chunk_records=DEFAULT_CHUNK_RECORDS):
+    """(작업, (MAX, MIN))을 입력 순서대로 반환
+
+    workers가 1이면 현재 프로세스에서 계산한다. 그 외에는 프로세스 풀에
+    청크를 보내되 메모리 사용을 제한하기 위해 작업자 수의 2배까지만 미리 보낸다.
+    """
+    chunks = iter_chunks(jobs, chunk_values, chunk_records)
+    if workers == 1:
+        for chunk in chunks:
+            yield from zip(chunk, score_chunk(_payload(chunk)))
+        return
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(score_chunk, _payload(chunk))))
+            if len(pending) >= max_pending:
+                chunk, future = pending.popleft()
+                yield from zip(chunk, future.result())
+        while pending:
+            chunk, future = pending.popleft()
+            yield from zip(chunk, future.result())
+
+
+def _finite_or_none(value):
+    """NaN/inf는 표준 JSON에 쓸 수 없으므로 null로 기록"""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def format_result(index, job, scores):
+    """JSONL 출력 한 줄에 해당하는 dict"""
+    nb_max, nb_min = scores
+    line = {
+        'index': index,
+        'source': job['source'],
+        'method': job['method'],
+        'bit': _finite_or_none(job['bit']),
+        'count': len(job['values']),
+        'nb_max': _finite_or_none(nb_max),
+        'nb_min': _finite_or_none(nb_min),
+    }
+    if job['meta']:
+        line.update(job['meta'])
+    return line
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="N/B 대량 재계산 (JSON/JSONL 입력 -> JSONL 출력)")
+    parser.add_argument('inputs', nargs='+', help="JSON/JSONL 파일 또는 폴더 ('-'는 표준 입력 JSONL)")
+    parser.add_argument('--method', choices=METHODS, default='auto',
+                        help="auto: unicode 입력은 calculate.js 방식, 조회수/숫자 배열은 calculateBit 방식")
+    parser.add_argument('--workers', type=int, default=None, help="작업 프로세스 수 (기본: CPU 수, 1이면 단일 프로세스)")
+    parser.add_argument('--chunk-values', type=int, default=DEFAULT_CHUNK_VALUES, help="청크당 값 개수")
+    parser.add_argument('--chunk-records', type=int, default=DEFAULT_CHUNK_RECORDS, help="청크당 최대 시퀀스 수")
+    parser.add_argument('--output', help="결과 JSONL 경로 (미지정 시 표준 출력)")
+    parser.add_argument('--quiet', action='store_true', help="진행 표시 생략")
+    args = parser.parse_args(argv)
+
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    started = time.time()
+    last_report = 0.0
+    done = 0
+    try:
+        results = score_jobs(iter_jobs(args.inputs, args.method), args.workers,
+                             args.chunk_values, args.chunk_records)
+        for done, (job, scores) in enumerate(results, 1):
+            out.write(json.dumps(format_result(done - 1, job, scores), ensure_ascii=False, allow_nan=False) + '\n')
+            now = time.time()
+            if not args.quiet and now - last_report >= PROGRESS_INTERVAL:
+                last_report = now
+                rate = done / max(now - started, 1e-9)
+                print(f"\r⏳ 진행: {done:,}건 ({rate:,.0f}건/초)", end='', file=sys.stderr, flush=True)
+    finally:
+        if args.output:
+            out.close()
+
+    if not args.quiet:
+        elapsed = time.time() - started
+        print(f"\r✅ 완료: {done:,}건, {elapsed:.1f}초", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
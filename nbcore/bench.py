@@ -0,0 +1,373 @@
+"""
+N/B 계산 벤치마크 (Python / JavaScript 구현 비교)
+
+입력 종류(조회수 정수, 유니코드 코드 배열, 부호 혼합 실수)와 크기(2 ~ 10k)별로
+구현마다 처리량, p50/p99 지연 시간, 최대 메모리 사용량을 측정하고
+같은 알고리즘 계열의 기준 구현과 결과 차이(drift)를 비교해 JSON으로 출력한다.
+
+사용법:
+    python -m nbcore.bench --output bench.json
+    python -m nbcore.bench --sizes 2 100 1000 --repeats 5 --compare bench.json
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from nbcore import engine, web
+
+DEFAULT_SIZES = [2, 10, 100, 1000, 10000]
+DEFAULT_REPEATS = 20
+DEFAULT_SEED = 20240101
+INPUT_KINDS = ('views', 'unicode', 'mixed')
+# 루프 기준 구현(O(n^2))을 실행하는 최대 입력 크기
+DEFAULT_LOOP_MAX_SIZE = 100
+# 이전 결과 대비 p50 지연 시간이 이 배율 이상 늘면 회귀로 표시
+REGRESSION_RATIO = 1.2
+
+CALCULATE_JS = os.path.join(ROOT_DIR, 'web', 'calculate.js')
+NB_CALCULATION_PY = os.path.join(ROOT_DIR, '8BIT', 'nb_calculation.py')
+
+# 반복마다 calculateNB MAX/MIN 계산 시간을 재고 결과와 힙 최대값 반환
+NODE_SCRIPT = r'''
+const { calculateNB } = require(process.argv[1]);
+let data = '';
+process.stdin.on('data', d => data += d);
+process.stdin.on('end', () => {
+    const job = JSON.parse(data);
+    const results = [];
+    const latencies = [];
+    let heapPeak = 0;
+    for (const nb of job.cases) {
+        const start = process.hrtime.bigint();
+        const pair = [calculateNB(nb, job.bit, false), calculateNB(nb, job.bit, true)];
+        latencies.push(Number(process.hrtime.bigint() - start) / 1e9);
+        heapPeak = Math.max(heapPeak, process.memoryUsage().heapUsed);
+        results.push(pair);
+    }
+    process.stdout.write(JSON.stringify({ results, latencies, heap_peak: heapPeak }));
+});
+'''
+
+TEXT_SAMPLE = (
+    "오늘의 주요 뉴스 정치 주식 비트코인 속보 논란 HANKOOK INTERNET 참소식 "
+    "경제 환율 금리 반도체 0123456789 !?#%&"
+)
+
+
+def generate_inputs(kind, size, count, rng):
+    """입력 종류별 시퀀스 count개 생성"""
+    cases = []
+    for _ in range(count):
+        if kind == 'views':
+            # 조회수처럼 한쪽으로 치우친 정수 분포
+            cases.append([int(rng.lognormvariate(8, 2.5)) for _ in range(size)])
+        elif kind == 'unicode':
+            cases.append(web.js_char_codes(''.join(rng.choice(TEXT_SAMPLE) for _ in range(size))))
+        elif kind == 'mixed':
+            cases.append([rng.uniform(-1000, 1000) for _ in range(size)])
+        else:
+            raise ValueError(f"알 수 없는 입력 종류: {kind}")
+    return cases
+
+
+def percentile(samples, fraction):
+    """최근접 순위(nearest-rank) 백분위수"""
+    ordered = sorted(samples)
+    rank = max(math.ceil(fraction * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def _load_nb_calculator():
+    """8BIT/nb_calculation.py의 NBCalculator 로드 (폴더명이 숫자로 시작해 경로로 import)"""
+    spec = importlib.util.spec_from_file_location('nb_calculation', NB_CALCULATION_PY)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.NBCalculator()
+
+
+def _load_monitor_score():
+    """YouTube 모니터의 calculate_nb_score 로드 (requests 미설치 시 ImportError)"""
+    youtube_dir = os.path.join(ROOT_DIR, 'youtube')
+    if youtube_dir not in sys.path:
+        sys.path.insert(0, youtube_dir)
+    import continuous_youtube_monitor
+    return continuous_youtube_monitor.calculate_nb_score
+
+
+def python_implementations(loop_max_size):
+    """(이름, 계열, 계산 함수, 최대 크기, 허용 오차, 로드 실패 사유) 목록
+
+    계산 함수는 값 목록을 받아 (MAX, MIN)을 반환한다.
+    계열별 첫 구현이 결과 비교 기준이다.
+    """
+    bit = 5.5
+    web_bit = web.WEB_BIT_DEFAULT
+    impls = [
+        ('engine.calculate_bit_loop', 'bitcalc',
+         lambda nb: (engine.calculate_bit_loop(nb, bit, False), engine.calculate_bit_loop(nb, bit, True)),
+         loop_max_size, 0.0, None),
+        ('engine.calculate_bit', 'bitcalc',
+         lambda nb: (engine.calculate_bit(nb, bit, False), engine.calculate_bit(nb, bit, True)),
+         None, 0.0, None),
+    ]
+
+    try:
+        calculator = _load_nb_calculator()
+    except ImportError as e:
+        impls.append(('8BIT.NBCalculator.calculate_bit', 'bitcalc', None, None, 0.0, str(e)))
+    else:
+        impls.append((
+            '8BIT.NBCalculator.calculate_bit', 'bitcalc',
+            lambda nb: (calculator.calculate_bit(nb, bit, False), calculator.calculate_bit(nb, bit, True)),
+            None, 0.0, None
+        ))
+
+    try:
+        monitor_score = _load_monitor_score()
+    except ImportError as e:
+        impls.append(('youtube.calculate_nb_score', 'bitcalc', None, None, 0.0, str(e)))
+    else:
+        def monitor_pair(nb):
+            data = monitor_score(nb)
+            return data['max'], data['min']
+        # 모니터 결과는 소수 4자리 반올림 (범위 밖 결과는 0 / 0.0001로 대체)
+        impls.append(('youtube.calculate_nb_score', 'bitcalc', monitor_pair, None, 5e-5, None))
+
+    impls.extend([
+        ('web.calculate_web_nb_loop', 'web',
+         lambda nb: (web.calculate_web_nb_loop(nb, web_bit, False), web.calculate_web_nb_loop(nb, web_bit, True)),
+         None, 0.0, None),
+        ('web.calculate_web_nb', 'web',
+         lambda nb: (web.calculate_web_nb(nb, web_bit, False), web.calculate_web_nb(nb, web_bit, True)),
+         None, 0.0, None),
+    ])
+    return impls
+
+
+def measure_python(func, cases):
+    """호출별 지연 시간과 결과 측정 후 tracemalloc으로 최대 메모리 측정 (별도 실행)"""
+    results = []
+    latencies = []
+    for nb in cases:
+        start = time.perf_counter()
+        results.append(func(nb))
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func(cases[0])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return results, latencies, peak
+
+
+def measure_node(node, cases, bit):
+    """node로 web/calculate.js calculateNB 실행 (지연 시간은 node 내부에서 측정)"""
+    completed = subprocess.run(
+        [node, '-e', NODE_SCRIPT, CALCULATE_JS],
+        input=json.dumps({'cases': cases, 'bit': bit}),
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        check=True
+    )
+    output = json.loads(completed.stdout)
+    results = [tuple(math.nan if value is None else value for value in pair) for pair in output['results']]
+    return results, output['latencies'], output['heap_peak']
+
+
+def compare_results(results, reference):
+    """기준 결과 대비 최대 절대/상대 차이 (NaN/inf 위치가 다르면 inf)"""
+    max_abs = 0.0
+    max_rel = 0.0
+    for pair, ref_pair in zip(results, reference):
+        for value, expected in zip(pair, ref_pair):
+            if value == expected or (math.isnan(value) and math.isnan(expected)):
+                continue
+            diff = abs(value - expected)
+            if not math.isfinite(diff):
+                return math.inf, math.inf
+            max_abs = max(max_abs, diff)
+            max_rel = max(max_rel, diff / max(abs(expected), 1e-300))
+    return max_abs, max_rel
+
+
+def summarize(name, family, kind, size, results, latencies, peak, reference, tolerance, runtime='python'):
+    """측정값 한 건을 JSON 항목으로 정리"""
+    total = sum(latencies)
+    entry = {
+        'implementation': name,
+        'family': family,
+        'runtime': runtime,
+        'kind': kind,
+        'size': size,
+        'calls': len(latencies),
+        'total_s': total,
+        'calls_per_s': len(latencies) / total if total > 0 else None,
+        'values_per_s': len(latencies) * size / total if total > 0 else None,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'peak_memory_bytes': peak,
+        'reference': None,
+        'max_abs_drift': None,
+        'max_rel_drift': None,
+        'drift': False,
+    }
+    if reference is not None:
+        ref_name, ref_results = reference
+        max_abs, max_rel = compare_results(results, ref_results)
+        # 표준 JSON에는 inf가 없으므로 null로 기록하고 drift로 표시
+        entry.update({
+            'reference': ref_name,
+            'max_abs_drift': max_abs if math.isfinite(max_abs) else None,
+            'max_rel_drift': max_rel if math.isfinite(max_rel) else None,
+            'drift': not math.isfinite(max_abs) or max_abs > tolerance,
+        })
+    return entry
+
+
+def run_benchmark(sizes=None, kinds=INPUT_KINDS, repeats=DEFAULT_REPEATS, seed=DEFAULT_SEED,
+                  loop_max_size=DEFAULT_LOOP_MAX_SIZE, use_node=True, log=print):
+    """전체 벤치마크 실행 후 JSON 직렬화 가능한 결과 반환"""
+    sizes = sizes or DEFAULT_SIZES
+    impls = python_implementations(loop_max_size)
+    node = shutil.which('node') if use_node else None
+
+    entries = []
+    skipped = [
+        {'implementation': name, 'reason': reason}
+        for name, _, func, _, _, reason in impls if func is None
+    ]
+    if use_node and not node:
+        skipped.append({'implementation': 'web/calculate.js calculateNB', 'reason': 'node 미설치'})
+
+    for kind in kinds:
+        for size in sizes:
+            # 입력은 (종류, 크기)별로 고정 시드에서 생성해 실행 간 비교 가능하게 유지
+            rng = random.Random(f"{seed}:{kind}:{size}")
+            cases = generate_inputs(kind, size, repeats, rng)
+            references = {}
+            for name, family, func, max_size, tolerance, _ in impls:
+                if func is None or (max_size is not None and size > max_size):
+                    continue
+                results, latencies, peak = measure_python(func, cases)
+                entry = summarize(name, family, kind, size, results, latencies, peak,
+                                  references.get(family), tolerance)
+                references.setdefault(family, (name, results))
+                entries.append(entry)
+                log(_format_entry(entry))
+            if node:
+                results, latencies, peak = measure_node(node, cases, web.WEB_BIT_DEFAULT)
+                entry = summarize('web/calculate.js calculateNB', 'web', kind, size, results, latencies,
+                                  peak, references.get('web'), 0.0, runtime='node')
+                entries.append(entry)
+                log(_format_entry(entry))
+
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': getattr(engine.np, '__version__', None),
+            'node': _node_version(node),
+            'platform': platform.platform(),
+            'sizes': sizes,
+            'kinds': list(kinds),
+            'repeats': repeats,
+            'seed': seed,
+            'loop_max_size': loop_max_size,
+        },
+        'results': entries,
+        'skipped': skipped,
+        'drift_count': sum(1 for entry in entries if entry['drift']),
+    }
+
+
+def _node_version(node):
+    if not node:
+        return None
+    completed = subprocess.run([node, '--version'], capture_output=True, text=True)
+    return completed.stdout.strip() or None
+
+
+def _format_entry(entry):
+    drift = ''
+    if entry['reference'] is not None:
+        max_abs = entry['max_abs_drift']
+        drift = (f" drift={max_abs:.3g}" if max_abs is not None else " drift=inf") + (" ⚠️ DRIFT" if entry['drift'] else "")
+    return (
+        f"  {entry['kind']:<7} n={entry['size']:<6} {entry['implementation']:<34} "
+        f"p50={entry['p50_ms']:.3f}ms p99={entry['p99_ms']:.3f}ms "
+        f"mem={entry['peak_memory_bytes'] / 1024:.0f}KiB{drift}"
+    )
+
+
+def find_regressions(current, previous, ratio=REGRESSION_RATIO):
+    """이전 결과 대비 p50 지연 시간이 ratio배 이상 늘어난 항목"""
+    key = lambda entry: (entry['implementation'], entry['kind'], entry['size'])
+    before = {key(entry): entry for entry in previous.get('results', [])}
+    regressions = []
+    for entry in current['results']:
+        old = before.get(key(entry))
+        if old and old['p50_ms'] > 0 and entry['p50_ms'] / old['p50_ms'] >= ratio:
+            regressions.append({
+                'implementation': entry['implementation'],
+                'kind': entry['kind'],
+                'size': entry['size'],
+                'previous_p50_ms': old['p50_ms'],
+                'p50_ms': entry['p50_ms'],
+                'ratio': entry['p50_ms'] / old['p50_ms'],
+            })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="N/B 계산 벤치마크 (처리량/지연/메모리/결과 차이)")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="입력 크기 목록")
+    parser.add_argument('--kinds', nargs='+', choices=INPUT_KINDS, default=list(INPUT_KINDS), help="입력 종류")
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS, help="(종류, 크기)별 입력 개수")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="입력 생성 시드")
+    parser.add_argument('--loop-max-size', type=int, default=DEFAULT_LOOP_MAX_SIZE,
+                        help="루프 기준 구현을 실행할 최대 크기")
+    parser.add_argument('--no-node', action='store_true', help="web/calculate.js 측정 생략")
+    parser.add_argument('--output', help="결과 JSON 저장 경로 (미지정 시 표준 출력)")
+    parser.add_argument('--compare', help="이전 결과 JSON (p50 회귀 표시)")
+    args = parser.parse_args(argv)
+
+    log = lambda message: print(message, file=sys.stderr)
+    report = run_benchmark(args.sizes, args.kinds, args.repeats, args.seed,
+                           args.loop_max_size, not args.no_node, log=log)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            report['regressions'] = find_regressions(report, json.load(f))
+        for item in report['regressions']:
+            log(f"  ⚠️ 회귀: {item['implementation']} {item['kind']} n={item['size']} "
+                f"p50 {item['previous_p50_ms']:.3f}ms → {item['p50_ms']:.3f}ms ({item['ratio']:.2f}x)")
+
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+        log(f"💾 저장: {args.output}")
+    else:
+        print(text)
+    return 1 if report['drift_count'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,521 @@
+"""
+N/B 계산 엔진 (NumPy 벡터 계산 + 배치 계산 + LRU 캐시)
+
+8BIT/nb_calculation.py, youtube/continuous_youtube_monitor.py가 함께 사용하는
+calculateBit(bitCalculation.v.0.1.js) 알고리즘 구현.
+"""
+
+import threading
+from collections import OrderedDict
+from itertools import chain
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# NB50 구간 생성 상수 (값 하나당 COUNT개 구간)
+COUNT = 50
+# float64로 정확히 표현되는 정수 범위 (이 범위를 넘으면 루프 계산 사용)
+MAX_EXACT_INT = 2 ** 53
+# 배치 계산 시 한 번에 패딩하는 최대 셀 수 (행 수 x 최대 길이)
+BATCH_CELLS = 1 << 20
+# 배치 결과 캐시 기본 크기
+DEFAULT_CACHE_SIZE = 50000
+
+
+def can_vectorize(nb):
+    """NumPy 벡터 계산 결과가 루프 계산과 비트 단위로 같은 입력인지 확인
+    
+    len(nb) * max(|값|)이 2**53 미만이면 합계/정규화 중간값이 모두 정확한
+    정수로 표현되므로 float64 배열 계산이 파이썬 계산과 같아진다.
+    """
+    if np is None:
+        return False
+    try:
+        values = np.asarray(nb, dtype=np.float64)
+    except (OverflowError, TypeError, ValueError):
+        return False
+    if not np.isfinite(values).all():
+        return False
+    return len(nb) * float(np.abs(values).max(initial=0)) < MAX_EXACT_INT
+
+
+def vectorizable_rows(sequences):
+    """여러 시퀀스에 대해 can_vectorize를 한 번에 검사 (길이 1 이상 가정)
+    
+    (판정 배열, 이어 붙인 값 배열, 길이 배열)을 반환한다.
+    """
+    lengths = np.fromiter((len(seq) for seq in sequences), dtype=np.int64, count=len(sequences))
+    try:
+        flat = np.fromiter(chain.from_iterable(sequences), dtype=np.float64, count=int(lengths.sum()))
+    except (OverflowError, TypeError, ValueError):
+        flags = np.array([can_vectorize(seq) for seq in sequences], dtype=bool)
+        return flags, None, lengths
+    starts = np.cumsum(lengths) - lengths
+    finite = np.logical_and.reduceat(np.isfinite(flat), starts)
+    with np.errstate(invalid='ignore'):
+        max_abs = np.maximum.reduceat(np.abs(flat), starts)
+        flags = finite & (lengths * max_abs < MAX_EXACT_INT)
+    return flags, flat, lengths
+
+
+class NBResultCache:
+    """(tuple(values), bit, reverse) 키 기반 LRU 캐시"""
+    
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """캐시 조회 (없으면 None)"""
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def put(self, key, value):
+        """캐시 저장 (용량 초과 시 가장 오래된 항목 제거)"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        """캐시 및 통계 초기화"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self):
+        return len(self._data)
+    
+    def stats(self):
+        """캐시 통계"""
+        total = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0
+        }
+
+
+RESULT_CACHE = NBResultCache()
+
+
+def calculate_bit(nb, bit=5.5, reverse=False):
+    """N/B 값을 계산하는 함수 (NumPy 사용 가능 시 벡터 계산)"""
+
+    if len(nb) < 2:
+        return bit / 100
+
+    if can_vectorize(nb):
+        return calculate_bit_vectorized(nb, bit, reverse)
+
+    return calculate_bit_loop(nb, bit, reverse)
+
+
+def first_bucket_indices(nb):
+    """값별로 처음 들어가는 B50/B100 구간 인덱스 배열 (매칭 없음 = 50 * len(nb))
+
+    B50/B100 구간 배열은 부호별 증분으로 한 번에 생성하고, 각 값이 처음
+    들어가는 구간은 searchsorted로 찾는다. 증분이 0 이상이므로 같은 부호
+    구간의 B50/B100은 단조 증가하며, 조건을 만족하는 인덱스는 [lo, hi)
+    범위에서 해당 부호 블록에 속하는 첫 인덱스가 된다.
+    """
+    n = len(nb)
+    size = COUNT * n
+    max_val = max(nb)
+    min_val = min(nb)
+
+    negative_range = abs(min_val) if min_val < 0 else 0
+    positive_range = max_val if max_val > 0 else 0
+
+    negative_increment = negative_range / (size - 1)
+    positive_increment = positive_range / (size - 1)
+
+    values = np.asarray(nb, dtype=np.float64)
+    steps = np.arange(1, size + 1, dtype=np.float64)
+    negative_blocks = values < 0
+    block_ids = np.arange(n)
+
+    first_index = np.full(n, size, dtype=np.int64)
+
+    for is_negative, increment in ((False, positive_increment), (True, negative_increment)):
+        block_mask = negative_blocks == is_negative
+        if not block_mask.any():
+            continue
+
+        a50 = min_val + increment * steps
+        b50 = a50 - increment * 2
+        b100 = a50 + increment
+
+        # b50[a] <= value 인 a는 [0, hi), value <= b100[a] 인 a는 [lo, size)
+        hi = np.searchsorted(b50, values, side='right')
+        lo = np.searchsorted(b100, values, side='left')
+
+        # lo 이후 처음 나오는 같은 부호 블록의 시작 인덱스
+        next_block = np.minimum.accumulate(np.where(block_mask, block_ids, n)[::-1])[::-1]
+        lo_block = np.minimum(lo // COUNT, n - 1)
+        candidate = np.maximum(lo, next_block[lo_block] * COUNT)
+
+        found = (candidate < hi) & (candidate < first_index)
+        first_index = np.where(found, candidate, first_index)
+
+    return first_index
+
+
+def calculate_bit_vectorized(nb, bit=5.5, reverse=False):
+    """N/B 값 벡터 계산 (calculate_bit_loop와 동일한 결과, first_bucket_indices 사용)"""
+
+    if len(nb) < 2:
+        return bit / 100
+
+    n = len(nb)
+    size = COUNT * n
+    max_val = max(nb)
+    first_index = first_bucket_indices(nb)
+
+    matched = first_index[first_index < size]
+
+    # Reverse 옵션: 뒤집힌 NBA100 배열을 인덱스로 참조
+    positions = size - matched if reverse else matched + 1
+    nba100 = positions * bit / size / (n - 1)
+
+    # NB50 합계는 루프 계산과 같은 순서로 누적
+    NB50 = float(np.add.accumulate(nba100)[-1]) if len(nba100) else 0
+
+    total_sum = 0
+    for value in nb:
+        total_sum += value
+
+    abs_max = abs(max_val) if max_val != 0 else 1
+    average_ratio = (total_sum / (n * abs_max)) * 100
+    NB50 = min((NB50 / 100) * average_ratio, bit)
+
+    if n == 2:
+        return bit - NB50
+
+    return NB50
+
+
+def initialize_arrays(count):
+    """배열 초기화"""
+    arrays = {
+        'BIT_START_A50': [0] * count,
+        'BIT_START_A100': [0] * count,
+        'BIT_START_B50': [0] * count,
+        'BIT_START_B100': [0] * count,
+        'BIT_START_NBA100': [0] * count,
+    }
+    return arrays
+
+
+def calculate_bit_loop(nb, bit=5.5, reverse=False):
+    """N/B 값 루프 계산 (원본 알고리즘, NumPy 미설치 시 사용)"""
+
+    if len(nb) < 2:
+        return bit / 100
+
+    BIT_NB = bit
+    max_val = max(nb)
+    min_val = min(nb)
+
+    # 음수와 양수 범위를 구분하여 증분 계산
+    negative_range = abs(min_val) if min_val < 0 else 0
+    positive_range = max_val if max_val > 0 else 0
+
+    negative_increment = negative_range / (COUNT * len(nb) - 1) if (COUNT * len(nb) - 1) > 0 else 0
+    positive_increment = positive_range / (COUNT * len(nb) - 1) if (COUNT * len(nb) - 1) > 0 else 0
+
+    arrays = initialize_arrays(COUNT * len(nb))
+    count = 0
+    total_sum = 0
+
+    for value in nb:
+        for i in range(COUNT):
+            BIT_END = 1
+
+            # 부호에 따른 A50, B50 계산
+            if value < 0:
+                A50 = min_val + negative_increment * (count + 1)
+            else:
+                A50 = min_val + positive_increment * (count + 1)
+
+            A100 = (count + 1) * BIT_NB / (COUNT * len(nb))
+
+            if value < 0:
+                B50 = A50 - negative_increment * 2
+                B100 = A50 + negative_increment
+            else:
+                B50 = A50 - positive_increment * 2
+                B100 = A50 + positive_increment
+
+            NBA100 = A100 / (len(nb) - BIT_END) if (len(nb) - BIT_END) > 0 else 0
+
+            arrays['BIT_START_A50'][count] = A50
+            arrays['BIT_START_A100'][count] = A100
+            arrays['BIT_START_B50'][count] = B50
+            arrays['BIT_START_B100'][count] = B100
+            arrays['BIT_START_NBA100'][count] = NBA100
+            count += 1
+
+        total_sum += value
+
+    # Reverse 옵션 처리
+    if reverse:
+        arrays['BIT_START_NBA100'].reverse()
+
+    # NB50 계산
+    NB50 = 0
+    for value in nb:
+        for a in range(len(arrays['BIT_START_NBA100'])):
+            if arrays['BIT_START_B50'][a] <= value <= arrays['BIT_START_B100'][a]:
+                NB50 += arrays['BIT_START_NBA100'][min(a, len(arrays['BIT_START_NBA100']) - 1)]
+                break
+
+    # 평균 비율 기반 NB50 정규화
+    abs_max = abs(max_val) if max_val != 0 else 1
+    average_ratio = (total_sum / (len(nb) * abs_max)) * 100
+    NB50 = min((NB50 / 100) * average_ratio, BIT_NB)
+
+    if len(nb) == 2:
+        return bit - NB50
+
+    return NB50
+
+
+def _search_count(target, sizes, bound_at, estimate, side_right):
+    """구간 경계 수열(단조 증가)에서 searchsorted를 원소별로 수행
+    
+    bound_at(index, sel)은 sel 원소들의 index 위치 경계 값을 계산한다.
+    side_right가 True이면 경계 <= target 개수, False이면 경계 < target 개수를
+    반환한다. 추정 위치 주변 구간이 맞으면 그 안에서만, 아니면 전체 범위에서
+    이분 탐색하므로 결과는 배열을 만들어 searchsorted한 것과 같다.
+    """
+    def inside(index, sel):
+        bound = bound_at(index, sel)
+        return bound <= target[sel] if side_right else bound < target[sel]
+    
+    everything = np.arange(len(target))
+    estimate = np.clip(estimate, 0, sizes)
+    lower = np.maximum(estimate - 2, 0)
+    upper = np.minimum(estimate + 2, sizes)
+    
+    # 추정 구간 [lower, upper]에 답이 있는지 확인, 없으면 전체 범위로 확장
+    lower_ok = (lower == 0) | inside(np.maximum(lower - 1, 0), everything)
+    upper_ok = (upper == sizes) | ~inside(np.minimum(upper, sizes - 1), everything)
+    bracketed = lower_ok & upper_ok
+    lower = np.where(bracketed, lower, 0)
+    upper = np.where(bracketed, upper, sizes)
+    
+    active = np.nonzero(lower < upper)[0]
+    while active.size:
+        mid = (lower[active] + upper[active]) // 2
+        go_right = inside(mid, active)
+        lower[active] = np.where(go_right, mid + 1, lower[active])
+        upper[active] = np.where(go_right, upper[active], mid)
+        active = active[lower[active] < upper[active]]
+    return lower
+
+
+def _calculate_bit_padded(flat, lengths, bit, directions):
+    """이어 붙인 값 배열(flat)을 행별 길이(lengths)로 패딩해 한 번에 계산
+    
+    모든 행은 길이 2 이상이고 can_vectorize를 통과해야 한다. 구간 탐색은
+    방향과 무관하므로 directions의 각 reverse 값에 대한 결과를 함께 반환한다.
+    """
+    rows = len(lengths)
+    width = int(lengths.max())
+    
+    valid = np.arange(width)[None, :] < lengths[:, None]
+    values = np.zeros((rows, width), dtype=np.float64)
+    values[valid] = flat
+    
+    sizes = COUNT * lengths
+    max_vals = np.where(valid, values, -np.inf).max(axis=1)
+    min_vals = np.where(valid, values, np.inf).min(axis=1)
+    negative_increments = np.where(min_vals < 0, np.abs(min_vals), 0.0) / (sizes - 1)
+    positive_increments = np.where(max_vals > 0, max_vals, 0.0) / (sizes - 1)
+    
+    size_grid = np.broadcast_to(sizes[:, None], (rows, width))
+    block_ids = np.broadcast_to(np.arange(width)[None, :], (rows, width))
+    negative_blocks = values < 0
+    
+    first_index = size_grid.copy()
+    for is_negative, increments in ((False, positive_increments), (True, negative_increments)):
+        block_mask = valid & (negative_blocks == is_negative)
+        # 해당 부호 블록이 있는 행의 값만 탐색
+        cells = valid & block_mask.any(axis=1)[:, None]
+        if not cells.any():
+            continue
+        
+        target = values[cells]
+        row_index = np.nonzero(cells)[0]
+        cell_sizes = sizes[row_index]
+        cell_mins = min_vals[row_index]
+        cell_incs = increments[row_index]
+        
+        def a50_at(index, sel):
+            return cell_mins[sel] + cell_incs[sel] * (index + 1).astype(np.float64)
+        
+        def b50_at(index, sel):
+            return a50_at(index, sel) - cell_incs[sel] * 2
+        
+        def b100_at(index, sel):
+            return a50_at(index, sel) + cell_incs[sel]
+        
+        # 등차 구간이므로 (값 - 최소값) / 증분으로 위치를 추정
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(cell_incs > 0, (target - cell_mins) / cell_incs, 0.0)
+        hi_estimate = np.where(cell_incs > 0, np.floor(ratio) + 2, np.where(cell_mins <= target, cell_sizes, 0))
+        lo_estimate = np.where(cell_incs > 0, np.ceil(ratio) - 2, np.where(cell_mins < target, cell_sizes, 0))
+        
+        hi = _search_count(target, cell_sizes, b50_at, hi_estimate.astype(np.int64), side_right=True)
+        lo = _search_count(target, cell_sizes, b100_at, lo_estimate.astype(np.int64), side_right=False)
+        
+        next_block = np.minimum.accumulate(np.where(block_mask, block_ids, width)[:, ::-1], axis=1)[:, ::-1]
+        lo_block = np.minimum(lo // COUNT, lengths[row_index] - 1)
+        candidate = np.maximum(lo, next_block[row_index, lo_block] * COUNT)
+        
+        current = first_index[cells]
+        first_index[cells] = np.where((candidate < hi) & (candidate < current), candidate, current)
+    
+    matched = valid & (first_index < size_grid)
+    total_sums = np.add.accumulate(np.where(valid, values, 0.0), axis=1)[:, -1]
+    abs_max = np.where(max_vals != 0, np.abs(max_vals), 1.0)
+    average_ratio = (total_sums / (lengths * abs_max)) * 100
+    
+    results = []
+    for reverse in directions:
+        positions = size_grid - first_index if reverse else first_index + 1
+        nba100 = positions * bit / size_grid / (lengths[:, None] - 1)
+        nb50 = np.add.accumulate(np.where(matched, nba100, 0.0), axis=1)[:, -1]
+        nb50 = np.minimum((nb50 / 100) * average_ratio, bit)
+        results.append(np.where(lengths == 2, bit - nb50, nb50))
+    return results
+
+
+def _calculate_directions(sequences, bit, directions, cache):
+    """directions의 각 reverse 값에 대해 calculate_bit 결과 리스트를 계산"""
+    results = [[None] * len(sequences) for _ in directions]
+    keys = [None] * len(sequences)
+    computed = []
+    pending = []
+    
+    for idx, seq in enumerate(sequences):
+        values = tuple(seq)
+        keys[idx] = values
+        missing = False
+        for slot, reverse in enumerate(directions):
+            cached = cache.get((values, bit, reverse)) if cache is not None else None
+            results[slot][idx] = cached
+            missing = missing or cached is None
+        if not missing:
+            continue
+        computed.append(idx)
+        if len(seq) >= 2 and np is not None:
+            pending.append(idx)
+        else:
+            for slot, reverse in enumerate(directions):
+                results[slot][idx] = calculate_bit(seq, bit, reverse)
+    
+    if pending:
+        # 길이 순 정렬 후 BATCH_CELLS 단위로 나누어 패딩 낭비를 줄임
+        pending.sort(key=lambda i: len(sequences[i]))
+        flags, flat, lengths = vectorizable_rows([sequences[i] for i in pending])
+        if flat is None:
+            flat = np.fromiter(
+                chain.from_iterable(sequences[i] for i, ok in zip(pending, flags) if ok),
+                dtype=np.float64
+            )
+        else:
+            flat = flat[np.repeat(flags, lengths)]
+        
+        for idx, ok in zip(pending, flags):
+            if not ok:
+                for slot, reverse in enumerate(directions):
+                    results[slot][idx] = calculate_bit_loop(sequences[idx], bit, reverse)
+        
+        rows = [idx for idx, ok in zip(pending, flags) if ok]
+        row_lengths = lengths[flags]
+        offsets = np.concatenate(([0], np.cumsum(row_lengths)))
+        start = 0
+        while start < len(rows):
+            end = start + 1
+            while end < len(rows) and (end - start + 1) * int(row_lengths[end]) <= BATCH_CELLS:
+                end += 1
+            chunk_results = _calculate_bit_padded(
+                flat[offsets[start]:offsets[end]], row_lengths[start:end], bit, directions
+            )
+            for slot, values in enumerate(chunk_results):
+                for idx, value in zip(rows[start:end], values.tolist()):
+                    results[slot][idx] = value
+            start = end
+    
+    if cache is not None:
+        for idx in computed:
+            for slot, reverse in enumerate(directions):
+                cache.put((keys[idx], bit, reverse), results[slot][idx])
+    
+    return results
+
+
+def calculate_bit_many(sequences, bit=5.5, reverse=False, cache=RESULT_CACHE):
+    """여러 시퀀스의 calculate_bit 결과를 한 번에 계산 (LRU 캐시 사용)
+    
+    캐시에 없는 시퀀스 중 벡터 계산 가능한 것은 길이 순으로 정렬해 패딩 배열로
+    묶어 계산하고, 나머지(길이 2 미만, 비유한 값 등)는 개별 계산한다.
+    """
+    results = _calculate_directions(sequences, bit, (reverse,), cache)[0]
+    return np.array(results, dtype=np.float64) if np is not None else results
+
+
+def calculate_bit_both(sequences, bit=5.5, cache=RESULT_CACHE):
+    """여러 시퀀스의 정방향/역방향 calculate_bit 결과 리스트 (정방향, 역방향)
+
+    두 방향이 같은 구간 배열을 공유하므로 calculate_bit_many를 두 번 부르는 것보다 빠르다.
+    cache=None이면 캐시를 쓰지 않는다 (한 번만 계산하는 대량 재계산용).
+    """
+    forward, backward = _calculate_directions(sequences, bit, (False, True), cache)
+    return forward, backward
+
+
+def calculate_many(sequences, bit=5.5, reverse=False, cache=RESULT_CACHE):
+    """여러 시퀀스의 N/B MAX, MIN, 점수를 배치로 계산
+    
+    MAX는 reverse 방향, MIN은 반대 방향 계산 결과이다 (기본: MAX 정방향).
+    SUPER_BIT 상태 대신 continuous_youtube_monitor의 검증 규칙을 따르며,
+    [-100, 100] 범위를 벗어나면 MAX=0, MIN=0.0001로 처리한다.
+    점수는 |MAX| / max(|MIN|, 0.0001)이다.
+    """
+    max_values, min_values = _calculate_directions(sequences, bit, (reverse, not reverse), cache)
+    
+    if np is None:
+        max_list, min_list, scores = [], [], []
+        for max_val, min_val in zip(max_values, min_values):
+            if not (-100 <= max_val <= 100 and -100 <= min_val <= 100):
+                max_val, min_val = 0, 0.0001
+            max_list.append(max_val)
+            min_list.append(min_val)
+            scores.append(abs(max_val) / max(abs(min_val), 0.0001))
+        return {'max': max_list, 'min': min_list, 'score': scores}
+    
+    max_values = np.array(max_values, dtype=np.float64)
+    min_values = np.array(min_values, dtype=np.float64)
+    in_range = (np.abs(max_values) <= 100) & (np.abs(min_values) <= 100)
+    max_values = np.where(in_range, max_values, 0.0)
+    min_values = np.where(in_range, min_values, 0.0001)
+    scores = np.abs(max_values) / np.maximum(np.abs(min_values), 0.0001)
+    return {'max': max_values, 'min': min_values, 'score': scores}
@@ -0,0 +1,166 @@
+"""
+N/B 결과 검색 인덱스 (값 범위 / 최근접 / 같은 유니코드 배열)
+
+nb_max, nb_min 각각의 정렬 배열(bisect)과 유니코드 서명 해시를 메모리에 두고
+한 파일(index.nbi)에 항목을 이어 써서 저장한다. 저장소(store.py)에 결과를
+추가할 때마다 같은 항목이 파일 끝에 추가되므로 다시 열 때 세그먼트 본문을
+모두 읽지 않아도 된다.
+
+파일 형식:
+    MAGIC (4바이트)
+    항목  [세그먼트 u32][오프셋 u32][nb_max f64][nb_min f64][유니코드 서명 u64][id 길이 u16][id]
+"""
+
+import bisect
+import hashlib
+import heapq
+import math
+import os
+import struct
+import sys
+from array import array
+
+MAGIC = b'NBI1'
+ENTRY = struct.Struct('<IIddQH')
+FIELDS = ('nb_max', 'nb_min')
+
+
+def unicode_signature(codes):
+    """유니코드 코드 배열의 64비트 서명 (배열이 없으면 0)"""
+    if not codes:
+        return 0
+    data = array('I', codes)
+    if sys.byteorder != 'little':
+        data.byteswap()
+    return int.from_bytes(hashlib.blake2b(data.tobytes(), digest_size=8).digest(), 'little') or 1
+
+
+def encode_entry(location, nb_max, nb_min, signature, calc_id):
+    id_bytes = calc_id.encode('utf-8')
+    return ENTRY.pack(location[0], location[1], nb_max, nb_min, signature, len(id_bytes)) + id_bytes
+
+
+def read_entries(path, start=0):
+    """인덱스 파일의 start 위치 이후 항목 목록과 유효한 파일 길이 (끝이 잘린 항목은 무시)"""
+    if not os.path.exists(path):
+        return [], 0
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            return [], 0
+        start = max(start, len(MAGIC))
+        f.seek(start)
+        data = f.read()
+    entries = []
+    pos = 0
+    while pos + ENTRY.size <= len(data):
+        segment, offset, nb_max, nb_min, signature, id_len = ENTRY.unpack_from(data, pos)
+        end = pos + ENTRY.size + id_len
+        if end > len(data):
+            break
+        calc_id = data[pos + ENTRY.size:end].decode('utf-8')
+        entries.append(((segment, offset), nb_max, nb_min, signature, calc_id))
+        pos = end
+    return entries, start + pos
+
+
+class NBIndex:
+    """레코드 번호 기준 N/B 값 인덱스"""
+
+    def __init__(self):
+        self.locations = []  # 레코드 번호 -> (세그먼트 번호, 오프셋)
+        self.values = []  # 레코드 번호 -> (nb_max, nb_min)
+        self.ids = []  # 레코드 번호 -> id
+        self.latest = {}  # id -> 마지막 레코드 번호
+        self.signatures = {}  # 유니코드 서명 -> 레코드 번호 목록
+        self.sorted = {field: ([], []) for field in FIELDS}  # (정렬된 값, 레코드 번호)
+
+    def __len__(self):
+        return len(self.locations)
+
+    def _register(self, location, nb_max, nb_min, signature, calc_id):
+        recno = len(self.locations)
+        self.locations.append(location)
+        self.values.append((nb_max, nb_min))
+        self.ids.append(calc_id)
+        self.latest[calc_id] = recno
+        if signature:
+            self.signatures.setdefault(signature, []).append(recno)
+        return recno
+
+    def add(self, location, nb_max, nb_min, signature, calc_id):
+        """항목 하나 추가 (정렬 배열에 바로 삽입) 후 레코드 번호 반환"""
+        recno = self._register(location, nb_max, nb_min, signature, calc_id)
+        for value, field in zip((nb_max, nb_min), FIELDS):
+            keys, recnos = self.sorted[field]
+            position = bisect.bisect_right(keys, value)
+            keys.insert(position, value)
+            recnos.insert(position, recno)
+        return recno
+
+    def _sort(self):
+        for field_no, field in enumerate(FIELDS):
+            order = sorted(range(len(self.values)), key=lambda recno: self.values[recno][field_no])
+            self.sorted[field] = ([self.values[recno][field_no] for recno in order], order)
+
+    def extend(self, entries):
+        """(위치, nb_max, nb_min, 서명, id) 여러 개 추가 후 한 번에 다시 정렬"""
+        for entry in entries:
+            self._register(*entry)
+        self._sort()
+
+    @classmethod
+    def from_entries(cls, entries):
+        index = cls()
+        index.extend(entries)
+        return index
+
+    @classmethod
+    def load(cls, path):
+        """인덱스 파일 읽기 (없으면 빈 인덱스, 끝이 잘린 항목은 무시)
+
+        (인덱스, 유효한 파일 길이)를 반환한다.
+        """
+        entries, size = read_entries(path)
+        return cls.from_entries(entries), size
+
+    def range(self, field, low=None, high=None):
+        """field 값이 [low, high]인 레코드 번호 (값 순서)"""
+        keys, recnos = self.sorted[field]
+        start = 0 if low is None else bisect.bisect_left(keys, low)
+        end = len(keys) if high is None else bisect.bisect_right(keys, high)
+        return recnos[start:end]
+
+    def nearest(self, nb_max, nb_min, k=5, scale=(1.0, 1.0)):
+        """(nb_max, nb_min)에 가장 가까운 k개 [(거리, 레코드 번호)] (가까운 순)
+
+        거리는 sqrt((Δmax*scale[0])^2 + (Δmin*scale[1])^2). nb_max 정렬 배열에서
+        질의 위치부터 양쪽으로 넓혀 가며, Δmax만으로도 현재 k번째 거리보다 멀어지면 멈춘다.
+        """
+        if k <= 0:
+            return []
+        keys, recnos = self.sorted['nb_max']
+        weight_max, weight_min = scale
+        best = []  # (-거리, -레코드 번호) 최대 힙
+        left = bisect.bisect_left(keys, nb_max) - 1
+        right = left + 1
+        while left >= 0 or right < len(keys):
+            left_gap = (nb_max - keys[left]) * weight_max if left >= 0 else math.inf
+            right_gap = (keys[right] - nb_max) * weight_max if right < len(keys) else math.inf
+            if left_gap <= right_gap:
+                gap, recno = left_gap, recnos[left]
+                left -= 1
+            else:
+                gap, recno = right_gap, recnos[right]
+                right += 1
+            if len(best) >= k and gap >= -best[0][0]:
+                break
+            distance = math.hypot(gap, (self.values[recno][1] - nb_min) * weight_min)
+            if len(best) < k:
+                heapq.heappush(best, (-distance, -recno))
+            elif distance < -best[0][0]:
+                heapq.heapreplace(best, (-distance, -recno))
+        return sorted((-distance, -recno) for distance, recno in best)
+
+    def same_signature(self, codes):
+        """유니코드 배열이 같은 결과의 레코드 번호"""
+        return list(self.signatures.get(unicode_signature(codes), ()))
@@ -0,0 +1,605 @@
+"""
+N/B 결과 저장소 (추가 전용 세그먼트 파일)
+
+data/nb_max/<숫자 경로>/results.json, data/nb_min/... 에 결과마다 JSON 파일을
+두 번 쓰는 대신, 결과를 길이 접두 레코드로 세그먼트 파일 끝에 이어 쓴다.
+검색 인덱스(index.py)는 index.nbi 한 파일에 이어 쓰므로 다시 열 때는 인덱스에
+없는 레코드만 세그먼트에서 읽는다. 웹 서버용 기존 폴더 구조는 export_legacy_tree로 필요할
+때 다시 만든다.
+
+세그먼트 형식:
+    파일 헤더  MAGIC (4바이트)
+    레코드     [본문 길이 u32][본문 crc32 u32][본문]
+    본문       [nb_max f64][nb_min f64][bit f64][flags u8]
+               [id 길이 u16][timestamp 길이 u16][input 길이 u32][unicode 개수 u32][extra 길이 u32]
+               [id][timestamp][input (UTF-8)][unicode (u32 배열)][extra (JSON)]
+
+extra에는 열로 저장하지 않은 나머지 필드(results, view_count 등)가 들어간다.
+쓰다가 중단되어 crc가 맞지 않는 마지막 레코드는 열 때 잘라낸다.
+
+사용법:
+    python -m nbcore.store import data/nb_max data/nb_min
+    python -m nbcore.store export --nb-max data/nb_max --nb-min data/nb_min
+    python -m nbcore.store query nb_max 1000 2000
+    python -m nbcore.store nearest 12345.6 0.0012 -k 10
+    python -m nbcore.store unicode "오늘의 주요 뉴스"
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from contextlib import contextmanager
+
+from .index import MAGIC as INDEX_MAGIC, NBIndex, encode_entry, read_entries
+from .web import js_char_codes
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+MAGIC = b'NBS1'
+RECORD_HEAD = struct.Struct('<II')
+RECORD_FIXED = struct.Struct('<dddBHHIII')
+# 세그먼트 하나의 최대 크기 (넘으면 새 세그먼트 사용)
+SEGMENT_BYTES = 8 * 1024 * 1024
+SEGMENT_PREFIX = 'segment_'
+SEGMENT_SUFFIX = '.nbs'
+EXPORT_STATE_FILE = 'export_state.json'
+INDEX_FILE = 'index.nbi'
+LOCK_FILE = 'store.lock'
+INDEX_FIELDS = ('nb_max', 'nb_min')
+
+HAS_TIMESTAMP = 1
+HAS_INPUT = 2
+HAS_UNICODE = 4
+HAS_BIT = 8
+
+# 기존 results.json 필드 순서 (save_news_nb_calculations 결과 형식)
+LEGACY_KEY_ORDER = (
+    'id', 'calculation_id', 'timestamp', 'type', 'input', 'unicode',
+    'bit', 'view_count', 'results', 'saved'
+)
+
+
+def number_to_path(value: float) -> str:
+    """숫자를 경로로 변환 (ide/gui/utils.number_to_path와 같은 규칙)"""
+    value_str = repr(value).replace('-', '_')
+    parts = []
+    for ch in value_str:
+        if ch == '.':
+            parts.append('.')
+        elif ch.isdigit() or ch == '_':
+            parts.append(ch)
+    return os.path.join(*parts) if parts else '0'
+
+
+def result_values(calc):
+    """계산 결과의 (id, nb_max, nb_min), 저장 대상이 아니면 None
+
+    save_news_results_by_path와 같은 조건 (id와 results[0]의 nb_max/nb_min 필요).
+    """
+    calc_id = calc.get('id') or calc.get('calculation_id')
+    results = calc.get('results') or []
+    if not calc_id or not results:
+        return None
+    nb_max = results[0].get('nb_max')
+    nb_min = results[0].get('nb_min')
+    if not isinstance(nb_max, (int, float)) or not isinstance(nb_min, (int, float)):
+        return None
+    return str(calc_id), float(nb_max), float(nb_min)
+
+
+def encode_record(calc):
+    """계산 결과 dict -> 레코드 바이트 (저장 대상이 아니면 None)"""
+    values = result_values(calc)
+    if values is None:
+        return None
+    calc_id, nb_max, nb_min = values
+
+    extra = {key: value for key, value in calc.items() if key != 'id'}
+    flags = 0
+    timestamp = input_text = b''
+    codes = array('I')
+    bit = math.nan
+
+    if isinstance(calc.get('timestamp'), str):
+        timestamp = extra.pop('timestamp').encode('utf-8')
+        flags |= HAS_TIMESTAMP
+    if isinstance(calc.get('input'), str):
+        input_text = extra.pop('input').encode('utf-8')
+        flags |= HAS_INPUT
+    unicode_values = calc.get('unicode')
+    if isinstance(unicode_values, list) and all(
+        isinstance(code, int) and not isinstance(code, bool) and 0 <= code < 2 ** 32 for code in unicode_values
+    ):
+        codes = array('I', extra.pop('unicode'))
+        flags |= HAS_UNICODE
+    if isinstance(calc.get('bit'), (int, float)) and not isinstance(calc.get('bit'), bool):
+        bit = float(extra.pop('bit'))
+        flags |= HAS_BIT
+        if isinstance(calc['bit'], int):
+            extra['_bit_int'] = True
+
+    # 기본 필드 순서와 다르면 원래 순서를 함께 저장 (내보낸 파일이 원본과 같도록)
+    if 'id' not in calc or list(calc) != _legacy_order(calc):
+        extra['_keys'] = list(calc)
+
+    id_bytes = calc_id.encode('utf-8')
+    if sys.byteorder != 'little':
+        codes.byteswap()
+    extra_bytes = json.dumps(extra, ensure_ascii=False, separators=(',', ':')).encode('utf-8') if extra else b''
+    body = b''.join((
+        RECORD_FIXED.pack(nb_max, nb_min, bit, flags, len(id_bytes), len(timestamp),
+                          len(input_text), len(codes), len(extra_bytes)),
+        id_bytes, timestamp, input_text, codes.tobytes(), extra_bytes
+    ))
+    return RECORD_HEAD.pack(len(body), zlib.crc32(body)) + body
+
+
+def decode_record(body):
+    """레코드 본문 -> 계산 결과 dict (기존 results.json 필드 순서)"""
+    (nb_max, nb_min, bit, flags, id_len, ts_len, input_len,
+     unicode_count, extra_len) = RECORD_FIXED.unpack_from(body)
+    pos = RECORD_FIXED.size
+    calc_id = body[pos:pos + id_len].decode('utf-8')
+    pos += id_len
+    timestamp = body[pos:pos + ts_len].decode('utf-8')
+    pos += ts_len
+    input_text = body[pos:pos + input_len].decode('utf-8')
+    pos += input_len
+    codes = array('I')
+    codes.frombytes(body[pos:pos + unicode_count * codes.itemsize])
+    if sys.byteorder != 'little':
+        codes.byteswap()
+    pos += unicode_count * codes.itemsize
+    extra = json.loads(body[pos:pos + extra_len].decode('utf-8')) if extra_len else {}
+
+    fields = dict(extra)
+    fields['id'] = calc_id
+    if flags & HAS_TIMESTAMP:
+        fields['timestamp'] = timestamp
+    if flags & HAS_INPUT:
+        fields['input'] = input_text
+    if flags & HAS_UNICODE:
+        fields['unicode'] = codes.tolist()
+    if flags & HAS_BIT:
+        fields['bit'] = int(bit) if fields.pop('_bit_int', False) else bit
+
+    order = fields.pop('_keys', None) or _legacy_order(fields)
+    return {key: fields[key] for key in order if key in fields}
+
+
+def _legacy_order(fields):
+    """기존 results.json 필드 순서 + 나머지 필드"""
+    return [key for key in LEGACY_KEY_ORDER if key in fields] + [
+        key for key in fields if key not in LEGACY_KEY_ORDER
+    ]
+
+
+def _record_entry(body, location):
+    """레코드 본문에서 인덱스 항목 (위치, nb_max, nb_min, 유니코드 서명, id) 추출"""
+    (nb_max, nb_min, _, flags, id_len, ts_len, input_len,
+     unicode_count, _) = RECORD_FIXED.unpack_from(body)
+    pos = RECORD_FIXED.size
+    calc_id = bytes(body[pos:pos + id_len]).decode('utf-8')
+    signature = 0
+    if flags & HAS_UNICODE and unicode_count:
+        pos += id_len + ts_len + input_len
+        codes = bytes(body[pos:pos + unicode_count * 4])
+        signature = int.from_bytes(hashlib.blake2b(codes, digest_size=8).digest(), 'little') or 1
+    return location, nb_max, nb_min, signature, calc_id
+
+
+@contextmanager
+def _file_lock(path):
+    """저장소를 같이 쓰는 프로세스 사이의 배타 잠금 (다른 프로세스가 놓을 때까지 대기)"""
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:  # LK_LOCK은 10초 동안 못 잡으면 실패
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    finally:
+        os.close(fd)
+
+
+class NBResultStore:
+    """추가 전용 N/B 결과 저장소 (index.NBIndex로 범위/최근접/유니코드 검색)"""
+
+    def __init__(self, root, segment_bytes=SEGMENT_BYTES, fsync=True):
+        self.root = root
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._index_path = os.path.join(root, INDEX_FILE)
+        self._lock_path = os.path.join(root, LOCK_FILE)
+        self.index = NBIndex()
+        self._index_size = 0
+        self._segment = 0
+        self._segment_size = 0
+        os.makedirs(root, exist_ok=True)
+        with _file_lock(self._lock_path):
+            self._load()
+
+    def __len__(self):
+        return len(self.index)
+
+    def _segment_path(self, number):
+        return os.path.join(self.root, f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}")
+
+    def _segment_numbers(self):
+        numbers = []
+        for name in os.listdir(self.root):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                number = name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+                if number.isdigit():
+                    numbers.append(int(number))
+        return sorted(numbers)
+
+    def _resume_position(self, sizes):
+        """인덱스에 마지막으로 기록된 레코드 다음 위치 (인덱스가 세그먼트와 맞지 않으면 None)"""
+        if not len(self.index):
+            return min(sizes) if sizes else 1, 0
+        segment, offset = self.index.locations[-1]
+        if offset + RECORD_HEAD.size > sizes.get(segment, 0):
+            return None
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(offset)
+            length, _ = RECORD_HEAD.unpack(f.read(RECORD_HEAD.size))
+        end = offset + RECORD_HEAD.size + length
+        return (segment, end) if end <= sizes[segment] else None
+
+    def _load(self):
+        """인덱스 파일을 읽고, 인덱스에 없는 레코드만 세그먼트에서 읽어 보충
+
+        인덱스 파일이 없거나 세그먼트와 맞지 않으면 전체 세그먼트로 다시 만든다.
+        끝이 깨진 레코드는 잘라낸다. 파일 잠금 안에서 호출한다.
+        """
+        numbers = self._segment_numbers()
+        sizes = {number: os.path.getsize(self._segment_path(number)) for number in numbers}
+        self.index, self._index_size = NBIndex.load(self._index_path)
+        resume = self._resume_position(sizes)
+        if resume is None:
+            self.index, self._index_size = NBIndex(), 0
+            resume = self._resume_position(sizes)
+        with open(self._index_path, 'ab') as f:
+            f.truncate(self._index_size)
+
+        entries = self._scan_segments(numbers, resume)
+        if entries:
+            self.index.extend(entries)
+            self._append_index(entries)
+        if not numbers:
+            self._segment = 1
+            self._segment_size = 0
+
+    def _refresh(self):
+        """다른 프로세스가 추가한 항목을 인덱스 파일에서 읽고 실제 세그먼트 끝 위치로 맞춤
+
+        파일 잠금 안에서 호출한다. 인덱스 파일과 세그먼트가 맞지 않으면 다시 연다.
+        """
+        added, self._index_size = read_entries(self._index_path, self._index_size)
+        for entry in added:
+            self.index.add(*entry)
+        numbers = self._segment_numbers()
+        sizes = {number: os.path.getsize(self._segment_path(number)) for number in numbers}
+        resume = self._resume_position(sizes)
+        if resume is None:
+            self._load()
+            return
+        entries = self._scan_segments(numbers, resume)
+        for entry in entries:
+            self.index.add(*entry)
+        if entries:
+            self._append_index(entries)
+
+    def _scan_segments(self, numbers, resume):
+        """resume 위치부터 세그먼트의 레코드를 읽어 인덱스 항목 목록 반환
+
+        끝이 깨진 레코드는 잘라내고 마지막 세그먼트 번호와 실제 크기를 기록한다.
+        """
+        entries = []
+        resume_segment, resume_offset = resume
+        for number in numbers:
+            if number < resume_segment:
+                continue
+            path = self._segment_path(number)
+            with open(path, 'rb') as f:
+                valid = f.read(len(MAGIC)) == MAGIC
+                base = max(len(MAGIC), resume_offset if number == resume_segment else 0)
+                f.seek(base)
+                data = f.read() if valid else b''
+                size = f.seek(0, os.SEEK_END)
+            pos = 0
+            while valid and pos + RECORD_HEAD.size <= len(data):
+                length, crc = RECORD_HEAD.unpack_from(data, pos)
+                body = data[pos + RECORD_HEAD.size:pos + RECORD_HEAD.size + length]
+                if len(body) < length or zlib.crc32(body) != crc:
+                    break
+                entries.append(_record_entry(body, (number, base + pos)))
+                pos += RECORD_HEAD.size + length
+            valid_end = base + pos if valid else 0
+            if valid_end < size:
+                with open(path, 'r+b') as f:
+                    f.truncate(valid_end)
+                    if not valid_end:
+                        f.write(MAGIC)
+                        valid_end = len(MAGIC)
+            self._segment = number
+            self._segment_size = valid_end
+        return entries
+
+    def _append_index(self, entries):
+        """인덱스 파일 끝에 항목 추가 (인덱스는 세그먼트로 다시 만들 수 있어 fsync 생략)
+
+        다른 프로세스가 쓰다 만 항목이 있으면 유효한 길이로 잘라낸 뒤 이어 쓴다.
+        """
+        with open(self._index_path, 'ab') as f:
+            f.truncate(self._index_size)
+            if not self._index_size:
+                f.write(INDEX_MAGIC)
+            f.write(b''.join(encode_entry(*entry) for entry in entries))
+            self._index_size = f.tell()
+
+    def append(self, calc):
+        """결과 하나 추가 (레코드 번호, 저장 대상이 아니면 None)"""
+        return self.append_many([calc])[0]
+
+    def append_many(self, calculations):
+        """결과 여러 개를 한 번의 쓰기/fsync로 추가하고 레코드 번호 목록 반환
+
+        같은 저장소를 쓰는 다른 프로세스와 겹치지 않도록 파일 잠금 안에서
+        다른 프로세스의 추가분을 먼저 읽고, 세그먼트를 쓴 뒤 인덱스 파일에 같은 항목을 이어 쓴다.
+        """
+        encoded = [encode_record(calc) for calc in calculations]
+        recnos = [None] * len(encoded)
+        if all(record is None for record in encoded):
+            return recnos
+        with self._lock, _file_lock(self._lock_path):
+            self._refresh()
+            batch = []
+            entries = []
+            for position, record in enumerate(encoded):
+                if record is None:
+                    continue
+                if self._segment_size and self._segment_size + len(record) > self.segment_bytes:
+                    self._write(batch)
+                    batch = []
+                    self._segment += 1
+                    self._segment_size = 0
+                if not self._segment_size:
+                    batch.append(MAGIC)
+                    self._segment_size = len(MAGIC)
+                body = memoryview(record)[RECORD_HEAD.size:]
+                entries.append(_record_entry(body, (self._segment, self._segment_size)))
+                batch.append(record)
+                self._segment_size += len(record)
+            self._write(batch)
+            self._append_index(entries)
+            added = iter([self.index.add(*entry) for entry in entries])
+            recnos = [next(added) if record is not None else None for record in encoded]
+        return recnos
+
+    def _write(self, chunks):
+        if not chunks:
+            return
+        with open(self._segment_path(self._segment), 'ab') as f:
+            f.write(b''.join(chunks))
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+    def get(self, recno):
+        """레코드 번호로 결과 dict 읽기"""
+        segment, offset = self.index.locations[recno]
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(offset)
+            length, _ = RECORD_HEAD.unpack(f.read(RECORD_HEAD.size))
+            return decode_record(f.read(length))
+
+    def find(self, calc_id):
+        """id의 마지막 결과 (없으면 None)"""
+        recno = self.index.latest.get(str(calc_id))
+        return self.get(recno) if recno is not None else None
+
+    def range_recnos(self, field, low=None, high=None):
+        """field(nb_max/nb_min) 값이 [low, high]인 레코드 번호 (값 순서)"""
+        return self.index.range(field, low, high)
+
+    def range(self, field, low=None, high=None):
+        """field 값이 [low, high]인 결과 dict 목록"""
+        return [self.get(recno) for recno in self.range_recnos(field, low, high)]
+
+    def nearest(self, nb_max, nb_min, k=5, scale=(1.0, 1.0)):
+        """(nb_max, nb_min)에 가까운 결과 k개 [(거리, 결과 dict)]"""
+        return [(distance, self.get(recno)) for distance, recno in self.index.nearest(nb_max, nb_min, k, scale)]
+
+    def same_unicode(self, codes):
+        """유니코드 배열이 같은 결과 dict 목록 (추가 순서)"""
+        results = []
+        for recno in self.index.same_signature(codes):
+            calc = self.get(recno)
+            if calc.get('unicode') == list(codes):
+                results.append(calc)
+        return results
+
+    def values(self, recno):
+        """레코드의 (nb_max, nb_min)"""
+        return self.index.values[recno]
+
+    def record_id(self, recno):
+        return self.index.ids[recno]
+
+    def iter_records(self, start=0):
+        """(레코드 번호, 결과 dict)를 추가 순서대로 반환 (세그먼트 순차 읽기)"""
+        with self._lock:
+            locations = self.index.locations[start:]
+        handle = None
+        current = None
+        try:
+            for recno, (segment, offset) in enumerate(locations, start):
+                if segment != current:
+                    if handle:
+                        handle.close()
+                    handle = open(self._segment_path(segment), 'rb')
+                    current = segment
+                handle.seek(offset)
+                length, _ = RECORD_HEAD.unpack(handle.read(RECORD_HEAD.size))
+                yield recno, decode_record(handle.read(length))
+        finally:
+            if handle:
+                handle.close()
+
+    def export_legacy_tree(self, nb_max_dir, nb_min_dir, start=0):
+        """레코드를 기존 폴더 구조(<숫자 경로>/results.json)로 내보내고 개수 반환
+
+        같은 경로는 기존 저장 방식처럼 나중 레코드가 덮어쓴다.
+        """
+        # 경로는 원본 값(정수/실수 표기)으로 계산해야 기존 number_to_path 결과와 같다
+        latest_paths = {}
+        for recno, calc in self.iter_records(start):
+            first = calc['results'][0]
+            latest_paths[os.path.join(nb_max_dir, number_to_path(first['nb_max']))] = recno
+            latest_paths[os.path.join(nb_min_dir, number_to_path(first['nb_min']))] = recno
+
+        by_record = {}
+        for directory, recno in latest_paths.items():
+            by_record.setdefault(recno, []).append(directory)
+        for recno in sorted(by_record):
+            payload = json.dumps(self.get(recno), ensure_ascii=False, indent=2)
+            for directory in by_record[recno]:
+                os.makedirs(directory, exist_ok=True)
+                with open(os.path.join(directory, 'results.json'), 'w', encoding='utf-8') as f:
+                    f.write(payload)
+        return len(by_record)
+
+    def export_pending(self, nb_max_dir, nb_min_dir):
+        """마지막 내보내기 이후 추가된 레코드만 기존 폴더 구조로 내보냄"""
+        state_file = os.path.join(self.root, EXPORT_STATE_FILE)
+        state = {}
+        if os.path.exists(state_file):
+            with open(state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        start = state.get('exported', 0)
+        total = len(self)
+        count = self.export_legacy_tree(nb_max_dir, nb_min_dir, start) if start < total else 0
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump({'exported': total}, f)
+        return count
+
+    def import_legacy_tree(self, directory):
+        """기존 폴더 구조의 results.json / result_*.json을 저장소로 가져옴 (추가 개수 반환)"""
+        calculations = []
+        seen = {_digest(calc) for _, calc in self.iter_records()}
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename != 'results.json' and not (filename.startswith('result_') and filename.endswith('.json')):
+                    continue
+                try:
+                    with open(os.path.join(dirpath, filename), 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                if not isinstance(data, dict) or result_values(data) is None:
+                    continue
+                # nb_max / nb_min 폴더에 같은 결과가 두 번 저장되어 있으므로 같은 내용은 한 번만
+                digest = _digest(data)
+                if digest in seen:
+                    continue
+                seen.add(digest)
+                calculations.append(data)
+        return sum(1 for recno in self.append_many(calculations) if recno is not None)
+
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+def open_store(root):
+    """경로별 공유 저장소 (같은 프로세스에서 세그먼트를 다시 읽지 않도록)"""
+    key = os.path.abspath(root)
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = _STORES[key] = NBResultStore(root)
+        return store
+
+
+def _digest(calc):
+    return hashlib.sha1(json.dumps(calc, sort_keys=True).encode('utf-8')).digest()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="N/B 결과 저장소 관리")
+    parser.add_argument('--root', default=os.path.join('data', 'nb_store'), help="저장소 폴더")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help="기존 폴더 구조 가져오기")
+    import_parser.add_argument('directories', nargs='+')
+
+    export_parser = commands.add_parser('export', help="기존 폴더 구조로 내보내기")
+    export_parser.add_argument('--nb-max', default=os.path.join('data', 'nb_max'))
+    export_parser.add_argument('--nb-min', default=os.path.join('data', 'nb_min'))
+    export_parser.add_argument('--pending', action='store_true', help="마지막 내보내기 이후 추가분만")
+
+    query_parser = commands.add_parser('query', help="값 범위 검색 (JSONL 출력)")
+    query_parser.add_argument('field', choices=INDEX_FIELDS)
+    query_parser.add_argument('low', type=float)
+    query_parser.add_argument('high', type=float)
+
+    nearest_parser = commands.add_parser('nearest', help="(MAX, MIN) 최근접 검색 (JSONL 출력)")
+    nearest_parser.add_argument('nb_max', type=float)
+    nearest_parser.add_argument('nb_min', type=float)
+    nearest_parser.add_argument('-k', type=int, default=5)
+
+    unicode_parser = commands.add_parser('unicode', help="같은 문자열(유니코드 배열) 결과 검색")
+    unicode_parser.add_argument('text')
+
+    args = parser.parse_args(argv)
+    store = NBResultStore(args.root)
+    if args.command == 'import':
+        for directory in args.directories:
+            print(f"📥 {directory}: {store.import_legacy_tree(directory)}건 추가")
+    elif args.command == 'export':
+        if args.pending:
+            count = store.export_pending(args.nb_max, args.nb_min)
+        else:
+            count = store.export_legacy_tree(args.nb_max, args.nb_min)
+        print(f"📤 {count}건 내보냄")
+    elif args.command == 'query':
+        for calc in store.range(args.field, args.low, args.high):
+            print(json.dumps(calc, ensure_ascii=False))
+    elif args.command == 'nearest':
+        for distance, calc in store.nearest(args.nb_max, args.nb_min, args.k):
+            print(json.dumps({'distance': distance, **calc}, ensure_ascii=False))
+    elif args.command == 'unicode':
+        for calc in store.same_unicode(js_char_codes(args.text)):
+            print(json.dumps(calc, ensure_ascii=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""
+증분(스트리밍) N/B 계산
+키워드별 조회수처럼 계속 추가되는 값 목록의 N/B MAX/MIN을 이어서 계산
+
+N/B 구간 격자는 값 개수(n), 최소값, 최대값, 값의 부호 배치로 정해진다.
+창(window) 크기를 고정하면 n이 변하지 않으므로, 창이 가득 찬 뒤에는
+최소/최대가 그대로이고 모든 값의 부호가 같을 때 새 값 하나의 구간만 찾아
+합계를 갱신한다 (값당 O(log) 이하). 그 외에는 전체를 다시 계산한다.
+
+구간 위치 합계를 정수로 누적한 뒤 한 번에 나누므로 calculate_bit의 순차
+부동소수점 합계와는 마지막 자리(상대 오차 1e-12 미만)까지 같지는 않다.
+"""
+
+import math
+from collections import deque
+from fractions import Fraction
+
+from .engine import COUNT, calculate_bit, can_vectorize, first_bucket_indices, np
+
+# 기본 창 크기 (None이면 전체 기록 사용, 매번 전체 계산)
+DEFAULT_WINDOW = 1000
+
+
+def _count_prefix(inside, estimate, size):
+    """inside(a)가 앞쪽 구간에서만 참일 때 참인 개수 (추정값 주변부터 이분 탐색)"""
+    lower = min(max(estimate - 2, 0), size)
+    upper = min(max(estimate + 2, 0), size)
+    if lower > 0 and not inside(lower - 1):
+        lower = 0
+    if upper < size and inside(upper):
+        upper = size
+    while lower < upper:
+        mid = (lower + upper) // 2
+        if inside(mid):
+            lower = mid + 1
+        else:
+            upper = mid
+    return lower
+
+
+def first_bucket_index(value, min_val, increment, size):
+    """부호가 모두 같은 값 목록에서 value가 처음 들어가는 구간 인덱스 (없으면 None)
+
+    engine.first_bucket_indices와 같은 경계 계산식을 사용한다.
+    """
+    if increment > 0:
+        ratio = (value - min_val) / increment
+        hi_estimate = math.floor(ratio) + 2
+        lo_estimate = math.ceil(ratio) - 2
+    else:
+        hi_estimate = size if min_val <= value else 0
+        lo_estimate = size if min_val < value else 0
+
+    def b50_at(a):
+        return (min_val + increment * (a + 1)) - increment * 2
+
+    def b100_at(a):
+        return (min_val + increment * (a + 1)) + increment
+
+    hi = _count_prefix(lambda a: b50_at(a) <= value, hi_estimate, size)
+    lo = _count_prefix(lambda a: b100_at(a) < value, lo_estimate, size)
+    return lo if lo < hi else None
+
+
+class IncrementalNBScorer:
+    """push/extend로 값을 추가하며 N/B MAX/MIN을 갱신하는 계산기"""
+
+    def __init__(self, bit=5.5, window=DEFAULT_WINDOW):
+        self.bit = bit
+        self.window = window
+        self.values = deque()
+        self.buckets = deque()  # 값별 구간 인덱스 (None = 매칭 없음)
+        self.total = 0
+        self.negative_count = 0
+        self.nonfinite_count = 0
+        self.forward_sum = 0
+        self.reverse_sum = 0
+        self.recomputes = 0
+        self.fast_updates = 0
+        self._min_queue = deque()  # (값, 순번) 증가 단조 큐
+        self._max_queue = deque()  # (값, 순번) 감소 단조 큐
+        self._next_seq = 0
+        self._head_seq = 0
+        self._state_valid = False
+        self._scores = None
+
+    def __len__(self):
+        return len(self.values)
+
+    @property
+    def min_value(self):
+        return self._min_queue[0][0] if self._min_queue else None
+
+    @property
+    def max_value(self):
+        return self._max_queue[0][0] if self._max_queue else None
+
+    def _single_sign(self):
+        return self.negative_count in (0, len(self.values))
+
+    def _increment(self, size):
+        min_val, max_val = self.min_value, self.max_value
+        if self.negative_count:
+            return (abs(min_val) if min_val < 0 else 0) / (size - 1)
+        return (max_val if max_val > 0 else 0) / (size - 1)
+
+    def _append(self, value):
+        seq = self._next_seq
+        self._next_seq += 1
+        self.values.append(value)
+        if value < 0:
+            self.negative_count += 1
+        if math.isfinite(value):
+            self.total += value if isinstance(value, int) else Fraction(value)
+        else:
+            self.nonfinite_count += 1
+        while self._min_queue and self._min_queue[-1][0] >= value:
+            self._min_queue.pop()
+        self._min_queue.append((value, seq))
+        while self._max_queue and self._max_queue[-1][0] <= value:
+            self._max_queue.pop()
+        self._max_queue.append((value, seq))
+
+    def _pop_oldest(self):
+        value = self.values.popleft()
+        bucket = self.buckets.popleft() if self.buckets else None
+        seq = self._head_seq
+        self._head_seq += 1
+        if value < 0:
+            self.negative_count -= 1
+        if math.isfinite(value):
+            self.total -= value if isinstance(value, int) else Fraction(value)
+        else:
+            self.nonfinite_count -= 1
+        if self._min_queue and self._min_queue[0][1] == seq:
+            self._min_queue.popleft()
+        if self._max_queue and self._max_queue[0][1] == seq:
+            self._max_queue.popleft()
+        return bucket
+
+    def push(self, value):
+        """값 하나 추가 후 갱신된 결과 반환"""
+        self._add(value)
+        return self.result()
+
+    def extend(self, values):
+        """여러 값 추가 후 갱신된 결과 반환 (계산은 마지막에 한 번)"""
+        for value in values:
+            self._add(value)
+        return self.result()
+
+    def _add(self, value):
+        self._scores = None
+        full = self.window is not None and len(self.values) >= self.window
+        fast = self._state_valid and full
+        old_min, old_max = self.min_value, self.max_value
+
+        removed_bucket = self._pop_oldest() if full else None
+        self._append(value)
+
+        if fast:
+            fast = (
+                self.min_value == old_min
+                and self.max_value == old_max
+                and self._single_sign()
+                and self.nonfinite_count == 0
+            )
+        if not fast:
+            self._state_valid = False
+            self.buckets.clear()
+            return
+
+        # 격자가 그대로이므로 나간 값/들어온 값의 구간만 반영
+        size = COUNT * len(self.values)
+        if removed_bucket is not None:
+            self.forward_sum -= removed_bucket + 1
+            self.reverse_sum -= size - removed_bucket
+        bucket = first_bucket_index(value, self.min_value, self._increment(size), size)
+        self.buckets.append(bucket)
+        if bucket is not None:
+            self.forward_sum += bucket + 1
+            self.reverse_sum += size - bucket
+        self.fast_updates += 1
+
+    def _rebuild(self):
+        """부호가 같은 값 목록의 구간 상태 전체 재계산"""
+        self.recomputes += 1
+        n = len(self.values)
+        size = COUNT * n
+        values = list(self.values)
+        if np is not None and can_vectorize(values):
+            indices = first_bucket_indices(values).tolist()
+            buckets = [index if index < size else None for index in indices]
+        else:
+            increment = self._increment(size)
+            buckets = [first_bucket_index(value, self.min_value, increment, size) for value in values]
+        self.buckets = deque(buckets)
+        matched = [bucket for bucket in buckets if bucket is not None]
+        self.forward_sum = sum(matched) + len(matched)
+        self.reverse_sum = size * len(matched) - sum(matched)
+        self._state_valid = True
+
+    def _finish(self, position_sum):
+        """구간 위치 합계로 calculate_bit 정규화 수행"""
+        n = len(self.values)
+        size = COUNT * n
+        max_val = self.max_value
+        nb50 = position_sum * self.bit / size / (n - 1)
+        abs_max = abs(max_val) if max_val != 0 else 1
+        average_ratio = float(self.total / (n * abs_max)) * 100
+        nb50 = min((nb50 / 100) * average_ratio, self.bit)
+        if n == 2:
+            return self.bit - nb50
+        return nb50
+
+    def scores(self):
+        """현재 (MAX, MIN) 반환"""
+        if self._scores is not None:
+            return self._scores
+        n = len(self.values)
+        if n < 2:
+            self._scores = (self.bit / 100, self.bit / 100)
+        elif self._single_sign() and self.nonfinite_count == 0:
+            if not self._state_valid:
+                self._rebuild()
+            self._scores = (self._finish(self.forward_sum), self._finish(self.reverse_sum))
+        else:
+            # 부호가 섞이면 블록 배치가 결과에 영향을 주므로 전체 계산
+            self.recomputes += 1
+            values = list(self.values)
+            self._scores = (calculate_bit(values, self.bit, False), calculate_bit(values, self.bit, True))
+        return self._scores
+
+    def result(self):
+        """calculate_nb_score와 같은 형식의 결과 (범위 밖이면 MAX=0, MIN=0.0001)"""
+        n = len(self.values)
+        if n < 2:
+            return {
+                "max": 0,
+                "min": 0,
+                "nb_score": 0,
+                "avg_views": 0,
+                "total_views": 0,
+                "video_count": n
+            }
+        bit_max, bit_min = self.scores()
+        if not ((-100 <= bit_max <= 100) and (-100 <= bit_min <= 100)):
+            bit_max, bit_min = 0, 0.0001
+        total = float(self.total) if isinstance(self.total, Fraction) else self.total
+        if self.nonfinite_count:
+            # inf/nan은 정확한 합계(total)에 넣을 수 없어 결과를 낼 때만 더함
+            total += sum(value for value in self.values if not math.isfinite(value))
+        return {
+            "max": round(bit_max, 4),
+            "min": round(bit_min, 4),
+            "nb_score": round(abs(bit_max) / max(abs(bit_min), 0.0001), 4),
+            "avg_views": round(total / n, 2),
+            "total_views": total,
+            "video_count": n
+        }
+
+    def stats(self):
+        """재계산/증분 갱신 횟수"""
+        return {
+            "samples": len(self.values),
+            "window": self.window,
+            "recomputes": self.recomputes,
+            "fast_updates": self.fast_updates
+        }
@@ -0,0 +1,96 @@
+"""
+N/B 대량 재계산 테스트 (입력 형식, 순서 유지, 단일/멀티 프로세스 결과 일치)
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nbcore import engine, web
+from nbcore.batch import iter_jobs, main, score_jobs
+
+
+def write_inputs(directory):
+    """결과 파일, 모니터 보고서, JSONL 입력 생성"""
+    unicode_values = web.js_char_codes('오늘의 주요 뉴스')
+    with open(os.path.join(directory, 'a_result.json'), 'w', encoding='utf-8') as f:
+        json.dump({'id': 'abc', 'unicode': unicode_values, 'bit': 999}, f)
+    with open(os.path.join(directory, 'b_report.json'), 'w', encoding='utf-8') as f:
+        json.dump({'keywords': [
+            {'keyword': '속보', 'views': [74586, 105346]},
+            {'keyword': '주식', 'views': [10, 2000, 35000]},
+            {'keyword': '비트코인', 'views': []},
+        ]}, f, ensure_ascii=False)
+    with open(os.path.join(directory, 'c_sequences.jsonl'), 'w', encoding='utf-8') as f:
+        for i in range(50):
+            f.write(json.dumps([i, i * 3 + 1, -i, 7]) + '\n')
+    return unicode_values
+
+
+def test_formats_and_order():
+    """입력 순서대로 계산 방식별 결과가 직접 계산과 같은지 확인"""
+    with tempfile.TemporaryDirectory() as directory:
+        unicode_values = write_inputs(directory)
+        jobs = list(iter_jobs([directory]))
+        assert len(jobs) == 1 + 3 + 50
+        results = list(score_jobs(iter(jobs), workers=1, chunk_values=10))
+
+    first_job, first_scores = results[0]
+    assert first_job['method'] == 'web' and first_job['meta'] == {'id': 'abc'}
+    assert first_scores[0] == web.to_fixed(web.calculate_web_nb(unicode_values, 999, False))
+    keyword_job, keyword_scores = results[2]
+    assert keyword_job['meta'] == {'keyword': '주식'}
+    assert keyword_scores == (
+        engine.calculate_bit([10, 2000, 35000], 5.5, False),
+        engine.calculate_bit([10, 2000, 35000], 5.5, True)
+    )
+    for i, (job, scores) in enumerate(results[4:]):
+        assert job['values'] == [i, i * 3 + 1, -i, 7]
+        assert scores == (engine.calculate_bit(job['values'], 5.5, False),
+                          engine.calculate_bit(job['values'], 5.5, True))
+
+
+def test_process_pool_matches_single_process():
+    """프로세스 풀 결과(JSONL)가 단일 프로세스 결과와 같은 순서/값인지 확인"""
+    with tempfile.TemporaryDirectory() as directory:
+        write_inputs(directory)
+        outputs = []
+        for workers in ('1', '2'):
+            output = os.path.join(directory, f'out_{workers}.jsonl')
+            main([directory, '--workers', workers, '--chunk-values', '20', '--output', output, '--quiet'])
+            with open(output, 'r', encoding='utf-8') as f:
+                outputs.append([json.loads(line) for line in f])
+    assert outputs[0] == outputs[1]
+    assert [line['index'] for line in outputs[0]] == list(range(len(outputs[0])))
+
+
+def test_empty_file_skipped_and_nonfinite_written_as_null():
+    """빈 배열 파일은 건너뛰고, 계산 결과가 NaN이면 표준 JSON의 null로 기록"""
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, 'empty.json'), 'w', encoding='utf-8') as f:
+            json.dump([], f)
+        with open(os.path.join(directory, 'inf.json'), 'w', encoding='utf-8') as f:
+            json.dump([float('inf'), 1, 5], f)  # 표준 JSON은 아니지만 json 모듈은 Infinity를 읽음
+        assert [job['source'] for job in iter_jobs([directory])] == [os.path.join(directory, 'inf.json')]
+        output = os.path.join(directory, 'out.jsonl')
+        main([directory, '--workers', '1', '--output', output, '--quiet'])
+        with open(output, 'r', encoding='utf-8') as f:
+            lines = [json.loads(line, parse_constant=lambda name: name) for line in f]  # NaN이 있으면 문자열로 남음
+    assert len(lines) == 1 and lines[0]['nb_max'] is None and lines[0]['nb_min'] is None
+
+
+def main_tests():
+    print("=" * 60)
+    print("N/B 대량 재계산 테스트")
+    print("=" * 60)
+    for test in (test_formats_and_order, test_process_pool_matches_single_process,
+                 test_empty_file_skipped_and_nonfinite_written_as_null):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main_tests()
@@ -0,0 +1,60 @@
+"""
+N/B 벤치마크 테스트 (작은 입력으로 결과 구조/결과 차이 확인)
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nbcore.bench import _format_entry, find_regressions, percentile, run_benchmark
+
+
+def test_small_benchmark_has_no_drift():
+    """모든 구현이 계열 기준 구현과 허용 오차 안에서 일치"""
+    report = run_benchmark(sizes=[2, 12], repeats=3, log=lambda message: None)
+    assert report['drift_count'] == 0, [entry for entry in report['results'] if entry['drift']]
+    names = {entry['implementation'] for entry in report['results']}
+    assert {'engine.calculate_bit_loop', 'engine.calculate_bit', 'web.calculate_web_nb'} <= names
+    for entry in report['results']:
+        assert entry['calls'] == 3
+        assert entry['p50_ms'] <= entry['p99_ms']
+        assert entry['peak_memory_bytes'] >= 0
+    # 표준 JSON으로 직렬화 가능해야 실행 간 비교 가능
+    json.loads(json.dumps(report, allow_nan=False))
+
+
+def test_percentile_and_regressions():
+    """최근접 순위 백분위수와 p50 회귀 판정"""
+    samples = list(range(1, 101))
+    assert percentile(samples, 0.5) == 50
+    assert percentile(samples, 0.99) == 99
+    entry = {'implementation': 'engine.calculate_bit', 'kind': 'views', 'size': 10, 'p50_ms': 3.0}
+    previous = {'results': [dict(entry, p50_ms=1.0)]}
+    regressions = find_regressions({'results': [entry]}, previous)
+    assert len(regressions) == 1 and regressions[0]['ratio'] == 3.0
+    assert find_regressions({'results': [entry]}, {'results': [entry]}) == []
+
+
+def test_log_line_flags_drift():
+    """허용 오차를 넘은 차이는 유한값이어도 로그에 표시"""
+    entry = {'implementation': 'web.calculate_web_nb', 'kind': 'views', 'size': 10, 'p50_ms': 1.0,
+             'p99_ms': 2.0, 'peak_memory_bytes': 2048, 'reference': 'engine.calculate_bit_loop',
+             'max_abs_drift': 0.5, 'drift': True}
+    assert _format_entry(entry).endswith(" drift=0.5 ⚠️ DRIFT")
+    assert _format_entry(dict(entry, max_abs_drift=None)).endswith(" drift=inf ⚠️ DRIFT")
+    assert _format_entry(dict(entry, max_abs_drift=0.0, drift=False)).endswith(" drift=0")
+
+
+def main():
+    print("=" * 60)
+    print("N/B 벤치마크 테스트")
+    print("=" * 60)
+    for test in (test_small_benchmark_has_no_drift, test_percentile_and_regressions, test_log_line_flags_drift):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+N/B 엔진 테스트 (calculate_bit_vectorized == calculate_bit_loop, 배치 계산)
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '8BIT'))
+
+from nbcore.engine import (
+    NBResultCache, calculate_bit, calculate_bit_both, calculate_bit_loop, calculate_bit_many,
+    calculate_bit_vectorized, calculate_many, can_vectorize
+)
+from nb_calculation import NBCalculator
+
+
+def build_corpus(seed=20260218):
+    """조회수, 유니코드, 음수/양수 실수 입력 생성"""
+    rng = random.Random(seed)
+    generators = [
+        lambda n: [rng.randint(0, 10 ** 7) for _ in range(n)],
+        lambda n: [ord(ch) for ch in ''.join(rng.choice('한국인터넷 참소식abc123!') for _ in range(n))],
+        lambda n: [rng.uniform(-100, 100) for _ in range(n)],
+        lambda n: [rng.randint(-5, 5) for _ in range(n)],
+        lambda n: [rng.choice([-1.5, 0, 2.5]) for _ in range(n)],
+        lambda n: [0] * n,
+        lambda n: [-3] * n,
+    ]
+    corpus = []
+    for generate in generators:
+        for n in (2, 3, 5, 10, 37):
+            corpus.append(generate(n))
+    return corpus
+
+
+def test_vectorized_matches_loop():
+    """모든 입력/BIT/reverse 조합에서 결과가 비트 단위로 같은지 확인"""
+    for nb in build_corpus():
+        assert can_vectorize(nb)
+        for bit in (5.5, 100, 999):
+            for reverse in (False, True):
+                expected = calculate_bit_loop(nb, bit, reverse)
+                actual = calculate_bit_vectorized(nb, bit, reverse)
+                assert actual == expected, (nb, bit, reverse, expected, actual)
+
+
+def test_bit_max_min_nb():
+    """bit_max_nb / bit_min_nb 결과 확인 (len(nb)==2 포함)"""
+    for nb in ([1.5, 2.5, 3.5], [-5.0, 10.0], [-1.2, 0.5, 2.3]):
+        expected_max = calculate_bit_loop(nb, 5.5, False)
+        expected_min = calculate_bit_loop(nb, 5.5, True)
+        calculator = NBCalculator()
+        assert calculator.bit_max_nb(nb) == expected_max
+        assert calculator.bit_min_nb(nb) == expected_min
+
+
+def test_loop_fallback_for_non_finite():
+    """무한대/큰 정수 입력은 루프 계산으로 처리"""
+    assert not can_vectorize([1.0, float('inf')])
+    assert not can_vectorize([1, 2 ** 60])
+
+
+def test_calculate_many_matches_single():
+    """배치(패딩) 계산 결과가 개별 계산과 같은지 확인 (길이 0/1 포함)"""
+    sequences = build_corpus() + [[], [7], [2 ** 60, 1], [1.0, float('nan'), 3.0]]
+    for bit in (5.5, 999):
+        for reverse in (False, True):
+            batch = calculate_bit_many(sequences, bit, reverse, cache=None)
+            for nb, actual in zip(sequences, batch.tolist()):
+                expected = calculate_bit(nb, bit, reverse)
+                assert actual == expected or (actual != actual and expected != expected), (nb, bit, reverse)
+        both = calculate_bit_both(sequences, bit, cache=None)
+        for nb, forward, backward in zip(sequences, *both):
+            for actual, reverse in ((forward, False), (backward, True)):
+                expected = calculate_bit(nb, bit, reverse)
+                assert actual == expected or (actual != actual and expected != expected), (nb, bit, reverse)
+
+
+def test_calculate_many_scores_and_cache():
+    """MAX/MIN/점수 배열 및 LRU 캐시 동작 확인"""
+    sequences = [[100, 200, 300], [5, 1], [ord(ch) for ch in '참소식 뉴스']]
+    cache = NBResultCache(maxsize=4)
+    result = calculate_many(sequences, cache=cache)
+    for idx, nb in enumerate(sequences):
+        max_val = calculate_bit(nb, 5.5, False)
+        min_val = calculate_bit(nb, 5.5, True)
+        assert result['max'][idx] == max_val
+        assert result['min'][idx] == min_val
+        assert result['score'][idx] == abs(max_val) / max(abs(min_val), 0.0001)
+    assert len(cache) == 4
+    assert cache.stats()['misses'] == 6
+    
+    calculate_many(sequences[2:], cache=cache)
+    assert cache.stats()['hits'] == 2
+
+
+def main():
+    print("=" * 60)
+    print("N/B 엔진 테스트")
+    print("=" * 60)
+    for test in (
+        test_vectorized_matches_loop,
+        test_bit_max_min_nb,
+        test_loop_fallback_for_non_finite,
+        test_calculate_many_matches_single,
+        test_calculate_many_scores_and_cache,
+    ):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+N/B 검색 인덱스 테스트 (범위/최근접/유니코드 검색을 전체 비교와 대조, 인덱스 파일 복구)
+"""
+
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nbcore.index import NBIndex, unicode_signature
+from nbcore.store import INDEX_FILE, NBResultStore
+from nbcore.web import calculate_web_result
+
+
+def random_index(count, seed=3):
+    rng = random.Random(seed)
+    entries = [
+        ((1, i), rng.uniform(0, 200000), rng.uniform(0, 1), unicode_signature([i % 50]), f"id{i}")
+        for i in range(count)
+    ]
+    return NBIndex.from_entries(entries)
+
+
+def test_range_and_nearest_match_brute_force():
+    """정렬 배열 검색 결과가 전체 비교 결과와 같은지 확인"""
+    index = random_index(3000)
+    for _ in range(20):
+        index.add((2, 0), random.uniform(0, 200000), random.uniform(0, 1), 0, 'added')
+    values = index.values
+    expected = sorted((recno for recno, (nb_max, _) in enumerate(values) if 1000 <= nb_max <= 5000),
+                      key=lambda recno: values[recno][0])
+    assert sorted(index.range('nb_max', 1000, 5000)) == sorted(expected)
+    assert all(0.2 <= values[recno][1] <= 0.3 for recno in index.range('nb_min', 0.2, 0.3))
+
+    for scale in ((1.0, 1.0), (1 / 200000, 1.0)):
+        query = (123456.0, 0.5)
+        brute = sorted(
+            (math.hypot((nb_max - query[0]) * scale[0], (nb_min - query[1]) * scale[1]), recno)
+            for recno, (nb_max, nb_min) in enumerate(values)
+        )[:7]
+        assert index.nearest(query[0], query[1], 7, scale) == brute
+    assert index.same_signature([3]) == list(range(3, 3000, 50))
+
+
+def test_queries_are_fast():
+    """10만 건에서 범위/최근접 검색이 1ms 미만"""
+    index = random_index(100000)
+    start = time.perf_counter()
+    for _ in range(100):
+        index.range('nb_max', 5000, 5100)
+        index.nearest(100000.0, 0.5, 10)
+        index.same_signature([7])
+    assert (time.perf_counter() - start) / 100 < 0.001
+
+
+def test_store_uses_index_file():
+    """저장소는 index.nbi를 이어 쓰고, 파일이 없거나 잘려도 세그먼트로 복구"""
+    with tempfile.TemporaryDirectory() as root:
+        store = NBResultStore(root, fsync=False)
+        texts = [f"뉴스 {i}" for i in range(10)]
+        for text in texts:
+            result = calculate_web_result(text)
+            store.append({'id': text, 'unicode': result['unicode'], 'results': result['results']})
+        index_path = os.path.join(root, INDEX_FILE)
+        size = os.path.getsize(index_path)
+
+        reopened = NBResultStore(root)
+        assert len(reopened) == 10 and os.path.getsize(index_path) == size
+        assert [calc['id'] for calc in reopened.same_unicode(calculate_web_result('뉴스 3')['unicode'])] == ['뉴스 3']
+        first = reopened.values(0)
+        assert reopened.nearest(first[0], first[1], 1)[0][1]['id'] == '뉴스 0'
+
+        with open(index_path, 'r+b') as f:
+            f.truncate(size - 5)
+        assert len(NBResultStore(root)) == 10
+        os.remove(index_path)
+        rebuilt = NBResultStore(root)
+        assert len(rebuilt) == 10 and os.path.getsize(index_path) == size
+
+
+def main():
+    print("=" * 60)
+    print("N/B 검색 인덱스 테스트")
+    print("=" * 60)
+    for test in (test_range_and_nearest_match_brute_force, test_queries_are_fast, test_store_uses_index_file):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
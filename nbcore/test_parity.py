@@ -0,0 +1,88 @@
+"""
+web/calculate.js 일치 테스트 (parity_corpus.json 고정 입력 + node 실행 확인)
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from nbcore.web import (
+    calculate_web_nb, calculate_web_nb_loop, calculate_web_result, js_char_codes, to_fixed
+)
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parity_corpus.json')
+CALCULATE_JS = os.path.join(ROOT_DIR, 'web', 'calculate.js')
+
+NODE_SCRIPT = r'''
+const { calculateNB } = require(process.argv[1]);
+let data = '';
+process.stdin.on('data', d => data += d);
+process.stdin.on('end', () => {
+    const cases = JSON.parse(data);
+    process.stdout.write(JSON.stringify(cases.map(c => calculateNB(c.nb, c.bit, c.reverse))));
+});
+'''
+
+
+def load_corpus():
+    """고정 입력과 calculate.js 기대값 로드"""
+    with open(CORPUS_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)['cases']
+
+
+def test_corpus_matches_calculate_js():
+    """벡터/루프 계산 모두 calculate.js 결과와 비트 단위로 같은지 확인"""
+    for case in load_corpus():
+        args = (case['nb'], case['bit'], case['reverse'])
+        assert calculate_web_nb(*args) == case['expected'], case['name']
+        assert calculate_web_nb_loop(*args) == case['expected'], case['name']
+        assert to_fixed(calculate_web_nb(*args)) == case['expected_fixed'], case['name']
+
+
+def test_live_node_parity():
+    """node가 있으면 calculate.js를 직접 실행해 고정 입력 재확인"""
+    node = shutil.which('node')
+    if not node:
+        print("⏭️ node 미설치 - 실시간 비교 생략")
+        return
+    cases = load_corpus()
+    completed = subprocess.run(
+        [node, '-e', NODE_SCRIPT, CALCULATE_JS],
+        input=json.dumps(cases),
+        capture_output=True,
+        text=True,
+        encoding='utf-8',
+        check=True
+    )
+    for case, expected in zip(cases, json.loads(completed.stdout)):
+        assert calculate_web_nb(case['nb'], case['bit'], case['reverse']) == expected, case['name']
+
+
+def test_js_char_codes_and_text_result():
+    """charCodeAt(0)과 같은 코드 배열 및 /api/calculate 결과 구조 확인"""
+    assert js_char_codes('참소식') == [52280, 49548, 49885]
+    assert js_char_codes('🚀') == [0xD83D]
+    result = calculate_web_result('오늘의 주요 뉴스')
+    assert result['unicode'] == js_char_codes('오늘의 주요 뉴스')
+    assert len(result['results']) == 3
+    first = result['results'][0]
+    assert first['nb_max'] == to_fixed(calculate_web_nb(result['unicode'], 999, False))
+    assert first['nb_min'] == to_fixed(calculate_web_nb(result['unicode'], 999, True))
+
+
+def main():
+    print("=" * 60)
+    print("web/calculate.js 일치 테스트")
+    print("=" * 60)
+    for test in (test_corpus_matches_calculate_js, test_live_node_parity, test_js_char_codes_and_text_result):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
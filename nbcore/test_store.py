@@ -0,0 +1,124 @@
+"""
+N/B 결과 저장소 테스트 (레코드 왕복, 범위 검색, 깨진 레코드 복구, 기존 폴더 내보내기)
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nbcore.store import NBResultStore, number_to_path
+from nbcore.web import calculate_web_result
+
+
+def make_calc(text, calc_id):
+    """save_news_nb_calculations 결과와 같은 형식의 계산 결과"""
+    result = calculate_web_result(text)
+    return {
+        'id': calc_id,
+        'calculation_id': calc_id,
+        'timestamp': '2026-02-19T08:34:56.085Z',
+        'type': 'text',
+        'input': text,
+        'unicode': result['unicode'],
+        'bit': 999,
+        'view_count': 0,
+        'results': result['results'],
+        'saved': True
+    }
+
+
+def test_round_trip_and_range():
+    """추가한 결과가 그대로 읽히고 nb_max/nb_min 범위 검색이 정렬 순서로 동작"""
+    texts = [f"오늘의 주요 뉴스 {i} 🚀" * (i % 4 + 1) for i in range(30)]
+    calcs = [make_calc(text, f"id{i:03d}") for i, text in enumerate(texts)]
+    with tempfile.TemporaryDirectory() as root:
+        store = NBResultStore(root, segment_bytes=4096, fsync=False)
+        recnos = store.append_many(calcs + [{'id': 'x', 'results': []}])
+        assert recnos[-1] is None and len(store) == 30
+        assert len([name for name in os.listdir(root) if name.endswith('.nbs')]) > 1
+
+        reopened = NBResultStore(root)
+        for calc in calcs:
+            assert json.dumps(reopened.find(calc['id'])) == json.dumps(calc)
+        values = sorted(calc['results'][0]['nb_max'] for calc in calcs)
+        low, high = values[5], values[20]
+        found = reopened.range('nb_max', low, high)
+        assert [calc['results'][0]['nb_max'] for calc in found] == [v for v in values if low <= v <= high]
+
+
+def test_truncated_tail_is_dropped():
+    """마지막 레코드가 일부만 쓰였으면 열 때 잘라내고 이어서 추가 가능"""
+    with tempfile.TemporaryDirectory() as root:
+        store = NBResultStore(root, fsync=False)
+        store.append_many([make_calc('가나다', 'a'), make_calc('라마바', 'b')])
+        segment = os.path.join(root, 'segment_000001.nbs')
+        with open(segment, 'r+b') as f:
+            f.truncate(os.path.getsize(segment) - 3)
+        reopened = NBResultStore(root, fsync=False)
+        assert len(reopened) == 1
+        reopened.append(make_calc('사아자', 'c'))
+        assert [calc['id'] for _, calc in NBResultStore(root).iter_records()] == ['a', 'c']
+
+
+def _append_from_process(args):
+    root, prefix = args
+    store = NBResultStore(root, fsync=False)
+    for i in range(20):
+        store.append(make_calc(f"{prefix} 뉴스 {i}", f"{prefix}{i:02d}"))
+
+
+def test_concurrent_writers():
+    """같은 폴더를 여는 다른 저장소/프로세스가 번갈아 추가해도 레코드와 인덱스가 맞음"""
+    with tempfile.TemporaryDirectory() as root:
+        first = NBResultStore(root, fsync=False)
+        second = NBResultStore(root, fsync=False)
+        first.append(make_calc('가나다', 'a'))
+        assert second.append(make_calc('라마바', 'b')) == 1
+        assert first.append(make_calc('사아자', 'c')) == 2
+        assert first.find('b')['input'] == '라마바'
+
+        with multiprocessing.Pool(3) as pool:
+            pool.map(_append_from_process, [(root, prefix) for prefix in 'xyz'])
+        reopened = NBResultStore(root)
+        ids = [calc['id'] for _, calc in reopened.iter_records()]
+        assert len(ids) == 63 and len(set(ids)) == 63
+        assert all(reopened.find(calc_id)['id'] == calc_id for calc_id in ids)
+        assert second.append(make_calc('차카타', 'd')) == 63
+
+
+def test_export_legacy_tree():
+    """기존 save_news_results_by_path와 같은 경로/내용으로 내보내고 추가분만 다시 내보냄"""
+    with tempfile.TemporaryDirectory() as root:
+        store = NBResultStore(os.path.join(root, 'nb_store'), fsync=False)
+        nb_max_dir = os.path.join(root, 'nb_max')
+        nb_min_dir = os.path.join(root, 'nb_min')
+        calc = make_calc('참소식', 'abc')
+        store.append(calc)
+        assert store.export_pending(nb_max_dir, nb_min_dir) == 1
+        assert store.export_pending(nb_max_dir, nb_min_dir) == 0
+
+        path = os.path.join(nb_max_dir, number_to_path(calc['results'][0]['nb_max']), 'results.json')
+        with open(path, 'r', encoding='utf-8') as f:
+            assert f.read() == json.dumps(calc, ensure_ascii=False, indent=2)
+
+        imported = NBResultStore(os.path.join(root, 'imported'), fsync=False)
+        assert imported.import_legacy_tree(nb_max_dir) == 1
+        assert imported.import_legacy_tree(nb_min_dir) == 0
+
+
+def main():
+    print("=" * 60)
+    print("N/B 결과 저장소 테스트")
+    print("=" * 60)
+    for test in (test_round_trip_and_range, test_truncated_tail_is_dropped, test_concurrent_writers,
+                 test_export_legacy_tree):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+증분 N/B 계산 테스트 (IncrementalNBScorer == calculate_bit, 허용 오차 내)
+"""
+
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nbcore.engine import calculate_bit
+from nbcore.stream import IncrementalNBScorer
+
+REL_TOLERANCE = 1e-12
+
+
+def assert_close(actual, expected):
+    assert abs(actual - expected) <= REL_TOLERANCE * max(abs(expected), 1), (actual, expected)
+
+
+def check_series(series, window):
+    """값을 하나씩 추가하며 창 전체 계산 결과와 비교"""
+    scorer = IncrementalNBScorer(window=window)
+    for idx, value in enumerate(series):
+        scorer.push(value)
+        current = series[max(0, idx + 1 - window):idx + 1] if window else series[:idx + 1]
+        bit_max, bit_min = scorer.scores()
+        assert_close(bit_max, calculate_bit(current, 5.5, False))
+        assert_close(bit_min, calculate_bit(current, 5.5, True))
+    return scorer
+
+
+def test_view_series_uses_fast_updates():
+    """조회수(양수) 창에서 최소/최대가 그대로면 증분 갱신"""
+    rng = random.Random(7)
+    series = [rng.randint(0, 10 ** 6)] + [10 ** 6] + [rng.randint(1000, 900000) for _ in range(400)]
+    scorer = check_series(series, window=50)
+    stats = scorer.stats()
+    assert stats['fast_updates'] > stats['recomputes']
+
+
+def test_mixed_sign_and_unbounded():
+    """부호가 섞인 값, 창 없는(전체 기록) 모드도 전체 계산과 일치"""
+    rng = random.Random(11)
+    check_series([rng.uniform(-5, 5) for _ in range(120)], window=20)
+    check_series([rng.randint(-3, 3) for _ in range(60)], window=None)
+
+
+def test_extend_and_result_format():
+    """extend는 마지막에 한 번 계산하고 calculate_nb_score 형식으로 반환"""
+    scorer = IncrementalNBScorer(window=10)
+    assert scorer.extend([5])['nb_score'] == 0
+    result = scorer.extend([100, 200, 300])
+    assert result['video_count'] == 4
+    assert result['total_views'] == 605
+    assert set(result) == {'max', 'min', 'nb_score', 'avg_views', 'total_views', 'video_count'}
+
+
+def test_nonfinite_values_leave_window():
+    """inf/nan을 추가해도 예외 없이 계산하고, 창에서 빠지면 다시 증분 갱신"""
+    scorer = IncrementalNBScorer(window=3)
+    scorer.extend([10, 20, 30])
+    result = scorer.push(float('inf'))
+    assert len(scorer) == 3 and scorer.nonfinite_count == 1
+    assert result['total_views'] == float('inf')
+    assert math.isnan(scorer.push(float('nan'))['total_views'])
+    assert scorer.nonfinite_count == 2
+    check = scorer.extend([40, 50, 60])
+    assert scorer.nonfinite_count == 0
+    assert check['total_views'] == 150
+    assert_close(scorer.scores()[0], calculate_bit([40, 50, 60], 5.5, False))
+    assert_close(scorer.push(45)['max'], round(calculate_bit([50, 60, 45], 5.5, False), 4))
+
+
+def main():
+    print("=" * 60)
+    print("증분 N/B 계산 테스트")
+    print("=" * 60)
+    for test in (test_view_series_uses_fast_updates, test_mixed_sign_and_unbounded, test_extend_and_result_format,
+                 test_nonfinite_values_leave_window):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
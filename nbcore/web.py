@@ -0,0 +1,142 @@
+"""
+web/calculate.js calculateNB 포팅 (웹 서버 /api/calculate와 같은 N/B 값)
+
+웹 서버는 bitCalculation 방식(engine.py)과 다른 START 가중 평균 공식을
+사용하므로 IDE 등에서 서버와 같은 값을 로컬로 얻을 때 이 모듈을 사용한다.
+"""
+
+import math
+from decimal import Decimal, ROUND_HALF_UP
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COUNT = 50
+# web/config.json 기본값
+WEB_BIT_DEFAULT = 999
+WEB_DECIMAL_PLACES = 10
+WEB_TEXT_CALCULATION_COUNT = 3
+
+
+def js_char_codes(text):
+    """JavaScript Array.from(text).map(c => c.charCodeAt(0))와 같은 코드 배열
+
+    BMP 밖의 문자(이모지 등)는 UTF-16 상위 서로게이트 값이 된다.
+    """
+    codes = []
+    for ch in text:
+        code = ord(ch)
+        if code > 0xFFFF:
+            code = 0xD800 + ((code - 0x10000) >> 10)
+        codes.append(code)
+    return codes
+
+
+def to_fixed(value, places=WEB_DECIMAL_PLACES):
+    """parseFloat(value.toFixed(places))와 같은 반올림"""
+    if not math.isfinite(value):
+        return value
+    quantum = Decimal(1).scaleb(-places)
+    return float(Decimal(value).quantize(quantum, rounding=ROUND_HALF_UP))
+
+
+def calculate_web_nb_loop(nb, bit=WEB_BIT_DEFAULT, reverse=False):
+    """calculateNB 루프 계산 (calculate.js와 같은 순서의 연산)"""
+    if len(nb) < 2:
+        return bit / 100
+
+    n = len(nb)
+    max_val = max(nb)
+    min_val = min(nb)
+
+    negative_range = abs(min_val) if min_val < 0 else 0
+    positive_range = max_val if max_val > 0 else 0
+
+    negative_increment = negative_range / (COUNT * n - 1)
+    positive_increment = positive_range / (COUNT * n - 1)
+
+    result = 0
+    count = 0
+    for value in nb:
+        increment = negative_increment if value < 0 else positive_increment
+        for _ in range(COUNT):
+            a50 = min_val + increment * (count + 1)
+            a100 = (count + 1) * bit / (COUNT * n)
+            b50 = a50 - increment * 2
+            b100 = a50 + increment
+            nba100 = a100 / (n - 1)
+
+            start = abs((a50 + a100) / 2 - (b50 + b100) / 2) / 2
+            if reverse:
+                result += nba100 / (start + 0.0000001)
+            else:
+                result += start * nba100
+            count += 1
+
+    result = result / count
+    if not math.isfinite(result):
+        result = bit / 100
+    return result
+
+
+def calculate_web_nb(nb, bit=WEB_BIT_DEFAULT, reverse=False):
+    """calculateNB 벡터 계산 (NumPy 미설치 시 루프 계산)"""
+    if len(nb) < 2:
+        return bit / 100
+    if np is None:
+        return calculate_web_nb_loop(nb, bit, reverse)
+
+    n = len(nb)
+    size = COUNT * n
+    values = np.asarray(nb, dtype=np.float64)
+    max_val = float(values.max())
+    min_val = float(values.min())
+
+    negative_range = abs(min_val) if min_val < 0 else 0
+    positive_range = max_val if max_val > 0 else 0
+
+    negative_increment = negative_range / (size - 1)
+    positive_increment = positive_range / (size - 1)
+
+    increments = np.repeat(np.where(values < 0, negative_increment, positive_increment), COUNT)
+    steps = np.arange(1, size + 1, dtype=np.float64)
+
+    a50 = min_val + increments * steps
+    a100 = steps * bit / size
+    b50 = a50 - increments * 2
+    b100 = a50 + increments
+    nba100 = a100 / (n - 1)
+
+    start = np.abs((a50 + a100) / 2 - (b50 + b100) / 2) / 2
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        terms = nba100 / (start + 0.0000001) if reverse else start * nba100
+        # JS와 같은 순서로 누적 (pairwise 합계 사용 안 함)
+        result = float(np.add.accumulate(terms)[-1]) / size
+
+    if not math.isfinite(result):
+        result = bit / 100
+    return result
+
+
+def calculate_web_result(text, bit=WEB_BIT_DEFAULT, decimal_places=WEB_DECIMAL_PLACES):
+    """/api/calculate 문자 입력 결과의 results 항목과 같은 구조 생성"""
+    unicode_array = js_char_codes(text)
+    max_result = calculate_web_nb(unicode_array, bit, False)
+    min_result = calculate_web_nb(unicode_array, bit, True)
+    results = []
+    for i in range(WEB_TEXT_CALCULATION_COUNT):
+        results.append({
+            'calculation': i + 1,
+            'nb_max': to_fixed(max_result, decimal_places),
+            'nb_min': to_fixed(min_result, decimal_places),
+            'difference': to_fixed(max_result - min_result, decimal_places)
+        })
+    return {
+        'type': 'text',
+        'input': text,
+        'unicode': unicode_array,
+        'bit': bit,
+        'results': results
+    }
@@ -0,0 +1,33 @@
+"""
+Ollama 공용 클라이언트
+YouTube 모니터, 키워드 갱신, 8BIT 트렌드 AI, 월드 모니터, IDE가 함께 사용하는
+/api/generate 호출 기능 제공 (연결 풀, stream 조기 종료, keep_alive, 재시도, 통계, 응답 캐시,
+프로세스 간 입장 대기열)
+"""
+
+from .admission import BATCH, INTERACTIVE, AdmissionQueue, AdmissionTimeout, get_queue
+from .cache import ResponseCache, get_cache
+from .client import (
+    DEFAULT_URL,
+    OllamaClient,
+    OllamaMetrics,
+    OllamaResult,
+    bracket_closed,
+    get_client,
+)
+
+__all__ = [
+    'AdmissionQueue',
+    'AdmissionTimeout',
+    'BATCH',
+    'DEFAULT_URL',
+    'INTERACTIVE',
+    'OllamaClient',
+    'OllamaMetrics',
+    'OllamaResult',
+    'ResponseCache',
+    'bracket_closed',
+    'get_cache',
+    'get_client',
+    'get_queue',
+]
@@ -0,0 +1,248 @@
+"""
+Ollama 요청 입장 제어 (프로세스 간 동시 실행 제한 + 우선순위 대기열, 파일 잠금 기반)
+
+PM2/배치 파일로 따로 뜨는 모니터, 키워드 갱신, IDE, 월드 모니터, 다이어그램 도구가
+같은 Ollama 서버에 동시에 몰리지 않도록 서버 주소별 디렉터리에서 자리를 나눠 쓴다.
+
+- 자리(slot-N.lock): OLLAMA_MAX_IN_FLIGHT개. OS 파일 잠금이라 프로세스가 죽으면 자동 반납
+- 대기표(*.ticket): 파일 이름이 "우선순위-등록시각-pid-번호"라 이름순이 곧 대기 순서.
+  대기표도 잠근 채로 두어, 잠글 수 있는 대기표는 죽은 프로세스 것으로 보고 삭제
+- 대기열 앞쪽(비어 있는 자리 수만큼)만 자리를 잡을 수 있어 IDE(INTERACTIVE) 요청이
+  배치 작업(BATCH)보다 먼저 들어감
+- 대기 시간/입장 수/시간초과를 프로세스별로 집계, status()로 현재 사용 중 자리와 대기열 길이 확인
+
+python -m ollama_client.admission 으로 현재 상태를 볼 수 있다.
+"""
+
+import itertools
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+INTERACTIVE = 0
+NORMAL = 5
+BATCH = 10
+
+DEFAULT_DIR = os.getenv(
+    "OLLAMA_ADMISSION_DIR",
+    str(Path(__file__).resolve().parent.parent / "data" / "cache" / "ollama_admission"),
+)
+DEFAULT_MAX_IN_FLIGHT = int(os.getenv("OLLAMA_MAX_IN_FLIGHT", "2"))
+DEFAULT_TIMEOUT = float(os.getenv("OLLAMA_ADMISSION_TIMEOUT", "900"))
+ENABLED = os.getenv("OLLAMA_ADMISSION_ENABLED", "1").lower() not in ("0", "false", "no")
+POLL_SECONDS = 0.05
+
+
+class AdmissionTimeout(requests.exceptions.Timeout):
+    """대기열에서 제한 시간 안에 자리를 받지 못함 (requests Timeout으로 처리 가능)"""
+
+
+class _FileLock:
+    """파일 하나에 대한 비차단 배타 잠금 (같은 프로세스의 다른 핸들과도 충돌)"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    def try_acquire(self) -> bool:
+        fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+
+class AdmissionQueue:
+    """여러 프로세스가 공유하는 동시 실행 제한 + 우선순위 대기열 (스레드 안전)"""
+
+    _sequence = itertools.count()
+
+    def __init__(self, directory, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT, timeout: Optional[float] = DEFAULT_TIMEOUT):
+        self.directory = Path(directory)
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.timeout = timeout
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.reset_stats()
+
+    # 집계
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {"admitted": 0, "timeouts": 0, "wait_total": 0.0, "wait_max": 0.0, "max_depth": 0}
+
+    def snapshot_stats(self) -> Dict[str, Any]:
+        """이 프로세스의 입장 수, 평균/최대 대기 시간, 본 대기열 최대 길이"""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["wait_avg"] = round(stats["wait_total"] / stats["admitted"], 3) if stats["admitted"] else 0.0
+        stats["wait_total"] = round(stats["wait_total"], 3)
+        stats["wait_max"] = round(stats["wait_max"], 3)
+        return stats
+
+    def status(self) -> Dict[str, Any]:
+        """모든 프로세스 기준 현재 사용 중 자리 수와 우선순위별 대기 수"""
+        waiting: Dict[int, int] = {}
+        for ticket in self._live_tickets():
+            priority = int(ticket.name.split("-", 1)[0])
+            waiting[priority] = waiting.get(priority, 0) + 1
+        return {
+            "max_in_flight": self.max_in_flight,
+            "in_flight": self.max_in_flight - self._free_slots(),
+            "waiting": sum(waiting.values()),
+            "waiting_by_priority": waiting,
+        }
+
+    # 자리/대기표
+    def _slot_paths(self):
+        return [self.directory / f"slot-{index}.lock" for index in range(self.max_in_flight)]
+
+    def _free_slots(self) -> int:
+        free = 0
+        for path in self._slot_paths():
+            probe = _FileLock(path)
+            if probe.try_acquire():
+                probe.release()
+                free += 1
+        return free
+
+    def _take_slot(self) -> Optional[_FileLock]:
+        for path in self._slot_paths():
+            lock = _FileLock(path)
+            if lock.try_acquire():
+                return lock
+        return None
+
+    def _live_tickets(self):
+        """살아 있는 대기표 (이름순 = 대기 순서). 잠글 수 있는 대기표는 주인이 없으므로 삭제"""
+        tickets = []
+        for path in sorted(self.directory.glob("*.ticket")):
+            probe = _FileLock(path)
+            try:
+                stale = probe.try_acquire()
+            except OSError:  # 주인이 방금 지운 대기표
+                continue
+            if stale:
+                probe.release()
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+                continue
+            tickets.append(path)
+        return tickets
+
+    def _enqueue(self, priority: int) -> _FileLock:
+        name = f"{max(0, min(int(priority), 999)):03d}-{time.time_ns():020d}-{os.getpid()}-{next(self._sequence)}.ticket"
+        ticket = _FileLock(self.directory / name)
+        ticket.try_acquire()
+        return ticket
+
+    @staticmethod
+    def _dequeue(ticket: _FileLock) -> None:
+        ticket.release()
+        try:
+            ticket.path.unlink()
+        except OSError:
+            pass
+
+    @contextmanager
+    def slot(self, priority: int = BATCH, timeout: Optional[float] = None) -> Iterator[float]:
+        """자리를 받을 때까지 대기열에서 기다린 뒤 블록 실행 (대기한 초를 넘겨줌)
+
+        timeout(기본 OLLAMA_ADMISSION_TIMEOUT 초) 안에 자리를 못 받으면 AdmissionTimeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        ticket = self._enqueue(priority)
+        lock = None
+        try:
+            while True:
+                tickets = self._live_tickets()
+                with self._lock:
+                    self.stats["max_depth"] = max(self.stats["max_depth"], len(tickets))
+                position = tickets.index(ticket.path) if ticket.path in tickets else 0
+                if position < self._free_slots():
+                    lock = self._take_slot()
+                    if lock is not None:
+                        break
+                if timeout and time.monotonic() - started >= timeout:
+                    with self._lock:
+                        self.stats["timeouts"] += 1
+                    raise AdmissionTimeout(f"Ollama 대기열에서 {timeout:.0f}초 안에 자리를 받지 못함")
+                time.sleep(POLL_SECONDS)
+        finally:
+            self._dequeue(ticket)
+
+        waited = time.monotonic() - started
+        with self._lock:
+            self.stats["admitted"] += 1
+            self.stats["wait_total"] += waited
+            self.stats["wait_max"] = max(self.stats["wait_max"], waited)
+        try:
+            yield waited
+        finally:
+            lock.release()
+
+
+_QUEUES: Dict[str, AdmissionQueue] = {}
+_QUEUES_LOCK = threading.Lock()
+
+
+def queue_dir_name(base_url: str) -> str:
+    """서버 주소별 디렉터리 이름 (예: localhost_11434)"""
+    address = re.sub(r"^[a-z]+://", "", (base_url or "").rstrip("/").lower())
+    return re.sub(r"[^0-9a-z.]+", "_", address).strip("_") or "default"
+
+
+def get_queue(base_url: str) -> Optional[AdmissionQueue]:
+    """서버 주소별 공용 입장 대기열 (OLLAMA_ADMISSION_ENABLED=0이거나 디렉터리를 만들 수 없으면 None)"""
+    if not ENABLED:
+        return None
+    name = queue_dir_name(base_url)
+    with _QUEUES_LOCK:
+        queue = _QUEUES.get(name)
+        if queue is None:
+            try:
+                queue = _QUEUES[name] = AdmissionQueue(Path(DEFAULT_DIR) / name)
+            except OSError:
+                return None
+        return queue
+
+
+if __name__ == "__main__":
+    from .client import DEFAULT_URL
+
+    current = get_queue(DEFAULT_URL)
+    print(json.dumps(current.status() if current else {"enabled": False}, ensure_ascii=False, indent=2))
@@ -0,0 +1,180 @@
+"""
+Ollama 응답 캐시 (프롬프트 내용 기준, SQLite)
+
+온도가 0에 가깝거나 입력이 같으면 결과가 같은 프롬프트(최근 업로드 판정, 요약 포맷,
+카테고리 생성, 검색어 생성 등)를 다시 계산하지 않도록 hash(model, prompt, options)를
+키로 응답을 저장한다. 파일 하나를 YouTube 모니터, IDE, 도구 스크립트가 함께 쓴다.
+
+- 최대 개수(OLLAMA_CACHE_MAX_ENTRIES)를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+- 유효 기간(OLLAMA_CACHE_TTL 초, 0이면 무제한)은 호출별로 따로 줄 수 있음
+- 적중/실패 횟수와 적중으로 아낀 생성 시간(saved_seconds) 집계
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_PATH = os.getenv(
+    "OLLAMA_CACHE_PATH",
+    str(Path(__file__).resolve().parent.parent / "data" / "cache" / "llm_cache.sqlite3"),
+)
+DEFAULT_MAX_ENTRIES = int(os.getenv("OLLAMA_CACHE_MAX_ENTRIES", "20000"))
+DEFAULT_TTL = float(os.getenv("OLLAMA_CACHE_TTL", "0")) or None
+ENABLED = os.getenv("OLLAMA_CACHE_ENABLED", "1").lower() not in ("0", "false", "no")
+
+# 응답 내용에 영향을 주는 /api/generate 필드 (stream, keep_alive 등은 제외)
+KEY_FIELDS = ("model", "prompt", "system", "template", "format", "raw", "suffix", "options")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT,
+    response TEXT NOT NULL,
+    data TEXT,
+    latency REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def cache_key(payload: Dict[str, Any], stop_when: Callable[[str], bool] = None) -> str:
+    """요청 본문의 모델/프롬프트/옵션 해시 (조기 종료 조건이 다르면 다른 키)"""
+    parts = {field: payload[field] for field in KEY_FIELDS if payload.get(field) not in (None, "", {})}
+    # 예전 호출부처럼 options 밖에 둔 temperature도 결과에 영향을 줌
+    if "temperature" in payload:
+        parts["temperature"] = payload["temperature"]
+    if stop_when is not None:
+        parts["stop_when"] = getattr(stop_when, "__qualname__", repr(stop_when))
+    encoded = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """프로세스 사이에 공유되는 응답 캐시 (스레드 안전, 적중률/절약 시간 집계)"""
+
+    def __init__(self, path=DEFAULT_PATH, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = DEFAULT_TTL):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses(last_used)")
+        self._conn.commit()
+        self.reset_stats()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # 집계
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0, "saved_seconds": 0.0}
+
+    def snapshot_stats(self) -> Dict[str, Any]:
+        """적중률, 아낀 생성 시간, 저장 항목 수"""
+        with self._lock:
+            stats = dict(self.stats)
+            try:
+                stats["entries"] = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            except sqlite3.Error:
+                stats["entries"] = None
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        stats["saved_seconds"] = round(stats["saved_seconds"], 2)
+        return stats
+
+    def summary_line(self) -> str:
+        """로그용 한 줄 요약"""
+        stats = self.snapshot_stats()
+        return (
+            f"LLM 캐시 적중 {stats['hits']}/{stats['hits'] + stats['misses']} "
+            f"({stats['hit_rate'] * 100:.0f}%), 절약 {stats['saved_seconds']:.1f}초, 저장 {stats['entries']}개"
+        )
+
+    # 조회/저장 (DB 오류는 캐시 실패로 처리하고 생성은 계속 진행)
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Tuple[str, Dict[str, Any], float]]:
+        """유효 기간 안의 (응답, 부가 정보, 원래 생성 시간). 없으면 None"""
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT response, data, latency, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and ttl and now - row[3] >= ttl:
+                    row = None
+                if row:
+                    self._conn.execute(
+                        "UPDATE responses SET last_used = ?, hits = hits + 1 WHERE key = ?", (now, key)
+                    )
+                    self._conn.commit()
+            except sqlite3.Error:
+                self.stats["errors"] += 1
+                row = None
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self.stats["saved_seconds"] += row[2]
+        return row[0], json.loads(row[1] or "{}"), row[2]
+
+    def put(self, key: str, model: str, response: str, data: Dict[str, Any] = None, latency: float = 0.0) -> None:
+        """응답 저장 후 최대 개수를 넘은 만큼 오래 안 쓴 항목 삭제"""
+        if not response:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, response, data, latency, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, model, response, json.dumps(data or {}, ensure_ascii=False, default=str), latency, now, now),
+                )
+                self.stats["stores"] += 1
+                if self.max_entries:
+                    count = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                    if count > self.max_entries:
+                        evicted = self._conn.execute(
+                            "DELETE FROM responses WHERE key IN "
+                            "(SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                            (count - self.max_entries,),
+                        ).rowcount
+                        self.stats["evictions"] += evicted
+                self._conn.commit()
+            except sqlite3.Error:
+                self.stats["errors"] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+
+_CACHE: Optional[ResponseCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """공용 응답 캐시 (OLLAMA_CACHE_ENABLED=0이거나 파일을 열 수 없으면 None)"""
+    global _CACHE, ENABLED
+    if not ENABLED:
+        return None
+    with _CACHE_LOCK:
+        if _CACHE is None:
+            try:
+                _CACHE = ResponseCache()
+            except (OSError, sqlite3.Error):
+                ENABLED = False
+                return None
+        return _CACHE
@@ -0,0 +1,345 @@
+"""
+Ollama /api/generate 공용 클라이언트
+
+- requests.Session 연결 풀 재사용 (스크립트/스레드 공용)
+- stream 응답을 읽다가 stop_when 조건이 맞으면 연결을 끊어 생성 중단
+- keep_alive 기본값(OLLAMA_KEEP_ALIVE)으로 모델을 메모리에 유지
+- 연결 실패, 429/5xx 응답은 지수 백오프로 재시도 (읽기 시간초과는 재시도하지 않음)
+- 호출별 지연/토큰 수를 결과에 담고 모델별 누적 통계 집계
+- cache=True인 호출은 공용 응답 캐시(cache.py)에서 같은 모델/프롬프트/옵션 결과 재사용
+- 요청마다 프로세스 간 입장 대기열(admission.py)에서 서버 자리를 받은 뒤 전송
+  (priority: INTERACTIVE가 BATCH보다 먼저, 기본은 클라이언트의 priority)
+
+오류는 requests와 같은 예외(ConnectionError, Timeout, HTTPError)로 올라오므로
+기존 requests.post 호출부의 예외 처리를 그대로 쓸 수 있다.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import admission
+from .cache import ResponseCache, cache_key, get_cache
+
+DEFAULT_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
+DEFAULT_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+DEFAULT_RETRIES = int(os.getenv("OLLAMA_MAX_RETRIES", "2"))
+DEFAULT_BACKOFF = float(os.getenv("OLLAMA_BACKOFF_SECONDS", "1.0"))
+RETRY_STATUS = (429, 500, 502, 503, 504)
+POOL_SIZE = 16
+
+
+def bracket_closed(text: str) -> bool:
+    """'[' 뒤에 ']'가 나왔는지 (대괄호 한 문장 응답의 조기 종료 조건)"""
+    start = text.find("[")
+    return start != -1 and "]" in text[start + 1:]
+
+
+class OllamaResult:
+    """생성 결과 (requests.Response처럼 json()/raise_for_status()도 제공)"""
+
+    status_code = 200
+
+    def __init__(
+        self,
+        text: str,
+        data: Dict[str, Any],
+        latency: float,
+        stopped_early: bool = False,
+        attempts: int = 1,
+        cached: bool = False,
+    ):
+        self.text = text
+        self.data = data
+        self.latency = latency
+        self.stopped_early = stopped_early
+        self.attempts = attempts
+        self.cached = cached
+        self.queue_wait = 0.0
+
+    @property
+    def model(self) -> str:
+        return self.data.get("model", "")
+
+    @property
+    def eval_count(self) -> int:
+        """생성 토큰 수 (조기 종료 시 받은 조각 수)"""
+        return int(self.data.get("eval_count") or 0)
+
+    @property
+    def prompt_eval_count(self) -> int:
+        return int(self.data.get("prompt_eval_count") or 0)
+
+    def json(self) -> Dict[str, Any]:
+        return {**self.data, "response": self.text}
+
+    def raise_for_status(self) -> None:
+        """오류 응답은 generate에서 이미 예외로 올라오므로 아무것도 하지 않음"""
+
+
+class OllamaMetrics:
+    """모델별 호출 수, 오류, 재시도, 조기 종료, 지연, 토큰 누적"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._models: Dict[str, Dict[str, float]] = {}
+
+    def _entry(self, model: str) -> Dict[str, float]:
+        return self._models.setdefault(model or "?", {
+            "calls": 0, "errors": 0, "retries": 0, "early_stops": 0,
+            "latency_total": 0.0, "latency_max": 0.0, "eval_tokens": 0, "prompt_tokens": 0,
+            "queue_wait_total": 0.0, "queue_wait_max": 0.0,
+        })
+
+    def record(
+        self, model: str, latency: float, result: OllamaResult = None, retries: int = 0, queue_wait: float = 0.0
+    ) -> None:
+        """호출 1건 기록 (latency는 대기열 대기 시간을 뺀 요청 시간)"""
+        with self._lock:
+            entry = self._entry(model)
+            entry["calls"] += 1
+            entry["retries"] += retries
+            entry["queue_wait_total"] += queue_wait
+            entry["queue_wait_max"] = max(entry["queue_wait_max"], queue_wait)
+            entry["latency_total"] += latency
+            entry["latency_max"] = max(entry["latency_max"], latency)
+            if result is None:
+                entry["errors"] += 1
+                return
+            entry["early_stops"] += int(result.stopped_early)
+            entry["eval_tokens"] += result.eval_count
+            entry["prompt_tokens"] += result.prompt_eval_count
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """모델별 통계 (평균 지연, 초당 토큰 포함)"""
+        with self._lock:
+            models = {model: dict(entry) for model, entry in self._models.items()}
+        for entry in models.values():
+            entry["latency_avg"] = round(entry["latency_total"] / entry["calls"], 3) if entry["calls"] else 0.0
+            entry["tokens_per_second"] = (
+                round(entry["eval_tokens"] / entry["latency_total"], 2) if entry["latency_total"] else 0.0
+            )
+            entry["latency_total"] = round(entry["latency_total"], 3)
+            entry["latency_max"] = round(entry["latency_max"], 3)
+            entry["queue_wait_total"] = round(entry["queue_wait_total"], 3)
+            entry["queue_wait_max"] = round(entry["queue_wait_max"], 3)
+        return models
+
+    def reset(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+class OllamaClient:
+    """연결 풀을 재사용하는 Ollama 클라이언트 (스레드 공용)"""
+
+    def __init__(
+        self,
+        base_url: str = DEFAULT_URL,
+        keep_alive: Optional[str] = DEFAULT_KEEP_ALIVE,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        pool_size: int = POOL_SIZE,
+        cache: ResponseCache = None,
+        priority: int = admission.BATCH,
+        admission_queue: admission.AdmissionQueue = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.priority = priority
+        self.keep_alive = keep_alive
+        self.retries = retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.metrics = OllamaMetrics()
+        self._cache = cache
+        self._admission = admission_queue
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        """응답 캐시 (지정하지 않았으면 공용 캐시)"""
+        return self._cache if self._cache is not None else get_cache()
+
+    @property
+    def admission(self) -> Optional[admission.AdmissionQueue]:
+        """입장 대기열 (지정하지 않았으면 서버 주소별 공용 대기열)"""
+        return self._admission if self._admission is not None else admission.get_queue(self.base_url)
+
+    def generate(
+        self,
+        model: str,
+        prompt: str,
+        options: Dict[str, Any] = None,
+        timeout: float = 120,
+        stop_when: Callable[[str], bool] = None,
+        on_chunk: Callable[[str], None] = None,
+        retries: int = None,
+        cache: bool = False,
+        cache_ttl: float = None,
+        limiter: ContextManager = None,
+        priority: int = None,
+        **fields,
+    ) -> OllamaResult:
+        """프롬프트 생성 (fields는 system, format, keep_alive 등 /api/generate 추가 필드)"""
+        payload = {"model": model, "prompt": prompt, "stream": False, **fields}
+        if options:
+            payload["options"] = options
+        return self.generate_payload(
+            payload, timeout=timeout, stop_when=stop_when, on_chunk=on_chunk, retries=retries,
+            cache=cache, cache_ttl=cache_ttl, limiter=limiter, priority=priority,
+        )
+
+    def generate_text(self, model: str, prompt: str, **kwargs) -> str:
+        """생성 결과 텍스트만 (앞뒤 공백 제거)"""
+        return self.generate(model, prompt, **kwargs).text.strip()
+
+    def generate_payload(
+        self,
+        payload: Dict[str, Any],
+        timeout: float = 120,
+        stop_when: Callable[[str], bool] = None,
+        on_chunk: Callable[[str], None] = None,
+        retries: int = None,
+        cache: bool = False,
+        cache_ttl: float = None,
+        limiter: ContextManager = None,
+        priority: int = None,
+    ) -> OllamaResult:
+        """/api/generate 요청 본문을 그대로 보내 결과 반환
+
+        stop_when 또는 on_chunk가 있으면 stream으로 받는다. timeout은 stream일 때
+        조각 사이 대기 시간에 적용된다. cache=True이면 같은 모델/프롬프트/옵션의
+        저장된 응답을 먼저 찾고(cache_ttl 초 이내), 없으면 생성 결과를 저장한다.
+        limiter(동시 실행 제한 컨텍스트)는 캐시 적중이 아닐 때 요청 동안만 잡는다.
+        priority는 프로세스 간 입장 대기열 순서 (admission.INTERACTIVE/BATCH, 기본은 self.priority).
+        """
+        store = self.cache if cache else None
+        key = cache_key(payload, stop_when) if store is not None else None
+        if store is not None:
+            hit = store.get(key, ttl=cache_ttl)
+            if hit is not None:
+                text, data, _ = hit
+                if on_chunk:
+                    on_chunk(text)
+                return OllamaResult(text, data, 0.0, attempts=0, cached=True)
+        with limiter or nullcontext():
+            return self._request(payload, timeout, stop_when, on_chunk, retries, store, key, priority)
+
+    def _admission_slot(self, priority: Optional[int]):
+        queue = self.admission
+        if queue is None:
+            return nullcontext(0.0)
+        return queue.slot(self.priority if priority is None else priority)
+
+    def _request(self, payload, timeout, stop_when, on_chunk, retries, store, key, priority) -> OllamaResult:
+        payload = dict(payload)
+        if self.keep_alive is not None:
+            payload.setdefault("keep_alive", self.keep_alive)
+        stream = bool(stop_when or on_chunk or payload.get("stream"))
+        payload["stream"] = stream
+        retries = self.retries if retries is None else retries
+        model = payload.get("model", "")
+
+        started = time.perf_counter()
+        queue_wait = 0.0
+        attempt = 0
+        while True:
+            try:
+                # 서버 자리는 요청/응답을 읽는 동안만 잡고 재시도 대기 중에는 반납
+                with self._admission_slot(priority) as waited:
+                    queue_wait += waited
+                    response = self.session.post(
+                        f"{self.base_url}/api/generate", json=payload, timeout=timeout, stream=stream
+                    )
+                    retry = response.status_code in RETRY_STATUS and attempt < retries
+                    try:
+                        if not retry:
+                            response.raise_for_status()
+                            if stream:
+                                text, data, stopped = self._read_stream(response, stop_when, on_chunk)
+                            else:
+                                data = response.json()
+                                text, stopped = data.get("response", "") or "", False
+                    finally:
+                        response.close()
+                if retry:
+                    self._sleep(attempt)
+                    attempt += 1
+                    continue
+            except requests.exceptions.ConnectionError:
+                if attempt < retries:
+                    self._sleep(attempt)
+                    attempt += 1
+                    continue
+                self.metrics.record(model, time.perf_counter() - started - queue_wait, retries=attempt, queue_wait=queue_wait)
+                raise
+            except Exception:
+                self.metrics.record(model, time.perf_counter() - started - queue_wait, retries=attempt, queue_wait=queue_wait)
+                raise
+            result = OllamaResult(text, data, time.perf_counter() - started - queue_wait, stopped, attempt + 1)
+            result.queue_wait = queue_wait
+            self.metrics.record(model, result.latency, result, retries=attempt, queue_wait=queue_wait)
+            if store is not None:
+                store.put(key, model, text, data, result.latency)
+            return result
+
+    def _sleep(self, attempt: int) -> None:
+        time.sleep(self.backoff * (2 ** attempt) + random.uniform(0, self.backoff / 2))
+
+    @staticmethod
+    def _read_stream(response, stop_when, on_chunk):
+        parts: List[str] = []
+        data: Dict[str, Any] = {}
+        chunks = 0
+        stopped = False
+        for line in response.iter_lines():
+            if not line:
+                continue
+            chunk = json.loads(line)
+            if chunk.get("error"):
+                raise requests.HTTPError(chunk["error"], response=response)
+            piece = chunk.get("response", "") or ""
+            if piece:
+                chunks += 1
+                parts.append(piece)
+                if on_chunk:
+                    on_chunk(piece)
+            if chunk.get("done"):
+                data = {key: value for key, value in chunk.items() if key not in ("response", "context")}
+                break
+            data.setdefault("model", chunk.get("model", ""))
+            if stop_when and stop_when("".join(parts)):
+                stopped = True
+                break
+        if stopped or "eval_count" not in data:
+            data["eval_count"] = chunks
+        return "".join(parts), data, stopped
+
+    def list_models(self, timeout: float = 5) -> List[str]:
+        """설치된 모델 이름 목록 (/api/tags)"""
+        response = self.session.get(f"{self.base_url}/api/tags", timeout=timeout)
+        response.raise_for_status()
+        return [model.get("name", "") for model in response.json().get("models", []) if model.get("name")]
+
+
+_CLIENTS: Dict[str, OllamaClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(base_url: str = None) -> OllamaClient:
+    """주소별 공용 클라이언트 (프로세스 안에서 연결 풀과 통계를 공유)"""
+    base_url = (base_url or DEFAULT_URL).rstrip("/")
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(base_url)
+        if client is None:
+            client = _CLIENTS[base_url] = OllamaClient(base_url)
+        return client
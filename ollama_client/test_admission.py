@@ -0,0 +1,89 @@
+"""
+Ollama 입장 대기열 테스트 (프로세스 간 자리 제한, 우선순위, 죽은 대기표 정리, 시간초과)
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from ollama_client.admission import BATCH, INTERACTIVE, AdmissionQueue, AdmissionTimeout, queue_dir_name
+
+HOLDER = """
+import sys, time
+sys.path.insert(0, sys.argv[1])
+from ollama_client.admission import AdmissionQueue
+with AdmissionQueue(sys.argv[2], max_in_flight=1).slot():
+    print('held', flush=True)
+    time.sleep(float(sys.argv[3]))
+"""
+
+
+def test_slot_shared_across_processes_and_timeout():
+    """다른 프로세스가 자리를 잡고 있으면 대기, 시간 안에 못 받으면 AdmissionTimeout"""
+    with tempfile.TemporaryDirectory() as tmp:
+        holder = subprocess.Popen([sys.executable, '-c', HOLDER, ROOT, tmp, '0.6'], stdout=subprocess.PIPE, text=True)
+        try:
+            assert holder.stdout.readline().strip() == 'held'
+            queue = AdmissionQueue(tmp, max_in_flight=1)
+            assert queue.status()['in_flight'] == 1
+            try:
+                with queue.slot(timeout=0.1):
+                    assert False, "자리가 없어야 함"
+            except AdmissionTimeout as e:
+                assert isinstance(e, requests.exceptions.Timeout)
+            with queue.slot(timeout=5) as waited:
+                assert waited > 0.2
+            stats = queue.snapshot_stats()
+            assert stats['admitted'] == 1 and stats['timeouts'] == 1
+        finally:
+            holder.wait(timeout=5)
+
+
+def test_interactive_outranks_batch_and_stale_tickets_removed():
+    """먼저 기다린 배치 요청보다 IDE 요청이 먼저 들어가고, 주인 없는 대기표는 삭제"""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = AdmissionQueue(tmp, max_in_flight=1)
+        stale = os.path.join(tmp, f'000-{0:020d}-999999-0.ticket')
+        open(stale, 'w').close()
+        order = []
+
+        def worker(name, priority):
+            with queue.slot(priority=priority):
+                order.append(name)
+
+        with queue.slot():
+            batch = threading.Thread(target=worker, args=('batch', BATCH))
+            batch.start()
+            time.sleep(0.2)
+            interactive = threading.Thread(target=worker, args=('ide', INTERACTIVE))
+            interactive.start()
+            time.sleep(0.2)
+            status = queue.status()
+            assert status['waiting'] == 2 and status['waiting_by_priority'] == {INTERACTIVE: 1, BATCH: 1}
+            assert not os.path.exists(stale)
+        batch.join(5)
+        interactive.join(5)
+        assert order == ['ide', 'batch']
+        assert queue.status() == {'max_in_flight': 1, 'in_flight': 0, 'waiting': 0, 'waiting_by_priority': {}}
+    assert queue_dir_name('http://localhost:11434/') == 'localhost_11434'
+
+
+def main():
+    print("=" * 60)
+    print("Ollama 입장 대기열 테스트")
+    print("=" * 60)
+    for test in (test_slot_shared_across_processes_and_timeout, test_interactive_outranks_batch_and_stale_tickets_removed):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Ollama 응답 캐시 테스트 (키 구성, LRU 삭제, 유효 기간, 적중률/절약 시간, 클라이언트 연동)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ollama_client import OllamaClient, ResponseCache, bracket_closed
+from ollama_client.cache import cache_key
+from ollama_client.test_client import FakeOllama, start_server
+
+
+def test_key_lru_and_ttl():
+    """stream/keep_alive는 키에 영향 없음, 최대 개수 초과 시 오래 안 쓴 항목 삭제, 유효 기간 확인"""
+    base = {'model': 'm', 'prompt': 'p', 'options': {'temperature': 0}}
+    assert cache_key(base) == cache_key({**base, 'stream': True, 'keep_alive': '5m'})
+    assert cache_key(base) != cache_key({**base, 'options': {'temperature': 0.3}})
+    assert cache_key(base) != cache_key(base, stop_when=bracket_closed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(os.path.join(tmp, 'llm.sqlite3'), max_entries=2, ttl=None)
+        cache.put('a', 'm', 'A', latency=1.5)
+        time.sleep(0.01)
+        cache.put('b', 'm', 'B', latency=2.0)
+        time.sleep(0.01)
+        assert cache.get('a')[0] == 'A'  # a를 최근 사용으로 갱신
+        cache.put('c', 'm', 'C', latency=1.0)
+        assert cache.get('b') is None and cache.get('c')[0] == 'C'
+        time.sleep(0.05)
+        assert cache.get('a', ttl=0.01) is None
+        stats = cache.snapshot_stats()
+        assert stats['hits'] == 2 and stats['misses'] == 2 and stats['evictions'] == 1
+        assert stats['saved_seconds'] == 2.5 and stats['hit_rate'] == 0.5 and stats['entries'] == 2
+        cache.close()
+
+
+def test_client_reuses_cached_response_across_clients():
+    """cache=True 호출만 저장/재사용, 다른 클라이언트(프로세스)도 같은 파일로 적중"""
+    server, url = start_server()
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'llm.sqlite3')
+            client = OllamaClient(url, retries=0, cache=ResponseCache(path))
+            before = len(FakeOllama.payloads)
+            first = client.generate('m', 'p', options={'temperature': 0}, cache=True)
+            second = client.generate('m', 'p', options={'temperature': 0}, cache=True)
+            client.generate('m', 'p', options={'temperature': 0})
+            assert not first.cached and second.cached and second.text == first.text
+            assert len(FakeOllama.payloads) - before == 2
+
+            other = OllamaClient(url, retries=0, cache=ResponseCache(path))
+            pieces = []
+            third = other.generate('m', 'p', options={'temperature': 0}, cache=True, on_chunk=pieces.append)
+            assert third.cached and pieces == [first.text]
+            assert len(FakeOllama.payloads) - before == 2
+            assert client.metrics.snapshot()['m']['calls'] == 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def main():
+    print("=" * 60)
+    print("Ollama 응답 캐시 테스트")
+    print("=" * 60)
+    for test in (test_key_lru_and_ttl, test_client_reuses_cached_response_across_clients):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Ollama 공용 클라이언트 테스트 (로컬 가짜 서버로 stream 조기 종료, 재시도, 통계, 예외 형식 확인)
+"""
+
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ollama_client import OllamaClient, bracket_closed
+
+TOKENS = ['[오늘', ' 주요', ' 뉴스', ']', ' 추가', ' 설명']
+
+
+class FakeOllama(BaseHTTPRequestHandler):
+    failures = 0
+    payloads = []
+    streamed = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        FakeOllama.payloads.append(payload)
+        if payload['model'] == 'busy' and FakeOllama.failures > 0:
+            FakeOllama.failures -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        if payload['model'] == 'missing':
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.end_headers()
+        if not payload['stream']:
+            body = {'model': payload['model'], 'response': ''.join(TOKENS), 'done': True,
+                    'eval_count': len(TOKENS), 'prompt_eval_count': 7}
+            self.wfile.write(json.dumps(body).encode('utf-8'))
+            return
+        sent = 0
+        try:
+            for token in TOKENS:
+                self.wfile.write((json.dumps({'model': payload['model'], 'response': token, 'done': False}) + '\n').encode('utf-8'))
+                self.wfile.flush()
+                sent += 1
+            self.wfile.write((json.dumps({'model': payload['model'], 'response': '', 'done': True,
+                                          'eval_count': len(TOKENS)}) + '\n').encode('utf-8'))
+        finally:
+            FakeOllama.streamed.append(sent)
+
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeOllama)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def test_generate_stream_and_early_stop():
+    """일반 응답/stream 응답이 같고, stop_when이면 ']'에서 끊음. keep_alive 기본값 포함"""
+    server, url = start_server()
+    try:
+        client = OllamaClient(url, keep_alive='10m', retries=0)
+        full = client.generate('m', 'p', options={'temperature': 0})
+        assert full.text == ''.join(TOKENS) and full.eval_count == 6 and full.prompt_eval_count == 7
+        assert full.json()['response'] == full.text
+        assert FakeOllama.payloads[-1]['keep_alive'] == '10m'
+        assert FakeOllama.payloads[-1]['options'] == {'temperature': 0}
+
+        pieces = []
+        streamed = client.generate('m', 'p', on_chunk=pieces.append)
+        assert streamed.text == full.text and pieces == TOKENS and not streamed.stopped_early
+
+        early = client.generate('m', 'p', stop_when=bracket_closed)
+        assert early.text == '[오늘 주요 뉴스]' and early.stopped_early and early.eval_count == 4
+
+        stats = client.metrics.snapshot()['m']
+        assert stats['calls'] == 3 and stats['early_stops'] == 1 and stats['errors'] == 0
+    finally:
+        server.shutdown()
+
+
+def test_retry_and_requests_exceptions():
+    """503은 백오프 후 재시도, 4xx는 HTTPError, 연결 실패는 ConnectionError"""
+    server, url = start_server()
+    try:
+        client = OllamaClient(url, retries=2, backoff=0.01)
+        FakeOllama.failures = 2
+        result = client.generate('busy', 'p')
+        assert result.attempts == 3 and result.text
+
+        FakeOllama.failures = 5
+        try:
+            client.generate('busy', 'p')
+            assert False, "HTTPError가 나야 함"
+        except requests.HTTPError as e:
+            assert e.response.status_code == 503
+        try:
+            client.generate('missing', 'p')
+            assert False, "HTTPError가 나야 함"
+        except requests.HTTPError:
+            pass
+        stats = client.metrics.snapshot()
+        assert stats['busy']['retries'] == 4 and stats['busy']['errors'] == 1 and stats['missing']['errors'] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    try:
+        OllamaClient(url, retries=1, backoff=0.01).generate('m', 'p', timeout=2)
+        assert False, "ConnectionError가 나야 함"
+    except requests.ConnectionError:
+        pass
+
+
+def main():
+    print("=" * 60)
+    print("Ollama 공용 클라이언트 테스트")
+    print("=" * 60)
+    for test in (test_generate_stream_and_early_stop, test_retry_and_requests_exceptions):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,17 @@ Selenium 기반 네이버 뉴스 크롤링 (개선版)
 페이지 렌더링 후 실제 뉴스 항목 파싱
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from bs4 import BeautifulSoup
 from typing import List, Dict
 from urllib.parse import quote
-import time
 import logging
 import re
 
+import webdriver_pool
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -67,30 +64,26 @@ def _extract_news_links(soup: BeautifulSoup, limit: int) -> List[Dict]:
     return results
 
 
+def _create_chrome():
+    return webdriver_pool.create_chrome(webdriver_pool.chrome_options(user_agent=webdriver_pool.DEFAULT_USER_AGENT), page_load_timeout=30)
+
+
 def get_chrome_driver_advanced():
-    """고급 Chrome 드라이버 설정"""
+    """고급 Chrome 드라이버 빌리기 (공용 풀에서 재사용)"""
     try:
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.set_page_load_timeout(30)
-        
-        logger.info("✅ Chrome 드라이버 시작")
+        driver = webdriver_pool.get_pool("naver_news", _create_chrome).checkout()
+        logger.info("✅ Chrome 드라이버 준비")
         return driver
     except Exception as e:
         logger.error(f"❌ Chrome 드라이버 실패: {e}")
         return None
 
 
+def release_chrome_driver(driver):
+    """다 쓴 드라이버를 풀에 반납 (초기화 실패 시 종료 후 교체)"""
+    webdriver_pool.get_pool("naver_news", _create_chrome).checkin(driver)
+
+
 def get_naver_news_by_category(category_id: int = None, limit: int = 10) -> List[Dict]:
     """
     네이버 뉴스 카테고리별 크롤링 (Selenium)
@@ -129,7 +122,7 @@ def get_naver_news_by_category(category_id: int = None, limit: int = 10) -> List
         
         # 페이지 로드
         driver.get(url)
-        time.sleep(3)  # 페이지 로딩 대기
+        webdriver_pool.wait_for_page(driver, 3, label="naver_news")  # 페이지 로딩 대기
         
         # JavaScript 렌더링 대기
         try:
@@ -219,11 +212,7 @@ def get_naver_news_by_category(category_id: int = None, limit: int = 10) -> List
     
     finally:
         if driver:
-            try:
-                driver.quit()
-                logger.info("✅ 드라이버 종료")
-            except:
-                pass
+            release_chrome_driver(driver)
 
 
 def get_naver_news_search_selenium(keyword: str, limit: int = 10) -> List[Dict]:
@@ -253,7 +242,7 @@ def get_naver_news_search_selenium(keyword: str, limit: int = 10) -> List[Dict]:
         logger.info(f"[URL] {url[:90]}")
         
         driver.get(url)
-        time.sleep(3)  # 페이지 로딩 대기
+        webdriver_pool.wait_for_page(driver, 3, label="naver_news")  # 페이지 로딩 대기
         
         # 렌더링 대기
         try:
@@ -333,11 +322,7 @@ def get_naver_news_search_selenium(keyword: str, limit: int = 10) -> List[Dict]:
     
     finally:
         if driver:
-            try:
-                driver.quit()
-                logger.info("✅ 드라이버 종료")
-            except:
-                pass
+            release_chrome_driver(driver)
 
 
 if __name__ == '__main__':
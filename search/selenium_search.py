@@ -3,47 +3,41 @@ Selenium 기반 동적 웹 크롤링 - Naver/Bing 검색 개선
 JavaScript 렌더링까지 처리 가능
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 from bs4 import BeautifulSoup
 from typing import List, Dict
 from urllib.parse import quote
-import time
 import logging
 
+import webdriver_pool
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _create_chrome():
+    return webdriver_pool.create_chrome(webdriver_pool.chrome_options(user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'), page_load_timeout=None)
+
+
 def get_chrome_driver():
-    """Chrome 드라이버 생성 (헤드리스 모드)"""
+    """Chrome 드라이버 빌리기 (헤드리스, 공용 풀에서 재사용)"""
     try:
-        options = Options()
-        options.add_argument('--headless')  # GUI 없이 실행
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
-        
-        logger.info("✅ Chrome 드라이버 시작")
+        driver = webdriver_pool.get_pool("selenium_search", _create_chrome).checkout()
+        logger.info("✅ Chrome 드라이버 준비")
         return driver
     except Exception as e:
         logger.error(f"❌ Chrome 드라이버 실패: {e}")
         return None
 
 
+def release_chrome_driver(driver):
+    """다 쓴 드라이버를 풀에 반납 (초기화 실패 시 종료 후 교체)"""
+    webdriver_pool.get_pool("selenium_search", _create_chrome).checkin(driver)
+
+
 def search_naver_selenium(keyword: str, search_type: str = 'news', limit: int = 5) -> List[Dict]:
     """
     Selenium을 사용한 네이버 검색 (JavaScript 렌더링 포함)
@@ -184,11 +178,7 @@ def search_naver_selenium(keyword: str, search_type: str = 'news', limit: int =
     
     finally:
         if driver:
-            try:
-                driver.quit()
-                logger.info("✅ 드라이버 종료")
-            except:
-                pass
+            release_chrome_driver(driver)
 
 
 def search_bing_selenium(keyword: str, search_type: str = 'web', limit: int = 5) -> List[Dict]:
@@ -234,7 +224,7 @@ def search_bing_selenium(keyword: str, search_type: str = 'web', limit: int = 5)
         except:
             logger.warning("⚠️  렌더링 시간 초과 (계속 진행)")
         
-        time.sleep(2)  # 추가 로딩 시간
+        webdriver_pool.wait_for_quiet(driver, 2, label="bing_selenium")  # 추가 로딩이 끝날 때까지
         
         soup = BeautifulSoup(driver.page_source, 'html.parser')
         
@@ -315,11 +305,7 @@ def search_bing_selenium(keyword: str, search_type: str = 'web', limit: int = 5)
     
     finally:
         if driver:
-            try:
-                driver.quit()
-                logger.info("✅ 드라이버 종료")
-            except:
-                pass
+            release_chrome_driver(driver)
 
 
 if __name__ == '__main__':
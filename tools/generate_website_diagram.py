@@ -24,16 +24,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import requests
 from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import ollama_client
+import webdriver_pool
 
-OLLAMA_API_URL = "http://localhost:11434/api/generate"
+
+OLLAMA_URL = os.environ.get("OLLAMA_URL", "http://localhost:11434")
 OLLAMA_MODEL = os.environ.get("OLLAMA_MODEL", "gpt-oss:120b-cloud")
 
 WAIT_TIME = 10
@@ -235,6 +237,8 @@ def build_driver(prefer_headless: bool | None = None) -> webdriver.Chrome:
         )
         options.add_experimental_option("excludeSwitches", ["enable-logging"])
         options.add_argument("--log-level=3")
+        # CDP performance log lets the readiness wait detect network idle
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
         return options
 
     requested_headless = HEADLESS_MODE if prefer_headless is None else prefer_headless
@@ -247,7 +251,7 @@ def build_driver(prefer_headless: bool | None = None) -> webdriver.Chrome:
     last_error: Exception | None = None
     for headless in launch_modes:
         try:
-            service = Service(ChromeDriverManager().install())
+            service = Service(webdriver_pool.chromedriver_path())
             driver = webdriver.Chrome(service=service, options=create_options(headless))
             driver.set_page_load_timeout(60)
             if headless and not requested_headless:
@@ -312,7 +316,7 @@ def collect_search_results(driver: webdriver.Chrome, target: dict[str, Any]) ->
 def read_first_result_page(driver: webdriver.Chrome, href: str, wait_time: int) -> str:
     try:
         driver.get(href)
-        time.sleep(min(wait_time, 5))
+        webdriver_pool.wait_for_page(driver, min(wait_time, 5), label="first_result")
         body_text = driver.find_element(By.TAG_NAME, "body").text.strip()
         return re.sub(r"\s+", " ", body_text)[:1000]
     except Exception as exc:
@@ -352,7 +356,7 @@ def search_result_and_extract(query: str, driver: webdriver.Chrome, wait_time: i
         try:
             print(f"[search] trying {target['name']}: {target['url']}")
             driver.get(target["url"])
-            time.sleep(2)
+            webdriver_pool.wait_for_page(driver, 5, selectors=target["selectors"], label=f"search_{target['name']}")
 
             body_elem = driver.find_element(By.TAG_NAME, "body")
             page_text = re.sub(r"\s+", " ", body_elem.text.strip())
@@ -394,14 +398,16 @@ def fetch_webpage(url: str, wait_time: int = WAIT_TIME) -> str | None:
 
         driver = build_driver()
         driver.get(url)
-        time.sleep(wait_time)
+        waited = webdriver_pool.wait_for_page(driver, wait_time, label="fetch")
+        print(f"[fetch] page ready after {waited:.1f}s")
 
+        # lazy-loaded sections render on scroll; wait for DOM/network to settle each time
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight / 2);")
-        time.sleep(SCROLL_WAIT)
+        webdriver_pool.wait_for_page(driver, SCROLL_WAIT, label="scroll")
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(SCROLL_WAIT)
+        webdriver_pool.wait_for_page(driver, SCROLL_WAIT, label="scroll")
         driver.execute_script("window.scrollTo(0, 0);")
-        time.sleep(1)
+        webdriver_pool.wait_for_quiet(driver, 1, label="scroll")
 
         try:
             loading_xpath = (
@@ -412,12 +418,15 @@ def fetch_webpage(url: str, wait_time: int = WAIT_TIME) -> str | None:
             loading_elements = driver.find_elements(By.XPATH, loading_xpath)
             if loading_elements:
                 print(f"[fetch] loading indicators: {len(loading_elements)}")
-                for i in range(DATA_LOAD_TIMEOUT):
-                    time.sleep(1)
-                    remaining = driver.find_elements(By.XPATH, loading_xpath)
-                    if not remaining:
-                        print(f"[fetch] loading complete after {i + 1}s")
-                        break
+                started = time.monotonic()
+                if webdriver_pool.wait_until(
+                    driver,
+                    lambda d: not d.find_elements(By.XPATH, loading_xpath),
+                    DATA_LOAD_TIMEOUT,
+                    label="loading_indicator",
+                    poll=0.25,
+                ):
+                    print(f"[fetch] loading complete after {time.monotonic() - started:.1f}s")
         except Exception as exc:
             print(f"[fetch] loading check skipped: {exc}")
 
@@ -767,21 +776,18 @@ def generate_diagram_with_ollama(url: str, page_content: dict[str, Any], model:
         prompt_template = load_prompt_template()
         prompt = build_prompt(url, page_content, prompt_template)
 
-        payload = {
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
+        result = ollama_client.get_client(OLLAMA_URL).generate(
+            model,
+            prompt,
+            options={
                 "temperature": 0.7,
                 "num_predict": 10000,
             },
-        }
-
-        response = requests.post(OLLAMA_API_URL, json=payload, timeout=120)
-        response.raise_for_status()
-        result = response.json()
-        print("[ollama] raw response received")
-        return enforce_finance_values_in_mermaid(clean_mermaid_code(result.get("response", "")))
+            timeout=120,
+            priority=ollama_client.BATCH,
+        )
+        print(f"[ollama] raw response received (queue wait {result.queue_wait:.1f}s)")
+        return enforce_finance_values_in_mermaid(clean_mermaid_code(result.text))
     except Exception as exc:
         print(f"[ollama] failed: {exc}")
         title = page_content.get("title", "Page")
@@ -876,7 +882,7 @@ def main() -> int:
     parser.add_argument("url", help="Target website URL")
     parser.add_argument("-o", "--output", default=None, help="Output HTML path")
     parser.add_argument("-m", "--model", default=OLLAMA_MODEL, help="Ollama model")
-    parser.add_argument("-w", "--wait", type=int, default=WAIT_TIME, help="JS wait time in seconds")
+    parser.add_argument("-w", "--wait", type=int, default=WAIT_TIME, help="Max JS wait time in seconds (stops early once the page settles)")
     args = parser.parse_args()
 
     args.model = "gpt-oss:120b-cloud"
@@ -893,6 +899,8 @@ def main() -> int:
     print("=" * 70)
 
     html_content = fetch_webpage(url, wait_time=args.wait)
+    for label, stats in webdriver_pool.snapshot_wait_stats().items():
+        print(f"[fetch] wait {label}: {stats['count']}x avg {stats['avg']}s max {stats['max']}s (capped {stats['timeouts']})")
     if not html_content:
         print("[main] failed to fetch source page")
         return 1
@@ -14,6 +14,9 @@ import requests
 
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+import ollama_client  # 저장소 루트의 Ollama 공용 클라이언트
+
 PUBLIC_DIR = ROOT_DIR / "web" / "public"
 UPLOAD_OUTPUT_PATH = PUBLIC_DIR / "world-monitor-ai.json"
 FEED_URL = os.getenv("WORLD_MONITOR_FEED_URL", "https://xn--9l4b4xi9r.com/feed.xml")
@@ -68,23 +71,18 @@ def fetch_feed_items(limit: int = 12) -> dict:
     }
 
 
-def ollama_generate(prompt: str, num_predict: int = 1200) -> str:
-    response = requests.post(
-        f"{OLLAMA_URL}/api/generate",
-        json={
-            "model": OLLAMA_MODEL,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.2,
-                "num_predict": num_predict,
-                "top_p": 0.9,
-            },
+def ollama_generate(prompt: str, num_predict: int = 1200, cache: bool = False) -> str:
+    return ollama_client.get_client(OLLAMA_URL).generate_text(
+        OLLAMA_MODEL,
+        prompt,
+        options={
+            "temperature": 0.2,
+            "num_predict": num_predict,
+            "top_p": 0.9,
         },
         timeout=180,
+        cache=cache,
     )
-    response.raise_for_status()
-    return response.json().get("response", "").strip()
 
 
 def parse_json_object(raw: str) -> dict:
@@ -182,7 +180,7 @@ upper_factors는 플러스 요소 목록, lower_factors는 마이너스 요소 
 
 {json.dumps(analysis, ensure_ascii=False, indent=2)}
 """.strip()
-    raw = ollama_generate(prompt, num_predict=1000)
+    raw = ollama_generate(prompt, num_predict=1000, cache=True)
     return parse_json_object(raw)
 
 
@@ -276,6 +274,9 @@ def main() -> int:
     try:
         feed_data = fetch_feed_items()
         analysis = generate_analysis(feed_data)
+        llm_cache = ollama_client.get_cache()
+        if llm_cache:
+            print(f"[INFO] {llm_cache.summary_line()}")
         output_path = save_payload(feed_data, analysis)
         print(f"[DONE] Saved {output_path}")
         if SITE_OUTPUT_PATH != UPLOAD_OUTPUT_PATH:
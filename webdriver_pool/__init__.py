@@ -0,0 +1,36 @@
+"""
+Chrome WebDriver 공용 풀
+YouTube 모니터(검색/자막 분석), search 모듈의 Selenium 검색, IDE 검색 페이지 수집이
+함께 사용하는 브라우저 재사용 기능 제공 (프로필별 풀, 대여/반납, 사용 횟수/충돌 시 교체)
+및 고정 sleep 대신 DOM/네트워크 상태를 보는 페이지 준비 대기
+"""
+
+from .pool import (
+    DEFAULT_USER_AGENT,
+    WebDriverPool,
+    chrome_options,
+    chromedriver_path,
+    create_chrome,
+    get_pool,
+)
+from .readiness import (
+    reset_wait_stats,
+    snapshot_wait_stats,
+    wait_for_page,
+    wait_for_quiet,
+    wait_until,
+)
+
+__all__ = [
+    'DEFAULT_USER_AGENT',
+    'WebDriverPool',
+    'chrome_options',
+    'chromedriver_path',
+    'create_chrome',
+    'get_pool',
+    'reset_wait_stats',
+    'snapshot_wait_stats',
+    'wait_for_page',
+    'wait_for_quiet',
+    'wait_until',
+]
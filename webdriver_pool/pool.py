@@ -0,0 +1,280 @@
+"""
+Chrome WebDriver 풀
+
+검색/자막 분석마다 ChromeDriverManager().install()과 Chrome 실행을 새로 하면 매번
+몇 초씩 걸린다. 용도(프로필)별로 Chrome을 띄워 두고 빌려 쓴 뒤 돌려받는다.
+
+- chromedriver 경로는 프로세스당 한 번만 확인 (CHROMEDRIVER_PATH가 있으면 그대로 사용)
+- 프로필마다 최대 size개까지 필요할 때 만들고, 모두 사용 중이면 반납될 때까지 대기
+- 빌려줄 때 응답이 없는 브라우저(충돌)는 버리고 새로 만듦
+- 반납 시 about:blank로 초기화(재생 중인 영상/스크립트 중단, 추가 탭 닫기),
+  초기화에 실패하거나 max_pages번 사용한 브라우저는 종료 후 교체
+"""
+
+import atexit
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Optional
+
+DEFAULT_SIZE = int(os.getenv("WEBDRIVER_POOL_SIZE", "3"))
+DEFAULT_MAX_PAGES = int(os.getenv("WEBDRIVER_MAX_PAGES", "50"))
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+_DRIVER_PATH: Optional[str] = None
+_DRIVER_PATH_LOCK = threading.Lock()
+
+
+def chromedriver_path() -> str:
+    """chromedriver 실행 파일 경로 (ChromeDriverManager 확인은 프로세스당 1회)"""
+    global _DRIVER_PATH
+    with _DRIVER_PATH_LOCK:
+        if _DRIVER_PATH is None:
+            _DRIVER_PATH = os.getenv("CHROMEDRIVER_PATH", "").strip()
+            if not _DRIVER_PATH:
+                from webdriver_manager.chrome import ChromeDriverManager
+
+                _DRIVER_PATH = ChromeDriverManager().install()
+        return _DRIVER_PATH
+
+
+def chrome_options(
+    headless: bool = True,
+    window_size: str = None,
+    user_agent: str = DEFAULT_USER_AGENT,
+    lang: str = None,
+    extra_arguments: Iterable[str] = (),
+    network_log: bool = False,
+):
+    """자동화 표시를 숨긴 공통 Chrome 옵션 (CHROME_BINARY가 있으면 해당 Chrome 사용)
+
+    network_log를 켜면 CDP 성능 로그로 wait_for_page의 네트워크 유휴를 판단한다.
+    """
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    if window_size:
+        options.add_argument(f"--window-size={window_size}")
+    if lang:
+        options.add_argument(f"--lang={lang}")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    if user_agent:
+        options.add_argument(f"user-agent={user_agent}")
+    for argument in extra_arguments:
+        options.add_argument(argument)
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+
+    if network_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    chrome_binary = os.getenv("CHROME_BINARY", "").strip()
+    if chrome_binary:
+        options.binary_location = chrome_binary
+    return options
+
+
+def create_chrome(options=None, page_load_timeout: float = 30):
+    """공용 chromedriver 경로로 Chrome 실행"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service
+
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options or chrome_options())
+    if page_load_timeout:
+        driver.set_page_load_timeout(page_load_timeout)
+    return driver
+
+
+class WebDriverPool:
+    """프로필 하나의 Chrome 인스턴스 풀 (스레드 안전, 한 드라이버는 한 스레드만 사용)"""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any] = None,
+        size: int = DEFAULT_SIZE,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        name: str = "default",
+    ):
+        self.factory = factory or create_chrome
+        self.size = max(1, int(size))
+        self.max_pages = max_pages
+        self.name = name
+        self._idle: list = []
+        self._pages: Dict[int, int] = {}
+        self._count = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self.reset_stats()
+
+    @staticmethod
+    def _alive(driver) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _discard(self, driver) -> None:
+        """드라이버를 종료하고 자리를 비움 (대기 중인 스레드가 새로 만들 수 있게)"""
+        self._quit(driver)
+        with self._condition:
+            self._pages.pop(id(driver), None)
+            self._count -= 1
+            self._condition.notify()
+
+    def _create(self):
+        """자리를 예약한 뒤 호출. 실패하면 예약 취소"""
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._condition:
+                self._count -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._pages[id(driver)] = 0
+            self.stats["created"] += 1
+        return driver
+
+    def checkout(self, timeout: float = None):
+        """드라이버 하나를 빌림 (모두 사용 중이면 반납될 때까지 대기, timeout 초과 시 TimeoutError)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError(f"WebDriver 풀이 닫힘: {self.name}")
+                    if self._idle or self._count < self.size:
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"WebDriver 풀 대기 시간 초과: {self.name}")
+                    self._condition.wait(remaining)
+                if self._idle:
+                    driver = self._idle.pop()
+                else:
+                    driver = None
+                    self._count += 1
+            if driver is None:
+                return self._create()
+            if self._alive(driver):
+                with self._condition:
+                    self.stats["reused"] += 1
+                return driver
+            with self._condition:
+                self.stats["crashed"] += 1
+            self._discard(driver)
+
+    def checkin(self, driver, broken: bool = False) -> None:
+        """드라이버 반납 (초기화 실패, 사용 횟수 초과, broken이면 종료 후 자리 반납)"""
+        if driver is None:
+            return
+        with self._condition:
+            pages = self._pages.get(id(driver), 0) + 1
+            self._pages[id(driver)] = pages
+            if broken:
+                reason = "crashed"
+            elif self._closed or (self.max_pages and pages >= self.max_pages):
+                reason = "recycled"
+            else:
+                reason = None
+        if reason is None:
+            try:
+                handles = driver.window_handles
+                for handle in handles[1:]:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                driver.switch_to.window(handles[0])
+                driver.get("about:blank")
+            except Exception:
+                reason = "crashed"
+        if reason:
+            with self._condition:
+                self.stats[reason] += 1
+            self._discard(driver)
+            return
+        with self._condition:
+            self._idle.append(driver)
+            self._condition.notify()
+
+    @contextmanager
+    def driver(self, timeout: float = None):
+        """with pool.driver() as driver: 형태로 빌리고 자동 반납"""
+        driver = self.checkout(timeout)
+        try:
+            yield driver
+        finally:
+            self.checkin(driver)
+
+    def warm(self, count: int = None) -> None:
+        """드라이버를 미리 띄워 둠 (기본: 풀 크기만큼)"""
+        target = min(count or self.size, self.size)
+        while True:
+            with self._condition:
+                if self._closed or self._count >= target:
+                    return
+                self._count += 1
+            driver = self._create()
+            with self._condition:
+                self._idle.append(driver)
+                self._condition.notify()
+
+    def reset_stats(self) -> None:
+        with self._condition:
+            self.stats = {"created": 0, "reused": 0, "recycled": 0, "crashed": 0}
+
+    def snapshot_stats(self) -> Dict[str, int]:
+        """생성/재사용/교체/충돌 횟수와 현재 열린/쉬는 드라이버 수"""
+        with self._condition:
+            return {**self.stats, "open": self._count, "idle": len(self._idle)}
+
+    def close(self) -> None:
+        """쉬고 있는 드라이버 종료 (사용 중인 드라이버는 반납될 때 종료)"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+
+_POOLS: Dict[str, WebDriverPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(name: str, factory: Callable[[], Any] = None, size: int = None, max_pages: int = None) -> WebDriverPool:
+    """이름별 공용 풀 (처음 부를 때의 factory/size로 생성, 프로세스 종료 시 모두 종료)"""
+    with _POOLS_LOCK:
+        pool = _POOLS.get(name)
+        if pool is None:
+            pool = _POOLS[name] = WebDriverPool(
+                factory,
+                size=DEFAULT_SIZE if size is None else size,
+                max_pages=DEFAULT_MAX_PAGES if max_pages is None else max_pages,
+                name=name,
+            )
+        return pool
+
+
+@atexit.register
+def close_all() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+    for pool in pools:
+        pool.close()
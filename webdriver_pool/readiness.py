@@ -0,0 +1,199 @@
+"""
+페이지 준비 대기 (고정 time.sleep 대신 실제 로딩 완료 시점까지만 대기)
+
+- DOM 조건: document.readyState, CSS 선택자 등장, 임의 조건 함수
+- DOM 안정: MutationObserver로 마지막 변경 이후 quiet초 동안 변화 없음
+- 네트워크 유휴: CDP 성능 로그(chrome_options(network_log=True))로 진행 중 요청이
+  2개 이하인 상태가 quiet초 유지. 로그를 켜지 않은 드라이버는 Resource Timing 개수로 대신 판단
+- 모든 대기는 timeout초 상한이 있고, 시간이 다 돼도 예외 없이 진행 (기존 sleep과 같은 최악 시간)
+- 라벨별 대기 횟수/실제 대기 시간/상한 도달 횟수 집계
+"""
+
+import json
+import threading
+import time
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional
+
+POLL_SECONDS = 0.1
+QUIET_SECONDS = 0.5
+# 롱폴링/스트리밍 연결은 끝나지 않으므로 이 개수 이하면 유휴로 봄 (networkidle2)
+IDLE_MAX_INFLIGHT = 2
+# 이보다 오래 열려 있는 요청은 유휴 판정에서 제외
+STALE_REQUEST_SECONDS = 5.0
+CSS_SELECTOR = "css selector"  # selenium By.CSS_SELECTOR (selenium 없이도 import 가능하게)
+
+_OBSERVER_SCRIPT = """
+if (!window.__nbReady) {
+    window.__nbReady = {last: Date.now()};
+    new MutationObserver(function () { window.__nbReady.last = Date.now(); })
+        .observe(document.documentElement || document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return [document.readyState, Date.now() - window.__nbReady.last, performance.getEntriesByType('resource').length];
+"""
+
+
+class _NetworkState:
+    """드라이버별 진행 중 요청 (성능 로그는 읽으면 비워지므로 호출 사이에 유지)"""
+
+    def __init__(self):
+        self.inflight: Dict[str, float] = {}
+        self.last_activity = time.monotonic()
+        self.resource_count = -1
+        self.log_available = True
+
+
+_NETWORK: "weakref.WeakKeyDictionary[Any, _NetworkState]" = weakref.WeakKeyDictionary()
+_NETWORK_LOCK = threading.Lock()
+
+
+def _network_state(driver) -> _NetworkState:
+    with _NETWORK_LOCK:
+        state = _NETWORK.get(driver)
+        if state is None:
+            state = _NETWORK[driver] = _NetworkState()
+        return state
+
+
+def _poll_network(driver, state: _NetworkState, resource_count: int, quiet: float) -> bool:
+    """네트워크 유휴 여부 (성능 로그가 없으면 리소스 개수 변화로 판단)"""
+    now = time.monotonic()
+    if state.log_available:
+        try:
+            entries = driver.get_log("performance")
+        except Exception:
+            state.log_available = False
+            entries = []
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            method = message.get("method", "")
+            request_id = message.get("params", {}).get("requestId")
+            if not method.startswith("Network.") or not request_id:
+                continue
+            state.last_activity = now
+            if method == "Network.requestWillBeSent":
+                state.inflight[request_id] = now
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                state.inflight.pop(request_id, None)
+    if not state.log_available and resource_count != state.resource_count:
+        state.resource_count = resource_count
+        state.last_activity = now
+
+    active = sum(1 for started in state.inflight.values() if now - started < STALE_REQUEST_SECONDS)
+    return active <= IDLE_MAX_INFLIGHT and now - state.last_activity >= quiet
+
+
+class WaitStats:
+    """라벨별 대기 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, label: str, seconds: float, timed_out: bool) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            stats["count"] += 1
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            stats["timeouts"] += int(timed_out)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """라벨별 횟수, 평균/최대/합계 대기 초, 상한 도달 횟수"""
+        with self._lock:
+            return {
+                label: {
+                    "count": stats["count"],
+                    "avg": round(stats["total"] / stats["count"], 3),
+                    "max": round(stats["max"], 3),
+                    "total": round(stats["total"], 3),
+                    "timeouts": stats["timeouts"],
+                }
+                for label, stats in self._stats.items()
+            }
+
+
+WAIT_STATS = WaitStats()
+
+
+def wait_until(
+    driver,
+    condition: Callable[[Any], Any],
+    timeout: float,
+    label: str = "condition",
+    poll: float = POLL_SECONDS,
+) -> bool:
+    """condition(driver)이 참이 될 때까지 최대 timeout초 대기 (조건 안의 예외는 거짓으로 봄)"""
+    started = time.monotonic()
+    deadline = started + timeout
+    while True:
+        try:
+            ready = bool(condition(driver))
+        except Exception:
+            ready = False
+        if ready or time.monotonic() >= deadline:
+            break
+        time.sleep(poll)
+    WAIT_STATS.record(label, time.monotonic() - started, not ready)
+    return ready
+
+
+def wait_for_page(
+    driver,
+    timeout: float,
+    selectors: Iterable[str] = (),
+    condition: Optional[Callable[[Any], Any]] = None,
+    quiet: float = QUIET_SECONDS,
+    network: bool = True,
+    label: str = "page",
+) -> float:
+    """페이지가 준비될 때까지 최대 timeout초 대기하고 실제 대기한 초를 돌려줌
+
+    readyState가 complete이고, selectors 중 하나가 있고(주어진 경우), condition이 참이고,
+    DOM이 quiet초 동안 바뀌지 않았고, network면 네트워크도 유휴일 때 준비된 것으로 본다.
+    """
+    selectors = tuple(selectors)
+    state = _network_state(driver) if network else None
+    started = time.monotonic()
+    deadline = started + timeout
+    ready = False
+    while True:
+        try:
+            ready_state, since_mutation, resource_count = driver.execute_script(_OBSERVER_SCRIPT)
+            ready = (
+                ready_state == "complete"
+                and since_mutation >= quiet * 1000
+                and (not selectors or any(driver.find_elements(CSS_SELECTOR, selector) for selector in selectors))
+                and (condition is None or bool(condition(driver)))
+            )
+            if state is not None:
+                network_idle = _poll_network(driver, state, resource_count, quiet)
+                ready = ready and network_idle
+        except Exception:
+            ready = False
+        if ready or time.monotonic() >= deadline:
+            break
+        time.sleep(POLL_SECONDS)
+    waited = time.monotonic() - started
+    WAIT_STATS.record(label, waited, not ready)
+    return waited
+
+
+def wait_for_quiet(driver, timeout: float, quiet: float = 0.3, label: str = "quiet") -> float:
+    """클릭/스크롤 뒤 DOM 변경이 quiet초 동안 멈출 때까지 대기 (네트워크는 보지 않음)"""
+    return wait_for_page(driver, timeout, quiet=quiet, network=False, label=label)
+
+
+def snapshot_wait_stats() -> Dict[str, Dict[str, float]]:
+    return WAIT_STATS.snapshot()
+
+
+def reset_wait_stats() -> None:
+    WAIT_STATS.reset()
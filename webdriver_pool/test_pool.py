@@ -0,0 +1,158 @@
+"""
+WebDriver 풀 테스트 (가짜 드라이버로 재사용, 최대 개수, 사용 횟수 교체, 충돌 교체 확인)
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from webdriver_pool import WebDriverPool
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    created = 0
+    lock = threading.Lock()
+
+    def __init__(self):
+        with FakeDriver.lock:
+            FakeDriver.created += 1
+        self.handles = ['main']
+        self.current = 'main'
+        self.url = ''
+        self.crashed = False
+        self.quit_called = False
+        self.busy = False
+        self.switch_to = FakeSwitch(self)
+
+    @property
+    def window_handles(self):
+        if self.crashed:
+            raise RuntimeError('chrome not reachable')
+        return list(self.handles)
+
+    def get(self, url):
+        if self.crashed:
+            raise RuntimeError('chrome not reachable')
+        self.url = url
+
+    def close(self):
+        self.handles.remove(self.current)
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_reuse_bounded_and_reset_on_checkin():
+    """최대 개수까지만 띄우고 재사용, 반납 시 추가 탭을 닫고 about:blank로 초기화"""
+    pool = WebDriverPool(FakeDriver, size=2, max_pages=100)
+
+    def visit(i):
+        with pool.driver() as driver:
+            assert not driver.busy, "드라이버를 두 스레드가 동시에 사용"
+            driver.busy = True
+            driver.get(f'https://example.com/{i}')
+            driver.handles.append(f'popup-{i}')
+            time.sleep(0.01)
+            driver.busy = False
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(visit, range(20)))
+    stats = pool.snapshot_stats()
+    assert stats['created'] == 2 and stats['reused'] == 18 and stats['open'] == 2 and stats['idle'] == 2
+    assert all(driver.url == 'about:blank' and driver.handles == ['main'] for driver in pool._idle)
+    idle = list(pool._idle)
+    pool.close()
+    assert all(driver.quit_called for driver in idle) and pool.snapshot_stats()['open'] == 0
+
+
+def test_recycle_after_max_pages_and_crash():
+    """max_pages번 쓰면 교체, 충돌한 드라이버는 빌려줄 때/반납할 때 버리고 새로 만듦"""
+    pool = WebDriverPool(FakeDriver, size=1, max_pages=3)
+    first = pool.checkout()
+    for _ in range(2):
+        pool.checkin(first)
+        assert pool.checkout() is first
+    pool.checkin(first)
+    assert first.quit_called and pool.snapshot_stats()['recycled'] == 1
+
+    second = pool.checkout()
+    assert second is not first
+    second.crashed = True
+    pool.checkin(second)
+    third = pool.checkout()
+    assert third is not second and second.quit_called
+    pool.checkin(third)
+    third.crashed = True
+    fourth = pool.checkout()
+    assert fourth is not third and pool.snapshot_stats()['crashed'] == 2
+
+    try:
+        pool.checkout(timeout=0.05)
+        assert False, "모두 사용 중이면 TimeoutError가 나야 함"
+    except TimeoutError:
+        pass
+    pool.checkin(fourth)
+    assert pool.checkout(timeout=0.05) is fourth
+
+
+def test_close_wakes_waiters_and_timeout_is_total():
+    """close()는 대기 중인 스레드를 깨우고, 다른 반납 알림이 와도 timeout은 처음부터 다시 세지 않음"""
+    pool = WebDriverPool(FakeDriver, size=1)
+    held = pool.checkout()
+    stop = threading.Event()
+
+    def notify_often():
+        while not stop.is_set():
+            with pool._condition:
+                pool._condition.notify_all()
+            time.sleep(0.01)
+
+    notifier = threading.Thread(target=notify_often)
+    notifier.start()
+    started = time.monotonic()
+    try:
+        pool.checkout(timeout=0.1)
+        assert False, "모두 사용 중이면 TimeoutError가 나야 함"
+    except TimeoutError:
+        assert time.monotonic() - started < 1.0
+    finally:
+        stop.set()
+        notifier.join()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        waiting = executor.submit(pool.checkout)
+        time.sleep(0.05)
+        pool.close()
+        try:
+            waiting.result(timeout=1.0)
+            assert False, "닫힌 풀에서 기다리던 스레드는 RuntimeError가 나야 함"
+        except RuntimeError:
+            pass
+    pool.checkin(held)
+    assert held.quit_called
+
+
+def main():
+    print("=" * 60)
+    print("WebDriver 풀 테스트")
+    print("=" * 60)
+    for test in (test_reuse_bounded_and_reset_on_checkin, test_recycle_after_max_pages_and_crash,
+                 test_close_wakes_waiters_and_timeout_is_total):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
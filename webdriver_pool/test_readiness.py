@@ -0,0 +1,97 @@
+"""
+페이지 준비 대기 테스트 (가짜 드라이버로 DOM 안정/선택자/네트워크 유휴, 상한, 집계 확인)
+"""
+
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import webdriver_pool
+from webdriver_pool import readiness
+
+
+class FakePage:
+    """ready_at초 뒤 DOM 변경이 멈추고, 요청 하나가 finish_at초에 끝나는 페이지"""
+
+    def __init__(self, ready_at=0.2, finish_at=None, selector_at=0.0, performance_log=True):
+        self.started = time.monotonic()
+        self.ready_at = ready_at
+        self.finish_at = finish_at
+        self.selector_at = selector_at
+        self.performance_log = performance_log
+        self.sent_request = False
+        self.finished_request = False
+
+    def _elapsed(self):
+        return time.monotonic() - self.started
+
+    def execute_script(self, script):
+        elapsed = self._elapsed()
+        since_mutation = max(0.0, elapsed - self.ready_at) * 1000
+        return ["complete" if elapsed >= self.ready_at else "loading", since_mutation, 3]
+
+    def find_elements(self, by, selector):
+        assert by == "css selector"
+        return [object()] if self.selector_at is not None and self._elapsed() >= self.selector_at else []
+
+    def get_log(self, kind):
+        if not self.performance_log:
+            raise RuntimeError("performance log disabled")
+        entries = []
+        if not self.sent_request:
+            self.sent_request = True
+            for request_id in ("slow", "poll-1", "poll-2"):
+                entries.append({"message": json.dumps({"message": {"method": "Network.requestWillBeSent", "params": {"requestId": request_id}}})})
+        if self.finish_at is not None and not self.finished_request and self._elapsed() >= self.finish_at:
+            self.finished_request = True
+            entries.append({"message": json.dumps({"message": {"method": "Network.loadingFinished", "params": {"requestId": "slow"}}})})
+        return entries
+
+
+def test_waits_for_dom_network_and_selectors_with_cap():
+    """DOM 안정 + 네트워크 유휴(요청 2개 이하)까지 기다리고, 조건이 안 맞으면 상한에서 멈춤"""
+    webdriver_pool.reset_wait_stats()
+
+    waited = webdriver_pool.wait_for_page(FakePage(ready_at=0.1, finish_at=0.6), 5, quiet=0.2, label="load")
+    assert 0.75 <= waited < 1.5, waited  # 느린 요청이 끝난 뒤 quiet만큼 더 대기 (롱폴링 2개는 무시)
+
+    waited = webdriver_pool.wait_for_page(FakePage(ready_at=0.0, performance_log=False), 5, quiet=0.2, label="load")
+    assert 0.15 <= waited < 1.0, waited  # 성능 로그가 없으면 리소스 개수 변화로 판단
+
+    waited = webdriver_pool.wait_for_page(FakePage(selector_at=None), 0.4, selectors=("div.g",), quiet=0.1, label="missing")
+    assert 0.4 <= waited < 0.8, waited
+
+    assert webdriver_pool.wait_until(FakePage(), lambda d: d._elapsed() >= 0.1, 2, label="click")
+    assert not webdriver_pool.wait_until(FakePage(), lambda d: 1 / 0, 0.2, label="click")
+
+    stats = webdriver_pool.snapshot_wait_stats()
+    assert stats["load"]["count"] == 2 and stats["load"]["timeouts"] == 0
+    assert stats["missing"]["timeouts"] == 1 and stats["missing"]["max"] >= 0.4
+    assert stats["click"]["count"] == 2 and stats["click"]["timeouts"] == 1
+
+
+def test_stale_requests_do_not_block_idle():
+    """끝나지 않는 요청도 STALE_REQUEST_SECONDS가 지나면 유휴 판정에서 제외"""
+    original = readiness.STALE_REQUEST_SECONDS
+    readiness.STALE_REQUEST_SECONDS = 0.3
+    try:
+        waited = webdriver_pool.wait_for_page(FakePage(ready_at=0.0), 5, quiet=0.1, label="stale")
+    finally:
+        readiness.STALE_REQUEST_SECONDS = original
+    assert waited < 2.0 and webdriver_pool.snapshot_wait_stats()["stale"]["timeouts"] == 0
+
+
+def main():
+    print("=" * 60)
+    print("페이지 준비 대기 테스트")
+    print("=" * 60)
+    for test in (test_waits_for_dom_network_and_selectors_with_cap, test_stale_requests_do_not_block_idle):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
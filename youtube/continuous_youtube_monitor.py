@@ -13,12 +13,29 @@ import json
 import time
 import argparse
 import tempfile
+import threading
+import atexit
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 import subprocess
 import requests
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+# 공통 N/B 계산 모듈 (nbcore, 첫 계산 시 로드), Ollama 공용 클라이언트 (ollama_client)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import nbcore
+import ollama_client
+import summary_batch
+import db_writer
+import report_index
+import report_archive
+import keyword_series
+import cycle_journal
+import video_cache
+import ytdlp_pool
+import webdriver_pool
 
 # RSS 피드 URL - 정치, 주식, 비트코인 위주
 RSS_FEEDS = [
@@ -46,6 +63,57 @@ KEYWORDS_FILE = SCRIPT_DIR / "monitor_keywords.txt"
 FIXED_KEYWORD = "오늘의 주요 뉴스"
 SUBTITLE_BLOCK_WARNED = False
 CURRENT_OLLAMA_MODEL = None  # 런타임에 설정됨
+NB_STREAM_WINDOW = int(os.getenv("NB_STREAM_WINDOW", "1000"))
+KEYWORD_NB_TRACKERS: Dict[str, Any] = {}  # 키워드별 누적 조회수 N/B 계산기 (사이클 간 유지)
+# 영상별 분석 캐시 (video_id 기준 SQLite, 요약 유효 기간 초)
+VIDEO_CACHE_ENABLED = os.getenv("VIDEO_CACHE_ENABLED", "1") == "1"
+VIDEO_CACHE_PATH = Path(os.getenv("VIDEO_CACHE_PATH", str(SCRIPT_DIR / "cache" / "video_cache.sqlite3")))
+VIDEO_CACHE_SUMMARY_TTL = float(os.getenv("VIDEO_CACHE_SUMMARY_TTL", str(video_cache.SUMMARY_TTL)))
+# 다른 요약과 달리 다시 분석해도 결과가 같아 캐시에 두는 스킵 판정
+CACHEABLE_SKIP_SUMMARY = "오늘 날짜 영상 아님(건너뜀)"
+_VIDEO_CACHE = None
+# 참소식 DB 비동기 저장 (보낼 편지함 경로, 전송 스레드 수, 사이클 끝 대기 초: 0이면 기다리지 않음)
+DB_OUTBOX_PATH = Path(os.getenv("DB_OUTBOX_PATH", str(SCRIPT_DIR / "cache" / "db_outbox.sqlite3")))
+DB_WRITER_WORKERS = int(os.getenv("DB_WRITER_WORKERS", "2"))
+DB_FLUSH_TIMEOUT = float(os.getenv("DB_FLUSH_TIMEOUT", "0"))
+_DB_WRITER = None
+_DB_SESSION = None
+_DB_VIDEOS: Dict[str, List[Dict[str, Any]]] = {}  # 전송 대기 중인 video_id -> 결과 dict 목록 (키워드마다 따로 있음)
+# 보고서 색인 (보고서 번호/키워드/N/B 점수/영상 요약, 비어 있으면 기존 보고서로 채움)
+REPORT_INDEX_PATH = Path(os.getenv("REPORT_INDEX_PATH", str(SCRIPT_DIR / "cache" / "report_index.sqlite3")))
+_REPORT_INDEX = None
+# 이 일수보다 오래된 날짜 폴더는 YYYY-MM-DD.rpa 하나로 묶어 보관 (0이면 사용 안 함)
+REPORT_ARCHIVE_DAYS = int(os.getenv("REPORT_ARCHIVE_DAYS", "7"))
+_REPORT_ARCHIVE_CHECKED = None  # 마지막으로 묶기를 확인한 날짜
+# 키워드 추이 시계열 (키워드/영상별 조회수, N/B 점수, 비어 있으면 기존 보고서로 채움)
+KEYWORD_SERIES_DIR = Path(os.getenv("KEYWORD_SERIES_DIR", str(SCRIPT_DIR / "cache" / "keyword_series")))
+TREND_WINDOW_DAYS = float(os.getenv("TREND_WINDOW_DAYS", "1"))  # 보고서에 넣을 상승 키워드 기간
+_KEYWORD_SERIES = None
+# 사이클 체크포인트 (키워드별 결과 기록, 이 시간(분) 안에 재시작하면 완료된 키워드 재사용, 0이면 사용 안 함)
+CYCLE_JOURNAL_PATH = Path(os.getenv("CYCLE_JOURNAL_PATH", str(SCRIPT_DIR / "cache" / "cycle_journal.jsonl")))
+CYCLE_RESUME_MAX_MINUTES = float(os.getenv("CYCLE_RESUME_MAX_MINUTES", "180"))
+_CYCLE_JOURNAL: Optional[cycle_journal.CycleJournal] = None  # 진행 중인 사이클의 기록
+_CYCLE_NB_STREAMED: set = set()  # 끝나지 않은 사이클에서 이미 누적 N/B에 넣은 키워드 (같은 프로세스에서 이어서 실행할 때 중복 방지)
+YTDLP_POOL_SIZE = int(os.getenv("YTDLP_POOL_SIZE", "8"))  # 프로필별 YoutubeDL 인스턴스 최대 수
+SELENIUM_POOL_SIZE = int(os.getenv("WEBDRIVER_POOL_SIZE", "4"))  # 검색/유튜브 분석용 Chrome 최대 수
+# Google 자동 요청 차단 방지 위한 User-Agent 설정
+YTDLP_HTTP_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Referer": "https://www.youtube.com/",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+# 영상 업로드 정보 공유 결과 (프로세스 내 video_id당 1회 조회, 실패는 일정 시간 뒤 재시도)
+VIDEO_METADATA: Dict[str, Dict[str, Any]] = {}
+METADATA_RETRY_SECONDS = int(os.getenv("METADATA_RETRY_SECONDS", "600"))
+RECENT_WINDOW_SECONDS = 24 * 3600
+TODAY_VERDICTS: Dict[str, Any] = {}  # video_id -> (최근 24시간 여부, 판정 유지 기한 epoch 초)
+# 단계별 동시 실행 수 (검색 / 자막 추출 / Ollama 호출)
+SEARCH_CONCURRENCY = int(os.getenv("SEARCH_CONCURRENCY", "4"))
+SUBTITLE_CONCURRENCY = int(os.getenv("SUBTITLE_CONCURRENCY", "8"))
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "2"))
+# 자막 요약 묶음 호출 (영상 N개 자막을 한 프롬프트로 요약, 1이면 영상별 단건 요약)
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", str(summary_batch.BATCH_SIZE)))
+SUMMARY_BATCH_WINDOW = float(os.getenv("SUMMARY_BATCH_WINDOW", str(summary_batch.BATCH_WINDOW)))
 
 LOGS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -54,6 +122,169 @@ DEFAULT_DYNAMIC_KEYWORDS = [
 ]
 
 
+class StageLimiter:
+    """단계별 동시 실행 제한 (같은 스레드에서 중첩 진입은 슬롯을 다시 잡지 않음)"""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, int(limit))
+        self._semaphore = threading.BoundedSemaphore(self.limit)
+        self._local = threading.local()
+
+    def __enter__(self):
+        depth = getattr(self._local, "depth", 0)
+        if depth == 0:
+            self._semaphore.acquire()
+        self._local.depth = depth + 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._local.depth -= 1
+        if self._local.depth == 0:
+            self._semaphore.release()
+        return False
+
+
+SEARCH_LIMITER = StageLimiter(SEARCH_CONCURRENCY)
+SUBTITLE_LIMITER = StageLimiter(SUBTITLE_CONCURRENCY)
+LLM_LIMITER = StageLimiter(LLM_CONCURRENCY)
+PRINT_LOCK = threading.Lock()
+_VIDEO_METADATA_LOCK = threading.Lock()
+_VIDEO_METADATA_INFLIGHT: Dict[str, threading.Event] = {}
+_VIDEO_CACHE_LOCK = threading.Lock()
+_DB_WRITER_LOCK = threading.Lock()
+_REPORT_INDEX_LOCK = threading.Lock()
+_KEYWORD_SERIES_LOCK = threading.Lock()
+
+
+def get_video_cache():
+    """영상별 분석 캐시 (첫 사용 시 열기, 비활성화면 None)"""
+    global _VIDEO_CACHE
+    if not VIDEO_CACHE_ENABLED:
+        return None
+    with _VIDEO_CACHE_LOCK:
+        if _VIDEO_CACHE is None:
+            _VIDEO_CACHE = video_cache.VideoCache(VIDEO_CACHE_PATH, summary_ttl=VIDEO_CACHE_SUMMARY_TTL)
+        return _VIDEO_CACHE
+
+
+def get_report_index() -> report_index.ReportIndex:
+    """보고서 색인 (첫 사용 시 열고, 비어 있으면 reports 폴더로 한 번 채움)"""
+    global _REPORT_INDEX
+    with _REPORT_INDEX_LOCK:
+        if _REPORT_INDEX is None:
+            index = report_index.ReportIndex(REPORT_INDEX_PATH)
+            if index.count() == 0 and REPORTS_BASE_DIR.exists():
+                indexed = index.rebuild(REPORTS_BASE_DIR)
+                print(f"[INDEX] 기존 보고서 {indexed}개 색인")
+            _REPORT_INDEX = index
+        return _REPORT_INDEX
+
+
+def get_keyword_series() -> keyword_series.KeywordSeries:
+    """키워드 추이 저장소 (첫 사용 시 열고, 비어 있으면 기존 보고서로 한 번 채움)"""
+    global _KEYWORD_SERIES
+    with _KEYWORD_SERIES_LOCK:
+        if _KEYWORD_SERIES is None:
+            series = keyword_series.KeywordSeries(KEYWORD_SERIES_DIR)
+            if series.is_empty():
+                cycles = []
+                for _, _, data, _ in report_archive.iter_reports(REPORTS_BASE_DIR):
+                    cycle_ts = keyword_series.report_timestamp(data)
+                    if cycle_ts is not None:
+                        cycles.append((cycle_ts, data.get("keywords")))
+                if cycles:
+                    series.append_cycles(cycles)
+                    print(f"[TREND] 기존 보고서 {len(cycles)}개로 키워드 추이 채움")
+            _KEYWORD_SERIES = series
+        return _KEYWORD_SERIES
+
+
+def record_keyword_trends(report_data: Dict[str, Any]) -> None:
+    """이번 사이클 키워드/영상 값을 추이에 덧붙이고 기간 내 상승 키워드를 보고서에 추가"""
+    try:
+        series = get_keyword_series()
+        series.append_cycle(keyword_series.report_timestamp(report_data), report_data["keywords"])
+        trends = {
+            metric: series.top_movers(TREND_WINDOW_DAYS, metric, limit=5, exclude=(FIXED_KEYWORD,))
+            for metric in ("views", "nb_score")
+        }
+    except Exception as e:
+        print(f"[WARN] 키워드 추이 기록 실패: {e}")
+        return
+    report_data["trends"] = {"window_days": TREND_WINDOW_DAYS, **trends}
+    if trends["views"]:
+        print(
+            f"[TREND] 최근 {TREND_WINDOW_DAYS:g}일 조회수 상승: "
+            + ", ".join(f"{item['keyword']} +{item['delta']:,.0f}" for item in trends["views"])
+        )
+
+
+def archive_old_reports() -> None:
+    """하루 한 번 오래된 날짜 폴더를 보관 파일로 묶고 색인 경로를 갱신"""
+    global _REPORT_ARCHIVE_CHECKED
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    if REPORT_ARCHIVE_DAYS <= 0 or _REPORT_ARCHIVE_CHECKED == today_str:
+        return
+    _REPORT_ARCHIVE_CHECKED = today_str
+    index = get_report_index()
+    try:
+        results = report_archive.compact_reports(REPORTS_BASE_DIR, REPORT_ARCHIVE_DAYS)
+    except Exception as e:
+        print(f"[WARN] 보고서 보관 실패: {e}")
+        return
+    failed = {result["day"] for result in results if "error" in result}
+    for result in results:
+        if result["day"] in failed:
+            print(f"[WARN] 보고서 보관 실패 ({result['day']}): {result['error']}")
+        elif result["removed"]:
+            index.set_day_path(result["day"], report_archive.archive_path(REPORTS_BASE_DIR, result["day"]))
+    # 다시 묶다 실패한 날짜는 보관 파일이 풀려 폴더에만 있으므로 폴더 경로로 다시 색인
+    if failed:
+        for day, number, data, path in report_archive.iter_reports(REPORTS_BASE_DIR):
+            if day in failed:
+                index.add_report(day, number, data, path)
+    results = [result for result in results if result["day"] not in failed]
+    if results:
+        original = sum(result["original_bytes"] for result in results)
+        archived = sum(result["archive_bytes"] for result in results)
+        print(f"[ARCHIVE] 날짜 {len(results)}개 묶음: {original / 1048576:.1f}MB -> {archived / 1048576:.1f}MB")
+
+
+def configure_stage_limits(search: int = None, subtitles: int = None, llm: int = None) -> None:
+    """검색/자막/Ollama 단계의 동시 실행 수 변경 (사이클 시작 전에 호출)"""
+    global SEARCH_CONCURRENCY, SUBTITLE_CONCURRENCY, LLM_CONCURRENCY
+    global SEARCH_LIMITER, SUBTITLE_LIMITER, LLM_LIMITER
+    if search:
+        SEARCH_CONCURRENCY = max(1, search)
+        SEARCH_LIMITER = StageLimiter(SEARCH_CONCURRENCY)
+    if subtitles:
+        SUBTITLE_CONCURRENCY = max(1, subtitles)
+        SUBTITLE_LIMITER = StageLimiter(SUBTITLE_CONCURRENCY)
+    if llm:
+        LLM_CONCURRENCY = max(1, llm)
+        LLM_LIMITER = StageLimiter(LLM_CONCURRENCY)
+
+
+def print_block(lines: List[str]) -> None:
+    """여러 줄 로그를 다른 스레드 출력과 섞이지 않게 한 번에 출력"""
+    if lines:
+        with PRINT_LOCK:
+            print("\n".join(lines), flush=True)
+
+
+def post_ollama_generate(
+    json: Dict[str, Any], timeout: float = 120, stop_when=None, cache: bool = False, cache_ttl: float = None
+) -> ollama_client.OllamaResult:
+    """Ollama /api/generate 호출 (공용 클라이언트 + Ollama 단계 동시 실행 제한)
+
+    결과는 requests.Response처럼 raise_for_status()/json()을 쓸 수 있다.
+    cache=True이면 같은 모델/프롬프트/옵션의 응답을 공용 LLM 캐시에서 재사용한다.
+    """
+    return ollama_client.get_client(OLLAMA_URL).generate_payload(
+        json, timeout=timeout, stop_when=stop_when, cache=cache, cache_ttl=cache_ttl, limiter=LLM_LIMITER
+    )
+
+
 class SilentYtDlpLogger:
     def debug(self, msg):
         pass
@@ -65,6 +296,86 @@ class SilentYtDlpLogger:
         pass
 
 
+def register_ytdlp_profiles(pool: ytdlp_pool.YoutubeDLPool) -> None:
+    """모니터에서 쓰는 yt_dlp 옵션 프로필 등록 (빠른 검색 / 메타데이터 / 자막)"""
+    pool.register("flat", {
+        "extract_flat": True,
+        "quiet": True,
+        "no_warnings": True,
+        "socket_timeout": 15,
+        "http_headers": YTDLP_HTTP_HEADERS,  # Google 요청 차단 방지
+    })
+    pool.register("metadata", {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "socket_timeout": 15,
+        "extract_flat": False,
+        "logger": SilentYtDlpLogger(),
+    })
+
+    subtitle_opts = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "writesubtitles": True,
+        "writeautomaticsub": True,
+        "subtitleslangs": ["ko", "en", "ja", "zh"],
+        "subtitlesformat": "vtt/best",
+        "socket_timeout": 20,
+        "http_headers": YTDLP_HTTP_HEADERS,
+        "extractor_retries": 2,
+        "sleep_interval_requests": 1,
+        "ignoreerrors": True,
+        "logger": SilentYtDlpLogger(),
+    }
+    cookie_file = os.getenv("YTDLP_COOKIES_FILE", "").strip()
+    if cookie_file and Path(cookie_file).exists():
+        subtitle_opts["cookiefile"] = cookie_file
+    pool.register("subtitles", subtitle_opts)
+
+    if os.getenv("USE_BROWSER_COOKIES", "0") == "1":
+        browser_name = os.getenv("YTDLP_BROWSER", "chrome").strip().lower()
+        pool.register("subtitles_browser", {**subtitle_opts, "cookiesfrombrowser": (browser_name or "chrome",)})
+
+
+YTDLP_POOL = ytdlp_pool.YoutubeDLPool(YTDLP_POOL_SIZE)
+register_ytdlp_profiles(YTDLP_POOL)
+atexit.register(YTDLP_POOL.close)
+
+
+def create_search_chrome():
+    """검색/유튜브 분석용 Chrome (SEARCH_HEADLESS=0이면 창 표시)"""
+    options = webdriver_pool.chrome_options(
+        headless=os.getenv("SEARCH_HEADLESS", "1") == "1",
+        window_size="1280,1800",
+        lang="ko-KR",
+        network_log=True,
+    )
+    return webdriver_pool.create_chrome(options, page_load_timeout=30)
+
+
+SELENIUM_POOL = webdriver_pool.get_pool("monitor", create_search_chrome, size=SELENIUM_POOL_SIZE)
+SELENIUM_SOURCES = {"google", "bing", "naver", "zum", "youtube"}
+
+
+def warm_selenium_pool() -> None:
+    """사이클 시작 시 Chrome을 미리 띄워 둠 (실패해도 첫 사용 때 다시 시도)"""
+    try:
+        SELENIUM_POOL.warm()
+    except Exception as e:
+        with PRINT_LOCK:
+            print(f"[WARN] Chrome 미리 띄우기 실패: {str(e)[:120]}")
+
+
+def resolve_video_metadata_batch(video_ids: List[str], workers: int = None) -> Dict[str, Dict[str, Any]]:
+    """여러 video_id의 전체 메타데이터를 메타데이터 프로필 인스턴스로 병렬 조회 ({video_id: 정보}, 실패는 제외)"""
+    urls = {f"https://www.youtube.com/watch?v={video_id}": video_id for video_id in video_ids if video_id}
+    with SEARCH_LIMITER:
+        infos = YTDLP_POOL.extract_many("metadata", urls, workers=workers)
+    return {urls[url]: info for url, info in infos.items() if info}
+
+
 def get_today_report_dir() -> Path:
     """오늘 날짜 폴더 경로 반환 (예: reports/2026-03-06/)"""
     today_str = datetime.now().strftime("%Y-%m-%d")
@@ -219,11 +530,11 @@ def redact_korean_person_names(text: str) -> str:
     return redacted
 
 
-def format_summary_with_ollama(keyword: str, upload_date: str, summary: str) -> str:
+def format_summary_with_ollama(keyword: str, upload_date: str, summary: str, model: str = None) -> str:
     """올라마가 요약을 포맷팅: 키워드에 맞는 메시지 + 핵심 내용 1줄"""
-    global CURRENT_OLLAMA_MODEL
-    
-    if not CURRENT_OLLAMA_MODEL or not summary:
+    model = model or CURRENT_OLLAMA_MODEL
+
+    if not model or not summary:
         return normalize_summary_text(summary)
 
     # 올라마가 요약을 단일 소식 1문장으로 생성
@@ -245,15 +556,16 @@ def format_summary_with_ollama(keyword: str, upload_date: str, summary: str) ->
 출력: 대괄호 한 문장 1개만"""
     
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
-                "model": CURRENT_OLLAMA_MODEL,
+                "model": model,
                 "prompt": prompt,
                 "stream": False,
                 "temperature": 0.3,
             },
             timeout=20,
+            stop_when=ollama_client.bracket_closed,  # 대괄호 한 문장이 끝나면 생성 중단
+            cache=True,
         )
         response.raise_for_status()
         
@@ -354,32 +666,116 @@ def log_database_save(message: str) -> None:
         pass
 
 
-def resolve_upload_date_by_video_id(video_id: str) -> str:
-    """video_id로 실제 업로드일(YYYY-MM-DD) 조회"""
-    if not video_id:
-        return ""
-    try:
-        import yt_dlp
+def upload_timestamp(metadata: Dict[str, Any]) -> Any:
+    """업로드 시각(epoch 초). timestamp → release_timestamp 순, 없으면 None"""
+    for key in ("timestamp", "release_timestamp"):
+        value = metadata.get(key)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
+    return None
 
-        ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "skip_download": True,
-            "socket_timeout": 15,
-            "extract_flat": False,
-            "logger": SilentYtDlpLogger(),
-        }
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
 
-        raw_upload_date = (info or {}).get("upload_date", "")
-        if raw_upload_date and len(raw_upload_date) == 8:
-            return f"{raw_upload_date[:4]}-{raw_upload_date[4:6]}-{raw_upload_date[6:8]}"
-    except Exception:
-        pass
+def format_upload_date(raw_upload_date: str) -> str:
+    """yt_dlp 업로드일(YYYYMMDD)을 YYYY-MM-DD로 변환 (형식이 다르면 빈 문자열)"""
+    raw_upload_date = str(raw_upload_date or "")
+    if len(raw_upload_date) == 8 and raw_upload_date.isdigit():
+        return f"{raw_upload_date[:4]}-{raw_upload_date[4:6]}-{raw_upload_date[6:8]}"
     return ""
 
 
+def upload_metadata_from_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """yt_dlp 정보에서 업로드 판정에 쓰는 값만 추출"""
+    info = info or {}
+    metadata = {"upload_date": format_upload_date(info.get("upload_date"))}
+    for key in ("timestamp", "release_timestamp"):
+        if isinstance(info.get(key), (int, float)):
+            metadata[key] = info[key]
+    return metadata
+
+
+def remember_video_metadata(video_id: str, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """공유 업로드 정보에 합치기 (빈 값으로 기존 값을 덮지 않음). 새로 알게 된 업로드 정보는 영상 캐시에도 저장"""
+    known = {key: value for key, value in metadata.items() if value}
+    with _VIDEO_METADATA_LOCK:
+        entry = VIDEO_METADATA.setdefault(video_id, {})
+        learned = any(entry.get(key) != value for key, value in known.items())
+        entry.update(known)
+        if entry.get("upload_date"):
+            entry.pop("failed_at", None)
+        merged = dict(entry)
+    if learned and merged.get("upload_date"):
+        cache = get_video_cache()
+        if cache:
+            cache.set_upload_date(video_id, merged["upload_date"], upload_timestamp(merged))
+    return merged
+
+
+def _metadata_settled(entry: Dict[str, Any], now: float) -> bool:
+    if not entry:
+        return False
+    if entry.get("upload_date"):
+        return True
+    return "failed_at" in entry and now - entry["failed_at"] < METADATA_RETRY_SECONDS
+
+
+def enrich_video_metadata(video_ids: List[str], workers: int = None) -> Dict[str, Dict[str, Any]]:
+    """업로드일이 필요한 영상들을 한 번에 병렬 보강해 {video_id: 업로드 정보} 반환
+
+    공유 결과(VIDEO_METADATA) → 영상 캐시 → yt_dlp 메타데이터 일괄 조회 순으로 찾는다.
+    다른 스레드가 조회 중인 video_id는 다시 조회하지 않고 그 결과를 기다린다.
+    """
+    video_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id]
+    cache = get_video_cache()
+    now = time.time()
+    to_fetch: List[str] = []
+    waits: List[threading.Event] = []
+    with _VIDEO_METADATA_LOCK:
+        pending = []
+        for video_id in video_ids:
+            if _metadata_settled(VIDEO_METADATA.get(video_id), now):
+                continue
+            if video_id in _VIDEO_METADATA_INFLIGHT:
+                waits.append(_VIDEO_METADATA_INFLIGHT[video_id])
+            else:
+                _VIDEO_METADATA_INFLIGHT[video_id] = threading.Event()
+                pending.append(video_id)
+
+    try:
+        for video_id in pending:
+            cached_info = cache.get_upload_info(video_id) if cache else {}
+            if cached_info:
+                with _VIDEO_METADATA_LOCK:
+                    VIDEO_METADATA.setdefault(video_id, {}).update(cached_info)
+            else:
+                to_fetch.append(video_id)
+
+        if to_fetch:
+            infos = resolve_video_metadata_batch(to_fetch, workers=workers)
+            for video_id in to_fetch:
+                if video_id in infos:
+                    remember_video_metadata(video_id, upload_metadata_from_info(infos[video_id]))
+                with _VIDEO_METADATA_LOCK:
+                    entry = VIDEO_METADATA.setdefault(video_id, {})
+                    if not entry.get("upload_date"):
+                        entry["failed_at"] = time.time()
+    finally:
+        with _VIDEO_METADATA_LOCK:
+            for video_id in pending:
+                _VIDEO_METADATA_INFLIGHT.pop(video_id).set()
+
+    for event in waits:
+        event.wait()
+    with _VIDEO_METADATA_LOCK:
+        return {video_id: dict(VIDEO_METADATA.get(video_id, {})) for video_id in video_ids}
+
+
+def resolve_upload_date_by_video_id(video_id: str) -> str:
+    """video_id로 실제 업로드일(YYYY-MM-DD) 조회 (공유 업로드 정보 사용)"""
+    if not video_id:
+        return ""
+    return enrich_video_metadata([video_id]).get(video_id, {}).get("upload_date", "")
+
+
 UNAVAILABLE_SUMMARIES = {
     "자막 미분석",
     "자막 없음",
@@ -470,7 +866,8 @@ def is_today_video_with_search_data(video: Dict[str, Any], keyword: str, search_
     if not model:
         return bool(upload_date and is_within_last_24_hours(upload_date))
 
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # 시 단위로 맞춰 같은 시간대의 같은 판정은 LLM 캐시에서 재사용
+    now_str = datetime.now().strftime("%Y-%m-%d %H:00")
     today_str = datetime.now().strftime("%Y-%m-%d")
     prompt = f"""다음 정보만 보고 이 YouTube 영상이 현재 시각({now_str}) 기준으로 '오늘 날짜 데이터/당일 이슈를 다루는 영상'인지 판정하세요.
 
@@ -495,8 +892,7 @@ def is_today_video_with_search_data(video: Dict[str, Any], keyword: str, search_
 출력: YES 또는 NO 하나만"""
 
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": prompt,
@@ -508,6 +904,8 @@ def is_today_video_with_search_data(video: Dict[str, Any], keyword: str, search_
                 },
             },
             timeout=20,
+            cache=True,
+            cache_ttl=3600,
         )
         response.raise_for_status()
         result = response.json()
@@ -582,33 +980,38 @@ def open_database_page(url: str) -> str:
         return f"error:{str(e)[:120]}"
 
 
-def save_single_summary_to_database(keyword: str, video: Dict[str, Any]) -> bool:
-    """단일 영상 요약을 참소식 DB에 즉시 저장"""
-    if not DATABASE_SAVE_ENABLED:
-        return False
-
-    # 올라마로 포맷팅된 요약 생성
-    title = (video.get("title") or "")[:120]
-    raw_summary = video.get("subtitle_summary", "")
-    upload_date = video.get("upload_date") or ""
-    summary = format_summary_with_ollama(keyword, upload_date, raw_summary)
-    
+def prepare_database_payload(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """전송 스레드에서 요약을 한 문장으로 포맷팅 (저장 대상이 아니면 None)"""
+    summary = format_summary_with_ollama(
+        payload.get("keyword", ""),
+        payload.get("upload_date", ""),
+        payload.get("summary", ""),
+        model=payload.get("model"),
+    )
     if not is_summary_eligible_for_db(summary):
-        return False
-
-    # DB 저장: 간단한 형식 (키워드와 요약만)
-    payload_text = f"{summary}"
-    payload_text = payload_text[:900]
-    params = {"nb": payload_text, "end": "5s"}
-
+        return None
+    return {**payload, "text": summary[:900]}
+
+
+def get_database_session() -> requests.Session:
+    """참소식 DB 전송용 keep-alive 세션 (전송 스레드 수만큼 연결 유지)"""
+    global _DB_SESSION
+    with _DB_WRITER_LOCK:
+        if _DB_SESSION is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max(1, DB_WRITER_WORKERS))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _DB_SESSION = session
+        return _DB_SESSION
+
+
+def send_database_payload(payload: Dict[str, Any]) -> bool:
+    """포맷팅된 요약 1건을 참소식 DB에 저장 (실패하면 전송 스레드가 재시도)"""
+    title = payload.get("title", "")
+    params = {"nb": payload.get("text", ""), "end": "5s"}
     try:
-        request_url = requests.Request(
-            "GET",
-            f"{DATABASE_BASE_URL}/database.html",
-            params=params,
-        ).prepare().url
-
-        response = requests.get(
+        response = get_database_session().get(
             f"{DATABASE_BASE_URL}/database.html",
             params=params,
             timeout=12,
@@ -616,9 +1019,9 @@ def save_single_summary_to_database(keyword: str, video: Dict[str, Any]) -> bool
         if 200 <= response.status_code < 400:
             log_database_save(f"SUCCESS status={response.status_code} title={title}")
 
-            if DATABASE_OPEN_PAGE and request_url:
+            if DATABASE_OPEN_PAGE:
                 try:
-                    open_result = open_database_page(request_url)
+                    open_result = open_database_page(response.request.url)
                     log_database_save(f"OPENED page title={title} mode={open_result}")
                 except Exception as e:
                     log_database_save(f"OPEN_FAIL title={title} reason={str(e)[:200]}")
@@ -631,9 +1034,82 @@ def save_single_summary_to_database(keyword: str, video: Dict[str, Any]) -> bool
         return False
 
 
+def on_database_result(payload: Dict[str, Any], status: str) -> None:
+    """전송 결과를 영상 결과/캐시에 반영 (sent/failed/skipped)"""
+    video_id = payload.get("video_id", "")
+    if status == "sent":
+        # 대기 목록을 비우기 전에 기록해야 그 사이 다시 들어온 같은 영상을 거를 수 있음
+        cache = get_video_cache()
+        if cache and video_id:
+            cache.set_db_saved(video_id)
+        journal = _CYCLE_JOURNAL
+        if journal:
+            journal.mark_db_saved(payload.get("key", ""))
+    with _DB_WRITER_LOCK:
+        videos = _DB_VIDEOS.pop(payload.get("key", ""), [])
+    for video in videos:
+        video["db_saved"] = status == "sent"
+    if status == "failed":
+        log_database_save(f"GIVE_UP title={payload.get('title', '')} (재시도 횟수 초과)")
+
+
+def get_db_writer() -> Optional[db_writer.DatabaseWriter]:
+    """참소식 DB 전송 스레드 (첫 사용 시 시작, 이전 실행에서 못 보낸 항목도 이어서 전송)"""
+    global _DB_WRITER
+    if not DATABASE_SAVE_ENABLED:
+        return None
+    with _DB_WRITER_LOCK:
+        if _DB_WRITER is None:
+            _DB_WRITER = db_writer.DatabaseWriter(
+                DB_OUTBOX_PATH,
+                send_database_payload,
+                prepare=prepare_database_payload,
+                on_result=on_database_result,
+                workers=DB_WRITER_WORKERS,
+            ).start()
+            atexit.register(_DB_WRITER.close)
+        return _DB_WRITER
+
+
+def queue_summary_for_database(keyword: str, video: Dict[str, Any]) -> bool:
+    """영상 요약을 참소식 DB 전송 대기열에 넣고 바로 반환 (포맷팅/전송은 전송 스레드에서)
+
+    이미 저장된 영상이면 저장 표시만 하고, 같은 영상이 전송 대기 중이면
+    결과 dict만 대기 목록에 더해 한 번만 보낸다.
+    """
+    writer = get_db_writer()
+    if writer is None:
+        return False
+    key = video.get("video_id") or (video.get("title") or "")[:120]
+    payload = {
+        "key": key,
+        "video_id": video.get("video_id", ""),
+        "keyword": keyword,
+        "title": (video.get("title") or "")[:120],
+        "summary": video.get("subtitle_summary", ""),
+        "upload_date": video.get("upload_date") or "",
+        "model": CURRENT_OLLAMA_MODEL,
+    }
+    cache = get_video_cache()
+    with _DB_WRITER_LOCK:
+        if cache and cache.is_db_saved(video.get("video_id", "")):
+            video["db_saved"] = True
+            return False
+        waiting = _DB_VIDEOS.setdefault(key, [])
+        waiting.append(video)
+        if len(waiting) > 1:
+            return False
+    writer.submit(key, payload)
+    return True
+
+
 def save_completed_summaries_to_database(results: List[Dict[str, Any]]) -> Dict[str, int]:
-    """요약 완료된 자막만 참소식 DB 엔드포인트로 전송"""
-    stats = {"sent": 0, "failed": 0, "skipped": 0}
+    """아직 저장 안 된 요약을 대기열에 넣고 바로 반환 (DB_FLUSH_TIMEOUT을 주면 그만큼만 대기)
+
+    기다리지 않으면 보고서에는 전송 대기 상태가 남고, 결과는 전송 스레드가
+    영상 캐시와 사이클 기록에 반영한다.
+    """
+    stats = {"sent": 0, "failed": 0, "skipped": 0, "pending": 0}
 
     if not DATABASE_SAVE_ENABLED:
         log_database_save("DB 저장 비활성화(DATABASE_SAVE_ENABLED=0)")
@@ -643,22 +1119,21 @@ def save_completed_summaries_to_database(results: List[Dict[str, Any]]) -> Dict[
         keyword = kw_data.get("keyword", "")
         for video in kw_data.get("videos", []) or []:
             summary = normalize_summary_text(video.get("subtitle_summary", ""))
-            if video.get("db_saved") is True:
-                stats["skipped"] += 1
-                continue
-
-            if not is_summary_eligible_for_db(summary):
+            if video.get("db_saved") is True or not is_summary_eligible_for_db(summary):
                 stats["skipped"] += 1
                 continue
-
-            saved = save_single_summary_to_database(keyword, video)
-            video["db_saved"] = saved
-            if saved:
-                stats["sent"] += 1
-            else:
-                stats["failed"] += 1
-            time.sleep(0.2)
-
+            queue_summary_for_database(keyword, video)
+
+    writer = get_db_writer()
+    if DB_FLUSH_TIMEOUT > 0:
+        writer.flush(DB_FLUSH_TIMEOUT)
+    writer_stats = writer.snapshot_stats()
+    stats["sent"] = writer_stats["sent"]
+    stats["failed"] = writer_stats["failed"]
+    stats["skipped"] += writer_stats["skipped"]
+    stats["pending"] = writer_stats["pending"]
+    stats["retries"] = writer_stats["retries"]
+    stats["coalesced"] = writer_stats["coalesced"]
     return stats
 
 
@@ -680,81 +1155,76 @@ def is_within_last_24_hours(upload_date: str) -> bool:
     return latest_possible >= window_start
 
 
-def is_today_video_with_ollama(video: Dict[str, Any], model: str) -> bool:
-    """영상 날짜/조회수 텍스트를 Ollama에 보내 최근 24시간 영상인지 판정"""
-    now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    upload_date = (video.get("upload_date") or "").strip()
+def decide_recent_upload(video: Dict[str, Any]):
+    """메타데이터만으로 최근 24시간 업로드 여부 판정
 
-    if not upload_date:
-        resolved_date = resolve_upload_date_by_video_id(video.get("video_id", ""))
-        if resolved_date:
-            upload_date = resolved_date
-            video["upload_date"] = resolved_date
+    업로드 시각(timestamp/release_timestamp)이 있으면 시 단위까지 정확히, 업로드일만
+    있으면 is_within_last_24_hours와 같은 날짜 단위 규칙으로 판정한다.
+    (판정, 판정이 유지되는 epoch 초)를 반환하고, 판단할 정보가 없으면 None.
+    """
+    with _VIDEO_METADATA_LOCK:
+        metadata = dict(VIDEO_METADATA.get(video.get("video_id", ""), {}))
+    for key in ("upload_date", "timestamp", "release_timestamp"):
+        if video.get(key) and not metadata.get(key):
+            metadata[key] = video[key]
+
+    uploaded_at = upload_timestamp(metadata)
+    if uploaded_at is not None:
+        recent_until = uploaded_at + RECENT_WINDOW_SECONDS
+    else:
+        try:
+            date_obj = datetime.strptime(metadata.get("upload_date") or "", "%Y-%m-%d")
+        except ValueError:
+            return None
+        # 업로드 시각이 없으므로 해당 날짜의 마지막 시각(23:59:59) 기준
+        recent_until = (date_obj.replace(hour=23, minute=59, second=59) + timedelta(hours=24)).timestamp()
 
-    info_text = (
-        f"제목: {video.get('title', '')}\n"
-        f"업로드일: {upload_date or '알 수 없음'}\n"
-        f"조회수: {video.get('views', 0):,}\n"
-    )
+    if time.time() <= recent_until:
+        return True, recent_until
+    return False, float("inf")  # 오래된 영상은 계속 오래된 영상
 
-    # 날짜 정보가 명확히 최근 24시간이 아니면 바로 제외
-    if upload_date and not is_within_last_24_hours(upload_date):
-        return False
 
-    if not model:
-        return True
+def is_recent_video(video: Dict[str, Any]) -> bool:
+    """메타데이터 기준 최근 24시간 업로드 영상인지 (정보가 없으면 False)"""
+    decision = decide_recent_upload(video)
+    return bool(decision and decision[0])
 
-    prompt = f"""다음 유튜브 영상 정보가 '현재 시각({now_str}) 기준 최근 24시간 이내 업로드 영상'인지 판정하세요.
 
-영상 정보:
-{info_text}
+def is_recent_upload(video: Dict[str, Any], keep_unknown: bool = False) -> bool:
+    """최근 24시간 영상인지 메타데이터로 판정 (업로드 정보가 전혀 없으면 keep_unknown)
 
-규칙:
-1) 업로드일이 최근 24시간 이내로 판단되면 YES
-2) 업로드일이 24시간을 초과하면 NO
-3) 업로드일이 없어서 판단 불가면 NO
+    업로드일을 모르면 Ollama도 판단할 근거가 없어 항상 NO였으므로 묻지 않는다.
+    Ollama 모델이 없을 때는 예전처럼 업로드일을 모르는 영상도 남기도록 keep_unknown=True로 부른다.
+    판정은 video_id별로 유지 기한까지 TODAY_VERDICTS에 보관한다.
+    """
+    video_id = video.get("video_id", "")
+    now = time.time()
+    with _VIDEO_METADATA_LOCK:
+        cached = TODAY_VERDICTS.get(video_id) if video_id else None
+    if cached and now <= cached[1]:
+        return cached[0]
+
+    if not (video.get("upload_date") or "").strip():
+        resolved_date = resolve_upload_date_by_video_id(video_id)
+        if resolved_date:
+            video["upload_date"] = resolved_date
 
-출력: YES 또는 NO 중 하나만"""
+    decision = decide_recent_upload(video)
+    if decision is None:
+        decision = (keep_unknown, now + METADATA_RETRY_SECONDS)  # 메타데이터 재조회 주기까지만 유지
 
-    try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": 0.0,
-                    "num_predict": 5,
-                    "top_p": 0.1,
-                },
-            },
-            timeout=20,
-        )
-        response.raise_for_status()
-        result = response.json()
-        verdict = (result.get("response", "") or "").strip().upper()
-        return verdict.startswith("YES")
-    except Exception:
-        # Ollama 판정 실패 시 보수적으로 업로드일 기준으로만 판단
-        return bool(upload_date and is_within_last_24_hours(upload_date))
+    if video_id:
+        with _VIDEO_METADATA_LOCK:
+            TODAY_VERDICTS[video_id] = decision
+    return decision[0]
 
 
 def get_next_report_number(report_dir: Path) -> int:
-    """해당 날짜 폴더의 다음 보고서 번호 반환"""
-    existing_reports = list(report_dir.glob("report_*.json"))
-    if not existing_reports:
-        return 1
-    
-    numbers = []
-    for report_file in existing_reports:
-        try:
-            num = int(report_file.stem.split("_")[1])
-            numbers.append(num)
-        except (IndexError, ValueError):
-            continue
-    
-    return max(numbers) + 1 if numbers else 1
+    """해당 날짜 폴더의 다음 보고서 번호 반환 (색인 조회, 색인에 없는 파일이 있으면 건너뜀)"""
+    number = get_report_index().next_number(report_dir.name)
+    while (report_dir / f"report_{number:03d}.json").exists():
+        number += 1
+    return number
 
 
 def get_latest_report_keywords(max_keywords: int = 8) -> Dict[str, Any]:
@@ -762,55 +1232,16 @@ def get_latest_report_keywords(max_keywords: int = 8) -> Dict[str, Any]:
     Returns: {"keywords": [...], "info": "..."}
     """
     try:
-        if not REPORTS_BASE_DIR.exists():
-            return {"keywords": [], "info": ""}
-        
-        # 날짜별 폴더 목록 (최신순)
-        date_folders = sorted(REPORTS_BASE_DIR.iterdir(), reverse=True)
-        
-        if not date_folders:
-            return {"keywords": [], "info": ""}
-        
-        # 각 폴더에서 가장 최신 리포트 찾기
-        for date_folder in date_folders:
-            if not date_folder.is_dir():
-                continue
-                
-            report_files = sorted(date_folder.glob("report_*.json"), reverse=True)
-            
-            if not report_files:
-                continue
-            
-            latest_report = report_files[0]
-            
-            try:
-                with open(latest_report, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # 상위 키워드 추출 (오늘의 주요 뉴스 제외)
-                keywords = []
-                if isinstance(data, dict) and "keywords" in data:
-                    all_keywords = data["keywords"]
-                    for kw in all_keywords:
-                        if kw.get("keyword") != "오늘의 주요 뉴스":
-                            keywords.append(kw.get("keyword", ""))
-                        if len(keywords) >= max_keywords:
-                            break
-                
-                if keywords:
-                    # 상위 키워드들로 정보 문자열 생성
-                    keywords_str = ", ".join(keywords[:5])
-                    return {
-                        "keywords": keywords,
-                        "info": f"최근 인기 주제: {keywords_str}"
-                    }
-            
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"[WARN] 리포트 파싱 오류: {latest_report} - {e}")
-                continue
-        
+        keywords = get_report_index().latest_keywords(max_keywords, exclude=FIXED_KEYWORD)
+        if keywords:
+            # 상위 키워드들로 정보 문자열 생성
+            keywords_str = ", ".join(keywords[:5])
+            return {
+                "keywords": keywords,
+                "info": f"최근 인기 주제: {keywords_str}"
+            }
         return {"keywords": [], "info": ""}
-        
+
     except Exception as e:
         print(f"[WARN] 최신 리포트 검색 오류: {e}")
         return {"keywords": [], "info": ""}
@@ -850,10 +1281,7 @@ def collect_rss_titles(rss_urls: List[str], max_per_feed: int = 20) -> List[str]
 def get_available_ollama_models() -> List[str]:
     """설치된 Ollama 모델 목록 조회"""
     try:
-        response = requests.get(f"{OLLAMA_URL}/api/tags", timeout=5)
-        response.raise_for_status()
-        data = response.json()
-        return [model["name"] for model in data.get("models", [])]
+        return ollama_client.get_client(OLLAMA_URL).list_models(timeout=5)
     except Exception as e:
         print(f"[WARN] Ollama 모델 조회 실패: {e}")
         return []
@@ -922,8 +1350,7 @@ def generate_keywords_with_ollama(titles: List[str], model: str, count: int = 10
 생성 키워드:"""
 
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": prompt,
@@ -1011,6 +1438,12 @@ def generate_keywords_with_ollama(titles: List[str], model: str, count: int = 10
 
 
 def get_video_subtitles(video_id: str) -> str:
+    """유튜브 영상의 자막 가져오기 (자막 단계 동시 실행 제한 적용)"""
+    with SUBTITLE_LIMITER:
+        return _fetch_video_subtitles(video_id)
+
+
+def _fetch_video_subtitles(video_id: str) -> str:
     """유튜브 영상의 자막 가져오기 (youtube-transcript-api 우선, yt_dlp 폴백)"""
     global SUBTITLE_BLOCK_WARNED
     transcript_error = None
@@ -1077,47 +1510,15 @@ def get_video_subtitles(video_id: str) -> str:
         import yt_dlp
 
         video_url = f"https://www.youtube.com/watch?v={video_id}"
+        http_headers = YTDLP_HTTP_HEADERS
 
-        user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        http_headers = {
-            "User-Agent": user_agent,
-            "Referer": "https://www.youtube.com/",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        }
-
-        cookie_file = os.getenv("YTDLP_COOKIES_FILE", "").strip()
-        browser_name = os.getenv("YTDLP_BROWSER", "chrome").strip().lower()
-
-        browser_candidates = [None]
+        profiles = ["subtitles"]
         if os.getenv("USE_BROWSER_COOKIES", "0") == "1":
-            browser_candidates.append(browser_name if browser_name else "chrome")
-
-        for browser in browser_candidates:
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": True,
-                "skip_download": True,
-                "writesubtitles": True,
-                "writeautomaticsub": True,
-                "subtitleslangs": ["ko", "en", "ja", "zh"],
-                "subtitlesformat": "vtt/best",
-                "socket_timeout": 20,
-                "http_headers": http_headers,
-                "extractor_retries": 2,
-                "sleep_interval_requests": 1,
-                "ignoreerrors": True,
-                "logger": SilentYtDlpLogger(),
-            }
-
-            if cookie_file and Path(cookie_file).exists():
-                ydl_opts["cookiefile"] = cookie_file
-
-            if browser:
-                ydl_opts["cookiesfrombrowser"] = (browser,)
+            profiles.append("subtitles_browser")
 
+        for profile in profiles:
             try:
-                with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    info = ydl.extract_info(video_url, download=False)
+                info = YTDLP_POOL.extract_info(profile, video_url)
 
                 subtitles = info.get("subtitles", {}) if info else {}
                 automatic_captions = info.get("automatic_captions", {}) if info else {}
@@ -1149,7 +1550,8 @@ def get_video_subtitles(video_id: str) -> str:
                 try:
                     with tempfile.TemporaryDirectory() as temp_dir:
                         outtmpl = str(Path(temp_dir) / "%(id)s.%(ext)s")
-                        download_opts = dict(ydl_opts)
+                        # outtmpl이 호출마다 달라 풀 인스턴스 대신 일회성 인스턴스 사용
+                        download_opts = YTDLP_POOL.profile_options(profile)
                         download_opts["outtmpl"] = outtmpl
 
                         with yt_dlp.YoutubeDL(download_opts) as ydl:
@@ -1185,12 +1587,12 @@ def get_video_subtitles(video_id: str) -> str:
     return ""
 
 
-def analyze_subtitles_with_ollama(subtitles_text: str, model: str, video_title: str) -> str:
-    """Ollama로 자막 내용 분석 및 요약 (VTT/XML 포맷 모두 지원)"""
+def extract_subtitle_content(subtitles_text: str) -> Tuple[str, str]:
+    """자막(VTT/XML/일반 텍스트)에서 요약에 넣을 본문 추출. (본문, 실패 사유) 반환"""
     import re
     
     if not subtitles_text or len(subtitles_text) < 50:
-        return "자막 없음"
+        return "", "자막 없음"
     
     # 텍스트 추출
     text_lines = []
@@ -1233,13 +1635,70 @@ def analyze_subtitles_with_ollama(subtitles_text: str, model: str, video_title:
                 text_lines.append(line)
     
     if not text_lines:
-        return "자막 파싱 실패"
+        return "", "자막 파싱 실패"
     
     # 처음 100줄, 최대 1500자로 제한
     subtitle_content = " ".join(text_lines[:100])[:1500]
     
     if len(subtitle_content) < 20:
-        return "자막 내용 부족"
+        return "", "자막 내용 부족"
+    return subtitle_content, ""
+
+
+def clean_subtitle_summary(summary: str) -> str:
+    """생성된 자막 요약 정리 (프롬프트 반복, 불릿, 마크다운 제거)"""
+    # 프롬프트 텍스트 제거 (요약 시작 부분)
+    # "다음은", "다음 영상", "이 영상", "요약:" 등의 프롬프트 부분을 찾아 제거
+    prompt_phrases = [
+        "다음은 영상의 자막",
+        "다음은 영상 자막",
+        "다음 영상의 자막",
+        "이 영상의 자막",
+        "요약:\n\n",
+        "요약:\n",
+        "# 요약",
+    ]
+
+    for phrase in prompt_phrases:
+        if phrase in summary:
+            # 프롬프트 뒤의 실제 내용 추출
+            idx = summary.find(phrase)
+            summary = summary[idx + len(phrase):].strip()
+            # 첫 줄의 구두점 제거
+            for char in [":", "-", "*", "#"]:
+                if summary.startswith(char):
+                    summary = summary[1:].strip()
+            break
+
+    # 불릿 포인트 형식 정리 (* 또는 - 로 시작하는 줄들)
+    if summary.startswith(("*", "-")):
+        lines = summary.split("\n")
+        cleaned_lines = []
+        for line in lines:
+            line = line.strip()
+            if line.startswith(("*", "-")):
+                line = line[1:].strip()
+                # 굵은 텍스트 마크다운 제거
+                line = line.replace("**", "")
+            if line:
+                cleaned_lines.append(line)
+        summary = " ".join(cleaned_lines)
+
+    # 요약 길이 제한 (전체 표시하되, 너무 길면 줄 단위로 제한)
+    if len(summary) > 3000:
+        # 최대 30줄까지
+        lines = summary.split("\n")
+        summary = "\n".join(lines[:30])
+
+    summary = normalize_summary_text(summary)
+    return summary if summary and len(summary) > 10 else "요약 내용 부족"
+
+
+def analyze_subtitles_with_ollama(subtitles_text: str, model: str, video_title: str) -> str:
+    """Ollama로 자막 내용 분석 및 요약 (VTT/XML 포맷 모두 지원)"""
+    subtitle_content, error = extract_subtitle_content(subtitles_text)
+    if error:
+        return error
     
     # 프롬프트
     prompt = f"""다음 영상의 자막을 3줄로 요약하시오:
@@ -1256,8 +1715,7 @@ def analyze_subtitles_with_ollama(subtitles_text: str, model: str, video_title:
             # 재시도 시에도 충분한 타임아웃 유지
             timeout = 180  # 180초 (3분)
             
-            response = requests.post(
-                f"{OLLAMA_URL}/api/generate",
+            response = post_ollama_generate(
                 json={
                     "model": model,
                     "prompt": prompt,
@@ -1275,51 +1733,7 @@ def analyze_subtitles_with_ollama(subtitles_text: str, model: str, video_title:
             summary = result.get("response", "").strip()
             
             if summary and len(summary) > 3:
-                # 프롬프트 텍스트 제거 (요약 시작 부분)
-                # "다음은", "다음 영상", "이 영상", "요약:" 등의 프롬프트 부분을 찾아 제거
-                prompt_phrases = [
-                    "다음은 영상의 자막",
-                    "다음은 영상 자막",
-                    "다음 영상의 자막",
-                    "이 영상의 자막",
-                    "요약:\n\n",
-                    "요약:\n",
-                    "# 요약",
-                ]
-                
-                for phrase in prompt_phrases:
-                    if phrase in summary:
-                        # 프롬프트 뒤의 실제 내용 추출
-                        idx = summary.find(phrase)
-                        summary = summary[idx + len(phrase):].strip()
-                        # 첫 줄의 구두점 제거
-                        for char in [":", "-", "*", "#"]:
-                            if summary.startswith(char):
-                                summary = summary[1:].strip()
-                        break
-                
-                # 불릿 포인트 형식 정리 (* 또는 - 로 시작하는 줄들)
-                if summary.startswith(("*", "-")):
-                    lines = summary.split("\n")
-                    cleaned_lines = []
-                    for line in lines:
-                        line = line.strip()
-                        if line.startswith(("*", "-")):
-                            line = line[1:].strip()
-                            # 굵은 텍스트 마크다운 제거
-                            line = line.replace("**", "")
-                        if line:
-                            cleaned_lines.append(line)
-                    summary = " ".join(cleaned_lines)
-                
-                # 요약 길이 제한 (전체 표시하되, 너무 길면 줄 단위로 제한)
-                if len(summary) > 3000:
-                    # 최대 30줄까지
-                    lines = summary.split("\n")
-                    summary = "\n".join(lines[:30])
-                
-                summary = normalize_summary_text(summary)
-                return summary if summary and len(summary) > 10 else "요약 내용 부족"
+                return clean_subtitle_summary(summary)
             else:
                 if attempt < max_retries:
                     wait_time = 2 + attempt
@@ -1353,10 +1767,57 @@ def analyze_subtitles_with_ollama(subtitles_text: str, model: str, video_title:
     return "요약 생성 실패"
 
 
+def summarize_transcript_batch(model: str, items: List[Tuple[str, str]]) -> List[Optional[str]]:
+    """(제목, 자막 본문) 여러 개를 한 번에 요약. 1개뿐이거나 검증 실패한 항목은 None (단건 요약 대상)"""
+    if len(items) < 2:
+        return [None] * len(items)
+    response = post_ollama_generate(
+        json={
+            "model": model,
+            "prompt": summary_batch.build_batch_prompt(items),
+            "stream": False,
+            "format": "json",
+            "options": {
+                "temperature": 0.2,
+                "num_predict": 400 * len(items),
+                "top_p": 0.8,
+            },
+        },
+        timeout=300,
+    )
+    summaries = []
+    for summary in summary_batch.parse_batch_response(response.text, len(items)):
+        summary = clean_subtitle_summary(summary) if summary else None
+        summaries.append(summary if summary and summary != "요약 내용 부족" else None)
+    return summaries
+
+
+SUMMARY_BATCHER = summary_batch.SummaryBatcher(summarize_transcript_batch, SUMMARY_BATCH_SIZE, SUMMARY_BATCH_WINDOW)
+
+
+def configure_summary_batch(size: int = None) -> None:
+    """자막 요약 묶음 크기 변경 (1 이하면 묶음 요약 끔)"""
+    global SUMMARY_BATCH_SIZE, SUMMARY_BATCHER
+    if size is not None:
+        SUMMARY_BATCH_SIZE = max(1, size)
+        SUMMARY_BATCHER = summary_batch.SummaryBatcher(summarize_transcript_batch, SUMMARY_BATCH_SIZE, SUMMARY_BATCH_WINDOW)
+
+
+def summarize_subtitles(subtitles_text: str, model: str, video_title: str) -> str:
+    """자막 요약 (묶음 모드면 동시에 들어온 다른 영상 자막과 한 번에 요약, 실패 항목만 단건 요약)"""
+    if SUMMARY_BATCH_SIZE > 1:
+        subtitle_content, error = extract_subtitle_content(subtitles_text)
+        if error:
+            return error
+        summary = SUMMARY_BATCHER.submit(model, video_title, subtitle_content)
+        if summary:
+            return summary
+    return analyze_subtitles_with_ollama(subtitles_text, model, video_title)
+
+
 def analyze_with_google(video_title: str, keyword: str, model: str) -> str:
     """ChromeDriver(Selenium)로 Google 검색 후 영상 분석"""
     from urllib.parse import quote_plus
-    import time
 
     try:
         search_count = max(1, min(int(os.getenv("SEARCH_COUNT", "5")), 10))
@@ -1374,15 +1835,15 @@ def analyze_with_google(video_title: str, keyword: str, model: str) -> str:
 
     question = f'"{video_title[:100]}" {keyword}'  # 기본값
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": query_prompt,
                 "stream": False,
                 "options": {"temperature": 0.3, "num_predict": 50}
             },
-            timeout=15
+            timeout=15,
+            cache=True,
         )
         if response.status_code == 200:
             ai_query = response.json().get("response", "").strip()
@@ -1396,50 +1857,14 @@ def analyze_with_google(video_title: str, keyword: str, model: str) -> str:
 
     driver = None
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        options = Options()
-        if os.getenv("SEARCH_HEADLESS", "1") == "1":
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1280,1800")
-        options.add_argument("--lang=ko-KR")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        chrome_binary = os.getenv("CHROME_BINARY", "").strip()
-        if chrome_binary:
-            options.binary_location = chrome_binary
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+
+        driver = SELENIUM_POOL.checkout()
         driver.set_page_load_timeout(25)
         driver.get(search_url)
 
-        # 페이지 로드 대기 (더 견고한 방식)
-        time.sleep(3)  # 기본 로드 시간
-        wait = WebDriverWait(driver, 15)
-        
-        # 다양한 선택자로 결과 대기
-        try:
-            wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.g")))
-        except Exception:
-            try:
-                wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div[data-sokoban-container]")))
-            except Exception:
-                pass
-        
-        time.sleep(2)  # 추가 로딩 시간
+        # 결과 목록이 나타나고 DOM/네트워크가 잠잠해질 때까지 대기 (최대 20초)
+        webdriver_pool.wait_for_page(driver, 20, selectors=("div.g", "div[data-sokoban-container]"), label="google")
         
         # 여러 선택자로 결과 수집 시도
         results = driver.find_elements(By.CSS_SELECTOR, "div.g")
@@ -1488,12 +1913,7 @@ def analyze_with_google(video_title: str, keyword: str, model: str) -> str:
         # print(f"      [DEBUG] Google 검색 오류: {str(e)[:100]}")
         return "구글 검색 실패"
     finally:
-        if driver:
-            try:
-                time.sleep(10)  # 결과 로딩 완료 대기
-                driver.quit()
-            except Exception:
-                pass
+        SELENIUM_POOL.checkin(driver)
 
     if not sources:
         return "구글 검색 결과 없음"
@@ -1515,8 +1935,7 @@ def analyze_with_google(video_title: str, keyword: str, model: str) -> str:
 """
 
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": prompt,
@@ -1544,7 +1963,6 @@ def analyze_with_google(video_title: str, keyword: str, model: str) -> str:
 def analyze_with_naver(video_title: str, keyword: str, model: str) -> str:
     """ChromeDriver(Selenium)로 Naver 검색 후 영상 분석"""
     from urllib.parse import quote_plus
-    import time
 
     try:
         search_count = max(1, min(int(os.getenv("SEARCH_COUNT", "5")), 10))
@@ -1562,15 +1980,15 @@ def analyze_with_naver(video_title: str, keyword: str, model: str) -> str:
 
     question = f'"{video_title[:100]}" {keyword}'  # 기본값
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": query_prompt,
                 "stream": False,
                 "options": {"temperature": 0.3, "num_predict": 50}
             },
-            timeout=15
+            timeout=15,
+            cache=True,
         )
         if response.status_code == 200:
             ai_query = response.json().get("response", "").strip()
@@ -1584,50 +2002,14 @@ def analyze_with_naver(video_title: str, keyword: str, model: str) -> str:
 
     driver = None
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        options = Options()
-        if os.getenv("SEARCH_HEADLESS", "1") == "1":
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1280,1800")
-        options.add_argument("--lang=ko-KR")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        chrome_binary = os.getenv("CHROME_BINARY", "").strip()
-        if chrome_binary:
-            options.binary_location = chrome_binary
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+
+        driver = SELENIUM_POOL.checkout()
         driver.set_page_load_timeout(25)
         driver.get(search_url)
 
-        # 페이지 로드 대기 (더 견고한 방식)
-        time.sleep(3)  # 기본 로드 시간
-        wait = WebDriverWait(driver, 15)
-        
-        # 다양한 선택자로 결과 대기
-        try:
-            wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.bx")))
-        except Exception:
-            try:
-                wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.api_list")))
-            except Exception:
-                pass
-        
-        time.sleep(2)  # 추가 로딩 시간
+        # 결과 목록이 나타나고 DOM/네트워크가 잠잠해질 때까지 대기 (최대 20초)
+        webdriver_pool.wait_for_page(driver, 20, selectors=("li.bx", "div.api_list"), label="naver")
         
         # 여러 선택자로 결과 수집 시도
         results = driver.find_elements(By.CSS_SELECTOR, "li.bx")
@@ -1675,12 +2057,7 @@ def analyze_with_naver(video_title: str, keyword: str, model: str) -> str:
         # print(f"      [DEBUG] Naver 검색 오류: {str(e)[:100]}")
         return "네이버 검색 실패"
     finally:
-        if driver:
-            try:
-                time.sleep(10)  # 결과 로딩 완료 대기
-                driver.quit()
-            except Exception:
-                pass
+        SELENIUM_POOL.checkin(driver)
 
     if not sources:
         return "네이버 검색 결과 없음"
@@ -1702,8 +2079,7 @@ def analyze_with_naver(video_title: str, keyword: str, model: str) -> str:
 """
 
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": prompt,
@@ -1731,7 +2107,6 @@ def analyze_with_naver(video_title: str, keyword: str, model: str) -> str:
 def analyze_with_bing(video_title: str, keyword: str, model: str) -> str:
     """ChromeDriver(Selenium)로 Bing 검색 후 영상 분석"""
     from urllib.parse import quote_plus
-    import time
 
     try:
         search_count = max(1, min(int(os.getenv("SEARCH_COUNT", "5")), 10))
@@ -1749,15 +2124,15 @@ def analyze_with_bing(video_title: str, keyword: str, model: str) -> str:
 
     question = f'"{video_title[:100]}" {keyword}'  # 기본값
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": query_prompt,
                 "stream": False,
                 "options": {"temperature": 0.3, "num_predict": 50}
             },
-            timeout=15
+            timeout=15,
+            cache=True,
         )
         if response.status_code == 200:
             ai_query = response.json().get("response", "").strip()
@@ -1771,50 +2146,14 @@ def analyze_with_bing(video_title: str, keyword: str, model: str) -> str:
 
     driver = None
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        options = Options()
-        if os.getenv("SEARCH_HEADLESS", "1") == "1":
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1280,1800")
-        options.add_argument("--lang=ko-KR")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        chrome_binary = os.getenv("CHROME_BINARY", "").strip()
-        if chrome_binary:
-            options.binary_location = chrome_binary
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+
+        driver = SELENIUM_POOL.checkout()
         driver.set_page_load_timeout(25)
         driver.get(search_url)
 
-        # 페이지 로드 대기 (더 견고한 방식)
-        time.sleep(3)  # 기본 로드 시간
-        wait = WebDriverWait(driver, 15)
-        
-        # 다양한 선택자로 결과 대기
-        try:
-            wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.b_algo")))
-        except Exception:
-            try:
-                wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.b_result")))
-            except Exception:
-                pass
-        
-        time.sleep(2)  # 추가 로딩 시간
+        # 결과 목록이 나타나고 DOM/네트워크가 잠잠해질 때까지 대기 (최대 20초)
+        webdriver_pool.wait_for_page(driver, 20, selectors=("li.b_algo", "div.b_result"), label="bing")
         
         # 여러 선택자로 결과 수집 시도
         results = driver.find_elements(By.CSS_SELECTOR, "li.b_algo")
@@ -1862,12 +2201,7 @@ def analyze_with_bing(video_title: str, keyword: str, model: str) -> str:
         # print(f"      [DEBUG] Bing 검색 오류: {str(e)[:100]}")
         return "빙 검색 실패"
     finally:
-        if driver:
-            try:
-                time.sleep(10)  # 결과 로딩 완료 대기
-                driver.quit()
-            except Exception:
-                pass
+        SELENIUM_POOL.checkin(driver)
 
     if not sources:
         return "빙 검색 결과 없음"
@@ -1889,8 +2223,7 @@ def analyze_with_bing(video_title: str, keyword: str, model: str) -> str:
 """
 
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": prompt,
@@ -1918,7 +2251,6 @@ def analyze_with_bing(video_title: str, keyword: str, model: str) -> str:
 def analyze_with_zum(video_title: str, keyword: str, model: str) -> str:
     """ChromeDriver(Selenium)로 Zum 검색 후 영상 분석"""
     from urllib.parse import quote_plus
-    import time
 
     try:
         search_count = max(1, min(int(os.getenv("SEARCH_COUNT", "5")),  10))
@@ -1936,15 +2268,15 @@ def analyze_with_zum(video_title: str, keyword: str, model: str) -> str:
 
     question = f'"{video_title[:100]}" {keyword}'  # 기본값
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": query_prompt,
                 "stream": False,
                 "options": {"temperature": 0.3, "num_predict": 50}
             },
-            timeout=15
+            timeout=15,
+            cache=True,
         )
         if response.status_code == 200:
             ai_query = response.json().get("response", "").strip()
@@ -1958,50 +2290,14 @@ def analyze_with_zum(video_title: str, keyword: str, model: str) -> str:
 
     driver = None
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.common.by import By
-        from selenium.webdriver.support.ui import WebDriverWait
-        from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        options = Options()
-        if os.getenv("SEARCH_HEADLESS", "1") == "1":
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1280,1800")
-        options.add_argument("--lang=ko-KR")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        chrome_binary = os.getenv("CHROME_BINARY", "").strip()
-        if chrome_binary:
-            options.binary_location = chrome_binary
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+
+        driver = SELENIUM_POOL.checkout()
         driver.set_page_load_timeout(25)
         driver.get(search_url)
 
-        # 페이지 로드 대기 (더 견고한 방식)
-        time.sleep(3)  # 기본 로드 시간
-        wait = WebDriverWait(driver, 15)
-        
-        # 다양한 선택자로 결과 대기
-        try:
-            wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.d_cmn_list")))
-        except Exception:
-            try:
-                wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.c-list-base")))
-            except Exception:
-                pass
-        
-        time.sleep(2)  # 추가 로딩 시간
+        # 결과 목록이 나타나고 DOM/네트워크가 잠잠해질 때까지 대기 (최대 20초)
+        webdriver_pool.wait_for_page(driver, 20, selectors=("div.d_cmn_list", "div.c-list-base"), label="zum")
         
         # 여러 선택자로 결과 수집 시도
         results = driver.find_elements(By.CSS_SELECTOR, "div.d_cmn_list")
@@ -2049,12 +2345,7 @@ def analyze_with_zum(video_title: str, keyword: str, model: str) -> str:
         # print(f"      [DEBUG] Zum 검색 오류: {str(e)[:100]}")
         return "줌 검색 실패"
     finally:
-        if driver:
-            try:
-                time.sleep(10)  # 결과 로딩 완료 대기
-                driver.quit()
-            except Exception:
-                pass
+        SELENIUM_POOL.checkin(driver)
 
     if not sources:
         return "줌 검색 결과 없음"
@@ -2076,8 +2367,7 @@ def analyze_with_zum(video_title: str, keyword: str, model: str) -> str:
 """
 
     try:
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": prompt,
@@ -2104,7 +2394,6 @@ def analyze_with_zum(video_title: str, keyword: str, model: str) -> str:
 
 def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: str, upload_date: str = "") -> str:
     """ChromeDriver로 YouTube 자막 직접 추출 후 분석"""
-    import time
 
     now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -2132,38 +2421,22 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
     
     driver = None
     try:
-        from selenium import webdriver
-        from selenium.webdriver.chrome.options import Options
-        from selenium.webdriver.chrome.service import Service
         from selenium.webdriver.common.by import By
         from selenium.webdriver.support.ui import WebDriverWait
         from selenium.webdriver.support import expected_conditions as EC
-        from webdriver_manager.chrome import ChromeDriverManager
-
-        options = Options()
-        if os.getenv("SEARCH_HEADLESS", "1") == "1":
-            options.add_argument("--headless=new")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1280,1800")
-        options.add_argument("--lang=ko-KR")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option("useAutomationExtension", False)
-
-        chrome_binary = os.getenv("CHROME_BINARY", "").strip()
-        if chrome_binary:
-            options.binary_location = chrome_binary
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+
+        driver = SELENIUM_POOL.checkout()
         driver.set_page_load_timeout(30)
         
         # YouTube 영상 페이지 접속
         driver.get(f"https://www.youtube.com/watch?v={video_id}")
-        time.sleep(5)  # 페이지 로드 대기
+        # 영상 정보 영역이 그려지고 DOM/네트워크가 잠잠해질 때까지 대기 (최대 15초)
+        webdriver_pool.wait_for_page(
+            driver,
+            15,
+            selectors=("ytd-watch-metadata", "ytd-video-primary-info-renderer", "#description"),
+            label="youtube",
+        )
         
         subtitles_text = ""
         fail_reasons = []
@@ -2176,19 +2449,19 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
                 # 시도 1: 새 UI
                 more_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "tp-yt-paper-button#expand")))
                 more_button.click()
-                time.sleep(2)
+                webdriver_pool.wait_for_quiet(driver, 2, label="youtube_expand")
             except Exception:
                 try:
                     # 시도 2: 구 UI
                     more_button = driver.find_element(By.XPATH, "//button[@aria-label='더보기' or contains(text(), '더보기')]")
                     more_button.click()
-                    time.sleep(2)
+                    webdriver_pool.wait_for_quiet(driver, 2, label="youtube_expand")
                 except Exception:
                     try:
                         # 시도 3: 영문
                         more_button = driver.find_element(By.XPATH, "//button[contains(@aria-label, 'Show more') or contains(text(), 'more')]")
                         more_button.click()
-                        time.sleep(2)
+                        webdriver_pool.wait_for_quiet(driver, 2, label="youtube_expand")
                     except Exception:
                         pass
 
@@ -2228,8 +2501,7 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
                 try:
                     for menu_btn in driver.find_elements(By.XPATH, menu_xpath)[:3]:
                         _safe_click(menu_btn)
-                        time.sleep(0.5)
-                        if _panel_visible():
+                        if webdriver_pool.wait_until(driver, lambda d: _panel_visible(), 0.5, label="youtube_panel"):
                             transcript_opened = True
                             break
                 except Exception:
@@ -2255,8 +2527,7 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
                                 if "스크립트" not in marker and "transcript" not in marker:
                                     continue
                                 if _safe_click(candidate):
-                                    time.sleep(1.2)
-                                    if _panel_visible():
+                                    if webdriver_pool.wait_until(driver, lambda d: _panel_visible(), 1.2, label="youtube_panel"):
                                         transcript_opened = True
                                         break
                         except Exception:
@@ -2280,8 +2551,7 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
                             return true;
                         """)
                         if clicked:
-                            time.sleep(1.2)
-                            transcript_opened = _panel_visible()
+                            transcript_opened = webdriver_pool.wait_until(driver, lambda d: _panel_visible(), 1.2, label="youtube_panel")
                     except Exception:
                         pass
 
@@ -2291,8 +2561,8 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
             # 3단계: Transcript 패널에서 텍스트 추출
             if transcript_opened:
                 try:
-                    # Transcript 패널 찾기
-                    time.sleep(2)
+                    segment_selector = "transcript-segment-view-model, ytd-transcript-segment-renderer"
+                    spinner_selector = "tp-yt-paper-spinner-lite, ytd-transcript-renderer #spinner, yt-spec-touch-feedback-shape"
 
                     # 무한 로딩 감지: 일정 시간 내 자막 세그먼트가 안 뜨면 로딩 실패로 처리
                     try:
@@ -2300,15 +2570,19 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
                     except ValueError:
                         loading_timeout_sec = 12
 
-                    start_wait = time.time()
-                    while time.time() - start_wait < loading_timeout_sec:
-                        has_segments = bool(driver.find_elements(By.CSS_SELECTOR, "transcript-segment-view-model, ytd-transcript-segment-renderer"))
-                        loading_visible = bool(driver.find_elements(By.CSS_SELECTOR, "tp-yt-paper-spinner-lite, ytd-transcript-renderer #spinner, yt-spec-touch-feedback-shape"))
-                        if has_segments:
-                            break
-                        if not loading_visible:
-                            break
-                        time.sleep(0.8)
+                    # 패널이 세그먼트나 로딩 표시를 그릴 때까지(최대 2초), 이후 세그먼트가 뜨거나 로딩이 끝날 때까지 대기
+                    webdriver_pool.wait_until(
+                        driver,
+                        lambda d: d.find_elements(By.CSS_SELECTOR, f"{segment_selector}, {spinner_selector}"),
+                        2,
+                        label="youtube_transcript",
+                    )
+                    webdriver_pool.wait_until(
+                        driver,
+                        lambda d: d.find_elements(By.CSS_SELECTOR, segment_selector) or not d.find_elements(By.CSS_SELECTOR, spinner_selector),
+                        loading_timeout_sec,
+                        label="youtube_transcript",
+                    )
 
                     has_segments_after_wait = bool(driver.find_elements(By.CSS_SELECTOR, "transcript-segment-view-model, ytd-transcript-segment-renderer"))
                     if not has_segments_after_wait:
@@ -2381,7 +2655,12 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
                     # CC 버튼 클릭
                     cc_button = driver.find_element(By.CSS_SELECTOR, "button.ytp-subtitles-button")
                     cc_button.click()
-                    time.sleep(3)
+                    webdriver_pool.wait_until(
+                        driver,
+                        lambda d: d.find_elements(By.CSS_SELECTOR, "div.ytp-caption-segment"),
+                        3,
+                        label="youtube_cc",
+                    )
                     
                     # 자막 컨테이너에서 추출
                     subtitle_containers = driver.find_elements(By.CSS_SELECTOR, "div.ytp-caption-segment")
@@ -2392,12 +2671,16 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
             
         except Exception as e:
             fail_reasons.append(f"자막 추출 단계 예외: {str(e)[:200]}")
-        
+
+        # 자막 폴백/요약은 브라우저 없이 진행하므로 먼저 반납
+        SELENIUM_POOL.checkin(driver)
+        driver = None
+
         if not subtitles_text or len(subtitles_text) < 50:
             # Selenium UI 추출 실패 시 비-UI 자막 폴백(youtube_transcript_api/yt_dlp)
             fallback_subtitles = get_video_subtitles(video_id)
             if fallback_subtitles and len(fallback_subtitles) >= 50 and fallback_subtitles not in {"자막 없음", "자막 요청 제한(429)", "자막 추출 실패"}:
-                return analyze_subtitles_with_ollama(fallback_subtitles, model, video_title)
+                return summarize_subtitles(fallback_subtitles, model, video_title)
 
             reason = " | ".join(fail_reasons) if fail_reasons else "자막 텍스트 없음 또는 길이 부족(<50)"
             log_subtitle_failure(
@@ -2410,7 +2693,7 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
             return "유튜브 자막 추출 실패"
             
         # Ollama로 요약
-        return analyze_subtitles_with_ollama(subtitles_text, model, video_title)
+        return summarize_subtitles(subtitles_text, model, video_title)
         
     except Exception as e:
         log_subtitle_failure(
@@ -2422,12 +2705,157 @@ def analyze_with_youtube(video_id: str, video_title: str, keyword: str, model: s
         )
         return "유튜브 자막 추출 실패"
     finally:
-        if driver:
-            try:
-                time.sleep(10)  # 결과 확인 대기
-                driver.quit()
-            except Exception:
-                pass
+        SELENIUM_POOL.checkin(driver)
+
+
+SUMMARY_RETRY_ERRORS = ["요약 생성 시간초과", "Ollama 연결 실패", "요약 생성 오류", "요약 생성 실패"]
+
+
+def summarize_subtitles_with_retry(subtitles: str, model: str, video_title: str, log: List[str]) -> str:
+    """자막 요약 (일시 오류면 최대 3번 재시도, 재시도는 단건 요약)"""
+    summary = summarize_subtitles(subtitles, model, video_title)
+    max_retry = 3
+    retry_count = 0
+
+    while summary in SUMMARY_RETRY_ERRORS and retry_count < max_retry:
+        retry_count += 1
+        log.append(f"            [RETRY {retry_count}/3] {summary} - 재시도 중...")
+        time.sleep(2)
+        summary = analyze_subtitles_with_ollama(subtitles, model, video_title)
+    return summary
+
+
+def summarize_subtitles_cached(
+    video_id: str,
+    analysis_source: str,
+    subtitles: str,
+    model: str,
+    video_title: str,
+    log: List[str],
+):
+    """자막 해시가 캐시와 같으면 저장된 요약 재사용, 아니면 요약. (자막 해시, 요약) 반환"""
+    digest = video_cache.transcript_hash(subtitles)
+    cache = get_video_cache()
+    cached_summary = cache.get_summary_for_transcript(video_id, analysis_source, digest) if cache else None
+    if cached_summary:
+        log.append("            → 자막 변경 없음, 캐시 요약 사용")
+        return digest, cached_summary
+    return digest, summarize_subtitles_with_retry(subtitles, model, video_title, log)
+
+
+def analyze_collected_video(
+    keyword: str,
+    video: Dict[str, Any],
+    position: int,
+    total: int,
+    model: str,
+    analysis_source: str,
+) -> List[str]:
+    """수집된 영상 1개 분석 (video에 결과 기록, 출력할 로그 줄 반환)"""
+    log: List[str] = []
+    video_id = video.get("video_id", "")
+    video_title = video.get("title", "제목 없음")
+    if not video_id:
+        return log
+
+    label = f"[{position}/{total}] {video_title}"
+
+    # 로그/판정 전에 video_id로 실제 업로드일 재보강
+    if not (video.get("upload_date") or "").strip():
+        resolved_date = resolve_upload_date_by_video_id(video_id)
+        if resolved_date:
+            video["upload_date"] = resolved_date
+
+    video_upload_date = video.get("upload_date", "") or "날짜 미상"
+
+    # 유효 기간 안의 캐시 요약이 있으면 조회/판정/요약/DB 저장을 모두 생략
+    cache = get_video_cache()
+    cached = cache.get_summary(video_id, analysis_source) if cache else None
+    if cached:
+        summary, db_saved = cached
+        video["subtitle_summary"] = summary
+        if db_saved:
+            video["db_saved"] = True
+        log.append(f"         캐시 사용: {label} (업로드일: {video_upload_date}) → {summary[:80]}")
+        return log
+
+    digest = None
+
+    # 자막 분석 전: 최근 24시간 영상 여부 확인 (아니면 건너뜀)
+    if analysis_source in {"youtube", "subtitles", "auto"}:
+        is_today_video = is_recent_upload(video, keep_unknown=not model)
+        if not is_today_video:
+            summary = CACHEABLE_SKIP_SUMMARY
+            video["subtitle_summary"] = summary
+            if cache:
+                cache.set_summary(video_id, analysis_source, summary)
+            log.append(f"         자막 분석 건너뜀: {label} (업로드일: {video_upload_date}) ({summary})")
+            return log
+
+    if analysis_source == "google":
+        log.append(f"         Google 질의 분석 중: {label} (업로드일: {video_upload_date})")
+        summary = analyze_with_google(video["title"], keyword, model)
+    elif analysis_source == "bing":
+        log.append(f"         Bing 질의 분석 중: {label} (업로드일: {video_upload_date})")
+        summary = analyze_with_bing(video["title"], keyword, model)
+    elif analysis_source == "naver":
+        log.append(f"         Naver 질의 분석 중: {label} (업로드일: {video_upload_date})")
+        summary = analyze_with_naver(video["title"], keyword, model)
+    elif analysis_source == "zum":
+        log.append(f"         Zum 질의 분석 중: {label} (업로드일: {video_upload_date})")
+        summary = analyze_with_zum(video["title"], keyword, model)
+    elif analysis_source == "youtube":
+        log.append(f"         YouTube 자막 추출 중: {label} (업로드일: {video_upload_date})")
+        # 브라우저 자막 추출도 자막 단계 슬롯을 사용 (내부 폴백 자막 조회는 같은 슬롯 재사용)
+        with SUBTITLE_LIMITER:
+            summary = analyze_with_youtube(
+                video_id,
+                video["title"],
+                keyword,
+                model,
+                upload_date=video.get("upload_date", ""),
+            )
+        summary = apply_search_fallback_if_needed(video, keyword, model, summary)
+    elif analysis_source == "subtitles":
+        log.append(f"         자막 분석 중: {label} (업로드일: {video_upload_date})")
+        subtitles = get_video_subtitles(video_id)
+        if subtitles:
+            digest, summary = summarize_subtitles_cached(video_id, analysis_source, subtitles, model, video['title'], log)
+        else:
+            summary = "자막 없음"
+    else:  # auto mode
+        log.append(f"         자막 분석 중: {label} (업로드일: {video_upload_date})")
+        subtitles = get_video_subtitles(video_id)
+        if subtitles:
+            digest, summary = summarize_subtitles_cached(video_id, analysis_source, subtitles, model, video['title'], log)
+        else:
+            log.append("            → 자막 없음, Google 검색 분석으로 폴백")
+            summary = "자막 없음"
+
+    if analysis_source in {"youtube", "subtitles", "auto"}:
+        summary = apply_search_fallback_if_needed(video, keyword, model, summary)
+
+    summary = normalize_summary_text(summary)
+    video["subtitle_summary"] = summary
+
+    if cache and (is_summary_eligible_for_db(summary) or summary == CACHEABLE_SKIP_SUMMARY):
+        cache.set_summary(video_id, analysis_source, summary, digest)
+
+    if is_summary_eligible_for_db(summary) and queue_summary_for_database(keyword, video):
+        log.append("            → 참소식 DB 저장 대기열에 추가")
+
+    if is_summary_eligible_for_db(summary):
+        display_summary = summary
+        if len(display_summary) > 500:
+            lines = display_summary.split("\n")
+            if len(lines) > 5:
+                display_summary = "\n".join(lines[:5]) + "\n..."
+            else:
+                display_summary = display_summary[:500] + "..."
+        log.append(f"            → 요약: {display_summary}")
+    else:
+        log.append(f"            → {summary}")
+    return log
 
 
 def collect_youtube_data(
@@ -2437,27 +2865,13 @@ def collect_youtube_data(
     analyze_subs: bool = False,
     analysis_source: str = "subtitles",
 ) -> Dict[str, Any]:
-    """특정 키워드의 유튜브 영상 데이터 수집 (오늘 영상 우선, 최근 영상도 포함)"""
+    """특정 키워드의 유튜브 영상 데이터 수집 (오늘 영상 우선, 최근 영상도 포함)
+
+    검색은 검색 단계 슬롯 안에서 실행하고, 영상 분석은 영상별로 스레드 풀에 나눠
+    자막/Ollama 단계 제한에 맞춰 동시에 진행한다.
+    """
     try:
-        import yt_dlp
-        
-        # Google 자동 요청 차단 방지 위한 User-Agent 설정
-        user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        http_headers = {
-            "User-Agent": user_agent,
-            "Referer": "https://www.youtube.com/",
-            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
-        }
-        
-        # 1단계: extract_flat으로 빠르게 검색
-        ydl_opts_flat = {
-            "extract_flat": True,
-            "quiet": True,
-            "no_warnings": True,
-            "socket_timeout": 15,
-            "http_headers": http_headers,  # Google 요청 차단 방지
-        }
-        
+        # 1단계: extract_flat으로 빠르게 검색 (flat 프로필 인스턴스 재사용)
         search_url = f"ytsearch{limit}:{keyword}"
         
         today_views = []
@@ -2465,172 +2879,88 @@ def collect_youtube_data(
         today_videos = []
         recent_videos = []
         
-        with yt_dlp.YoutubeDL(ydl_opts_flat) as ydl:
-            info = ydl.extract_info(search_url, download=False)
-            
-            if not info or "entries" not in info:
-                return {
-                    "views": [], "video_count": 0, "videos": [],
-                    "today_videos": [], "recent_videos": []
-                }
-            
-            entries = info["entries"]
-            
-            # 모든 영상 수집 (오늘 영상과 최근 영상 분리)
-            for entry in entries:
-                if not entry:
-                    continue
-                
-                upload_date = entry.get("upload_date", "")
-                view_count = entry.get("view_count")
-                
-                if not view_count or not isinstance(view_count, int):
-                    continue
-                
-                # 날짜 포맷팅 (YYYYMMDD → YYYY-MM-DD)
-                formatted_date = ""
-                if upload_date and len(upload_date) == 8:
-                    formatted_date = f"{upload_date[:4]}-{upload_date[4:6]}-{upload_date[6:8]}"
-                
-                video_data = {
-                    "title": entry.get("title", "제목 없음"),
-                    "video_id": entry.get("id", ""),
-                    "views": view_count,
-                    "upload_date": formatted_date,
-                    "url": entry.get("url", ""),
-                    "subtitle_summary": "자막 미분석"
-                }
-                
-                # 최근 24시간 영상과 그 외 최근 영상 분리
-                if is_within_last_24_hours(formatted_date):
-                    today_views.append(view_count)
-                    today_videos.append(video_data)
-                else:
-                    recent_views.append(view_count)
-                    recent_videos.append(video_data)
-            
-            # 모든 영상 (오늘 + 최근, 오늘 우선)
-            all_videos = today_videos + recent_videos
-            all_views = today_views + recent_views
-            
-            # 2단계: 분석이 필요한 경우 모든 영상 분석 (전부 나와야 함)
-            if analyze_subs and model and all_videos:
-                for idx, video in enumerate(all_videos):  # 모든 영상 분석
-                    video_id = video.get("video_id", "")
-                    video_title = video.get("title", "제목 없음")
-                    if not video_id:
-                        continue
-
-                    # 로그/판정 전에 video_id로 실제 업로드일 재보강
-                    if not (video.get("upload_date") or "").strip():
-                        resolved_date = resolve_upload_date_by_video_id(video_id)
-                        if resolved_date:
-                            video["upload_date"] = resolved_date
-
-                    video_upload_date = video.get("upload_date", "") or "날짜 미상"
-
-                    # 자막 분석 전: Ollama로 오늘 날짜 영상 여부 확인 (아니면 건너뜀)
-                    if analysis_source in {"youtube", "subtitles", "auto"}:
-                        is_today_video = is_today_video_with_ollama(video, model)
-                        if not is_today_video:
-                            summary = "오늘 날짜 영상 아님(건너뜀)"
-                            video["subtitle_summary"] = summary
-                            print(f"         자막 분석 건너뜀: [{idx+1}/{len(all_videos)}] {video_title} (업로드일: {video_upload_date}) ({summary})")
-                            continue
+        with SEARCH_LIMITER:
+            info = YTDLP_POOL.extract_info("flat", search_url)
 
-                    if analysis_source == "google":
-                        print(f"         Google 질의 분석 중: [{idx+1}/{len(all_videos)}] {video_title} (업로드일: {video_upload_date})")
-                        summary = analyze_with_google(video["title"], keyword, model)
-                    elif analysis_source == "bing":
-                        print(f"         Bing 질의 분석 중: [{idx+1}/{len(all_videos)}] {video_title} (업로드일: {video_upload_date})")
-                        summary = analyze_with_bing(video["title"], keyword, model)
-                    elif analysis_source == "naver":
-                        print(f"         Naver 질의 분석 중: [{idx+1}/{len(all_videos)}] {video_title} (업로드일: {video_upload_date})")
-                        summary = analyze_with_naver(video["title"], keyword, model)
-                    elif analysis_source == "zum":
-                        print(f"         Zum 질의 분석 중: [{idx+1}/{len(all_videos)}] {video_title} (업로드일: {video_upload_date})")
-                        summary = analyze_with_zum(video["title"], keyword, model)
-                    elif analysis_source == "youtube":
-                        print(f"         YouTube 자막 추출 중: [{idx+1}/{len(all_videos)}] {video_title} (업로드일: {video_upload_date})")
-                        summary = analyze_with_youtube(
-                            video_id,
-                            video["title"],
-                            keyword,
-                            model,
-                            upload_date=video.get("upload_date", ""),
-                        )
-                        summary = apply_search_fallback_if_needed(video, keyword, model, summary)
-                    elif analysis_source == "subtitles":
-                        print(f"         자막 분석 중: [{idx+1}/{len(all_videos)}] {video_title} (업로드일: {video_upload_date})")
-                        subtitles = get_video_subtitles(video_id)
-                        if subtitles:
-                            summary = analyze_subtitles_with_ollama(subtitles, model, video['title'])
-                            max_retry = 3
-                            retry_count = 0
-
-                            while summary in ["요약 생성 시간초과", "Ollama 연결 실패", "요약 생성 오류", "요약 생성 실패"] and retry_count < max_retry:
-                                retry_count += 1
-                                print(f"            [RETRY {retry_count}/3] {summary} - 재시도 중...")
-                                time.sleep(2)
-                                summary = analyze_subtitles_with_ollama(subtitles, model, video['title'])
-                        else:
-                            summary = "자막 없음"
-                    else:  # auto mode
-                        print(f"         자막 분석 중: [{idx+1}/{len(all_videos)}] {video_title} (업로드일: {video_upload_date})")
-                        subtitles = get_video_subtitles(video_id)
-                        if subtitles:
-                            summary = analyze_subtitles_with_ollama(subtitles, model, video['title'])
-                            max_retry = 3
-                            retry_count = 0
-
-                            while summary in ["요약 생성 시간초과", "Ollama 연결 실패", "요약 생성 오류", "요약 생성 실패"] and retry_count < max_retry:
-                                retry_count += 1
-                                print(f"            [RETRY {retry_count}/3] {summary} - 재시도 중...")
-                                time.sleep(2)
-                                summary = analyze_subtitles_with_ollama(subtitles, model, video['title'])
-                        else:
-                            print("            → 자막 없음, Google 검색 분석으로 폴백")
-                            summary = "자막 없음"
+        if not info or "entries" not in info:
+            return {
+                "views": [], "video_count": 0, "videos": [],
+                "today_videos": [], "recent_videos": []
+            }
 
-                    if analysis_source in {"youtube", "subtitles", "auto"}:
-                        summary = apply_search_fallback_if_needed(video, keyword, model, summary)
+        entries = info["entries"]
 
-                    summary = normalize_summary_text(summary)
-                    video["subtitle_summary"] = summary
+        # 검색 결과 정리 (조회수 없는 항목 제외)
+        candidates = []
+        for entry in entries:
+            if not entry:
+                continue
 
-                    if is_summary_eligible_for_db(summary):
-                        saved = save_single_summary_to_database(keyword, video)
-                        video["db_saved"] = saved
-                        if saved:
-                            print("            → 참소식 DB 저장 완료")
-                        else:
-                            print("            → 참소식 DB 저장 실패")
-
-                    if is_summary_eligible_for_db(summary):
-                        display_summary = summary
-                        if len(display_summary) > 500:
-                            lines = display_summary.split("\n")
-                            if len(lines) > 5:
-                                display_summary = "\n".join(lines[:5]) + "\n..."
-                            else:
-                                display_summary = display_summary[:500] + "..."
-                        print(f"            → 요약: {display_summary}")
-                    else:
-                        print(f"            → {summary}")
-
-                # 3단계: 분석 요약 실패 + 오늘 날짜 아님(최근 영상)인 경우 생략
-                original_recent_count = len(recent_videos)
-                recent_videos = [
-                    video for video in recent_videos
-                    if video.get("subtitle_summary") not in UNAVAILABLE_SUMMARIES
+            view_count = entry.get("view_count")
+
+            if not view_count or not isinstance(view_count, int):
+                continue
+
+            video_id = entry.get("id", "")
+            metadata = upload_metadata_from_info(entry)
+            if video_id and any(metadata.values()):
+                metadata = remember_video_metadata(video_id, metadata)
+
+            candidates.append({
+                "title": entry.get("title", "제목 없음"),
+                "video_id": video_id,
+                "views": view_count,
+                "upload_date": metadata.get("upload_date", ""),  # YYYY-MM-DD
+                "url": entry.get("url", ""),
+                "subtitle_summary": "자막 미분석"
+            })
+
+        # 업로드일이 없는 영상은 분류 전에 한 번에 병렬 보강
+        missing_ids = [video["video_id"] for video in candidates if not video["upload_date"] and video["video_id"]]
+        if missing_ids:
+            enriched = enrich_video_metadata(missing_ids)
+            for video in candidates:
+                if not video["upload_date"]:
+                    video["upload_date"] = enriched.get(video["video_id"], {}).get("upload_date", "")
+
+        # 최근 24시간 영상과 그 외 최근 영상 분리 (업로드 시각을 알면 시 단위 판정)
+        for video_data in candidates:
+            if is_recent_video(video_data):
+                today_views.append(video_data["views"])
+                today_videos.append(video_data)
+            else:
+                recent_views.append(video_data["views"])
+                recent_videos.append(video_data)
+
+        # 모든 영상 (오늘 + 최근, 오늘 우선)
+        all_videos = today_videos + recent_videos
+        all_views = today_views + recent_views
+
+        # 2단계: 분석이 필요한 경우 모든 영상 분석 (전부 나와야 함)
+        if analyze_subs and model and all_videos:
+            total = len(all_videos)
+            workers = max(1, min(SUBTITLE_CONCURRENCY, total))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="video") as executor:
+                futures = [
+                    executor.submit(analyze_collected_video, keyword, video, idx, total, model, analysis_source)
+                    for idx, video in enumerate(all_videos, 1)
                 ]
-                skipped_recent_count = original_recent_count - len(recent_videos)
-                if skipped_recent_count > 0:
-                    print(f"         최근 영상 {skipped_recent_count}개 생략 (분석 요약 실패)")
+                for future in as_completed(futures):
+                    print_block(future.result())
+
+            # 3단계: 분석 요약 실패 + 오늘 날짜 아님(최근 영상)인 경우 생략
+            original_recent_count = len(recent_videos)
+            recent_videos = [
+                video for video in recent_videos
+                if video.get("subtitle_summary") not in UNAVAILABLE_SUMMARIES
+            ]
+            skipped_recent_count = original_recent_count - len(recent_videos)
+            if skipped_recent_count > 0:
+                print_block([f"         최근 영상 {skipped_recent_count}개 생략 (분석 요약 실패)"])
 
-                # 필터 반영 후 전체 목록/조회수 재구성
-                all_videos = today_videos + recent_videos
-                all_views = [video.get("views", 0) for video in all_videos if isinstance(video.get("views"), int)]
+            # 필터 반영 후 전체 목록/조회수 재구성
+            all_videos = today_videos + recent_videos
+            all_views = [video.get("views", 0) for video in all_videos if isinstance(video.get("views"), int)]
         
         return {
             "views": all_views,
@@ -2643,7 +2973,7 @@ def collect_youtube_data(
         }
     
     except Exception as e:
-        print(f"[ERROR] 데이터 수집 실패 ({keyword}): {e}")
+        print_block([f"[ERROR] 데이터 수집 실패 ({keyword}): {e}"])
         return {
             "views": [], "video_count": 0, "videos": [],
             "today_videos": [], "recent_videos": [],
@@ -2653,124 +2983,54 @@ def collect_youtube_data(
 
 def calculate_nb_score(views: List[int]) -> Dict[str, Any]:
     """N/B 점수 계산 (bitCalculation.v.0.1.js의 calculateBit 알고리즘 사용)"""
-    if not views or len(views) < 2:
-        return {
-            "max": 0,
-            "min": 0,
-            "nb_score": 0,
-            "avg_views": 0,
-            "total_views": 0
-        }
+    return calculate_nb_scores([views])[0]
+
+
+def calculate_nb_scores(view_lists: List[List[int]]) -> List[Dict[str, Any]]:
+    """여러 조회수 목록의 N/B 점수를 nbcore 배치 계산으로 한 번에 계산"""
+    empty = {
+        "max": 0,
+        "min": 0,
+        "nb_score": 0,
+        "avg_views": 0,
+        "total_views": 0
+    }
+    scored = [views for views in view_lists if views and len(views) >= 2]
+    # Forward Time Flow(MAX) / Reverse Time Flow(MIN), 범위 밖이면 MAX=0, MIN=0.0001
+    batch = nbcore.calculate_many(scored, 5.5) if scored else None
     
-    # calculateBit 함수의 Python 구현 (bitCalculation.v.0.1.js 포팅)
-    def calculate_bit(nb: List[int], bit: float = 100, reverse: bool = False) -> float:
-        """bitCalculation.v.0.1.js의 calculateBit 함수 포팅"""
-        if len(nb) < 2:
-            return bit / 100
-        
-        max_val = max(nb)
-        min_val = min(nb)
-        count_const = 50
-        range_val = max_val - min_val
-        
-        # 음수와 양수 범위를 구분하여 증분 계산
-        negative_range = abs(min_val) if min_val < 0 else 0
-        positive_range = max_val if max_val > 0 else 0
-        
-        negative_increment = negative_range / (count_const * len(nb) - 1) if (count_const * len(nb) - 1) != 0 else 0
-        positive_increment = positive_range / (count_const * len(nb) - 1) if (count_const * len(nb) - 1) != 0 else 0
-        
-        # 배열 초기화
-        arrays = {
-            'BIT_START_A50': [0] * (count_const * len(nb)),
-            'BIT_START_A100': [0] * (count_const * len(nb)),
-            'BIT_START_B50': [0] * (count_const * len(nb)),
-            'BIT_START_B100': [0] * (count_const * len(nb)),
-            'BIT_START_NBA100': [0] * (count_const * len(nb)),
-        }
-        
-        count = 0
-        total_sum = 0
-        
-        for value in nb:
-            for i in range(count_const):
-                bit_end = 1
-                
-                # 부호에 따른 A50, B50 계산
-                if value < 0:
-                    a50 = min_val + negative_increment * (count + 1)
-                else:
-                    a50 = min_val + positive_increment * (count + 1)
-                
-                a100 = (count + 1) * bit / (count_const * len(nb))
-                
-                if value < 0:
-                    b50 = a50 - negative_increment * 2
-                else:
-                    b50 = a50 - positive_increment * 2
-                
-                if value < 0:
-                    b100 = a50 + negative_increment
-                else:
-                    b100 = a50 + positive_increment
-                
-                nba100 = a100 / (len(nb) - bit_end) if (len(nb) - bit_end) != 0 else 0
-                
-                arrays['BIT_START_A50'][count] = a50
-                arrays['BIT_START_A100'][count] = a100
-                arrays['BIT_START_B50'][count] = b50
-                arrays['BIT_START_B100'][count] = b100
-                arrays['BIT_START_NBA100'][count] = nba100
-                count += 1
-            
-            total_sum += value
-        
-        # Reverse 옵션 처리 (시간 역방향 흐름 분석)
-        if reverse:
-            arrays['BIT_START_NBA100'] = arrays['BIT_START_NBA100'][::-1]
-        
-        # NB50 계산 (시간 흐름 기반 가중치 분석)
-        nb50 = 0
-        for value in nb:
-            for a in range(len(arrays['BIT_START_NBA100'])):
-                if arrays['BIT_START_B50'][a] <= value <= arrays['BIT_START_B100'][a]:
-                    nba_idx = min(a, len(arrays['BIT_START_NBA100']) - 1)
-                    nb50 += arrays['BIT_START_NBA100'][nba_idx]
-                    break
-        
-        # 평균 비율 기반 NB50 정규화
-        bit_weight = max((10 - len(nb)) * 10, 1)
-        average_ratio = (total_sum / (len(nb) * abs(max_val or 1))) * 100  # 절대값으로 계산
-        nb50 = min((nb50 / 100) * average_ratio, bit)
-        
-        # 시간 흐름의 상한치(MAX)와 하한치(MIN) 보정
-        if len(nb) == 2:
-            return bit - nb50  # NB 분석 점수가 작을수록 시간 흐름 안정성이 높음
+    results = []
+    position = 0
+    for views in view_lists:
+        if not views or len(views) < 2:
+            results.append(dict(empty))
+            continue
+        bit_max = float(batch["max"][position])
+        bit_min = float(batch["min"][position])
+        nb_score = float(batch["score"][position])
+        position += 1
         
-        return nb50
-    
-    # BIT_MAX_NB와 BIT_MIN_NB 호출 (global SUPER_BIT 없이 구현)
-    bit_max = calculate_bit(views, 5.5, False)  # Forward Time Flow
-    bit_min = calculate_bit(views, 5.5, True)   # Reverse Time Flow
-    
-    # 유효성 검증
-    if not (isinstance(bit_max, (int, float)) and isinstance(bit_min, (int, float))):
-        bit_max, bit_min = 0, 0.0001
-    
-    if not ((-100 <= bit_max <= 100) and (-100 <= bit_min <= 100)):
-        bit_max, bit_min = 0, 0.0001
-    
-    avg_val = sum(views) / len(views)
-    nb_score = abs(bit_max) / max(abs(bit_min), 0.0001)
-    
-    return {
-        "max": round(bit_max, 4),
-        "min": round(bit_min, 4),
-        "nb_score": round(nb_score, 4),
-        "avg_views": round(avg_val, 2),
-        "total_views": sum(views),
-        "video_count": len(views)
-    }
+        avg_val = sum(views) / len(views)
+        results.append({
+            "max": round(bit_max, 4),
+            "min": round(bit_min, 4),
+            "nb_score": round(nb_score, 4),
+            "avg_views": round(avg_val, 2),
+            "total_views": sum(views),
+            "video_count": len(views)
+        })
+    return results
+
+
+def update_keyword_nb_stream(keyword: str, views: List[int]) -> Dict[str, Any]:
+    """키워드의 누적 조회수 목록에 이번 사이클 조회수를 추가하고 N/B 점수 갱신"""
+    tracker = KEYWORD_NB_TRACKERS.get(keyword)
+    if tracker is None:
+        tracker = nbcore.IncrementalNBScorer(5.5, window=NB_STREAM_WINDOW)
+        KEYWORD_NB_TRACKERS[keyword] = tracker
+    result = tracker.extend(views)
+    result["stats"] = tracker.stats()
+    return result
 
 
 def generate_report_with_ollama(report_data: Dict[str, Any], model: str) -> str:
@@ -2830,8 +3090,7 @@ def generate_report_with_ollama(report_data: Dict[str, Any], model: str) -> str:
 
 전문적인 형식의 마크다운 리포트를 작성해주세요:"""
         
-        response = requests.post(
-            f"{OLLAMA_URL}/api/generate",
+        response = post_ollama_generate(
             json={
                 "model": model,
                 "prompt": prompt,
@@ -2863,6 +3122,10 @@ def save_report(report_data: Dict[str, Any], report_dir: Path, report_num: int,
     json_path = report_dir / f"report_{report_num:03d}.json"
     with open(json_path, "w", encoding="utf-8") as f:
         json.dump(report_data, f, ensure_ascii=False, indent=2)
+    try:
+        get_report_index().add_report(report_dir.name, report_num, report_data, json_path)
+    except Exception as e:
+        print(f"[WARN] 보고서 색인 실패: {e}")
     
     # 마크다운 파일 생성
     md_path = report_dir / f"report_{report_num:03d}.md"
@@ -2886,6 +3149,19 @@ def save_report(report_data: Dict[str, Any], report_dir: Path, report_num: int,
             f.write(f"**분석 키워드 수**: {len(report_data['keywords'])}\n\n")
             f.write(f"**분석 활성화**: {'활성화' if report_data.get('analyze_subtitles') else '비활성화'}\n")
             f.write(f"**분석 소스**: {report_data.get('analysis_source', 'subtitles')}\n\n")
+            cache_stats = report_data.get("video_cache")
+            if cache_stats:
+                cache_text = ", ".join(
+                    f"{field} {counts['hit']}/{counts['miss']}"
+                    for field, counts in cache_stats.items() if isinstance(counts, dict)
+                )
+                f.write(f"**영상 캐시 적중/실패**: {cache_text}\n\n")
+            llm_stats = report_data.get("llm_cache")
+            if llm_stats:
+                f.write(
+                    f"**LLM 캐시 적중**: {llm_stats['hits']}/{llm_stats['hits'] + llm_stats['misses']} "
+                    f"(절약 {llm_stats['saved_seconds']}초)\n\n"
+                )
             f.write("---\n\n")
             
             f.write("## 분석 결과\n\n")
@@ -2937,8 +3213,27 @@ def run_monitoring_cycle(
     analysis_source: str = "subtitles",
 ):
     """1회 모니터링 사이클 실행"""
-    global CURRENT_OLLAMA_MODEL
+    global CURRENT_OLLAMA_MODEL, _CYCLE_JOURNAL
     CURRENT_OLLAMA_MODEL = model
+    cache = get_video_cache()
+    if cache:
+        cache.reset_stats()
+    ollama_client.get_client(OLLAMA_URL).metrics.reset()
+    llm_cache = ollama_client.get_cache()
+    if llm_cache:
+        llm_cache.reset_stats()
+    SUMMARY_BATCHER.reset_stats()
+    writer = get_db_writer()
+    if writer:
+        writer.reset_stats()
+    admission_queue = ollama_client.get_client(OLLAMA_URL).admission
+    if admission_queue:
+        admission_queue.reset_stats()
+    SELENIUM_POOL.reset_stats()
+    webdriver_pool.reset_wait_stats()
+    if analysis_source in SELENIUM_SOURCES:
+        threading.Thread(target=warm_selenium_pool, daemon=True).start()
+    archive_old_reports()
     
     # 한글 배너 출력
     print("\n" + "═"*55)
@@ -2969,70 +3264,125 @@ def run_monitoring_cycle(
     analyze_subs_str = "활성화" if analyze_subtitles else "비활성화"
     print(f"\n[2/3] 키워드별 유튜브 데이터 수집 및 분석 중... (분석: {analyze_subs_str}, 소스: {analysis_source})")
     print(f"[INFO] {len(keywords)}개 키워드 분석 시작...\n")
+
+    # 이전 실행이 사이클 중간에 멈췄으면 완료된 키워드 결과를 이어서 사용
+    completed: Dict[str, Dict[str, Any]] = {}
+    journal = None
+    if _CYCLE_JOURNAL is not None:  # 이전 사이클이 예외로 끝나 열려 있는 기록
+        _CYCLE_JOURNAL.close()
+        _CYCLE_JOURNAL = None
+    if CYCLE_RESUME_MAX_MINUTES > 0:
+        journal = cycle_journal.CycleJournal(CYCLE_JOURNAL_PATH, max_age=CYCLE_RESUME_MAX_MINUTES * 60)
+        try:
+            completed = journal.begin({
+                "model": model,
+                "video_limit": video_limit,
+                "analyze_subtitles": analyze_subtitles,
+                "analysis_source": analysis_source,
+            })
+        except (OSError, ValueError) as e:
+            print(f"[WARN] 사이클 기록 열기 실패: {e}")
+            journal = None
+        _CYCLE_JOURNAL = journal
+    if not completed:
+        _CYCLE_NB_STREAMED.clear()
+    resumed = [keyword for keyword in keywords if keyword in completed]
+    if resumed:
+        print(f"[RESUME] 이전 사이클에서 완료된 키워드 {len(resumed)}개 재사용: {', '.join(resumed)}")
     
-    results = []
-    for idx, keyword in enumerate(keywords, 1):
-        is_fixed = (keyword == "오늘의 주요 뉴스")
-        print(f"  [{idx}/{len(keywords)}] {keyword}{'🔒' if is_fixed else ''} 분석 중...")
-        
-        # 조회수 + 분석 데이터 수집
-        data = collect_youtube_data(
-            keyword,
-            video_limit,
-            model=model,
-            analyze_subs=analyze_subtitles,
-            analysis_source=analysis_source,
-        )
-        views = data["views"]
-        video_count = data["video_count"]
-        videos = data["videos"]
-        today_videos = data.get("today_videos", [])
-        recent_videos = data.get("recent_videos", [])
-        today_count = data.get("today_count", 0)
-        recent_count = data.get("recent_count", 0)
-        
-        nb_data = calculate_nb_score(views)
-        
-        result = {
-            "keyword": keyword,
-            "is_fixed": is_fixed,
-            "views": views,
-            "video_count": video_count,
-            "videos": videos,
-            **nb_data
-        }
-        results.append(result)
-        
-        # 상세 로그 출력
-        if video_count > 0:
-            print(f"       → 검색 결과: {video_count}개 영상 발견")
-            
-            # 오늘 영상 출력
-            if today_count > 0:
-                print(f"         [오늘] {today_count}개:")
-                for v_idx, v in enumerate(today_videos, 1):
-                    print(f"           {v_idx}. {v['title']} ({v['views']:,} 조회수)")
-            
-            # 최근 영상 출력
-            if recent_count > 0:
-                print(f"         [최근] {recent_count}개:")
-                for v_idx, v in enumerate(recent_videos[:5], 1):  # 최근 영상은 최대 5개만 표시
-                    date_str = v.get('upload_date', '날짜 미상')
-                    print(f"           {v_idx}. {v['title']} ({v['views']:,} 조회수, {date_str})")
-            
-            # N/B Score 출력
-            print(f"         N/B Score: {nb_data['nb_score']}")
-            
-            # 분석 완료 표시
-            if analyze_subtitles and videos:
-                analyzed_count = sum(1 for v in videos if v.get('subtitle_summary') and v['subtitle_summary'] != '자막 미분석')
-                if analyzed_count > 0:
-                    print(f"         영상 분석: {analyzed_count}개 완료")
-        else:
-            print(f"       → 검색 결과 없음")
-        
-        print(f"  [{idx}/{len(keywords)}] ✓ 완료\n")  # 각 키워드 완료 표시
-        time.sleep(1)  # API 부하 방지
+    # 키워드는 검색 단계 동시 실행 수만큼 동시에 수집하고, 결과는 키워드 순서 자리에 저장
+    results: List[Dict[str, Any]] = [None] * len(keywords)
+    keyword_workers = max(1, min(SEARCH_CONCURRENCY, len(keywords)))
+    print(
+        f"[INFO] 동시 실행: 키워드 {keyword_workers}개, 검색 {SEARCH_CONCURRENCY}, "
+        f"자막 {SUBTITLE_CONCURRENCY}, Ollama {LLM_CONCURRENCY}"
+    )
+    with ThreadPoolExecutor(max_workers=keyword_workers, thread_name_prefix="keyword") as executor:
+        futures = {}
+        for idx, keyword in enumerate(keywords, 1):
+            is_fixed = (keyword == FIXED_KEYWORD)
+            if keyword in completed:
+                results[idx - 1] = {**completed[keyword], "is_fixed": is_fixed}
+                # 재시작하면 누적 N/B 계산기가 비어 있으므로 기록된 조회수를 다시 넣음
+                if keyword not in _CYCLE_NB_STREAMED:
+                    results[idx - 1]["nb_stream"] = update_keyword_nb_stream(keyword, completed[keyword].get("views") or [])
+                    _CYCLE_NB_STREAMED.add(keyword)
+                print_block([f"  [{idx}/{len(keywords)}] {keyword}{'🔒' if is_fixed else ''} ✓ 이전 실행 결과 사용\n"])
+                continue
+            print_block([f"  [{idx}/{len(keywords)}] {keyword}{'🔒' if is_fixed else ''} 분석 중..."])
+            future = executor.submit(
+                collect_youtube_data,
+                keyword,
+                video_limit,
+                model=model,
+                analyze_subs=analyze_subtitles,
+                analysis_source=analysis_source,
+            )
+            futures[future] = idx
+
+        for future in as_completed(futures):
+            idx = futures[future]
+            keyword = keywords[idx - 1]
+            is_fixed = (keyword == FIXED_KEYWORD)
+
+            # 조회수 + 분석 데이터
+            data = future.result()
+            views = data["views"]
+            video_count = data["video_count"]
+            videos = data["videos"]
+            today_videos = data.get("today_videos", [])
+            recent_videos = data.get("recent_videos", [])
+            today_count = data.get("today_count", 0)
+            recent_count = data.get("recent_count", 0)
+
+            nb_data = calculate_nb_score(views)
+            nb_stream = update_keyword_nb_stream(keyword, views)
+            _CYCLE_NB_STREAMED.add(keyword)
+
+            results[idx - 1] = {
+                "keyword": keyword,
+                "is_fixed": is_fixed,
+                "views": views,
+                "video_count": video_count,
+                "videos": videos,
+                **nb_data,
+                "nb_stream": nb_stream
+            }
+            if journal:
+                journal.record(keyword, results[idx - 1])
+
+            # 상세 로그 (키워드별로 묶어서 출력)
+            log = [f"  [{idx}/{len(keywords)}] {keyword}{'🔒' if is_fixed else ''} 결과"]
+            if video_count > 0:
+                log.append(f"       → 검색 결과: {video_count}개 영상 발견")
+
+                # 오늘 영상 출력
+                if today_count > 0:
+                    log.append(f"         [오늘] {today_count}개:")
+                    for v_idx, v in enumerate(today_videos, 1):
+                        log.append(f"           {v_idx}. {v['title']} ({v['views']:,} 조회수)")
+
+                # 최근 영상 출력
+                if recent_count > 0:
+                    log.append(f"         [최근] {recent_count}개:")
+                    for v_idx, v in enumerate(recent_videos[:5], 1):  # 최근 영상은 최대 5개만 표시
+                        date_str = v.get('upload_date', '날짜 미상')
+                        log.append(f"           {v_idx}. {v['title']} ({v['views']:,} 조회수, {date_str})")
+
+                # N/B Score 출력
+                log.append(f"         N/B Score: {nb_data['nb_score']}")
+                log.append(f"         누적 N/B Score: {nb_stream['nb_score']} ({nb_stream['video_count']}개 조회수)")
+
+                # 분석 완료 표시
+                if analyze_subtitles and videos:
+                    analyzed_count = sum(1 for v in videos if v.get('subtitle_summary') and v['subtitle_summary'] != '자막 미분석')
+                    if analyzed_count > 0:
+                        log.append(f"         영상 분석: {analyzed_count}개 완료")
+            else:
+                log.append(f"       → 검색 결과 없음")
+
+            log.append(f"  [{idx}/{len(keywords)}] ✓ 완료\n")  # 각 키워드 완료 표시
+            print_block(log)
     
     # N/B Score 기준 정렬 (단, "오늘의 주요 뉴스"는 항상 상위 유지)
     fixed_results = [r for r in results if r.get("is_fixed")]
@@ -3054,15 +3404,66 @@ def run_monitoring_cycle(
         "analysis_source": analysis_source,
         "keywords": results
     }
+    if resumed:
+        report_data["resumed_keywords"] = resumed
+    record_keyword_trends(report_data)
+    report_data["ollama"] = ollama_client.get_client(OLLAMA_URL).metrics.snapshot()
+    if llm_cache:
+        report_data["llm_cache"] = llm_cache.snapshot_stats()
+        print(f"[CACHE] {llm_cache.summary_line()}")
+    if admission_queue:
+        queue_stats = {**admission_queue.snapshot_stats(), **admission_queue.status()}
+        report_data["ollama_admission"] = queue_stats
+        print(
+            f"[QUEUE] Ollama 대기열: 입장 {queue_stats['admitted']}건, 평균 대기 {queue_stats['wait_avg']}초 "
+            f"(최대 {queue_stats['wait_max']}초, 최대 대기열 {queue_stats['max_depth']}), "
+            f"현재 사용 중 {queue_stats['in_flight']}/{queue_stats['max_in_flight']}"
+        )
+    browser_stats = SELENIUM_POOL.snapshot_stats()
+    if browser_stats["created"] or browser_stats["reused"]:
+        report_data["webdriver_pool"] = browser_stats
+        print(
+            f"[BROWSER] Chrome 새로 실행 {browser_stats['created']}회, 재사용 {browser_stats['reused']}회 "
+            f"(교체 {browser_stats['recycled']}, 충돌 {browser_stats['crashed']}, 열림 {browser_stats['open']})"
+        )
+    page_waits = webdriver_pool.snapshot_wait_stats()
+    if page_waits:
+        report_data["page_waits"] = page_waits
+        print(
+            "[BROWSER] 페이지 대기 평균/최대(초): "
+            + ", ".join(f"{label} {stats['avg']}/{stats['max']} ({stats['count']}회, 상한 {stats['timeouts']})" for label, stats in page_waits.items())
+        )
+    batch_stats = SUMMARY_BATCHER.snapshot_stats()
+    if batch_stats["batches"]:
+        report_data["summary_batch"] = batch_stats
+        print(
+            f"[BATCH] 자막 묶음 요약 {batch_stats['batches']}회, 영상 {batch_stats['items']}개 "
+            f"(성공 {batch_stats['hits']}, 단건 재요약 {batch_stats['fallbacks']})"
+        )
+    if cache:
+        report_data["video_cache"] = cache.snapshot_stats()
+        cache_stats = report_data["video_cache"]
+        print(
+            "[CACHE] 영상 캐시 적중/실패: "
+            + ", ".join(f"{field} {cache_stats[field]['hit']}/{cache_stats[field]['miss']}" for field in video_cache.FIELDS)
+            + f" (저장 영상 {cache_stats['entries']}개)"
+        )
     
-    save_report(report_data, report_dir, report_num, model=model)
-
+    # 남은 요약을 전송 대기열에 넣음 (전송은 기다리지 않고 보고서에는 대기 건수를 기록)
     db_stats = save_completed_summaries_to_database(results)
     if DATABASE_SAVE_ENABLED:
+        report_data["database"] = db_stats
         print(
             f"[DB] 참소식 저장 전송: 성공 {db_stats['sent']}건, "
-            f"실패 {db_stats['failed']}건, 스킵 {db_stats['skipped']}건"
+            f"실패 {db_stats['failed']}건, 스킵 {db_stats['skipped']}건, "
+            f"재시도 대기 {db_stats['pending']}건"
         )
+
+    save_report(report_data, report_dir, report_num, model=model)
+    _CYCLE_NB_STREAMED.clear()
+    if journal:
+        _CYCLE_JOURNAL = None
+        journal.finish()
     
     print(f"\n{'='*60}")
     print(f"[DONE] 보고서 #{report_num:03d} 생성 완료: {report_dir / f'report_{report_num:03d}.json'}")
@@ -3084,8 +3485,17 @@ def main():
         help="분석 소스 선택 (subtitles|google|bing|naver|zum|youtube|auto)",
     )
     parser.add_argument("--once", action="store_true", help="1회만 실행하고 종료")
+    parser.add_argument("--search-workers", type=int, default=SEARCH_CONCURRENCY, help=f"동시 검색 수 (기본: {SEARCH_CONCURRENCY})")
+    parser.add_argument("--subtitle-workers", type=int, default=SUBTITLE_CONCURRENCY, help=f"동시 자막 추출 수 (기본: {SUBTITLE_CONCURRENCY})")
+    parser.add_argument("--llm-workers", type=int, default=LLM_CONCURRENCY, help=f"동시 Ollama 호출 수 (기본: {LLM_CONCURRENCY})")
+    parser.add_argument(
+        "--summary-batch", type=int, default=SUMMARY_BATCH_SIZE,
+        help=f"자막 요약 묶음 크기, 1이면 영상별 단건 요약 (기본: {SUMMARY_BATCH_SIZE})",
+    )
     
     args = parser.parse_args()
+    configure_stage_limits(args.search_workers, args.subtitle_workers, args.llm_workers)
+    configure_summary_batch(args.summary_batch)
     
     # Ollama 모델 선택
     model = choose_ollama_model(args.model)
@@ -3103,7 +3513,9 @@ def main():
 - 자막 분석: {'활성화' if args.subtitles else '비활성화'}
 - 분석 소스: {args.analysis_source}
 - 모니터링 간격: {args.interval}분
-- 보고서 저장: {REPORTS_BASE_DIR}
+- 동시 실행: 검색 {SEARCH_CONCURRENCY}, 자막 {SUBTITLE_CONCURRENCY}, Ollama {LLM_CONCURRENCY}
+- 자막 요약 묶음: {SUMMARY_BATCH_SIZE if SUMMARY_BATCH_SIZE > 1 else '사용 안 함'}
+- 보고서 저장: {REPORTS_BASE_DIR} ({f'{REPORT_ARCHIVE_DAYS}일 지난 날짜는 압축 보관' if REPORT_ARCHIVE_DAYS > 0 else '압축 보관 안 함'})
 """)
     
     if args.once or args.interval <= 0:
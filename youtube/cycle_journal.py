@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+모니터링 사이클 체크포인트 (JSON Lines 기록, 중간에 멈춘 사이클 이어서 실행)
+
+키워드 하나가 끝날 때마다 결과를 기록해 두고, 프로세스가 죽거나 PM2가 재시작해도
+다음 사이클이 완료된 키워드는 다시 검색/요약하지 않고 결과를 그대로 보고서에 쓴다.
+
+- 첫 줄: {"type": "cycle", "started", "params"} (모델/소스 등이 다르거나 max_age보다 오래되면 새로 시작)
+- {"type": "keyword", "keyword", "result"}: 완료된 키워드 결과
+- {"type": "db_saved", "key"}: 참소식 DB 전송 성공 (이어서 실행할 때 결과의 db_saved에 반영해 다시 저장하지 않음)
+- 줄마다 flush + fsync, 마지막 줄이 잘려 있으면 그 앞까지만 사용
+- 보고서 저장이 끝나면 finish()로 파일 삭제
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+
+def video_key(video: Dict[str, Any]) -> str:
+    """DB 전송 대기열과 같은 영상 key (video_id, 없으면 제목 앞 120자)"""
+    return video.get("video_id") or (video.get("title") or "")[:120]
+
+
+class CycleJournal:
+    """사이클 1회분 체크포인트 (스레드 안전)"""
+
+    def __init__(self, path, max_age: float = 3 * 3600):
+        self.path = Path(path)
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _read(self) -> list:
+        """기록을 읽고 잘린 마지막 줄은 잘라냄"""
+        entries = []
+        with open(self.path, "rb") as f:
+            raw = f.read()
+        offset = 0
+        for line in raw.splitlines(keepends=True):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b"\n") or not isinstance(entry, dict):
+                break
+            entries.append(entry)
+            offset += len(line)
+        if offset != len(raw):
+            with open(self.path, "r+b") as f:
+                f.truncate(offset)
+        return entries
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def begin(self, params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """이어서 실행할 수 있으면 완료된 키워드 결과({키워드: 결과})를 돌려주고, 아니면 새로 시작"""
+        completed: Dict[str, Dict[str, Any]] = {}
+        saved = set()
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            entries = self._read() if self.path.exists() else []
+            header = entries[0] if entries and entries[0].get("type") == "cycle" else None
+            resumable = (
+                header is not None
+                and header.get("params") == params
+                and time.time() - header.get("started", 0) <= self.max_age
+            )
+            if resumable:
+                for entry in entries[1:]:
+                    if entry.get("type") == "keyword":
+                        completed[entry["keyword"]] = entry["result"]
+                    elif entry.get("type") == "db_saved":
+                        saved.add(entry.get("key"))
+                self._file = open(self.path, "a", encoding="utf-8")
+            else:
+                self._file = open(self.path, "w", encoding="utf-8")
+                self._append({"type": "cycle", "started": time.time(), "params": params})
+        for result in completed.values():
+            for video in result.get("videos") or []:
+                if isinstance(video, dict) and video_key(video) in saved:
+                    video["db_saved"] = True
+        return completed
+
+    def record(self, keyword: str, result: Dict[str, Any]) -> None:
+        """키워드 1개 완료"""
+        with self._lock:
+            if self._file is not None:
+                self._append({"type": "keyword", "keyword": keyword, "result": result})
+
+    def mark_db_saved(self, key: str) -> None:
+        """영상 요약이 DB에 저장됨 (전송 스레드에서 호출)"""
+        with self._lock:
+            if self._file is not None and key:
+                self._append({"type": "db_saved", "key": key})
+
+    def finish(self) -> None:
+        """보고서까지 저장한 사이클의 기록 삭제"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def close(self) -> None:
+        """기록은 남기고 파일만 닫음 (다음 실행에서 이어서 사용)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+참소식 DB 비동기 저장 (SQLite 보낼 편지함 + 백그라운드 전송 스레드)
+
+모니터링 스레드는 submit()으로 편지함에 넣고 바로 돌아가며, 전송 스레드가
+요약 포맷팅(Ollama)과 HTTP 전송을 맡는다.
+
+- 편지함(outbox): key(video_id)당 한 줄. 보내기 전에 같은 key로 다시 들어오면
+  최신 내용으로 합침. 전송에 성공하거나 포기한 항목만 삭제하므로 프로세스가
+  죽어도 다음 실행 때 이어서 보냄
+- 포맷팅 결과는 편지함에 저장해 재시도 때 Ollama를 다시 부르지 않음
+- 실패 시 지수 백오프(±50% 지터)로 max_attempts번까지 재시도
+- 깨우기 신호는 크기 제한 큐라 가득 차도 submit이 막히지 않음 (편지함은 주기적으로 다시 확인)
+"""
+
+import json
+import queue
+import random
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+MAX_ATTEMPTS = 6
+BASE_DELAY = 2.0
+MAX_DELAY = 300.0
+QUEUE_SIZE = 256
+POLL_SECONDS = 1.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    version INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    created REAL NOT NULL
+)
+"""
+
+
+def backoff_delay(attempts: int, base: float = BASE_DELAY, cap: float = MAX_DELAY) -> float:
+    """attempts번 실패한 뒤 기다릴 초 (지수 증가, 상한 cap, ±50% 지터)"""
+    return min(cap, base * (2 ** max(0, attempts - 1))) * random.uniform(0.5, 1.5)
+
+
+class DatabaseWriter:
+    """편지함 기반 백그라운드 저장기 (스레드 안전)
+
+    send(payload) -> bool: 전송 (False/예외면 재시도)
+    prepare(payload) -> Optional[dict]: 전송 전 1회 가공 (None이면 보내지 않고 삭제)
+    on_result(payload, status): "sent" / "failed" / "skipped"
+    """
+
+    def __init__(
+        self,
+        path,
+        send: Callable[[Dict[str, Any]], bool],
+        prepare: Optional[Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]] = None,
+        on_result: Optional[Callable[[Dict[str, Any], str], None]] = None,
+        workers: int = 1,
+        max_attempts: int = MAX_ATTEMPTS,
+        base_delay: float = BASE_DELAY,
+        max_delay: float = MAX_DELAY,
+        queue_size: int = QUEUE_SIZE,
+    ):
+        self.path = Path(path)
+        self.send = send
+        self.prepare = prepare
+        self.on_result = on_result
+        self.workers = max(1, int(workers))
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(SCHEMA)
+        self._conn.commit()
+        self._wake: "queue.Queue[str]" = queue.Queue(maxsize=max(1, int(queue_size)))
+        self._inflight: set = set()
+        self._threads: List[threading.Thread] = []
+        self._stopped = threading.Event()
+        self.reset_stats()
+
+    # 집계
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {"queued": 0, "coalesced": 0, "sent": 0, "retries": 0, "failed": 0, "skipped": 0}
+
+    def snapshot_stats(self) -> Dict[str, int]:
+        """이번 사이클 접수/합침/성공/재시도/포기/스킵 수와 편지함에 남은 항목 수"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats["pending"] = self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+        return stats
+
+    # 접수
+    def submit(self, key: str, payload: Dict[str, Any]) -> None:
+        """편지함에 넣고 바로 반환 (같은 key가 아직 안 보내졌으면 최신 내용으로 교체)"""
+        now = time.time()
+        with self._lock:
+            existing = self._conn.execute("SELECT 1 FROM outbox WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                """
+                INSERT INTO outbox (key, payload, version, attempts, next_attempt, created)
+                VALUES (?, ?, ?, 0, ?, ?)
+                ON CONFLICT(key) DO UPDATE SET
+                    payload = excluded.payload, version = excluded.version,
+                    attempts = 0, next_attempt = excluded.next_attempt
+                """,
+                (key, json.dumps(payload, ensure_ascii=False), time.time_ns(), now, now),
+            )
+            self._conn.commit()
+            self.stats["coalesced" if existing else "queued"] += 1
+        try:
+            self._wake.put_nowait(key)
+        except queue.Full:
+            pass
+
+    def pending_keys(self) -> List[str]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT key FROM outbox")]
+
+    # 전송 스레드
+    def start(self) -> "DatabaseWriter":
+        """전송 스레드 시작 (이전 실행에서 남은 항목도 바로 보냄)"""
+        with self._lock:
+            if self._threads:
+                return self
+            # 이전 실행에서 재시도 대기 중이던 항목은 바로 다시 시도
+            self._conn.execute("UPDATE outbox SET next_attempt = ? WHERE next_attempt > ?", (time.time(), time.time()))
+            self._conn.commit()
+            self._stopped.clear()
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"db-writer-{index}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return self
+
+    def _claim(self) -> Optional[tuple]:
+        """보낼 시각이 된 항목 하나를 가져옴 (다른 스레드가 보내는 중인 key 제외)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, payload, version, attempts FROM outbox WHERE next_attempt <= ? ORDER BY next_attempt",
+                (time.time(),),
+            ).fetchall()
+            for row in rows:
+                if row[0] not in self._inflight:
+                    self._inflight.add(row[0])
+                    return row
+        return None
+
+    def _finish(self, key: str, version: int, status: Optional[str], payload: Dict[str, Any], attempts: int = 0) -> None:
+        with self._lock:
+            if status is None:  # 재시도 예약 (그 사이 새로 들어온 내용이면 그대로 둠)
+                self._conn.execute(
+                    "UPDATE outbox SET attempts = ?, next_attempt = ? WHERE key = ? AND version = ?",
+                    (attempts, time.time() + backoff_delay(attempts, self.base_delay, self.max_delay), key, version),
+                )
+                self.stats["retries"] += 1
+            else:
+                self._conn.execute("DELETE FROM outbox WHERE key = ? AND version = ?", (key, version))
+                self.stats[status] += 1
+            self._conn.commit()
+            self._inflight.discard(key)
+            self._idle.notify_all()
+        if status and self.on_result:
+            try:
+                self.on_result(payload, status)
+            except Exception:
+                pass
+
+    def _process(self, row: tuple) -> None:
+        key, raw, version, attempts = row
+        payload = json.loads(raw)
+        try:
+            if self.prepare and not payload.get("_prepared"):
+                prepared = self.prepare(payload)
+                if prepared is None:
+                    self._finish(key, version, "skipped", payload)
+                    return
+                payload = {**prepared, "_prepared": True}
+                with self._lock:
+                    self._conn.execute(
+                        "UPDATE outbox SET payload = ? WHERE key = ? AND version = ?",
+                        (json.dumps(payload, ensure_ascii=False), key, version),
+                    )
+                    self._conn.commit()
+            ok = bool(self.send(payload))
+        except Exception:
+            ok = False
+        if ok:
+            self._finish(key, version, "sent", payload)
+        elif attempts + 1 >= self.max_attempts:
+            self._finish(key, version, "failed", payload)
+        else:
+            self._finish(key, version, None, payload, attempts + 1)
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            row = self._claim()
+            if row is None:
+                try:
+                    self._wake.get(timeout=POLL_SECONDS)
+                except queue.Empty:
+                    pass
+                continue
+            self._process(row)
+
+    def flush(self, timeout: float = None) -> int:
+        """편지함이 빌 때까지 최대 timeout초 대기하고 남은 항목 수를 돌려줌
+
+        다음 재시도 시각이 timeout 이후인 항목만 남았으면 바로 돌아간다.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            while True:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                horizon = float("inf") if remaining is None else time.time() + remaining
+                due = self._conn.execute(
+                    "SELECT COUNT(*) FROM outbox WHERE next_attempt <= ?", (horizon,)
+                ).fetchone()[0]
+                if not due and not self._inflight:
+                    break
+                self._idle.wait(POLL_SECONDS if remaining is None else min(POLL_SECONDS, remaining))
+            return self._conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0]
+
+    def close(self, timeout: float = 5.0) -> None:
+        """전송 스레드 종료 (남은 항목은 편지함에 유지)"""
+        self._stopped.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        with self._lock:
+            busy = any(thread.is_alive() for thread in self._threads)
+            self._threads = []
+            if not busy:  # 전송 중인 스레드가 끝나지 않았으면 연결은 프로세스 종료 때 정리
+                self._conn.close()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+키워드 추이 시계열 (사이클마다 키워드/영상별 조회수, N/B 점수를 열 단위로 추가 기록)
+
+보고서는 사이클 하나의 스냅샷이라 키워드가 어떻게 변했는지 보려면 JSON 수십 개를
+열어야 한다. 사이클이 끝날 때 (키워드, video_id, 사이클 시각) 행을 날짜별 열 파일에
+덧붙여 두고, 기간 조회는 해당 날짜들의 필요한 열만 읽어 NumPy로 한 번에 계산한다.
+
+- 날짜 폴더마다 cycles.<열>.bin (ts, keyword, nb_score, video_count, total_views, avg_views),
+  videos.<열>.bin (ts, keyword, video, views)
+- keyword/video 열은 keywords.txt, video_ids.txt 줄 번호 (추가만 함)
+  키워드가 수만 개로 계속 바뀌므로 키워드별 파일 대신 번호 열로 묶어 저장
+- ts는 증가만 하므로 기간 시작 위치는 이진 탐색으로 찾음
+  (마지막 ts 이하의 사이클은 버려서 같은 보고서를 다시 넣어도 중복되지 않음)
+- 쓰다가 멈춰 열 길이가 어긋나면 다음에 열 때 가장 짧은 열 길이로 맞춤
+
+python keyword_series.py movers [일수] [views|nb_score|video_count]
+python keyword_series.py velocity 키워드 [일수]
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TABLES = {
+    "cycles": {"ts": "<f8", "keyword": "<i4", "nb_score": "<f8", "video_count": "<i8", "total_views": "<i8", "avg_views": "<f8"},
+    "videos": {"ts": "<f8", "keyword": "<i4", "video": "<i4", "views": "<i8"},
+}
+METRICS = ("views", "nb_score", "video_count")
+DAY_SECONDS = 86400.0
+
+
+def _number(value, default):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
+
+def _day(ts: float) -> str:
+    return datetime.fromtimestamp(ts).strftime("%Y-%m-%d")
+
+
+def report_timestamp(data: Dict[str, Any]) -> Optional[float]:
+    """보고서 timestamp(ISO) -> epoch 초"""
+    try:
+        return datetime.fromisoformat(data["timestamp"]).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _group_bounds(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """정렬된 키 배열에서 같은 값 구간의 (처음, 마지막) 위치"""
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    return starts, ends
+
+
+class _Names:
+    """추가만 하는 이름 <-> 번호 표 (한 줄에 하나)
+
+    줄은 "\n"으로만 나눈다. splitlines는 U+2028 등도 줄바꿈으로 보아 번호가 밀린다.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.names = []
+        if path.exists():
+            self.names = path.read_bytes().decode("utf-8").split("\n")
+            partial = self.names.pop()  # 마지막 "\n" 뒤 (쓰다 멈춘 이름이면 잘라냄)
+            if partial:
+                with open(path, "r+b") as f:
+                    f.truncate(path.stat().st_size - len(partial.encode("utf-8")))
+        self.index = {name: number for number, name in enumerate(self.names)}
+
+    def add(self, names: Iterable[str]) -> None:
+        new = []
+        for name in names:
+            if name not in self.index:
+                self.index[name] = len(self.names)
+                self.names.append(name)
+                new.append(name)
+        if new:
+            with open(self.path, "ab") as f:
+                f.write("".join(name + "\n" for name in new).encode("utf-8"))
+
+
+class KeywordSeries:
+    """키워드 추이 저장소 (스레드 안전)"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._keywords = _Names(self.root / "keywords.txt")
+        self._videos = _Names(self.root / "video_ids.txt")
+        self.last_ts = float("-inf")
+        days = self._days()
+        if days:
+            rows = self._trim(days[-1])
+            if rows:
+                self.last_ts = float(self._read_day(days[-1], "cycles", ("ts",))["ts"][-1])
+
+    # 열 파일
+    def _days(self) -> List[str]:
+        return sorted(path.name for path in self.root.iterdir() if path.is_dir())
+
+    def _file(self, day: str, table: str, column: str) -> Path:
+        return self.root / day / f"{table}.{column}.bin"
+
+    def _rows(self, day: str, table: str) -> int:
+        sizes = []
+        for column, dtype in TABLES[table].items():
+            path = self._file(day, table, column)
+            sizes.append(path.stat().st_size // np.dtype(dtype).itemsize if path.exists() else 0)
+        return min(sizes)
+
+    def _trim(self, day: str) -> int:
+        """열 길이를 가장 짧은 열에 맞춤 (쓰다가 멈춘 행 제거), cycles 행 수 반환"""
+        for table, columns in TABLES.items():
+            rows = self._rows(day, table)
+            for column, dtype in columns.items():
+                path = self._file(day, table, column)
+                size = rows * np.dtype(dtype).itemsize
+                if path.exists() and path.stat().st_size != size:
+                    with open(path, "r+b") as f:
+                        f.truncate(size)
+        return self._rows(day, "cycles")
+
+    def _read_day(self, day: str, table: str, columns: Sequence[str], since: float = None) -> Dict[str, np.ndarray]:
+        rows = self._rows(day, table)
+        start = 0
+        if since is not None and rows:
+            ts = np.memmap(self._file(day, table, "ts"), dtype=TABLES[table]["ts"], mode="r", shape=(rows,))
+            start = int(np.searchsorted(ts, since, side="left"))
+            del ts
+        result = {}
+        for column in columns:
+            dtype = np.dtype(TABLES[table][column])
+            if rows - start <= 0:
+                result[column] = np.empty(0, dtype=dtype)
+            else:
+                result[column] = np.fromfile(self._file(day, table, column), dtype=dtype, count=rows - start, offset=start * dtype.itemsize)
+        return result
+
+    # 기록
+    def is_empty(self) -> bool:
+        with self._lock:
+            return self.last_ts == float("-inf")
+
+    def append_cycles(self, cycles: Iterable[Tuple[float, List[Dict[str, Any]]]]) -> int:
+        """[(사이클 시각, 보고서 keywords 목록)]을 날짜별로 모아 덧붙임, 추가한 키워드 행 수 반환
+
+        마지막으로 기록한 사이클 시각 이하인 사이클은 건너뛴다.
+        """
+        with self._lock:
+            pending: Dict[str, Dict[str, Dict[str, list]]] = {}
+            last_ts = self.last_ts
+            for cycle_ts, keywords in sorted((item for item in cycles if item[0] is not None), key=lambda item: item[0]):
+                if cycle_ts <= last_ts:
+                    continue
+                last_ts = cycle_ts
+                tables = pending.setdefault(_day(cycle_ts), {
+                    table: {column: [] for column in columns} for table, columns in TABLES.items()
+                })
+                for kw_data in keywords or []:
+                    if not isinstance(kw_data, dict) or not kw_data.get("keyword"):
+                        continue
+                    self._keywords.add([kw_data["keyword"]])
+                    keyword = self._keywords.index[kw_data["keyword"]]
+                    cycle = tables["cycles"]
+                    cycle["ts"].append(cycle_ts)
+                    cycle["keyword"].append(keyword)
+                    cycle["nb_score"].append(_number(kw_data.get("nb_score"), float("nan")))
+                    cycle["video_count"].append(_number(kw_data.get("video_count"), 0))
+                    cycle["total_views"].append(_number(kw_data.get("total_views"), 0))
+                    cycle["avg_views"].append(_number(kw_data.get("avg_views"), float("nan")))
+                    for video in kw_data.get("videos") or []:
+                        views = _number(video.get("views"), None) if isinstance(video, dict) else None
+                        if views is None or not video.get("video_id"):
+                            continue
+                        self._videos.add([video["video_id"]])
+                        tables["videos"]["ts"].append(cycle_ts)
+                        tables["videos"]["keyword"].append(keyword)
+                        tables["videos"]["video"].append(self._videos.index[video["video_id"]])
+                        tables["videos"]["views"].append(views)
+            added = 0
+            for day, tables in pending.items():
+                (self.root / day).mkdir(exist_ok=True)
+                for table, values in tables.items():
+                    for column, dtype in TABLES[table].items():
+                        with open(self._file(day, table, column), "ab") as f:
+                            f.write(np.asarray(values[column], dtype=dtype).tobytes())
+                added += len(tables["cycles"]["ts"])
+            self.last_ts = last_ts
+            return added
+
+    def append_cycle(self, cycle_ts: float, keywords: List[Dict[str, Any]]) -> int:
+        return self.append_cycles([(cycle_ts, keywords)])
+
+    # 조회
+    def keywords(self) -> List[str]:
+        with self._lock:
+            return list(self._keywords.names)
+
+    def read(self, table: str, columns: Sequence[str] = None, days: float = None, keyword: str = None, now: float = None) -> Dict[str, np.ndarray]:
+        """최근 days일 행에서 요청한 열만 읽음 (days=None이면 전체, keyword를 주면 그 키워드 행만)"""
+        columns = tuple(columns or TABLES[table])
+        needed = columns + (("keyword",) if keyword is not None and "keyword" not in columns else ())
+        since = None if days is None else (now or time.time()) - days * DAY_SECONDS
+        with self._lock:
+            keyword_id = None if keyword is None else self._keywords.index.get(keyword, -1)
+            parts = [
+                self._read_day(day, table, needed, since)
+                for day in self._days()
+                if since is None or day >= _day(since)
+            ]
+        result = {
+            column: np.concatenate([part[column] for part in parts]) if parts else np.empty(0, dtype=TABLES[table][column])
+            for column in needed
+        }
+        if keyword_id is not None:
+            mask = result["keyword"] == keyword_id
+            result = {column: values[mask] for column, values in result.items()}
+        return {column: result[column] for column in columns}
+
+    def _video_gains(self, days: float, keyword: str = None, now: float = None) -> Dict[str, np.ndarray]:
+        """기간 안 (키워드, 영상)별 조회수 증가와 경과 시간(시)"""
+        data = self.read("videos", ("ts", "keyword", "video", "views"), days, keyword, now)
+        if not len(data["ts"]):
+            return {"keyword": np.empty(0, dtype=np.int32), "video": np.empty(0, dtype=np.int32),
+                    "gain": np.empty(0), "hours": np.empty(0)}
+        order = np.lexsort((data["ts"], data["video"], data["keyword"]))
+        keyword_ids, video, ts, views = (data[column][order] for column in ("keyword", "video", "ts", "views"))
+        pair = keyword_ids.astype(np.int64) << 32 | video.astype(np.int64)
+        starts, ends = _group_bounds(pair)
+        return {
+            "keyword": keyword_ids[starts],
+            "video": video[starts],
+            "gain": (views[ends] - views[starts]).astype(float),
+            "hours": (ts[ends] - ts[starts]) / 3600.0,
+        }
+
+    def view_velocity(self, keyword: str, days: float = 1.0, now: float = None) -> Dict[str, float]:
+        """기간 안에 두 번 이상 잡힌 영상별 시간당 조회수 증가"""
+        gains = self._video_gains(days, keyword, now)
+        with self._lock:
+            names = self._videos.names
+            return {
+                names[video]: round(float(gain / hours), 2)
+                for video, gain, hours in zip(gains["video"], gains["gain"], gains["hours"])
+                if hours > 0
+            }
+
+    def nb_delta(self, keyword: str, days: float = 1.0, now: float = None) -> Dict[str, Any]:
+        """기간 안 N/B 점수 처음/마지막/변화량/최소/최대"""
+        scores = self.read("cycles", ("nb_score",), days, keyword, now)["nb_score"]
+        scores = scores[~np.isnan(scores)]
+        if not len(scores):
+            return {"cycles": 0, "first": None, "last": None, "delta": None, "min": None, "max": None}
+        return {
+            "cycles": int(len(scores)),
+            "first": round(float(scores[0]), 4),
+            "last": round(float(scores[-1]), 4),
+            "delta": round(float(scores[-1] - scores[0]), 4),
+            "min": round(float(scores.min()), 4),
+            "max": round(float(scores.max()), 4),
+        }
+
+    def top_movers(self, days: float = 1.0, metric: str = "views", limit: int = 10, exclude: Iterable[str] = (), now: float = None) -> List[Dict[str, Any]]:
+        """기간 안에 가장 많이 오른 키워드 (기간 안 사이클이 2개 이상인 키워드만)
+
+        views: 영상별 조회수 증가 합계 (영상 교체 영향 없음), nb_score/video_count: 마지막 - 처음
+        """
+        if metric not in METRICS:
+            raise ValueError(f"metric은 {METRICS} 중 하나: {metric}")
+        columns = ("ts", "keyword") if metric == "views" else ("ts", "keyword", metric)
+        data = self.read("cycles", columns, days, now=now)
+        if metric != "views":
+            valid = ~np.isnan(data[metric].astype(float))
+            data = {column: values[valid] for column, values in data.items()}
+        if not len(data["ts"]):
+            return []
+        order = np.lexsort((data["ts"], data["keyword"]))
+        keyword_ids, ts = data["keyword"][order], data["ts"][order]
+        starts, ends = _group_bounds(keyword_ids)
+        ids = keyword_ids[starts]
+        cycles = ends - starts + 1
+        hours = (ts[ends] - ts[starts]) / 3600.0
+        if metric == "views":
+            gains = self._video_gains(days, now=now)
+            delta = np.bincount(gains["keyword"], weights=gains["gain"], minlength=int(ids.max()) + 1)[ids]
+        else:
+            values = data[metric][order].astype(float)
+            delta = values[ends] - values[starts]
+        with self._lock:
+            names = self._keywords.names
+            excluded = {self._keywords.index[name] for name in exclude if name in self._keywords.index}
+        keep = (cycles >= 2) & ~np.isin(ids, list(excluded))
+        ranked = np.flatnonzero(keep)[np.argsort(-delta[keep], kind="stable")][:limit]
+        return [
+            {
+                "keyword": names[ids[index]],
+                "metric": metric,
+                "delta": round(float(delta[index]), 4),
+                "per_hour": round(float(delta[index] / hours[index]), 2) if hours[index] > 0 else None,
+                "cycles": int(cycles[index]),
+            }
+            for index in ranked
+        ]
+
+
+if __name__ == "__main__":
+    series = KeywordSeries(Path(__file__).resolve().parent / "cache" / "keyword_series")
+    command = sys.argv[1] if len(sys.argv) > 1 else "movers"
+    if command == "velocity" and len(sys.argv) > 2:
+        days = float(sys.argv[3]) if len(sys.argv) > 3 else 1.0
+        print(f"N/B: {series.nb_delta(sys.argv[2], days)}")
+        for video_id, per_hour in sorted(series.view_velocity(sys.argv[2], days).items(), key=lambda item: -item[1]):
+            print(f"  {video_id}: 시간당 {per_hour:+,.0f}회")
+    else:
+        days = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+        metric = sys.argv[3] if len(sys.argv) > 3 else "views"
+        for item in series.top_movers(days, metric):
+            print(f"{item['keyword']}: {item['delta']:+,} (시간당 {item['per_hour']}, 사이클 {item['cycles']}개)")
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보고서 일별 압축 보관 (youtube/reports/YYYY-MM-DD.rpa)
+
+사이클마다 쓰는 report_NNN.json/md는 같은 영상 제목/요약이 하루 수십 번 반복된다.
+지난 날짜 폴더를 파일 하나로 묶어 크기와 sync 전송량을 줄이고, 필요할 때 기존
+JSON을 그대로 복원한다.
+
+- 영상 레코드 저장소: 조회수/DB 저장 여부를 뺀 영상 레코드를 내용 해시로 한 번만 저장
+- 보고서: 영상 자리에 (해시, 같은 영상의 직전 보고서 대비 조회수 증감)만 기록,
+  키워드의 views 목록은 영상 조회수로 다시 만들 수 있으면 생략
+- 파일: MAGIC 뒤에 [종류 1B][코덱 1B][길이 4B][본문] 프레임
+  (zstandard가 있으면 zstd, 없으면 표준 라이브러리 xz. gzip 프레임도 읽고 쓸 수 있음)
+- 묶은 뒤 모든 보고서를 다시 풀어 원본 파일과 바이트 단위로 같을 때만 원본을 지움
+
+python report_archive.py compact [일수]      # 일수보다 오래된 날짜 폴더 묶기 (기본 7)
+python report_archive.py extract YYYY-MM-DD  # 묶은 날짜를 report_NNN.json/md로 다시 풀기
+"""
+
+import gzip
+import hashlib
+import json
+import lzma
+import struct
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b"RPA1"
+SUFFIX = ".rpa"
+FRAME_HEADER = struct.Struct(">ccI")
+KIND_BLOBS = b"B"
+KIND_REPORTS = b"R"
+CODEC_GZIP = b"g"
+CODEC_XZ = b"x"
+CODEC_ZSTD = b"z"
+# 보고서마다 바뀌는 영상 필드 (영상 레코드 해시에서 제외하고 보고서 쪽에 기록)
+VARIABLE_FIELDS = ("views", "db_saved")
+# 키워드 views 목록이 영상 조회수와 같을 때 쓰는 표시
+DERIVED_VIEWS = "@videos"
+
+
+def legacy_json(data: Dict[str, Any]) -> str:
+    """save_report와 같은 형식의 JSON 문자열"""
+    return json.dumps(data, ensure_ascii=False, indent=2)
+
+
+def archive_path(reports_dir, day: str) -> Path:
+    return Path(reports_dir) / f"{day}{SUFFIX}"
+
+
+def _blob_id(record: Dict[str, Any]) -> str:
+    """키 순서까지 포함한 영상 레코드 내용 해시"""
+    text = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=10).hexdigest()
+
+
+def _is_count(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+# 묶기 / 풀기
+def pack_reports(reports: List[Tuple[int, Dict[str, Any], Optional[str]]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """[(번호, 보고서, 마크다운)] -> (영상 레코드 저장소, 참조로 줄인 보고서 목록)"""
+    blobs: Dict[str, Dict[str, Any]] = {}
+    last_views: Dict[str, int] = {}
+    packed = []
+    for number, data, markdown in sorted(reports, key=lambda item: item[0]):
+        keywords = []
+        for kw_data in data.get("keywords") if isinstance(data.get("keywords"), list) else []:
+            if not isinstance(kw_data, dict) or not isinstance(kw_data.get("videos"), list):
+                keywords.append(kw_data)
+                continue
+            refs = []
+            for video in kw_data["videos"]:
+                if not isinstance(video, dict):
+                    refs.append({"raw": video})
+                    continue
+                record = {key: (None if key in VARIABLE_FIELDS else value) for key, value in video.items()}
+                blob = _blob_id(record)
+                blobs.setdefault(blob, record)
+                ref: Dict[str, Any] = {"b": blob}
+                if "views" in video:
+                    views = video["views"]
+                    video_key = str(video.get("video_id") or blob)
+                    if _is_count(views):
+                        ref["d"] = views - last_views.get(video_key, 0)
+                        last_views[video_key] = views
+                    else:
+                        ref["v"] = views
+                if "db_saved" in video:
+                    ref["s"] = video["db_saved"]
+                refs.append(ref)
+            packed_kw = dict(kw_data, videos=refs)
+            derived = [video.get("views") for video in kw_data["videos"] if isinstance(video, dict)]
+            if "views" in kw_data and kw_data["views"] == derived:
+                packed_kw["views"] = DERIVED_VIEWS
+            keywords.append(packed_kw)
+        packed.append({"number": number, "data": dict(data, keywords=keywords) if isinstance(data.get("keywords"), list) else data,
+                       "markdown": markdown})
+    return blobs, packed
+
+
+def unpack_reports(blobs: Dict[str, Dict[str, Any]], packed: List[Dict[str, Any]]) -> Iterator[Tuple[int, Dict[str, Any], Optional[str]]]:
+    """pack_reports의 역순 (번호순으로 (번호, 보고서, 마크다운))"""
+    last_views: Dict[str, int] = {}
+    for entry in packed:
+        data = entry["data"]
+        if not isinstance(data.get("keywords"), list):
+            yield entry["number"], data, entry.get("markdown")
+            continue
+        keywords = []
+        for kw_data in data["keywords"]:
+            if not isinstance(kw_data, dict) or not isinstance(kw_data.get("videos"), list):
+                keywords.append(kw_data)
+                continue
+            videos = []
+            for ref in kw_data["videos"]:
+                if "raw" in ref:
+                    videos.append(ref["raw"])
+                    continue
+                video = dict(blobs[ref["b"]])
+                if "views" in video:
+                    if "d" in ref:
+                        video_key = str(video.get("video_id") or ref["b"])
+                        last_views[video_key] = video["views"] = last_views.get(video_key, 0) + ref["d"]
+                    else:
+                        video["views"] = ref.get("v")
+                if "db_saved" in video:
+                    video["db_saved"] = ref.get("s")
+                videos.append(video)
+            restored = dict(kw_data, videos=videos)
+            if kw_data.get("views") == DERIVED_VIEWS:
+                restored["views"] = [video.get("views") for video in videos if isinstance(video, dict)]
+            keywords.append(restored)
+        yield entry["number"], dict(data, keywords=keywords), entry.get("markdown")
+
+
+# 프레임
+def default_codec() -> bytes:
+    return CODEC_ZSTD if zstandard is not None else CODEC_XZ
+
+
+def _compress(codec: bytes, payload: bytes) -> bytes:
+    if codec == CODEC_ZSTD:
+        return zstandard.ZstdCompressor(level=19).compress(payload)
+    if codec == CODEC_XZ:
+        return lzma.compress(payload, preset=9)
+    if codec == CODEC_GZIP:
+        return gzip.compress(payload, compresslevel=9, mtime=0)
+    raise ValueError(f"알 수 없는 압축 형식: {codec!r}")
+
+
+def _decompress(codec: bytes, payload: bytes) -> bytes:
+    if codec == CODEC_XZ:
+        return lzma.decompress(payload)
+    if codec == CODEC_GZIP:
+        return gzip.decompress(payload)
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 보관 파일입니다. pip install zstandard 후 다시 시도하세요.")
+        return zstandard.ZstdDecompressor().decompress(payload)
+    raise ValueError(f"알 수 없는 압축 형식: {codec!r}")
+
+
+def write_archive(path, blobs: Dict[str, Any], packed: List[Dict[str, Any]], codec: bytes = None) -> int:
+    """보관 파일 쓰기 (임시 파일에 쓴 뒤 교체), 파일 크기 반환"""
+    path = Path(path)
+    codec = codec or default_codec()
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        for kind, obj in ((KIND_BLOBS, blobs), (KIND_REPORTS, packed)):
+            body = _compress(codec, json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+            f.write(FRAME_HEADER.pack(kind, codec, len(body)))
+            f.write(body)
+    tmp_path.replace(path)
+    return path.stat().st_size
+
+
+def read_archive(path) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """보관 파일 -> (영상 레코드 저장소, 보고서 목록)"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"보고서 보관 파일이 아닙니다: {path}")
+    frames: Dict[bytes, Any] = {}
+    offset = len(MAGIC)
+    while offset < len(raw):
+        kind, codec, length = FRAME_HEADER.unpack_from(raw, offset)
+        offset += FRAME_HEADER.size
+        frames[kind] = json.loads(_decompress(codec, raw[offset:offset + length]).decode("utf-8"))
+        offset += length
+    return frames.get(KIND_BLOBS, {}), frames.get(KIND_REPORTS, [])
+
+
+# 날짜 단위
+def _report_number(path: Path) -> Optional[int]:
+    try:
+        return int(path.stem.split("_")[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def compact_day(day_dir, remove: bool = True) -> Dict[str, Any]:
+    """날짜 폴더의 report_NNN.json/md를 YYYY-MM-DD.rpa 하나로 묶음
+
+    다시 풀어 원본과 바이트 단위로 같을 때만 원본을 지운다 (다른 파일이 없으면 폴더도 삭제).
+    """
+    day_dir = Path(day_dir)
+    sources: List[Path] = []
+    reports = []
+    for json_path in sorted(day_dir.glob("report_*.json")):
+        number = _report_number(json_path)
+        if number is None:
+            continue
+        text = json_path.read_text(encoding="utf-8")
+        md_path = json_path.with_suffix(".md")
+        markdown = md_path.read_text(encoding="utf-8") if md_path.exists() else None
+        reports.append((number, json.loads(text), markdown))
+        sources.append(json_path)
+        if markdown is not None:
+            sources.append(md_path)
+    if not reports:
+        return {"day": day_dir.name, "reports": 0, "original_bytes": 0, "archive_bytes": 0, "removed": False}
+
+    path = archive_path(day_dir.parent, day_dir.name)
+    archive_bytes = write_archive(path, *pack_reports(reports))
+    restored = {number: (data, markdown) for number, data, markdown in unpack_reports(*read_archive(path))}
+    for number, data, markdown in reports:
+        json_path = day_dir / f"report_{number:03d}.json"
+        if (legacy_json(restored[number][0]) != json_path.read_text(encoding="utf-8")
+                or restored[number][1] != markdown):
+            path.unlink()
+            raise ValueError(f"복원 결과가 원본과 다릅니다: {json_path}")
+
+    original_bytes = sum(source.stat().st_size for source in sources)
+    if remove:
+        for source in sources:
+            source.unlink()
+        if not any(day_dir.iterdir()):
+            day_dir.rmdir()
+    return {"day": day_dir.name, "reports": len(reports), "original_bytes": original_bytes,
+            "archive_bytes": archive_bytes, "removed": remove}
+
+
+def compact_reports(reports_dir, older_than_days: int = 7, remove: bool = True) -> List[Dict[str, Any]]:
+    """older_than_days일보다 오래된 날짜 폴더를 모두 묶음
+
+    가장 최근 날짜 폴더는 IDE가 최신 보고서를 찾는 곳이라 묶지 않는다.
+    이미 묶은 날짜에 새 파일이 있으면 합쳐서 다시 묶는다.
+    묶지 못한 날짜는 원본을 그대로 두고 결과에 "error"를 담아 다음 날짜로 넘어간다.
+    """
+    reports_dir = Path(reports_dir)
+    cutoff = (datetime.now() - timedelta(days=older_than_days)).strftime("%Y-%m-%d")
+    day_dirs = sorted(path for path in reports_dir.iterdir() if path.is_dir()) if reports_dir.exists() else []
+    results = []
+    for day_dir in day_dirs[:-1]:
+        if day_dir.name >= cutoff:
+            continue
+        existing = archive_path(reports_dir, day_dir.name)
+        try:
+            if existing.exists():
+                extract_day(reports_dir, day_dir.name, overwrite=False)
+            results.append(compact_day(day_dir, remove=remove))
+        except (OSError, ValueError, RuntimeError) as e:
+            results.append({"day": day_dir.name, "reports": 0, "original_bytes": 0, "archive_bytes": 0,
+                            "removed": False, "error": str(e)})
+    return results
+
+
+def iter_day(reports_dir, day: str) -> Iterator[Tuple[int, Dict[str, Any], Optional[str]]]:
+    """묶은 날짜의 보고서를 번호순으로 복원"""
+    yield from unpack_reports(*read_archive(archive_path(reports_dir, day)))
+
+
+def archived_days(reports_dir) -> List[str]:
+    return sorted(path.stem for path in Path(reports_dir).glob(f"*{SUFFIX}"))
+
+
+def iter_reports(reports_dir) -> Iterator[Tuple[str, int, Dict[str, Any], Path]]:
+    """묶은 날짜와 날짜 폴더의 모든 보고서를 날짜순으로 (날짜, 번호, 보고서, 경로), 읽을 수 없는 파일은 건너뜀"""
+    reports_dir = Path(reports_dir)
+    if not reports_dir.exists():
+        return
+    folders = {path.name for path in reports_dir.iterdir() if path.is_dir()}
+    for day in sorted(folders | set(archived_days(reports_dir))):
+        path = archive_path(reports_dir, day)
+        if path.exists():
+            try:
+                reports = list(iter_day(reports_dir, day))
+            except (OSError, ValueError, RuntimeError):
+                reports = []
+            for number, data, _ in reports:
+                yield day, number, data, path
+        if day not in folders:
+            continue
+        numbered = ((_report_number(json_path), json_path) for json_path in (reports_dir / day).glob("report_*.json"))
+        for number, json_path in sorted((item for item in numbered if item[0] is not None), key=lambda item: item[0]):
+            try:
+                with open(json_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if isinstance(data, dict):
+                yield day, number, data, json_path
+
+
+def load_report(reports_dir, day: str, number: int) -> Optional[Dict[str, Any]]:
+    """보고서 1개 읽기 (날짜 폴더의 JSON 우선, 없으면 보관 파일에서 복원)"""
+    json_path = Path(reports_dir) / day / f"report_{number:03d}.json"
+    if json_path.exists():
+        with open(json_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    if archive_path(reports_dir, day).exists():
+        for archived_number, data, _ in iter_day(reports_dir, day):
+            if archived_number == number:
+                return data
+    return None
+
+
+def extract_day(reports_dir, day: str, overwrite: bool = True) -> int:
+    """묶은 날짜를 report_NNN.json/md로 다시 풀고 보관 파일 삭제, 푼 보고서 수 반환"""
+    day_dir = Path(reports_dir) / day
+    day_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    for number, data, markdown in iter_day(reports_dir, day):
+        json_path = day_dir / f"report_{number:03d}.json"
+        if json_path.exists() and not overwrite:
+            continue
+        json_path.write_text(legacy_json(data), encoding="utf-8")
+        if markdown is not None:
+            json_path.with_suffix(".md").write_text(markdown, encoding="utf-8")
+        count += 1
+    archive_path(reports_dir, day).unlink()
+    return count
+
+
+if __name__ == "__main__":
+    reports_dir = Path(__file__).resolve().parent / "reports"
+    command = sys.argv[1] if len(sys.argv) > 1 else "compact"
+    if command == "extract" and len(sys.argv) > 2:
+        print(f"{sys.argv[2]}: 보고서 {extract_day(reports_dir, sys.argv[2])}개 복원")
+    else:
+        days = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+        for result in compact_reports(reports_dir, days):
+            if "error" in result:
+                print(f"{result['day']}: 묶기 실패 ({result['error']})")
+                continue
+            ratio = result["original_bytes"] / max(1, result["archive_bytes"])
+            print(f"{result['day']}: 보고서 {result['reports']}개 "
+                  f"{result['original_bytes'] / 1024:,.0f}KB -> {result['archive_bytes'] / 1024:,.0f}KB ({ratio:.1f}배)")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보고서 색인 (youtube/reports 날짜 폴더 대신 SQLite 조회)
+
+save_report 때 보고서 번호, 생성 시각, 키워드별 N/B 점수, 영상별 id/요약을 함께
+기록해 "최신 키워드", "다음 보고서 번호", "최근 N일 키워드 기록"을 폴더 탐색과
+JSON 전체 읽기 없이 조회한다. 색인이 비어 있으면 처음 열 때 기존 보고서로 한 번 채운다.
+
+python report_index.py rebuild            # 보고서 폴더로 색인 다시 만들기
+python report_index.py history [일수] [키워드]
+"""
+
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import report_archive
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    day TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    timestamp TEXT,
+    model TEXT,
+    analysis_source TEXT,
+    path TEXT,
+    UNIQUE(day, number)
+);
+CREATE TABLE IF NOT EXISTS report_keywords (
+    report_id INTEGER NOT NULL REFERENCES reports(id) ON DELETE CASCADE,
+    rank INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    is_fixed INTEGER NOT NULL DEFAULT 0,
+    nb_score REAL,
+    nb_max REAL,
+    nb_min REAL,
+    video_count INTEGER,
+    avg_views REAL,
+    total_views INTEGER
+);
+CREATE TABLE IF NOT EXISTS report_videos (
+    report_id INTEGER NOT NULL REFERENCES reports(id) ON DELETE CASCADE,
+    keyword TEXT NOT NULL,
+    video_id TEXT,
+    title TEXT,
+    views INTEGER,
+    upload_date TEXT,
+    summary TEXT,
+    db_saved INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_reports_timestamp ON reports(timestamp);
+CREATE INDEX IF NOT EXISTS idx_report_keywords_keyword ON report_keywords(keyword);
+CREATE INDEX IF NOT EXISTS idx_report_keywords_report ON report_keywords(report_id);
+CREATE INDEX IF NOT EXISTS idx_report_videos_report ON report_videos(report_id);
+CREATE INDEX IF NOT EXISTS idx_report_videos_video ON report_videos(video_id);
+"""
+
+
+def _number(value, default=None):
+    return value if isinstance(value, (int, float)) and not isinstance(value, bool) else default
+
+
+class ReportIndex:
+    """보고서 색인 (스레드 안전)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+
+    # 기록
+    def add_report(self, day: str, number: int, data: Dict[str, Any], path: Optional[Path] = None) -> None:
+        """보고서 1개 색인 (같은 날짜/번호가 있으면 교체)"""
+        keywords = data.get("keywords") or []
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM reports WHERE day = ? AND number = ?", (day, number))
+            report_id = self._conn.execute(
+                "INSERT INTO reports (day, number, timestamp, model, analysis_source, path) VALUES (?, ?, ?, ?, ?, ?)",
+                (day, number, data.get("timestamp"), data.get("model"), data.get("analysis_source"), str(path) if path else None),
+            ).lastrowid
+            for rank, kw_data in enumerate(keywords, 1):
+                if not isinstance(kw_data, dict):
+                    continue
+                keyword = kw_data.get("keyword", "")
+                self._conn.execute(
+                    "INSERT INTO report_keywords VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        report_id, rank, keyword, int(bool(kw_data.get("is_fixed"))),
+                        _number(kw_data.get("nb_score")), _number(kw_data.get("max")), _number(kw_data.get("min")),
+                        _number(kw_data.get("video_count")), _number(kw_data.get("avg_views")), _number(kw_data.get("total_views")),
+                    ),
+                )
+                self._conn.executemany(
+                    "INSERT INTO report_videos VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            report_id, keyword, video.get("video_id"), video.get("title"), _number(video.get("views")),
+                            video.get("upload_date"), video.get("subtitle_summary"), int(video.get("db_saved") is True),
+                        )
+                        for video in kw_data.get("videos") or []
+                        if isinstance(video, dict)
+                    ],
+                )
+
+    def rebuild(self, reports_dir) -> int:
+        """보고서 폴더(YYYY-MM-DD/report_NNN.json)와 묶은 날짜(YYYY-MM-DD.rpa)를 읽어 색인을 채움, 색인한 보고서 수 반환"""
+        indexed = 0
+        for day, number, data, path in report_archive.iter_reports(reports_dir):
+            self.add_report(day, number, data, path)
+            indexed += 1
+        return indexed
+
+    def set_day_path(self, day: str, path) -> None:
+        """날짜를 묶은 뒤 해당 날짜 보고서의 경로를 보관 파일로 변경"""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE reports SET path = ? WHERE day = ?", (str(path), day))
+
+    # 조회
+    def next_number(self, day: str) -> int:
+        """해당 날짜의 다음 보고서 번호"""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(number) FROM reports WHERE day = ?", (day,)).fetchone()
+        return (row[0] or 0) + 1
+
+    def latest_keywords(self, max_keywords: int = 8, exclude: str = None) -> List[str]:
+        """고정 키워드를 뺀 키워드가 있는 가장 최근 보고서의 키워드 (순위순)"""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT r.id FROM reports r
+                WHERE EXISTS (
+                    SELECT 1 FROM report_keywords k
+                    WHERE k.report_id = r.id AND k.keyword != '' AND k.keyword != ?
+                )
+                ORDER BY r.day DESC, r.number DESC LIMIT 1
+                """,
+                (exclude or "",),
+            ).fetchone()
+            if not row:
+                return []
+            rows = self._conn.execute(
+                "SELECT keyword FROM report_keywords WHERE report_id = ? AND keyword != '' AND keyword != ? ORDER BY rank LIMIT ?",
+                (row[0], exclude or "", max_keywords),
+            ).fetchall()
+        return [keyword for (keyword,) in rows]
+
+    def keyword_history(self, days: int = 7, keyword: str = None) -> List[Dict[str, Any]]:
+        """최근 days일 보고서의 키워드별 N/B 점수/영상 수 (오래된 순)"""
+        since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        query = """
+            SELECT r.day, r.number, r.timestamp, k.keyword, k.nb_score, k.nb_max, k.nb_min, k.video_count, k.avg_views
+            FROM report_keywords k JOIN reports r ON r.id = k.report_id
+            WHERE r.day >= ?
+        """
+        params: list = [since]
+        if keyword:
+            query += " AND k.keyword = ?"
+            params.append(keyword)
+        query += " ORDER BY r.day, r.number, k.rank"
+        columns = ("day", "number", "timestamp", "keyword", "nb_score", "max", "min", "video_count", "avg_views")
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [dict(zip(columns, row)) for row in rows]
+
+    def report_videos(self, day: str, number: int) -> List[Dict[str, Any]]:
+        """보고서 1개의 영상별 id/제목/요약/DB 저장 여부"""
+        columns = ("keyword", "video_id", "title", "views", "upload_date", "summary", "db_saved")
+        with self._lock:
+            rows = self._conn.execute(
+                f"""
+                SELECT {", ".join("v." + column for column in columns)} FROM report_videos v
+                JOIN reports r ON r.id = v.report_id WHERE r.day = ? AND r.number = ?
+                """,
+                (day, number),
+            ).fetchall()
+        return [dict(zip(columns, row), db_saved=bool(row[-1])) for row in rows]
+
+
+if __name__ == "__main__":
+    script_dir = Path(__file__).resolve().parent
+    index = ReportIndex(script_dir / "cache" / "report_index.sqlite3")
+    command = sys.argv[1] if len(sys.argv) > 1 else "history"
+    if command == "rebuild":
+        print(f"색인한 보고서: {index.rebuild(script_dir / 'reports')}개")
+    else:
+        days = int(sys.argv[2]) if len(sys.argv) > 2 else 7
+        for item in index.keyword_history(days, sys.argv[3] if len(sys.argv) > 3 else None):
+            print(f"{item['day']} #{item['number']:03d} {item['keyword']}: N/B {item['nb_score']} (영상 {item['video_count']})")
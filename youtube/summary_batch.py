@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자막 요약 묶음 호출 (여러 영상의 자막을 한 프롬프트로 요약)
+
+영상별 분석 스레드가 자막 요약 단계에 들어오면 열린 묶음에 합류한다. 묶음을 처음 연
+스레드(리더)가 최대 개수가 차거나 대기 시간이 지나면 한 번에 요약을 요청하고,
+나머지 스레드는 결과를 기다린다. 응답은 영상별 JSON 항목으로 받아 항목마다 검증하며,
+검증에 실패한 항목은 None으로 돌려 호출부가 단건 요약으로 처리하게 한다.
+"""
+
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+BATCH_SIZE = 5
+BATCH_WINDOW = 2.0  # 첫 항목 이후 묶음이 차기를 기다리는 최대 초
+MIN_SUMMARY_LENGTH = 10
+
+BatchItem = Tuple[str, str]  # (영상 제목, 자막 본문)
+
+
+def build_batch_prompt(items: Sequence[BatchItem]) -> str:
+    """영상 N개의 자막을 각각 3줄로 요약하고 JSON으로 답하게 하는 프롬프트"""
+    blocks = [
+        f"[{index}]\n제목: {title[:250]}\n자막: {content}"
+        for index, (title, content) in enumerate(items, 1)
+    ]
+    return (
+        f"다음 영상 {len(items)}개의 자막을 영상마다 따로 3줄로 요약하시오.\n"
+        "각 요약은 해당 영상의 자막만 근거로 작성하고 다른 영상 내용을 섞지 마시오.\n\n"
+        + "\n\n".join(blocks)
+        + "\n\n출력: 아래 형식의 JSON 하나만 (설명 없이, id는 위 번호)\n"
+        '{"items": [{"id": 1, "summary": "첫째 줄\\n둘째 줄\\n셋째 줄"}]}'
+    )
+
+
+def _load_json(raw: str) -> Any:
+    """응답에서 JSON 부분만 읽기 (앞뒤 설명/코드 블록 무시)"""
+    text = (raw or "").strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    for opener, closer in (("{", "}"), ("[", "]")):
+        start, end = text.find(opener), text.rfind(closer)
+        if start != -1 and end > start:
+            try:
+                return json.loads(text[start:end + 1])
+            except ValueError:
+                continue
+    return None
+
+
+def parse_batch_response(raw: str, count: int) -> List[Optional[str]]:
+    """영상 순서대로 요약 목록 (없거나 형식이 틀린 항목은 None)"""
+    data = _load_json(raw)
+    if isinstance(data, dict):
+        data = data.get("items", data.get("summaries"))
+    results: List[Optional[str]] = [None] * count
+    if not isinstance(data, list):
+        return results
+    for position, entry in enumerate(data):
+        if isinstance(entry, str):  # id 없이 순서대로 요약만 준 경우
+            index, summary = position, entry
+        elif isinstance(entry, dict):
+            try:
+                index = int(entry.get("id")) - 1
+            except (TypeError, ValueError):
+                continue
+            summary = entry.get("summary")
+        else:
+            continue
+        if isinstance(summary, list):
+            summary = "\n".join(str(line) for line in summary)
+        if not isinstance(summary, str) or not 0 <= index < count or results[index] is not None:
+            continue
+        summary = re.sub(r"\n{2,}", "\n", summary.strip())
+        if len(summary) > MIN_SUMMARY_LENGTH:
+            results[index] = summary
+    return results
+
+
+class _Batch:
+    def __init__(self):
+        self.items: List[BatchItem] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.results: List[Optional[str]] = []
+
+
+class SummaryBatcher:
+    """같은 그룹(모델)의 요약 요청을 모아 run_batch(items) 한 번으로 처리 (스레드 안전)
+
+    run_batch는 항목 순서대로 요약 또는 None 목록을 돌려준다. 예외가 나면 묶음 전체가
+    None(단건 처리 대상)이 된다.
+    """
+
+    def __init__(
+        self,
+        run_batch: Callable[[Hashable, List[BatchItem]], List[Optional[str]]],
+        max_items: int = BATCH_SIZE,
+        window: float = BATCH_WINDOW,
+    ):
+        self.run_batch = run_batch
+        self.max_items = max(1, int(max_items))
+        self.window = window
+        self._lock = threading.Lock()
+        self._open: Dict[Hashable, _Batch] = {}
+        self.stats = {"batches": 0, "items": 0, "hits": 0, "fallbacks": 0}
+
+    def submit(self, group: Hashable, title: str, content: str) -> Optional[str]:
+        """묶음에 합류해 이 항목의 요약을 받음 (실패 항목은 None)"""
+        with self._lock:
+            batch = self._open.get(group)
+            leader = batch is None or len(batch.items) >= self.max_items
+            if leader:
+                batch = self._open[group] = _Batch()
+            index = len(batch.items)
+            batch.items.append((title, content))
+            if len(batch.items) >= self.max_items:
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self.window)
+            with self._lock:
+                if self._open.get(group) is batch:
+                    del self._open[group]  # 이후 요청은 새 묶음으로
+                items = list(batch.items)
+            try:
+                results = list(self.run_batch(group, items))
+            except Exception:
+                results = []
+            batch.results = (results + [None] * len(items))[:len(items)]
+            with self._lock:
+                self.stats["batches"] += 1
+                self.stats["items"] += len(items)
+                self.stats["hits"] += sum(1 for result in batch.results if result)
+                self.stats["fallbacks"] += sum(1 for result in batch.results if not result)
+            batch.done.set()
+        else:
+            batch.done.wait()
+        return batch.results[index]
+
+    def snapshot_stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = {key: 0 for key in self.stats}
@@ -0,0 +1,73 @@
+"""
+사이클 체크포인트 테스트 (완료 키워드 이어서 사용, DB 저장 표시, 잘린 줄, 설정 변경/오래된 기록)
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cycle_journal import CycleJournal
+
+PARAMS = {"model": "m", "video_limit": 10, "analyze_subtitles": True, "analysis_source": "youtube"}
+
+
+def result(keyword, *video_ids):
+    return {"keyword": keyword, "nb_score": 1.0,
+            "videos": [{"video_id": video_id, "title": video_id, "subtitle_summary": "요약", "db_saved": False}
+                       for video_id in video_ids]}
+
+
+def test_resume_completed_keywords_with_db_saved():
+    """재시작하면 완료된 키워드와 DB 저장 여부를 돌려주고, 잘린 마지막 줄은 버림"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cycle_journal.jsonl"
+        journal = CycleJournal(path)
+        assert journal.begin(PARAMS) == {}
+        journal.record("환율", result("환율", "a", "b"))
+        journal.record("코스피", result("코스피", "c"))
+        journal.mark_db_saved("a")
+        journal.close()  # 보고서 저장 전에 프로세스가 멈춤
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "keyword", "keyword": "금리", "res')
+
+        resumed = CycleJournal(path)
+        completed = resumed.begin(PARAMS)
+        assert sorted(completed) == ["코스피", "환율"]
+        assert [video["db_saved"] for video in completed["환율"]["videos"]] == [True, False]
+        resumed.record("금리", result("금리"))
+        resumed.close()
+        assert sorted(CycleJournal(path).begin(PARAMS)) == ["금리", "코스피", "환율"]
+
+
+def test_new_cycle_when_params_change_or_stale_and_finish_removes():
+    """설정이 다르거나 max_age가 지난 기록은 버리고 새로 시작, finish()는 기록 삭제"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cycle_journal.jsonl"
+        journal = CycleJournal(path)
+        journal.begin(PARAMS)
+        journal.record("환율", result("환율", "a"))
+        journal.close()
+
+        assert CycleJournal(path).begin({**PARAMS, "model": "other"}) == {}
+        stale = CycleJournal(path, max_age=-1)
+        assert stale.begin({**PARAMS, "model": "other"}) == {}
+        stale.finish()
+        assert not path.exists()
+        stale.mark_db_saved("a")  # 끝난 기록에는 더 쓰지 않음
+        assert not path.exists()
+
+
+def main():
+    print("=" * 60)
+    print("사이클 체크포인트 테스트")
+    print("=" * 60)
+    for test in (test_resume_completed_keywords_with_db_saved, test_new_cycle_when_params_change_or_stale_and_finish_removes):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+참소식 DB 비동기 저장 테스트 (합치기, 재시도/포기, 포맷팅 스킵, 재시작 후 이어서 전송)
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from db_writer import DatabaseWriter, backoff_delay
+
+
+def test_coalesce_retry_and_give_up():
+    """보내기 전 같은 key는 합치고, 실패는 재시도 후 성공/포기, prepare가 None이면 스킵"""
+    with tempfile.TemporaryDirectory() as tmp:
+        sent, results = [], []
+        failures = {'flaky': 2}
+        gate = threading.Event()
+
+        def send(payload):
+            gate.wait(5)
+            if payload['key'] == 'down':
+                raise ConnectionError('서버 응답 없음')
+            if failures.get(payload['key'], 0) > 0:
+                failures[payload['key']] -= 1
+                return False
+            sent.append((payload['key'], payload['text']))
+            return True
+
+        def prepare(payload):
+            return None if payload['summary'] == '' else {**payload, 'text': f"[{payload['summary']}]"}
+
+        writer = DatabaseWriter(
+            os.path.join(tmp, 'outbox.sqlite3'), send, prepare=prepare,
+            on_result=lambda payload, status: results.append((payload['key'], status)),
+            workers=2, max_attempts=3, base_delay=0.01, max_delay=0.05,
+        )
+        writer.submit('a', {'key': 'a', 'summary': '첫 요약'})
+        writer.submit('a', {'key': 'a', 'summary': '고친 요약'})
+        for key, summary in (('flaky', '재시도 요약'), ('down', '전송 불가'), ('empty', '')):
+            writer.submit(key, {'key': key, 'summary': summary})
+        writer.start()
+        time.sleep(0.1)  # 전송 스레드 둘 다 send에서 막힌 상태
+        started = time.monotonic()
+        writer.submit('late', {'key': 'late', 'summary': '나중 요약'})
+        assert time.monotonic() - started < 0.5, "submit이 전송을 기다리면 안 됨"
+        gate.set()
+
+        assert writer.flush(5) == 0
+        assert sorted(sent) == [('a', '[고친 요약]'), ('flaky', '[재시도 요약]'), ('late', '[나중 요약]')]
+        assert sorted(results) == [('a', 'sent'), ('down', 'failed'), ('empty', 'skipped'), ('flaky', 'sent'), ('late', 'sent')]
+        stats = writer.snapshot_stats()
+        assert stats['queued'] == 5 and stats['coalesced'] == 1 and stats['sent'] == 3
+        assert stats['failed'] == 1 and stats['skipped'] == 1 and stats['retries'] == 4 and stats['pending'] == 0
+        writer.close()
+
+    delays = [backoff_delay(attempt, base=1.0, cap=10.0) for attempt in (1, 3, 10)]
+    assert 0.5 <= delays[0] <= 1.5 and 2.0 <= delays[1] <= 6.0 and 5.0 <= delays[2] <= 15.0
+
+
+def test_outbox_survives_restart():
+    """전송 전에 프로세스가 멈춰도 다음 실행에서 포맷팅된 내용 그대로 이어서 전송"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'outbox.sqlite3')
+        prepared = []
+
+        def prepare(payload):
+            prepared.append(payload['key'])
+            return {**payload, 'text': payload['summary']}
+
+        first = DatabaseWriter(path, lambda payload: False, prepare=prepare, base_delay=30, max_delay=30)
+        first.submit('v1', {'key': 'v1', 'summary': '저장할 요약'})
+        first.submit('v2', {'key': 'v2', 'summary': '두 번째 요약'})
+        first.start()
+        first.flush(0.2)
+        assert sorted(first.pending_keys()) == ['v1', 'v2']
+        first.close()
+
+        sent = []
+        second = DatabaseWriter(path, lambda payload: sent.append(payload['text']) or True, prepare=prepare).start()
+        assert second.flush(5) == 0
+        assert sorted(sent) == ['두 번째 요약', '저장할 요약']
+        assert sorted(prepared) == ['v1', 'v2'], "재시작 후 포맷팅을 다시 하면 안 됨"
+        second.close()
+
+
+def main():
+    print("=" * 60)
+    print("참소식 DB 비동기 저장 테스트")
+    print("=" * 60)
+    for test in (test_coalesce_retry_and_give_up, test_outbox_survives_restart):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+키워드 추이 시계열 테스트 (조회수 속도, N/B 변화, 상승 키워드, 중복/잘린 행 처리)
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from keyword_series import KeywordSeries
+
+HOUR = 3600.0
+START = 1_770_000_000.0  # 기간 계산 기준 시각
+
+
+def keyword(name, nb_score, videos):
+    return {"keyword": name, "nb_score": nb_score, "video_count": len(videos), "total_views": sum(videos.values()),
+            "avg_views": 0.0, "videos": [{"video_id": video_id, "views": views} for video_id, views in videos.items()]}
+
+
+CYCLES = [
+    (START, [keyword("환율", 1.0, {"a": 100, "b": 10}), keyword("코스피", 2.0, {"c": 50})]),
+    (START + HOUR, [keyword("환율", 1.5, {"a": 300, "b": 20}), keyword("코스피", 1.0, {"c": 60})]),
+    (START + 2 * HOUR, [keyword("환율", 3.0, {"a": 500, "d": 5}), keyword("코스피", 0.5, {"c": 70}),
+                        keyword("신규", 9.0, {"e": 1})]),
+]
+
+
+def test_velocity_deltas_and_movers():
+    """영상별 시간당 조회수, N/B 변화량, 조회수/N/B 기준 상승 키워드를 기간 안에서 계산"""
+    with tempfile.TemporaryDirectory() as tmp:
+        series = KeywordSeries(Path(tmp))
+        assert series.is_empty()
+        assert series.append_cycles(CYCLES) == 7
+        now = START + 2 * HOUR
+
+        assert series.view_velocity("환율", days=1, now=now) == {"a": 200.0, "b": 10.0}
+        assert series.nb_delta("환율", days=1, now=now) == {"cycles": 3, "first": 1.0, "last": 3.0, "delta": 2.0, "min": 1.0, "max": 3.0}
+        assert series.nb_delta("환율", days=1.5 * HOUR / 86400, now=now)["cycles"] == 2  # 최근 1.5시간만
+        assert series.nb_delta("없음", now=now)["cycles"] == 0
+
+        movers = series.top_movers(days=1, metric="views", now=now)
+        assert [(item["keyword"], item["delta"], item["per_hour"]) for item in movers] == [("환율", 410.0, 205.0), ("코스피", 20.0, 10.0)]
+        assert [item["keyword"] for item in series.top_movers(days=1, metric="nb_score", now=now)] == ["환율", "코스피"]
+        assert series.top_movers(days=1, metric="views", exclude=("환율",), now=now)[0]["keyword"] == "코스피"
+
+        data = series.read("cycles", ("nb_score",), keyword="코스피")
+        assert list(data) == ["nb_score"] and data["nb_score"].tolist() == [2.0, 1.0, 0.5]
+
+
+def test_reopen_skips_duplicates_and_trims_partial_rows():
+    """다시 열면 이미 넣은 사이클은 건너뛰고, 쓰다 멈춘 열은 가장 짧은 열 길이로 맞춤"""
+    with tempfile.TemporaryDirectory() as tmp:
+        KeywordSeries(Path(tmp)).append_cycles(CYCLES[:2])
+        day_dir = next(path for path in Path(tmp).iterdir() if path.is_dir())
+        with open(day_dir / "cycles.nb_score.bin", "ab") as f:
+            f.write(b"\x00" * 5)  # 잘린 행
+
+        series = KeywordSeries(Path(tmp))
+        assert (day_dir / "cycles.nb_score.bin").stat().st_size == 4 * 8
+        assert series.append_cycles(CYCLES) == 3  # 세 번째 사이클만 추가
+        assert series.read("cycles", ("ts",))["ts"].tolist() == [START] * 2 + [START + HOUR] * 2 + [START + 2 * HOUR] * 3
+
+
+def test_names_with_unicode_line_separators_round_trip():
+    """U+2028, U+0085 등이 든 키워드도 다시 열었을 때 같은 번호로 읽힘"""
+    with tempfile.TemporaryDirectory() as tmp:
+        names = ["a\u2028b", "c\x85d\x0be", "f\r", "g"]
+        cycle = (START, [keyword(name, 1.0, {f"v{number}": 10}) for number, name in enumerate(names)])
+        KeywordSeries(Path(tmp)).append_cycles([cycle])
+        with open(Path(tmp) / "keywords.txt", "ab") as f:
+            f.write("쓰다 멈춘".encode("utf-8"))
+
+        series = KeywordSeries(Path(tmp))
+        assert series.keywords() == names
+        assert series.nb_delta("g", now=START)["cycles"] == 1
+        assert series.read("videos", ("views",), keyword="g")["views"].tolist() == [10]
+        series.append_cycles([(START + HOUR, [keyword("h", 1.0, {"v9": 1})])])
+        assert KeywordSeries(Path(tmp)).keywords() == names + ["h"]
+
+
+def main():
+    print("=" * 60)
+    print("키워드 추이 시계열 테스트")
+    print("=" * 60)
+    for test in (test_velocity_deltas_and_movers, test_reopen_skips_duplicates_and_trims_partial_rows,
+                 test_names_with_unicode_line_separators_round_trip):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
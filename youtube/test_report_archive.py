@@ -0,0 +1,133 @@
+"""
+보고서 압축 보관 테스트 (영상 레코드 중복 제거, 조회수 증감, 원본 복원, 날짜 폴더 묶기/풀기)
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import report_archive
+from report_index import ReportIndex
+
+
+def video(video_id, views, summary="요약", **extra):
+    return {"title": f"{video_id} 제목", "video_id": video_id, "views": views, "upload_date": "2026-03-15",
+            "url": f"https://www.youtube.com/watch?v={video_id}", "subtitle_summary": summary, **extra}
+
+
+def make_report(number, videos, views=None):
+    keyword = {"keyword": "환율", "is_fixed": False,
+               "views": views if views is not None else [item["views"] for item in videos if isinstance(item, dict)],
+               "video_count": len(videos), "videos": videos, "max": 1.5, "min": 0.0, "nb_score": 1.2345,
+               "avg_views": 10.5, "total_views": 21}
+    return {"timestamp": f"2026-03-16T0{number}:00:00", "model": "m", "keyword_count": 2,
+            "analyze_subtitles": True, "analysis_source": "youtube",
+            "keywords": [{"keyword": "오늘의 주요 뉴스", "is_fixed": True, "views": [], "video_count": 0,
+                          "videos": [], "max": 0, "min": 0, "nb_score": 0, "avg_views": 0, "total_views": 0}, keyword]}
+
+
+REPORTS = [
+    (1, make_report(1, [video("a", 100, db_saved=False), video("b", 7)]), "# 보고서 1\n"),
+    (2, make_report(2, [video("a", 130, db_saved=True), video("b", None)]), "# 보고서 2\n"),
+    (3, make_report(3, [video("a", 125, "고친 요약", db_saved=True), "깨진 항목"], views=[1, 2]), None),
+]
+
+
+def test_pack_dedups_and_restores_exactly():
+    """같은 영상 레코드는 한 번만 저장하고, 조회수는 증감으로 기록하되 원본 JSON 그대로 복원"""
+    blobs, packed = report_archive.pack_reports(REPORTS)
+    assert len(blobs) == 3  # a, b, 요약이 바뀐 a
+    refs = [entry["data"]["keywords"][1]["videos"] for entry in packed]
+    assert refs[0][0]["d"] == 100 and refs[1][0]["d"] == 30 and refs[2][0]["d"] == -5
+    assert refs[1][1]["v"] is None and refs[2][1] == {"raw": "깨진 항목"}
+    assert packed[0]["data"]["keywords"][1]["views"] == report_archive.DERIVED_VIEWS
+    assert packed[2]["data"]["keywords"][1]["views"] == [1, 2]
+
+    restored = list(report_archive.unpack_reports(blobs, packed))
+    assert [number for number, _, _ in restored] == [1, 2, 3]
+    for (_, original, markdown), (_, data, restored_markdown) in zip(REPORTS, restored):
+        assert report_archive.legacy_json(data) == report_archive.legacy_json(original)
+        assert restored_markdown == markdown
+
+
+def test_compact_extract_and_index():
+    """지난 날짜 폴더를 묶어 원본을 지우고, 읽기/색인/다시 풀기가 원본과 같음 (최신 폴더는 그대로)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        reports_dir = Path(tmp) / "reports"
+        old_day = (datetime.now() - timedelta(days=10)).strftime("%Y-%m-%d")
+        latest_day = (datetime.now() - timedelta(days=9)).strftime("%Y-%m-%d")
+        originals = {}
+        for day in (old_day, latest_day):
+            (reports_dir / day).mkdir(parents=True)
+            for number, data, markdown in REPORTS:
+                json_path = reports_dir / day / f"report_{number:03d}.json"
+                json_path.write_text(report_archive.legacy_json(data), encoding="utf-8")
+                if markdown is not None:
+                    json_path.with_suffix(".md").write_text(markdown, encoding="utf-8")
+                originals[number] = json_path.read_text(encoding="utf-8")
+
+        results = report_archive.compact_reports(reports_dir, older_than_days=7)
+        assert [(result["day"], result["reports"], result["removed"]) for result in results] == [(old_day, 3, True)]
+        assert not (reports_dir / old_day).exists() and (reports_dir / latest_day).is_dir()
+        assert report_archive.archived_days(reports_dir) == [old_day]
+        assert report_archive.load_report(reports_dir, old_day, 2) == REPORTS[1][1]
+        assert report_archive.load_report(reports_dir, old_day, 9) is None
+
+        index = ReportIndex(Path(tmp) / "index.sqlite3")
+        assert index.rebuild(reports_dir) == 6 and index.next_number(old_day) == 4
+        index.close()
+
+        assert report_archive.extract_day(reports_dir, old_day) == 3
+        for number, text in originals.items():
+            assert (reports_dir / old_day / f"report_{number:03d}.json").read_text(encoding="utf-8") == text
+        assert (reports_dir / old_day / "report_001.md").read_text(encoding="utf-8") == "# 보고서 1\n"
+        assert not (reports_dir / old_day / "report_003.md").exists()
+
+
+def test_failed_day_is_skipped_and_reported():
+    """복원 결과가 원본과 다른 날짜는 원본을 두고 건너뛰며, 나머지 날짜는 계속 묶음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        reports_dir = Path(tmp) / "reports"
+        days = [(datetime.now() - timedelta(days=offset)).strftime("%Y-%m-%d") for offset in (12, 11, 10, 1)]
+        for day in days:
+            (reports_dir / day).mkdir(parents=True)
+            number, data, markdown = REPORTS[0]
+            text = report_archive.legacy_json(data)
+            if day == days[1]:
+                text = json.dumps(data)  # 다른 형식으로 저장된 파일은 바이트 단위로 복원되지 않음
+            (reports_dir / day / f"report_{number:03d}.json").write_text(text, encoding="utf-8")
+
+        results = report_archive.compact_reports(reports_dir, older_than_days=7)
+        assert [(result["day"], result["removed"], "error" in result) for result in results] == [
+            (days[0], True, False), (days[1], False, True), (days[2], True, False)]
+        assert report_archive.archived_days(reports_dir) == [days[0], days[2]]
+        assert (reports_dir / days[1] / "report_001.json").exists()
+
+
+def test_gzip_frames_are_readable():
+    """zstd/xz가 아닌 gzip 프레임으로 쓴 보관 파일도 읽음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "day.rpa"
+        report_archive.write_archive(path, *report_archive.pack_reports(REPORTS), codec=report_archive.CODEC_GZIP)
+        blobs, packed = report_archive.read_archive(path)
+        assert [json.dumps(data) for _, data, _ in report_archive.unpack_reports(blobs, packed)] == \
+               [json.dumps(data) for _, data, _ in REPORTS]
+
+
+def main():
+    print("=" * 60)
+    print("보고서 압축 보관 테스트")
+    print("=" * 60)
+    for test in (test_pack_dedups_and_restores_exactly, test_compact_extract_and_index, test_failed_day_is_skipped_and_reported,
+                 test_gzip_frames_are_readable):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
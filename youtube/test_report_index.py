@@ -0,0 +1,85 @@
+"""
+보고서 색인 테스트 (기존 폴더 채우기, 다음 번호, 최신 키워드, 키워드 기록, 영상 요약)
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from report_index import ReportIndex
+
+
+def make_report(keywords, day_offset=0):
+    return {
+        "timestamp": (datetime.now() - timedelta(days=day_offset)).isoformat(),
+        "model": "m",
+        "analysis_source": "youtube",
+        "keywords": [
+            {
+                "keyword": keyword,
+                "is_fixed": keyword == "오늘의 주요 뉴스",
+                "nb_score": score,
+                "max": score + 1,
+                "min": score - 1,
+                "video_count": 1,
+                "avg_views": 100.0,
+                "total_views": 100,
+                "videos": [{"video_id": f"{keyword}-v", "title": f"{keyword} 영상", "views": 100,
+                            "subtitle_summary": f"{keyword} 요약", "db_saved": True}],
+            }
+            for keyword, score in keywords
+        ],
+    }
+
+
+def test_rebuild_and_lookups():
+    """폴더의 보고서를 색인하고, 번호/최신 키워드/기록/영상을 색인으로 조회"""
+    with tempfile.TemporaryDirectory() as tmp:
+        reports = Path(tmp) / "reports"
+        old_day = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+        today = datetime.now().strftime("%Y-%m-%d")
+        for day, number, data in (
+            (old_day, 1, make_report([("오늘의 주요 뉴스", 0), ("환율", 1.5), ("코스피", 2.0)], 3)),
+            (today, 1, make_report([("오늘의 주요 뉴스", 0), ("비트코인", 3.0)])),
+            (today, 2, make_report([("오늘의 주요 뉴스", 0)])),
+        ):
+            (reports / day).mkdir(parents=True, exist_ok=True)
+            with open(reports / day / f"report_{number:03d}.json", "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+        (reports / today / "report_xyz.json").write_text("{}", encoding="utf-8")
+
+        index = ReportIndex(Path(tmp) / "index.sqlite3")
+        assert index.rebuild(reports) == 3 and index.count() == 3
+        assert index.next_number(today) == 3 and index.next_number("2000-01-01") == 1
+        assert index.latest_keywords(8, exclude="오늘의 주요 뉴스") == ["비트코인"]
+
+        index.add_report(today, 3, make_report([("환율", 4.0), ("금리", 1.0)]))
+        index.add_report(today, 3, make_report([("환율", 5.0), ("금리", 1.0)]))  # 같은 번호는 교체
+        assert index.count() == 4 and index.latest_keywords(1) == ["환율"]
+
+        history = index.keyword_history(7, "환율")
+        assert [(item["day"], item["nb_score"]) for item in history] == [(old_day, 1.5), (today, 5.0)]
+        assert len(index.keyword_history(1)) == 5
+
+        videos = index.report_videos(today, 3)
+        assert [(video["video_id"], video["summary"], video["db_saved"]) for video in videos] == [
+            ("환율-v", "환율 요약", True), ("금리-v", "금리 요약", True)]
+        index.close()
+
+
+def main():
+    print("=" * 60)
+    print("보고서 색인 테스트")
+    print("=" * 60)
+    for test in (test_rebuild_and_lookups,):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+자막 요약 묶음 호출 테스트 (프롬프트 구성, 항목별 검증, 스레드 묶음/단건 처리)
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from summary_batch import SummaryBatcher, build_batch_prompt, parse_batch_response
+
+
+def test_prompt_and_per_item_validation():
+    """번호별 자막이 들어가고, 틀린 항목만 None"""
+    prompt = build_batch_prompt([('제목 A', '자막 A'), ('제목 B', '자막 B')])
+    assert '[1]\n제목: 제목 A\n자막: 자막 A' in prompt and '[2]\n제목: 제목 B' in prompt
+
+    raw = '```json\n{"items": [{"id": 2, "summary": ["둘째 영상 첫 줄", "둘째 줄"]},' \
+          ' {"id": 1, "summary": "짧음"}, {"id": 9, "summary": "범위 밖 영상 요약입니다"},' \
+          ' {"id": "3", "summary": "셋째 영상 요약 내용입니다"}]}\n```'
+    assert parse_batch_response(raw, 3) == [None, '둘째 영상 첫 줄\n둘째 줄', '셋째 영상 요약 내용입니다']
+    assert parse_batch_response('[" 첫째 영상 요약 내용 "]', 2) == ['첫째 영상 요약 내용', None]
+    assert parse_batch_response('요약할 수 없습니다', 2) == [None, None]
+
+
+def test_batcher_groups_concurrent_requests():
+    """동시에 들어온 요청을 최대 개수만큼 묶고, 실패 항목/예외는 None"""
+    calls = []
+    lock = threading.Lock()
+
+    def run_batch(model, items):
+        with lock:
+            calls.append((model, [title for title, _ in items]))
+        if model == 'broken':
+            raise RuntimeError('응답 없음')
+        return [None if title.endswith('3') else f'{title} 요약' for title, _ in items]
+
+    batcher = SummaryBatcher(run_batch, max_items=4, window=1.0)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda i: batcher.submit('m', f'영상{i}', '자막'), range(8)))
+    assert sorted(len(titles) for _, titles in calls) == [4, 4]
+    assert results == [None if i == 3 else f'영상{i} 요약' for i in range(8)]
+    assert batcher.snapshot_stats() == {'batches': 2, 'items': 8, 'hits': 7, 'fallbacks': 1}
+
+    assert SummaryBatcher(run_batch, max_items=4, window=0.01).submit('broken', '영상', '자막') is None
+
+
+def main():
+    print("=" * 60)
+    print("자막 요약 묶음 호출 테스트")
+    print("=" * 60)
+    for test in (test_prompt_and_per_item_validation, test_batcher_groups_concurrent_requests):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
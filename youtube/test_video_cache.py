@@ -0,0 +1,73 @@
+"""
+영상별 분석 캐시 테스트 (필드별 유효 기간, 자막 해시 재사용, DB 저장 여부, 적중 집계)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from video_cache import VideoCache, transcript_hash
+
+
+def test_ttl_per_field():
+    """업로드일은 영구, 요약은 유효 기간이 지나면 실패 처리"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = VideoCache(os.path.join(tmp, 'cache.sqlite3'), summary_ttl=0.05)
+        cache.set_upload_date('v1', '2026-10-18')
+        cache.set_summary('v1', 'youtube', '[요약]')
+        assert cache.get_summary('v1', 'youtube') == ('[요약]', False)
+        assert cache.get_summary('v1', 'google') is None
+        time.sleep(0.1)
+        assert cache.get_summary('v1', 'youtube') is None
+        assert cache.get_upload_date('v1') == '2026-10-18'
+        assert cache.get_upload_date('v2') == ''
+        cache.set_upload_date('v1', '2026-10-18', 1792300000.0)
+        cache.set_upload_date('v1', '2026-10-18')
+        assert cache.get_upload_info('v1') == {'upload_date': '2026-10-18', 'timestamp': 1792300000.0}
+        stats = cache.snapshot_stats()
+        assert stats['summary'] == {'hit': 1, 'miss': 2}
+        assert stats['upload_date'] == {'hit': 2, 'miss': 1}
+        assert stats['entries'] == 1
+        cache.close()
+
+
+def test_transcript_hash_and_db_saved_survive_reopen():
+    """같은 자막이면 기간이 지나도 요약 재사용, 요약이 바뀌면 DB 저장 여부 초기화"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite3')
+        cache = VideoCache(path, summary_ttl=0)
+        digest = transcript_hash('자막  내용\n입니다')
+        assert digest == transcript_hash('자막 내용 입니다')
+        cache.set_summary('v1', 'subtitles', '[요약]', digest)
+        cache.set_db_saved('v1')
+        cache.close()
+
+        cache = VideoCache(path)
+        assert cache.is_db_saved('v1') and not cache.is_db_saved('v2')
+        assert cache.get_summary('v1', 'subtitles') == ('[요약]', True)
+        assert cache.get_summary_for_transcript('v1', 'subtitles', digest) == '[요약]'
+        assert cache.get_summary_for_transcript('v1', 'subtitles', transcript_hash('다른 자막')) is None
+        cache.set_summary('v1', 'subtitles', '[요약]', digest)
+        assert cache.get_summary('v1', 'subtitles') == ('[요약]', True)
+        cache.set_summary('v1', 'subtitles', '[새 요약]')
+        assert cache.get_summary('v1', 'subtitles') == ('[새 요약]', False)
+        assert not cache.is_db_saved('v1')
+        cache.reset_stats()
+        assert cache.snapshot_stats()['summary'] == {'hit': 0, 'miss': 0}
+        cache.close()
+
+
+def main():
+    print("=" * 60)
+    print("영상별 분석 캐시 테스트")
+    print("=" * 60)
+    for test in (test_ttl_per_field, test_transcript_hash_and_db_saved_survive_reopen):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+yt_dlp 인스턴스 풀 테스트 (가짜 YoutubeDL로 재사용, 최대 개수, 쿠키 공유, 일괄 추출 확인)
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ytdlp_pool import YoutubeDLPool
+
+
+class FakeYoutubeDL:
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def __init__(self, options):
+        self.options = options
+        self.cookiejar = object()
+        self.busy = False
+        self.closed = False
+
+    def extract_info(self, url, download=False):
+        assert not self.busy, "인스턴스를 두 스레드가 동시에 사용"
+        self.busy = True
+        with FakeYoutubeDL.lock:
+            FakeYoutubeDL.active += 1
+            FakeYoutubeDL.max_active = max(FakeYoutubeDL.max_active, FakeYoutubeDL.active)
+        time.sleep(0.01)
+        with FakeYoutubeDL.lock:
+            FakeYoutubeDL.active -= 1
+        self.busy = False
+        if 'fail' in url:
+            raise RuntimeError(url)
+        return {'url': url, 'profile': self.options['name']}
+
+    def close(self):
+        self.closed = True
+
+
+def test_instances_are_reused_and_bounded():
+    """프로필별 최대 개수까지만 만들고, 같은 인스턴스를 다시 빌려줌"""
+    pool = YoutubeDLPool(max_per_profile=3, factory=FakeYoutubeDL)
+    pool.register('metadata', {'name': 'metadata'})
+    urls = [f'https://youtu.be/{i}' for i in range(30)] + ['https://youtu.be/fail']
+    infos = pool.extract_many('metadata', urls + urls[:5], workers=8)
+    assert len(infos) == 31 and infos['https://youtu.be/fail'] is None
+    assert infos[urls[7]] == {'url': urls[7], 'profile': 'metadata'}
+    assert pool.stats['created'] <= 3 and FakeYoutubeDL.max_active <= 3
+    assert pool.stats['created'] + pool.stats['reused'] == 31
+
+
+def test_cookiejar_shared_by_cookie_options():
+    """쿠키 설정이 같은 프로필끼리만 쿠키 저장소 공유, close 시 모두 닫힘"""
+    pool = YoutubeDLPool(max_per_profile=2, factory=FakeYoutubeDL)
+    pool.register('flat', {'name': 'flat'})
+    pool.register('metadata', {'name': 'metadata'})
+    pool.register('browser', {'name': 'browser', 'cookiesfrombrowser': ('chrome',)})
+    with pool.acquire('flat') as first, pool.acquire('metadata') as second, pool.acquire('browser') as third:
+        assert first is not second and first.cookiejar is second.cookiejar
+        assert third.cookiejar is not first.cookiejar
+    instances = list(pool._instances)
+    pool.close()
+    assert all(ydl.closed for ydl in instances) and not pool._instances
+
+
+def main():
+    print("=" * 60)
+    print("yt_dlp 인스턴스 풀 테스트")
+    print("=" * 60)
+    for test in (test_instances_are_reused_and_bounded, test_cookiejar_shared_by_cookie_options):
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
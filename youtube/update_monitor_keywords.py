@@ -25,6 +25,10 @@ from typing import Dict, List, Optional
 
 import requests
 
+# Ollama 공용 클라이언트 (저장소 루트의 ollama_client)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import ollama_client
+
 try:
     from selenium import webdriver
     from selenium.common.exceptions import TimeoutException, WebDriverException
@@ -357,23 +361,16 @@ def generate_keywords_with_ollama(lines: List[str], model: str, limit: int) -> L
 9. 설명 없이 키워드만 출력
 """
 
-    response = requests.post(
-        f"{OLLAMA_URL}/api/generate",
-        json={
-            "model": model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.25,
-                "top_p": 0.9,
-                "num_predict": 180,
-            },
+    raw = ollama_client.get_client(OLLAMA_URL).generate(
+        model,
+        prompt,
+        options={
+            "temperature": 0.25,
+            "top_p": 0.9,
+            "num_predict": 180,
         },
         timeout=120,
-    )
-    response.raise_for_status()
-    payload = response.json()
-    raw = payload.get("response", "")
+    ).text
 
     keywords: List[str] = []
     seen = set()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+영상별 분석 캐시 (video_id 기준, SQLite)
+
+모니터링 사이클마다 같은 영상을 다시 조회/요약하지 않도록 video_id별로
+업로드일, 자막 해시, 요약, 참소식 DB 저장 여부를 저장한다.
+
+필드별 유효 기간:
+- upload_date, upload_timestamp: 영구 (업로드 시각은 바뀌지 않음)
+- summary: 24시간 (VIDEO_CACHE_SUMMARY_TTL 초)
+- transcript_hash: 요약과 함께 저장. 자막 해시가 같으면 기간이 지나도 요약 재사용
+- db_saved: 요약과 함께 유지
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+SUMMARY_TTL = 24 * 3600
+FIELDS = ("upload_date", "summary", "transcript")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS videos (
+    video_id TEXT PRIMARY KEY,
+    upload_date TEXT,
+    upload_date_at REAL,
+    upload_timestamp REAL,
+    transcript_hash TEXT,
+    summary TEXT,
+    summary_source TEXT,
+    summary_at REAL,
+    db_saved INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+def transcript_hash(text: str) -> str:
+    """자막 텍스트 해시 (공백 정규화 후 blake2b 16바이트)"""
+    normalized = " ".join((text or "").split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class VideoCache:
+    """video_id별 분석 결과 캐시 (스레드 안전, 적중/실패 횟수 집계)"""
+
+    def __init__(self, path, summary_ttl: float = SUMMARY_TTL, upload_date_ttl: Optional[float] = None):
+        self.path = Path(path)
+        self.summary_ttl = summary_ttl
+        self.upload_date_ttl = upload_date_ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(videos)")}
+        if "upload_timestamp" not in columns:  # 이전 버전 캐시 파일
+            self._conn.execute("ALTER TABLE videos ADD COLUMN upload_timestamp REAL")
+        self._conn.commit()
+        self.reset_stats()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # 집계
+    def reset_stats(self) -> None:
+        """사이클 시작 시 적중/실패 횟수 초기화"""
+        with self._lock:
+            self.stats = {field: {"hit": 0, "miss": 0} for field in FIELDS}
+
+    def _count(self, field: str, hit: bool) -> None:
+        self.stats[field]["hit" if hit else "miss"] += 1
+
+    def snapshot_stats(self) -> Dict[str, Any]:
+        """보고서에 기록할 적중/실패 횟수"""
+        with self._lock:
+            stats = {field: dict(counts) for field, counts in self.stats.items()}
+            entries = self._conn.execute("SELECT COUNT(*) FROM videos").fetchone()[0]
+        stats["entries"] = entries
+        return stats
+
+    # 조회
+    def _row(self, video_id: str, columns: str):
+        return self._conn.execute(f"SELECT {columns} FROM videos WHERE video_id = ?", (video_id,)).fetchone()
+
+    @staticmethod
+    def _fresh(stored_at, ttl, now) -> bool:
+        return stored_at is not None and (ttl is None or now - stored_at < ttl)
+
+    def get_upload_info(self, video_id: str) -> Dict[str, Any]:
+        """저장된 업로드 정보 {"upload_date", "timestamp"(있으면)} (없으면 빈 dict)"""
+        with self._lock:
+            row = self._row(video_id, "upload_date, upload_date_at, upload_timestamp")
+            hit = bool(row and row[0] and self._fresh(row[1], self.upload_date_ttl, time.time()))
+            self._count("upload_date", hit)
+        if not hit:
+            return {}
+        info = {"upload_date": row[0]}
+        if row[2] is not None:
+            info["timestamp"] = row[2]
+        return info
+
+    def get_upload_date(self, video_id: str) -> str:
+        """저장된 업로드일 (없으면 빈 문자열)"""
+        return self.get_upload_info(video_id).get("upload_date", "")
+
+    def get_summary(self, video_id: str, source: str) -> Optional[Tuple[str, bool]]:
+        """유효 기간 안의 (요약, DB 저장 여부). 분석 소스가 다르면 None"""
+        with self._lock:
+            row = self._row(video_id, "summary, summary_source, summary_at, db_saved")
+            hit = bool(row and row[0] and row[1] == source and self._fresh(row[2], self.summary_ttl, time.time()))
+            self._count("summary", hit)
+        return (row[0], bool(row[3])) if hit else None
+
+    def get_summary_for_transcript(self, video_id: str, source: str, digest: str) -> Optional[str]:
+        """자막 해시가 같을 때 저장된 요약 (유효 기간과 무관)"""
+        with self._lock:
+            row = self._row(video_id, "summary, summary_source, transcript_hash")
+            hit = bool(row and row[0] and row[1] == source and row[2] == digest)
+            self._count("transcript", hit)
+        return row[0] if hit else None
+
+    def is_db_saved(self, video_id: str) -> bool:
+        """현재 요약이 참소식 DB에 저장됐는지 (적중 집계에는 넣지 않음)"""
+        if not video_id:
+            return False
+        with self._lock:
+            row = self._row(video_id, "db_saved")
+        return bool(row and row[0])
+
+    # 저장
+    def set_upload_date(self, video_id: str, upload_date: str, timestamp: float = None) -> None:
+        """업로드일 저장 (업로드 시각을 모르면 기존 시각 유지)"""
+        if not video_id or not upload_date:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO videos (video_id, upload_date, upload_date_at, upload_timestamp) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(video_id) DO UPDATE SET upload_date = excluded.upload_date, "
+                "upload_date_at = excluded.upload_date_at, "
+                "upload_timestamp = COALESCE(excluded.upload_timestamp, videos.upload_timestamp)",
+                (video_id, upload_date, time.time(), timestamp),
+            )
+            self._conn.commit()
+
+    def set_summary(self, video_id: str, source: str, summary: str, digest: str = None) -> None:
+        """요약 저장 (요약이 바뀌면 DB 저장 여부 초기화)"""
+        if not video_id or not summary:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO videos (video_id, summary, summary_source, summary_at, transcript_hash) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(video_id) DO UPDATE SET "
+                "db_saved = CASE WHEN videos.summary IS excluded.summary THEN videos.db_saved ELSE 0 END, "
+                "summary = excluded.summary, summary_source = excluded.summary_source, "
+                "summary_at = excluded.summary_at, transcript_hash = excluded.transcript_hash",
+                (video_id, summary, source, time.time(), digest),
+            )
+            self._conn.commit()
+
+    def set_db_saved(self, video_id: str, saved: bool = True) -> None:
+        if not video_id:
+            return
+        with self._lock:
+            self._conn.execute("UPDATE videos SET db_saved = ? WHERE video_id = ?", (int(bool(saved)), video_id))
+            self._conn.commit()
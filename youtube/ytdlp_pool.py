@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+yt_dlp YoutubeDL 인스턴스 풀
+
+호출마다 YoutubeDL을 새로 만들면 추출기 초기화와 HTTP 세션 생성을 매번
+다시 한다. 옵션 프로필(빠른 검색, 메타데이터, 자막 등)별로 오래 쓰는
+인스턴스를 만들어 두고 스레드마다 하나씩 빌려 쓴 뒤 돌려받는다.
+
+- 인스턴스는 필요할 때 만들고 프로필마다 최대 max_per_profile개까지 유지
+- 한 인스턴스는 동시에 한 스레드만 사용 (YoutubeDL은 스레드 안전하지 않음)
+- 쿠키 설정(cookiefile, cookiesfrombrowser)이 같은 인스턴스끼리는 쿠키 저장소를
+  공유한다 (http.cookiejar는 내부 잠금을 사용하므로 여러 스레드에서 안전)
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Optional
+
+DEFAULT_MAX_PER_PROFILE = 8
+
+
+def _default_factory(options: Dict[str, Any]):
+    import yt_dlp
+
+    return yt_dlp.YoutubeDL(options)
+
+
+def cookie_key(options: Dict[str, Any]):
+    """쿠키 저장소를 공유할 수 있는 인스턴스를 구분하는 키"""
+    return options.get("cookiefile"), repr(options.get("cookiesfrombrowser"))
+
+
+class YoutubeDLPool:
+    """프로필별 YoutubeDL 인스턴스 풀"""
+
+    def __init__(self, max_per_profile: int = DEFAULT_MAX_PER_PROFILE, factory: Callable = None):
+        self.max_per_profile = max(1, int(max_per_profile))
+        self.factory = factory or _default_factory
+        self._profiles: Dict[str, Dict[str, Any]] = {}
+        self._idle: Dict[str, list] = {}
+        self._created: Dict[str, int] = {}
+        self._instances: list = []
+        self._cookiejars: Dict[Any, Any] = {}
+        self._condition = threading.Condition()
+        self.stats = {"created": 0, "reused": 0}
+
+    def register(self, name: str, options: Dict[str, Any]) -> None:
+        """옵션 프로필 등록 (이미 등록된 이름이면 그대로 둠)"""
+        with self._condition:
+            if name in self._profiles:
+                return
+            self._profiles[name] = dict(options)
+            self._idle[name] = []
+            self._created[name] = 0
+
+    def profile_options(self, name: str) -> Dict[str, Any]:
+        """등록된 프로필 옵션 사본 (일회성 인스턴스를 만들 때 사용)"""
+        return dict(self._profiles[name])
+
+    def _create(self, name: str):
+        options = self._profiles[name]
+        ydl = self.factory(dict(options))
+        own_jar = getattr(ydl, "cookiejar", None)
+        with self._condition:
+            jar = self._cookiejars.setdefault(cookie_key(options), own_jar)
+            self._instances.append(ydl)
+            self.stats["created"] += 1
+        if jar is not own_jar:
+            try:
+                ydl.cookiejar = jar
+            except AttributeError:
+                pass
+        return ydl
+
+    @contextmanager
+    def acquire(self, name: str):
+        """프로필 인스턴스 하나를 빌림 (모두 사용 중이면 반납될 때까지 대기)"""
+        with self._condition:
+            if name not in self._profiles:
+                raise KeyError(f"등록되지 않은 yt_dlp 프로필: {name}")
+            while not self._idle[name] and self._created[name] >= self.max_per_profile:
+                self._condition.wait()
+            if self._idle[name]:
+                ydl = self._idle[name].pop()
+                self.stats["reused"] += 1
+            else:
+                self._created[name] += 1
+                ydl = None
+        if ydl is None:
+            try:
+                ydl = self._create(name)
+            except Exception:
+                with self._condition:
+                    self._created[name] -= 1
+                    self._condition.notify()
+                raise
+        try:
+            yield ydl
+        finally:
+            with self._condition:
+                self._idle[name].append(ydl)
+                self._condition.notify()
+
+    def extract_info(self, name: str, url: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """프로필 인스턴스로 extract_info(download=False)"""
+        with self.acquire(name) as ydl:
+            return ydl.extract_info(url, download=False, **kwargs)
+
+    def extract_many(self, name: str, urls: Iterable[str], workers: int = None) -> Dict[str, Optional[Dict[str, Any]]]:
+        """여러 URL을 병렬로 추출해 {URL: 정보 또는 None} 반환 (실패한 URL은 None)"""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+
+        def _extract(url):
+            try:
+                return self.extract_info(name, url)
+            except Exception:
+                return None
+
+        workers = max(1, min(workers or self.max_per_profile, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ytdlp") as executor:
+            return dict(zip(urls, executor.map(_extract, urls)))
+
+    def _close_instance(self, ydl) -> None:
+        try:
+            ydl.close()
+        except Exception:
+            pass
+        if ydl in self._instances:
+            self._instances.remove(ydl)
+
+    def close(self) -> None:
+        """모든 인스턴스 닫기 (쿠키 파일이 있으면 yt_dlp가 이때 저장)"""
+        with self._condition:
+            for ydl in list(self._instances):
+                self._close_instance(ydl)
+            for name in self._profiles:
+                self._idle[name] = []
+                self._created[name] = 0
+            self._cookiejars.clear()
+            self._condition.notify_all()